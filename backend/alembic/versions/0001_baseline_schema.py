@@ -0,0 +1,110 @@
+"""baseline schema
+
+Tables as they existed when the app created them with create_all at startup.
+Databases created that way are stamped at this revision by the migration
+runner instead of running it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=True),
+        sa.Column('picture', sa.String(length=500), nullable=True),
+        sa.Column('refresh_token', sa.String(length=1024), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_admin', sa.Boolean(), nullable=True),
+        sa.Column('last_login', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
+
+    op.create_table(
+        'employee_profiles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.String(length=50), nullable=False),
+        sa.Column('first_name', sa.String(length=100), nullable=False),
+        sa.Column('last_name', sa.String(length=100), nullable=False),
+        sa.Column('date_of_birth', sa.Date(), nullable=True),
+        sa.Column('gender', sa.String(length=20), nullable=True),
+        sa.Column('nationality', sa.String(length=100), nullable=True),
+        sa.Column('phone_number', sa.String(length=20), nullable=True),
+        sa.Column('personal_email', sa.String(length=255), nullable=True),
+        sa.Column('emergency_contact_name', sa.String(length=100), nullable=True),
+        sa.Column('emergency_contact_number', sa.String(length=20), nullable=True),
+        sa.Column('department', sa.String(length=100), nullable=True),
+        sa.Column('position', sa.String(length=100), nullable=True),
+        sa.Column('employment_type', sa.String(length=50), nullable=True),
+        sa.Column('date_of_joining', sa.Date(), nullable=True),
+        sa.Column('employee_status', sa.String(length=50), nullable=True),
+        sa.Column('address_line1', sa.String(length=255), nullable=True),
+        sa.Column('address_line2', sa.String(length=255), nullable=True),
+        sa.Column('city', sa.String(length=100), nullable=True),
+        sa.Column('state', sa.String(length=100), nullable=True),
+        sa.Column('country', sa.String(length=100), nullable=True),
+        sa.Column('postal_code', sa.String(length=20), nullable=True),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('skills', sa.Text(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id')
+    )
+    op.create_index('ix_employee_profiles_employee_id', 'employee_profiles', ['employee_id'], unique=True)
+    op.create_index('ix_employee_profiles_id', 'employee_profiles', ['id'], unique=False)
+
+    op.create_table(
+        'employee_documents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('document_type', sa.String(length=100), nullable=False),
+        sa.Column('document_name', sa.String(length=255), nullable=False),
+        sa.Column('file_path', sa.String(length=500), nullable=False),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('mime_type', sa.String(length=100), nullable=True),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('uploaded_by', sa.Integer(), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), nullable=True),
+        sa.Column('verified_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('verified_by', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['employee_id'], ['employee_profiles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['uploaded_by'], ['users.id']),
+        sa.ForeignKeyConstraint(['verified_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_employee_documents_id', 'employee_documents', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employee_documents_id', table_name='employee_documents')
+    op.drop_table('employee_documents')
+    op.drop_index('ix_employee_profiles_id', table_name='employee_profiles')
+    op.drop_index('ix_employee_profiles_employee_id', table_name='employee_profiles')
+    op.drop_table('employee_profiles')
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_table('users')
@@ -0,0 +1,60 @@
+"""manager hierarchy
+
+Adds employee_profiles.manager_id and the employee_hierarchy closure table,
+backfilled with one self row (depth 0) per existing profile.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:01:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('employee_profiles') as batch_op:
+        batch_op.add_column(sa.Column('manager_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_employee_profiles_manager_id', 'employee_profiles',
+            ['manager_id'], ['id'], ondelete='SET NULL'
+        )
+        batch_op.create_index('ix_employee_profiles_manager_id', ['manager_id'], unique=False)
+
+    op.create_table(
+        'employee_hierarchy',
+        sa.Column('ancestor_id', sa.Integer(), nullable=False),
+        sa.Column('descendant_id', sa.Integer(), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['employee_profiles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['employee_profiles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index(
+        'ix_employee_hierarchy_descendant_depth', 'employee_hierarchy',
+        ['descendant_id', 'depth'], unique=False
+    )
+
+    # No manager links exist yet, so the closure is just the self rows
+    op.execute(
+        "INSERT INTO employee_hierarchy (ancestor_id, descendant_id, depth) "
+        "SELECT id, id, 0 FROM employee_profiles"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employee_hierarchy_descendant_depth', table_name='employee_hierarchy')
+    op.drop_table('employee_hierarchy')
+    with op.batch_alter_table('employee_profiles') as batch_op:
+        batch_op.drop_index('ix_employee_profiles_manager_id')
+        batch_op.drop_constraint('fk_employee_profiles_manager_id', type_='foreignkey')
+        batch_op.drop_column('manager_id')
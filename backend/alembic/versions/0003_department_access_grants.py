@@ -0,0 +1,34 @@
+"""department access grants
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 09:02:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'department_access_grants',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('department', sa.String(length=100), nullable=False),
+        sa.Column('can_edit', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'department')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('department_access_grants')
@@ -0,0 +1,43 @@
+"""employee facet counts
+
+Creates the facet counter table and backfills it from active profiles.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 09:03:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FACETS = ('department', 'employee_status', 'employment_type', 'country', 'city')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'employee_facet_counts',
+        sa.Column('facet', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.String(length=100), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('facet', 'value')
+    )
+
+    for facet in FACETS:
+        op.execute(
+            "INSERT INTO employee_facet_counts (facet, value, count) "
+            f"SELECT '{facet}', COALESCE({facet}, ''), COUNT(*) FROM employee_profiles "
+            f"WHERE is_active = true GROUP BY COALESCE({facet}, '')"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('employee_facet_counts')
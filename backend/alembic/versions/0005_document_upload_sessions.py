@@ -0,0 +1,69 @@
+"""resumable document uploads
+
+Adds employee_documents.checksum_sha256 and the upload session/chunk tables.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 09:04:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('employee_documents', sa.Column('checksum_sha256', sa.String(length=64), nullable=True))
+
+    op.create_table(
+        'document_upload_sessions',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('document_type', sa.String(length=100), nullable=False),
+        sa.Column('document_name', sa.String(length=255), nullable=False),
+        sa.Column('file_name', sa.String(length=255), nullable=True),
+        sa.Column('mime_type', sa.String(length=100), nullable=True),
+        sa.Column('total_size', sa.BigInteger(), nullable=False),
+        sa.Column('temp_path', sa.String(length=500), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=True),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['employee_id'], ['employee_profiles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['document_id'], ['employee_documents.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_document_upload_sessions_employee_id', 'document_upload_sessions', ['employee_id'], unique=False)
+    op.create_index('ix_document_upload_sessions_expires_at', 'document_upload_sessions', ['expires_at'], unique=False)
+
+    op.create_table(
+        'document_upload_chunks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.String(length=32), nullable=False),
+        sa.Column('byte_offset', sa.BigInteger(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('received_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['session_id'], ['document_upload_sessions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_document_upload_chunks_session_id', 'document_upload_chunks', ['session_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_document_upload_chunks_session_id', table_name='document_upload_chunks')
+    op.drop_table('document_upload_chunks')
+    op.drop_index('ix_document_upload_sessions_expires_at', table_name='document_upload_sessions')
+    op.drop_index('ix_document_upload_sessions_employee_id', table_name='document_upload_sessions')
+    op.drop_table('document_upload_sessions')
+    with op.batch_alter_table('employee_documents') as batch_op:
+        batch_op.drop_column('checksum_sha256')
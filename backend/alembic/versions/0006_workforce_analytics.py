@@ -0,0 +1,62 @@
+"""workforce analytics
+
+Adds employee_profiles.date_of_leaving and the analytics snapshot tables.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 09:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('employee_profiles', sa.Column('date_of_leaving', sa.Date(), nullable=True))
+
+    op.create_table(
+        'analytics_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('profile_count', sa.Integer(), nullable=False),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_analytics_snapshots_computed_at', 'analytics_snapshots', ['computed_at'], unique=False)
+    op.create_index('ix_analytics_snapshots_id', 'analytics_snapshots', ['id'], unique=False)
+
+    op.create_table(
+        'analytics_series_points',
+        sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+        sa.Column('snapshot_id', sa.Integer(), nullable=False),
+        sa.Column('metric', sa.String(length=50), nullable=False),
+        sa.Column('department', sa.String(length=100), nullable=False),
+        sa.Column('bucket', sa.String(length=20), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['snapshot_id'], ['analytics_snapshots.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_analytics_series_points_lookup', 'analytics_series_points',
+        ['snapshot_id', 'metric', 'department'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analytics_series_points_lookup', table_name='analytics_series_points')
+    op.drop_table('analytics_series_points')
+    op.drop_index('ix_analytics_snapshots_id', table_name='analytics_snapshots')
+    op.drop_index('ix_analytics_snapshots_computed_at', table_name='analytics_snapshots')
+    op.drop_table('analytics_snapshots')
+    with op.batch_alter_table('employee_profiles') as batch_op:
+        batch_op.drop_column('date_of_leaving')
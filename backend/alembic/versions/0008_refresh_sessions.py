@@ -0,0 +1,54 @@
+"""refresh sessions
+
+Adds refresh_sessions: one row per issued refresh token, grouped into
+families per login, for rotation with a reuse grace window.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 09:07:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'refresh_sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('family_id', sa.String(length=32), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('successor_id', sa.Integer(), nullable=True),
+        sa.Column('successor_token', sa.String(length=1024), nullable=True),
+        sa.Column('rotated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['successor_id'], ['refresh_sessions.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_refresh_sessions_id', 'refresh_sessions', ['id'], unique=False)
+    op.create_index('ix_refresh_sessions_user_id', 'refresh_sessions', ['user_id'], unique=False)
+    op.create_index('ix_refresh_sessions_family_id', 'refresh_sessions', ['family_id'], unique=False)
+    op.create_index('ix_refresh_sessions_token_hash', 'refresh_sessions', ['token_hash'], unique=True)
+    op.create_index('ix_refresh_sessions_expires_at', 'refresh_sessions', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_refresh_sessions_expires_at', table_name='refresh_sessions')
+    op.drop_index('ix_refresh_sessions_token_hash', table_name='refresh_sessions')
+    op.drop_index('ix_refresh_sessions_family_id', table_name='refresh_sessions')
+    op.drop_index('ix_refresh_sessions_user_id', table_name='refresh_sessions')
+    op.drop_index('ix_refresh_sessions_id', table_name='refresh_sessions')
+    op.drop_table('refresh_sessions')
@@ -0,0 +1,44 @@
+"""maintenance job runs
+
+Adds maintenance_job_runs: history of scheduled maintenance job runs, used
+by the scheduler leader to decide which jobs are due.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 09:08:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'maintenance_job_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_name', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('items', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('worker', sa.String(length=255), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_maintenance_job_runs_id', 'maintenance_job_runs', ['id'], unique=False)
+    op.create_index('ix_maintenance_job_runs_job_started', 'maintenance_job_runs', ['job_name', 'started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_maintenance_job_runs_job_started', table_name='maintenance_job_runs')
+    op.drop_index('ix_maintenance_job_runs_id', table_name='maintenance_job_runs')
+    op.drop_table('maintenance_job_runs')
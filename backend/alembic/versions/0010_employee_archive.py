@@ -0,0 +1,111 @@
+"""employee archive
+
+Adds partial indexes on active employee profiles, an employee_id index on
+employee_documents, and the archive tables soft-deleted profiles and their
+documents move to after the retention period.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 09:09:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same predicate text the queries render, so the planners match the indexes
+ACTIVE = {
+    'postgresql_where': sa.text('is_active = true'),
+    'sqlite_where': sa.text('is_active = 1'),
+}
+
+
+def upgrade() -> None:
+    op.create_index('ix_employee_profiles_active_id', 'employee_profiles', ['id'], unique=False, **ACTIVE)
+    op.create_index(
+        'ix_employee_profiles_active_department', 'employee_profiles',
+        ['department', 'id'], unique=False, **ACTIVE
+    )
+    op.create_index(
+        'ix_employee_profiles_active_status', 'employee_profiles',
+        ['employee_status', 'id'], unique=False, **ACTIVE
+    )
+    op.create_index('ix_employee_documents_employee_id', 'employee_documents', ['employee_id'], unique=False)
+
+    op.create_table(
+        'employee_profiles_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('employee_id', sa.String(length=50), nullable=False),
+        sa.Column('first_name', sa.String(length=100), nullable=False),
+        sa.Column('last_name', sa.String(length=100), nullable=False),
+        sa.Column('date_of_birth', sa.Date(), nullable=True),
+        sa.Column('gender', sa.String(length=20), nullable=True),
+        sa.Column('nationality', sa.String(length=100), nullable=True),
+        sa.Column('phone_number', sa.String(length=20), nullable=True),
+        sa.Column('personal_email', sa.String(length=255), nullable=True),
+        sa.Column('emergency_contact_name', sa.String(length=100), nullable=True),
+        sa.Column('emergency_contact_number', sa.String(length=20), nullable=True),
+        sa.Column('department', sa.String(length=100), nullable=True),
+        sa.Column('position', sa.String(length=100), nullable=True),
+        sa.Column('employment_type', sa.String(length=50), nullable=True),
+        sa.Column('date_of_joining', sa.Date(), nullable=True),
+        sa.Column('date_of_leaving', sa.Date(), nullable=True),
+        sa.Column('employee_status', sa.String(length=50), nullable=True),
+        sa.Column('manager_id', sa.Integer(), nullable=True),
+        sa.Column('address_line1', sa.String(length=255), nullable=True),
+        sa.Column('address_line2', sa.String(length=255), nullable=True),
+        sa.Column('city', sa.String(length=100), nullable=True),
+        sa.Column('state', sa.String(length=100), nullable=True),
+        sa.Column('country', sa.String(length=100), nullable=True),
+        sa.Column('postal_code', sa.String(length=20), nullable=True),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('skills', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_employee_profiles_archive_user_id', 'employee_profiles_archive', ['user_id'], unique=False)
+    op.create_index('ix_employee_profiles_archive_employee_id', 'employee_profiles_archive', ['employee_id'], unique=False)
+
+    op.create_table(
+        'employee_documents_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('document_type', sa.String(length=100), nullable=False),
+        sa.Column('document_name', sa.String(length=255), nullable=False),
+        sa.Column('file_path', sa.String(length=500), nullable=False),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('mime_type', sa.String(length=100), nullable=True),
+        sa.Column('checksum_sha256', sa.String(length=64), nullable=True),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('uploaded_by', sa.Integer(), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), nullable=True),
+        sa.Column('verified_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('verified_by', sa.Integer(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(['employee_id'], ['employee_profiles_archive.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_employee_documents_archive_employee_id', 'employee_documents_archive', ['employee_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employee_documents_archive_employee_id', table_name='employee_documents_archive')
+    op.drop_table('employee_documents_archive')
+    op.drop_index('ix_employee_profiles_archive_employee_id', table_name='employee_profiles_archive')
+    op.drop_index('ix_employee_profiles_archive_user_id', table_name='employee_profiles_archive')
+    op.drop_table('employee_profiles_archive')
+    op.drop_index('ix_employee_documents_employee_id', table_name='employee_documents')
+    op.drop_index('ix_employee_profiles_active_status', table_name='employee_profiles')
+    op.drop_index('ix_employee_profiles_active_department', table_name='employee_profiles')
+    op.drop_index('ix_employee_profiles_active_id', table_name='employee_profiles')
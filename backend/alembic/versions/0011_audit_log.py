@@ -0,0 +1,82 @@
+"""audit log
+
+Adds audit_log: append-only field-level change history. On PostgreSQL it is
+range-partitioned by month on occurred_at, with a default partition and the
+current and next month created here; the audit_partitions maintenance job
+creates later months ahead of time.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 09:10:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _month_start(day: date, months_ahead: int) -> date:
+    month = day.month - 1 + months_ahead
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_log',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=True),
+        sa.Column('request_id', sa.String(length=36), nullable=True),
+        sa.Column('entity', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('action', sa.String(length=10), nullable=False),
+        sa.Column('field', sa.String(length=100), nullable=True),
+        sa.Column('old_value', sa.Text(), nullable=True),
+        sa.Column('new_value', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id', 'occurred_at'),
+        postgresql_partition_by='RANGE (occurred_at)'
+    )
+    op.create_index('ix_audit_log_employee_occurred', 'audit_log', ['employee_id', 'occurred_at'], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
+        today = date.today()
+        for offset in range(2):
+            start = _month_start(today, offset)
+            op.execute(
+                f"CREATE TABLE audit_log_p{start:%Y%m} PARTITION OF audit_log "
+                f"FOR VALUES FROM ('{start}') TO ('{_month_start(start, 1)}')"
+            )
+        op.execute(
+            "CREATE FUNCTION audit_log_append_only() RETURNS trigger AS $$ "
+            "BEGIN RAISE EXCEPTION 'audit_log is append-only'; END "
+            "$$ LANGUAGE plpgsql"
+        )
+        op.execute(
+            "CREATE TRIGGER audit_log_append_only BEFORE UPDATE OR DELETE ON audit_log "
+            "FOR EACH ROW EXECUTE FUNCTION audit_log_append_only()"
+        )
+    else:
+        for operation in ('UPDATE', 'DELETE'):
+            op.execute(
+                f"CREATE TRIGGER audit_log_no_{operation.lower()} BEFORE {operation} ON audit_log "
+                "BEGIN SELECT RAISE(ABORT, 'audit_log is append-only'); END"
+            )
+
+
+def downgrade() -> None:
+    # Dropping the table drops its partitions and triggers
+    op.drop_index('ix_audit_log_employee_occurred', table_name='audit_log')
+    op.drop_table('audit_log')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP FUNCTION audit_log_append_only()")
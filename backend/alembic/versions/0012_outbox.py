@@ -0,0 +1,65 @@
+"""outbox
+
+Adds outbox_events, written in the same transaction as each employee
+change, and webhook_subscriptions for push delivery of those events.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 09:11:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=True),
+        sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('position')
+    )
+    op.create_index(
+        'ix_outbox_events_unpublished', 'outbox_events', ['id'], unique=False,
+        postgresql_where=sa.text('position IS NULL'), sqlite_where=sa.text('position IS NULL')
+    )
+
+    op.create_table(
+        'webhook_subscriptions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('url', sa.String(length=500), nullable=False),
+        sa.Column('secret', sa.String(length=64), nullable=False),
+        sa.Column('event_types', sa.String(length=255), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('cursor', sa.Integer(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('last_delivered_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_webhook_subscriptions_id', 'webhook_subscriptions', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_webhook_subscriptions_id', table_name='webhook_subscriptions')
+    op.drop_table('webhook_subscriptions')
+    op.drop_index('ix_outbox_events_unpublished', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -0,0 +1,53 @@
+"""partial profile indexes
+
+Replaces the full employee_id, manager_id and id indexes on
+employee_profiles with partial indexes on active rows. ix_employee_profiles_id
+and ix_employee_profiles_active_id only duplicated the primary key and are
+dropped.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19 09:13:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014'
+down_revision: Union[str, None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same predicate text the queries render, so the planners match the indexes
+ACTIVE = {
+    'postgresql_where': sa.text('is_active = true'),
+    'sqlite_where': sa.text('is_active = 1'),
+}
+
+
+def upgrade() -> None:
+    op.drop_index('ix_employee_profiles_active_id', table_name='employee_profiles')
+    op.drop_index('ix_employee_profiles_id', table_name='employee_profiles')
+    op.drop_index('ix_employee_profiles_employee_id', table_name='employee_profiles')
+    op.drop_index('ix_employee_profiles_manager_id', table_name='employee_profiles')
+    op.create_index(
+        'ix_employee_profiles_active_employee_id', 'employee_profiles',
+        ['employee_id'], unique=True, **ACTIVE
+    )
+    op.create_index(
+        'ix_employee_profiles_active_manager_id', 'employee_profiles',
+        ['manager_id'], unique=False, **ACTIVE
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employee_profiles_active_manager_id', table_name='employee_profiles')
+    op.drop_index('ix_employee_profiles_active_employee_id', table_name='employee_profiles')
+    op.create_index('ix_employee_profiles_manager_id', 'employee_profiles', ['manager_id'], unique=False)
+    op.create_index('ix_employee_profiles_employee_id', 'employee_profiles', ['employee_id'], unique=True)
+    op.create_index('ix_employee_profiles_id', 'employee_profiles', ['id'], unique=False)
+    op.create_index('ix_employee_profiles_active_id', 'employee_profiles', ['id'], unique=False, **ACTIVE)
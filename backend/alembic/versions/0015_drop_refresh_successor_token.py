@@ -0,0 +1,32 @@
+"""drop refresh successor token
+
+Drops refresh_sessions.successor_token, the plaintext successor kept for
+concurrent refreshes. Refreshes within the grace window now get a new
+token in the same family, so only token hashes are stored.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-19 09:14:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0015'
+down_revision: Union[str, None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('refresh_sessions') as batch_op:
+        batch_op.drop_column('successor_token')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('refresh_sessions') as batch_op:
+        batch_op.add_column(sa.Column('successor_token', sa.String(length=1024), nullable=True))
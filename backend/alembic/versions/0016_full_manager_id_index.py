@@ -0,0 +1,36 @@
+"""full manager_id index
+
+Restores the full manager_id index on employee_profiles in place of the
+partial one from 0014. The self-referencing foreign key's ON DELETE SET
+NULL lookup has no is_active filter, so without it every profile the
+archive job deletes scanned the table.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-19 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0016'
+down_revision: Union[str, None] = '0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_employee_profiles_active_manager_id', table_name='employee_profiles')
+    op.create_index('ix_employee_profiles_manager_id', 'employee_profiles', ['manager_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employee_profiles_manager_id', table_name='employee_profiles')
+    op.create_index(
+        'ix_employee_profiles_active_manager_id', 'employee_profiles', ['manager_id'], unique=False,
+        postgresql_where=sa.text('is_active = true'), sqlite_where=sa.text('is_active = 1')
+    )
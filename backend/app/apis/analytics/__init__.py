@@ -0,0 +1,3 @@
+"""
+Workforce analytics API module.
+"""
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Vectorized workforce computations.
+
+Every function works on whole NumPy columns at once: dates are
+``datetime64[D]`` arrays (NaT for missing) and departments are integer codes,
+so grouping is a single ``np.bincount`` over ``department * buckets + bucket``
+instead of a Python loop over ORM objects.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Tuple
+
+import numpy as np
+
+
+TENURE_EDGES = [1, 2, 5, 10]
+TENURE_LABELS = ["<1y", "1-2y", "2-5y", "5-10y", "10y+", "unknown"]
+
+AGE_EDGES = [25, 35, 45, 55]
+AGE_LABELS = ["<25", "25-34", "35-44", "45-54", "55+", "unknown"]
+
+DAYS_PER_YEAR = 365.25
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# (metric, department, bucket, value)
+SeriesRow = Tuple[str, str, str, int]
+
+
+@dataclass
+class WorkforceColumns:
+    """Column arrays for every profile, active or not."""
+    department: np.ndarray  # str, "" for unassigned
+    joined: np.ndarray      # datetime64[D]
+    left: np.ndarray        # datetime64[D], NaT while still employed
+    birth: np.ndarray       # datetime64[D]
+
+    @classmethod
+    def from_rows(cls, rows) -> "WorkforceColumns":
+        """
+        Build columns from (department, joined, left, birth, is_active, updated_at) tuples.
+        
+        Inactive profiles without a leaving date (deactivated before it was
+        recorded) are treated as having left on their last update.
+        """
+        if not rows:
+            empty = np.array([], dtype="datetime64[D]")
+            return cls(np.array([], dtype=object), empty, empty.copy(), empty.copy())
+
+        department, joined, left, birth, is_active, updated_at = zip(*rows)
+        left = _to_days(left)
+        inactive = ~np.fromiter(map(bool, is_active), dtype=bool, count=len(rows))
+        fallback = inactive & np.isnat(left)
+        if fallback.any():
+            last_update = _to_days([value.date() if value else None for value in updated_at])
+            left[fallback] = last_update[fallback]
+
+        return cls(
+            department=np.array([value or "" for value in department], dtype=object),
+            joined=_to_days(joined),
+            left=left,
+            birth=_to_days(birth),
+        )
+
+
+def _to_days(values) -> np.ndarray:
+    """Convert a sequence of dates (or None) to datetime64[D] via ordinals; much faster than np.array(dates)."""
+    ordinals = np.fromiter(
+        (value.toordinal() if value else 0 for value in values),
+        dtype=np.int64,
+        count=len(values)
+    )
+    days = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+    days[ordinals == 0] = np.datetime64("NaT")
+    return days
+
+def compute_workforce_series(columns: WorkforceColumns, as_of: date, history_months: int) -> List[SeriesRow]:
+    """Compute headcount, joiner, leaver, tenure and age series per department."""
+    departments, dept_codes = np.unique(columns.department.astype(str), return_inverse=True)
+    n_depts = len(departments)
+
+    end_month = np.datetime64(as_of, "M")
+    start_month = end_month - (history_months - 1)
+    month_labels = np.arange(start_month, end_month + 1).astype(str).tolist()
+    n_months = len(month_labels)
+
+    join_offsets = _month_offsets(columns.joined, start_month)
+    leave_offsets = _month_offsets(columns.left, start_month)
+
+    joiners = _grouped_counts(dept_codes, join_offsets, n_depts, n_months)
+    leavers = _grouped_counts(dept_codes, leave_offsets, n_depts, n_months)
+
+    # Headcount at month end = joined on/before m minus left on/before m.
+    # Missing join dates count from the window start; missing leave dates never leave.
+    joined_by = _cumulative_counts(dept_codes, join_offsets, n_depts, n_months, missing=0)
+    left_by = _cumulative_counts(dept_codes, leave_offsets, n_depts, n_months, missing=n_months)
+    headcount = joined_by - left_by
+
+    today = np.datetime64(as_of, "D")
+    employed = (np.isnat(columns.left) | (columns.left > today)) & (
+        np.isnat(columns.joined) | (columns.joined <= today)
+    )
+    tenure = _banded_counts(dept_codes[employed], columns.joined[employed], today, TENURE_EDGES, n_depts)
+    age = _banded_counts(dept_codes[employed], columns.birth[employed], today, AGE_EDGES, n_depts)
+
+    rows: List[SeriesRow] = []
+    for metric, matrix, labels in (
+        ("headcount", headcount, month_labels),
+        ("joiners", joiners, month_labels),
+        ("leavers", leavers, month_labels),
+        ("tenure", tenure, TENURE_LABELS),
+        ("age", age, AGE_LABELS),
+    ):
+        rows.extend(_emit(metric, matrix, departments, labels))
+    return rows
+
+
+def _month_offsets(dates: np.ndarray, start_month: np.datetime64) -> np.ndarray:
+    """Months since the window start, with -1 standing in for NaT (masked by callers)."""
+    offsets = np.full(dates.shape, -1, dtype=np.int64)
+    valid = ~np.isnat(dates)
+    offsets[valid] = (dates[valid].astype("datetime64[M]") - start_month).astype(np.int64)
+    offsets[valid & (offsets < 0)] = -2  # before window, distinct from missing
+    return offsets
+
+
+def _grouped_counts(dept_codes: np.ndarray, offsets: np.ndarray, n_depts: int, n_months: int) -> np.ndarray:
+    """Count events per (department, month) inside the window."""
+    in_window = (offsets >= 0) & (offsets < n_months)
+    flat = dept_codes[in_window] * n_months + offsets[in_window]
+    return np.bincount(flat, minlength=n_depts * n_months).reshape(n_depts, n_months)
+
+
+def _cumulative_counts(
+    dept_codes: np.ndarray,
+    offsets: np.ndarray,
+    n_depts: int,
+    n_months: int,
+    missing: int
+) -> np.ndarray:
+    """Count events on or before each month, per department."""
+    positions = offsets.copy()
+    positions[offsets == -1] = missing
+    positions[offsets == -2] = 0  # before the window counts from its first month
+    positions = np.minimum(positions, n_months)  # after the window falls in an overflow column
+
+    width = n_months + 1
+    counts = np.bincount(dept_codes * width + positions, minlength=n_depts * width)
+    return counts.reshape(n_depts, width)[:, :n_months].cumsum(axis=1)
+
+
+def _banded_counts(
+    dept_codes: np.ndarray,
+    dates: np.ndarray,
+    today: np.datetime64,
+    edges: List[int],
+    n_depts: int
+) -> np.ndarray:
+    """Count (department, band) where band is years elapsed since the date; last band is unknown."""
+    n_bands = len(edges) + 2
+    bands = np.full(dates.shape, n_bands - 1, dtype=np.int64)
+    valid = ~np.isnat(dates)
+    years = (today - dates[valid]).astype(np.int64) / DAYS_PER_YEAR
+    bands[valid] = np.digitize(years, edges)
+
+    flat = dept_codes * n_bands + bands
+    return np.bincount(flat, minlength=n_depts * n_bands).reshape(n_depts, n_bands)
+
+
+def _emit(metric: str, matrix: np.ndarray, departments: np.ndarray, labels: List[str]) -> List[SeriesRow]:
+    """Flatten a (department, bucket) matrix plus its all-department total into rows."""
+    rows: List[SeriesRow] = []
+    totals = matrix.sum(axis=0).tolist()
+    rows.extend((metric, "", label, int(value)) for label, value in zip(labels, totals))
+
+    for department, values in zip(departments.tolist(), matrix.tolist()):
+        if department == "":
+            department = "(unassigned)"
+        rows.extend((metric, department, label, int(value)) for label, value in zip(labels, values))
+    return rows
\ No newline at end of file
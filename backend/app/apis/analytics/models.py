@@ -0,0 +1,56 @@
+import logging
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Date, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.database.base import Base
+
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsSnapshot(Base):
+    """One precomputed run of the workforce analytics batch job."""
+    
+    __tablename__ = "analytics_snapshots"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    as_of = Column(Date, nullable=False)
+    profile_count = Column(Integer, nullable=False, default=0)
+    duration_ms = Column(Integer, nullable=True)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    
+    # Relationships
+    points = relationship(
+        "AnalyticsSeriesPoint",
+        backref="snapshot",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+    
+    def __repr__(self):
+        return f"<AnalyticsSnapshot(id={self.id}, as_of={self.as_of})>"
+
+
+class AnalyticsSeriesPoint(Base):
+    """
+    One value of a precomputed series.
+    
+    Department "" holds the all-department total. Bucket is a month
+    ("2024-05") for time series or a band label for distributions.
+    """
+    
+    __tablename__ = "analytics_series_points"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    snapshot_id = Column(Integer, ForeignKey("analytics_snapshots.id", ondelete="CASCADE"), nullable=False)
+    metric = Column(String(50), nullable=False)  # headcount, joiners, leavers, tenure, age
+    department = Column(String(100), nullable=False, default="")
+    bucket = Column(String(20), nullable=False)
+    value = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_analytics_series_points_lookup", "snapshot_id", "metric", "department"),
+    )
+    
+    def __repr__(self):
+        return f"<AnalyticsSeriesPoint(metric={self.metric}, department={self.department}, bucket={self.bucket})>"
\ No newline at end of file
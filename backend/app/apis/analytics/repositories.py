@@ -0,0 +1,159 @@
+import logging
+from datetime import date
+from typing import Optional, List, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, delete, false, union_all
+
+from app.apis.employees_profile.models import EmployeeProfile, EmployeeProfileArchive
+from .models import AnalyticsSnapshot, AnalyticsSeriesPoint
+
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsRepository:
+    """Repository for workforce analytics snapshots."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def load_workforce_columns(self) -> List[Tuple]:
+        """Fetch the columns the batch job needs for every profile, archived ones included, as plain tuples."""
+        logger.debug("Loading workforce columns")
+        try:
+            stmt = union_all(
+                select(
+                    EmployeeProfile.department,
+                    EmployeeProfile.date_of_joining,
+                    EmployeeProfile.date_of_leaving,
+                    EmployeeProfile.date_of_birth,
+                    EmployeeProfile.is_active,
+                    EmployeeProfile.updated_at
+                ),
+                select(
+                    EmployeeProfileArchive.department,
+                    EmployeeProfileArchive.date_of_joining,
+                    EmployeeProfileArchive.date_of_leaving,
+                    EmployeeProfileArchive.date_of_birth,
+                    false(),
+                    EmployeeProfileArchive.updated_at
+                )
+            )
+            return self.db.execute(stmt.execution_options(yield_per=10000)).all()
+            
+        except Exception as e:
+            logger.error(f"Error loading workforce columns: {str(e)}")
+            raise
+    
+    def get_latest_snapshot(self) -> Optional[AnalyticsSnapshot]:
+        """Get the most recent snapshot."""
+        logger.debug("Fetching latest analytics snapshot")
+        try:
+            return self.db.query(AnalyticsSnapshot).order_by(
+                AnalyticsSnapshot.id.desc()
+            ).first()
+            
+        except Exception as e:
+            logger.error(f"Error fetching latest analytics snapshot: {str(e)}")
+            raise
+    
+    def get_snapshots(self, limit: int = 20) -> List[AnalyticsSnapshot]:
+        """List snapshots, newest first."""
+        logger.debug("Fetching analytics snapshots")
+        try:
+            return self.db.query(AnalyticsSnapshot).order_by(
+                AnalyticsSnapshot.id.desc()
+            ).limit(limit).all()
+            
+        except Exception as e:
+            logger.error(f"Error fetching analytics snapshots: {str(e)}")
+            raise
+    
+    def get_points(
+        self,
+        snapshot_id: int,
+        metric: Optional[str] = None,
+        departments: Optional[List[str]] = None
+    ) -> List[AnalyticsSeriesPoint]:
+        """Get a snapshot's points, optionally narrowed to one metric and some departments."""
+        logger.debug(f"Fetching points for analytics snapshot {snapshot_id}")
+        try:
+            query = self.db.query(AnalyticsSeriesPoint).filter(
+                AnalyticsSeriesPoint.snapshot_id == snapshot_id
+            )
+            if metric:
+                query = query.filter(AnalyticsSeriesPoint.metric == metric)
+            if departments is not None:
+                query = query.filter(AnalyticsSeriesPoint.department.in_(departments))
+            
+            return query.order_by(
+                AnalyticsSeriesPoint.metric,
+                AnalyticsSeriesPoint.department,
+                AnalyticsSeriesPoint.id
+            ).all()
+            
+        except Exception as e:
+            logger.error(f"Error fetching points for analytics snapshot {snapshot_id}: {str(e)}")
+            raise
+    
+    def create_snapshot(
+        self,
+        as_of: date,
+        profile_count: int,
+        duration_ms: int,
+        rows: List[Tuple[str, str, str, int]]
+    ) -> AnalyticsSnapshot:
+        """Store a snapshot and bulk-insert its points in one executemany."""
+        logger.info(f"Storing analytics snapshot as of {as_of} with {len(rows)} points")
+        try:
+            snapshot = AnalyticsSnapshot(
+                as_of=as_of,
+                profile_count=profile_count,
+                duration_ms=duration_ms
+            )
+            self.db.add(snapshot)
+            self.db.flush()
+            
+            if rows:
+                self.db.execute(insert(AnalyticsSeriesPoint), [
+                    {
+                        "snapshot_id": snapshot.id,
+                        "metric": metric,
+                        "department": department,
+                        "bucket": bucket,
+                        "value": value
+                    }
+                    for metric, department, bucket, value in rows
+                ])
+            
+            self.db.flush()
+            return snapshot
+            
+        except Exception as e:
+            logger.error(f"Error storing analytics snapshot: {str(e)}")
+            raise
+    
+    def prune_snapshots(self, keep: int) -> int:
+        """Delete all but the newest `keep` snapshots and their points."""
+        try:
+            kept = select(AnalyticsSnapshot.id).order_by(
+                AnalyticsSnapshot.id.desc()
+            ).limit(keep).scalar_subquery()
+            stale = select(AnalyticsSnapshot.id).where(AnalyticsSnapshot.id.not_in(kept))
+            
+            # Delete points explicitly; not every backend enforces ON DELETE CASCADE
+            self.db.execute(delete(AnalyticsSeriesPoint).where(
+                AnalyticsSeriesPoint.snapshot_id.in_(stale)
+            ))
+            removed = self.db.execute(delete(AnalyticsSnapshot).where(
+                AnalyticsSnapshot.id.in_(stale)
+            )).rowcount
+            self.db.flush()
+            
+            if removed:
+                logger.info(f"Pruned {removed} analytics snapshots")
+            return removed
+            
+        except Exception as e:
+            logger.error(f"Error pruning analytics snapshots: {str(e)}")
+            raise
\ No newline at end of file
@@ -0,0 +1,104 @@
+import logging
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.database.session import get_db, get_read_db
+from app.database.unit_of_work import UnitOfWorkRoute
+from app.apis.employees_profile.policies import Principal
+from app.apis.employees_profile.routers import get_principal
+from .repositories import AnalyticsRepository
+from .services import AnalyticsService
+from .schemas import AnalyticsSnapshotResponse, WorkforceAnalyticsResponse
+
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/api/analytics", tags=["Analytics"], route_class=UnitOfWorkRoute)
+
+
+# ========== DEPENDENCY INJECTION ==========
+
+def get_analytics_service(db: Session = Depends(get_db)) -> AnalyticsService:
+    return AnalyticsService(AnalyticsRepository(db))
+
+
+def get_read_analytics_service(db: Session = Depends(get_read_db)) -> AnalyticsService:
+    return AnalyticsService(AnalyticsRepository(db))
+
+
+def require_admin(principal: Principal = Depends(get_principal)) -> Principal:
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return principal
+
+
+# ========== ROUTES ==========
+
+@router.get("/workforce", response_model=WorkforceAnalyticsResponse)
+async def get_workforce_analytics(
+    request: Request,
+    metric: Optional[str] = None,
+    department: Optional[str] = None,
+    principal: Principal = Depends(get_principal),
+    analytics_service: AnalyticsService = Depends(get_read_analytics_service)
+):
+    """
+    Get precomputed headcount, joiner/leaver, tenure and age series.
+    
+    Admins see every department and the overall total (department "");
+    others see only departments they hold an access grant for.
+    """
+    logger.info("Get workforce analytics endpoint called")
+    
+    allowed_departments = None
+    if not principal.is_admin:
+        if not principal.read_departments:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied"
+            )
+        allowed_departments = sorted(principal.read_departments)
+    
+    return analytics_service.get_workforce(
+        metric=metric,
+        department=department,
+        allowed_departments=allowed_departments
+    )
+
+
+@router.get("/snapshots", response_model=list[AnalyticsSnapshotResponse])
+async def list_snapshots(
+    request: Request,
+    limit: int = 20,
+    principal: Principal = Depends(require_admin),
+    analytics_service: AnalyticsService = Depends(get_read_analytics_service)
+):
+    """
+    List recent analytics snapshots.
+    """
+    logger.info("List analytics snapshots endpoint called")
+    
+    return analytics_service.list_snapshots(limit=min(limit, 100))
+
+
+@router.post("/snapshots", response_model=AnalyticsSnapshotResponse, status_code=status.HTTP_201_CREATED)
+async def compute_snapshot(
+    request: Request,
+    as_of: Optional[date] = None,
+    principal: Principal = Depends(require_admin),
+    analytics_service: AnalyticsService = Depends(get_analytics_service)
+):
+    """
+    Run the analytics batch job now and store a new snapshot.
+    """
+    logger.info("Compute analytics snapshot endpoint called")
+    
+    # CPU-bound batch work; keep it off the event loop
+    return await run_in_threadpool(analytics_service.compute_snapshot, as_of)
\ No newline at end of file
@@ -0,0 +1,34 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date, datetime
+
+
+class SeriesPoint(BaseModel):
+    """One bucket of a series."""
+    bucket: str
+    value: int
+
+
+class WorkforceSeries(BaseModel):
+    """One metric for one department; department "" is the all-department total."""
+    metric: str
+    department: str
+    points: List[SeriesPoint]
+
+
+class AnalyticsSnapshotResponse(BaseModel):
+    """Schema for analytics snapshot metadata."""
+    id: int
+    as_of: date
+    profile_count: int
+    duration_ms: Optional[int] = None
+    computed_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class WorkforceAnalyticsResponse(BaseModel):
+    """Precomputed workforce series from the latest snapshot."""
+    snapshot: AnalyticsSnapshotResponse
+    series: List[WorkforceSeries]
\ No newline at end of file
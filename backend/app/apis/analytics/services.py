@@ -0,0 +1,141 @@
+import logging
+import time
+from datetime import date
+from typing import List, Optional
+from fastapi import HTTPException, status
+
+from .repositories import AnalyticsRepository
+from .schemas import (
+    SeriesPoint,
+    WorkforceSeries,
+    AnalyticsSnapshotResponse,
+    WorkforceAnalyticsResponse
+)
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("headcount", "joiners", "leavers", "tenure", "age")
+
+
+class AnalyticsService:
+    """Service computing and serving precomputed workforce analytics."""
+    
+    def __init__(self, analytics_repo: AnalyticsRepository):
+        self.analytics_repo = analytics_repo
+    
+    def compute_snapshot(self, as_of: Optional[date] = None) -> AnalyticsSnapshotResponse:
+        """Run the batch job: load columns in bulk, compute all series vectorized, store a snapshot."""
+        as_of = as_of or date.today()
+        logger.info(f"Computing workforce analytics snapshot as of {as_of}")
+        
+        try:
+            # NumPy is only needed by this batch job; keep it out of worker boot
+            from .computations import WorkforceColumns, compute_workforce_series
+            
+            started = time.perf_counter()
+            
+            rows = self.analytics_repo.load_workforce_columns()
+            columns = WorkforceColumns.from_rows(rows)
+            series = compute_workforce_series(columns, as_of, settings.ANALYTICS_HISTORY_MONTHS)
+            
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            snapshot = self.analytics_repo.create_snapshot(
+                as_of=as_of,
+                profile_count=len(rows),
+                duration_ms=duration_ms,
+                rows=series
+            )
+            self.analytics_repo.prune_snapshots(settings.ANALYTICS_SNAPSHOTS_KEEP)
+            
+            logger.info(
+                f"Analytics snapshot {snapshot.id} computed from {len(rows)} profiles "
+                f"in {duration_ms}ms ({len(series)} points)"
+            )
+            return AnalyticsSnapshotResponse.from_orm(snapshot)
+            
+        except Exception as e:
+            logger.exception(f"Error computing analytics snapshot: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def list_snapshots(self, limit: int = 20) -> List[AnalyticsSnapshotResponse]:
+        """List recent snapshots."""
+        logger.info("Listing analytics snapshots")
+        
+        try:
+            snapshots = self.analytics_repo.get_snapshots(limit=limit)
+            return [AnalyticsSnapshotResponse.from_orm(snapshot) for snapshot in snapshots]
+            
+        except Exception as e:
+            logger.exception(f"Error listing analytics snapshots: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def get_workforce(
+        self,
+        metric: Optional[str] = None,
+        department: Optional[str] = None,
+        allowed_departments: Optional[List[str]] = None
+    ) -> WorkforceAnalyticsResponse:
+        """
+        Serve series from the latest snapshot.
+        
+        allowed_departments=None means unrestricted (including the "" total);
+        otherwise only those departments' series are returned.
+        """
+        logger.info(f"Getting workforce analytics: metric={metric}, department={department}")
+        
+        try:
+            if metric and metric not in METRICS:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown metric. Expected one of: {', '.join(METRICS)}"
+                )
+            
+            departments = allowed_departments
+            if department is not None:
+                if allowed_departments is not None and department not in allowed_departments:
+                    raise HTTPException(
+                        status_code=status.HTTP_403_FORBIDDEN,
+                        detail="Access denied"
+                    )
+                departments = [department]
+            
+            snapshot = self.analytics_repo.get_latest_snapshot()
+            if not snapshot:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="No analytics snapshot has been computed yet"
+                )
+            
+            points = self.analytics_repo.get_points(
+                snapshot.id,
+                metric=metric,
+                departments=departments
+            )
+            
+            series = []
+            for point in points:
+                if not series or (series[-1].metric, series[-1].department) != (point.metric, point.department):
+                    series.append(WorkforceSeries(metric=point.metric, department=point.department, points=[]))
+                series[-1].points.append(SeriesPoint(bucket=point.bucket, value=point.value))
+            
+            return WorkforceAnalyticsResponse(
+                snapshot=AnalyticsSnapshotResponse.from_orm(snapshot),
+                series=series
+            )
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error getting workforce analytics: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Audit trail API module.
+"""
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Audit entries from the session's collected row changes.
+
+Changes are collected by app.database.changes (flushed rows, and bulk
+statements reported with `record_change()`). Nothing is written per flush:
+at commit the audited changes go out as one multi-row INSERT in the same
+transaction, so a request pays a single extra statement however many
+fields it touched, and the audit entries commit or roll back with the
+change itself. Updates give one entry per changed field; creates and
+deletes one entry holding the row.
+"""
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.apis.employees_profile.models import EmployeeProfile, EmployeeDocument
+from app.database.changes import RowChange, on_commit_changes
+from .models import AuditLogEntry
+
+
+logger = logging.getLogger(__name__)
+
+_ACTOR_KEY = "audit_actor"
+
+# Audited models: entity name and how to find the profile a row belongs to
+AUDITED: Dict[type, Tuple[str, Callable[[RowChange], int]]] = {
+    EmployeeProfile: ("employee_profile", lambda change: change.row_id),
+    EmployeeDocument: ("employee_document", lambda change: change.values.get("employee_id")),
+}
+
+# Maintained by the database, not by anyone making a change
+IGNORED_FIELDS = {"created_at", "updated_at"}
+
+
+def set_actor(session: Session, user_id: Optional[int], request_id: Optional[str] = None):
+    """Attribute the session's changes to a user (and request)."""
+    session.info[_ACTOR_KEY] = (user_id, request_id)
+
+
+def _dump(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, default=str)
+
+
+def _snapshot(change: RowChange) -> Optional[str]:
+    return _dump({
+        key: value for key, value in change.values.items()
+        if key not in IGNORED_FIELDS and value is not None
+    })
+
+
+def _entries(change: RowChange) -> List[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+    """(action, field, old_value, new_value) for each audit entry of a change."""
+    if change.action == "create":
+        return [("create", None, None, _snapshot(change))]
+    if change.action == "delete":
+        return [("delete", None, _snapshot(change), None)]
+    return [
+        ("update", field, _dump(old), _dump(new))
+        for field, (old, new) in change.changed.items()
+        if field not in IGNORED_FIELDS
+    ]
+
+
+@on_commit_changes(*AUDITED)
+def _write_entries(session: Session, changes: List[RowChange]):
+    occurred_at = datetime.now(timezone.utc)
+    actor_id, request_id = session.info.get(_ACTOR_KEY, (None, None))
+    rows = []
+    for change in changes:
+        entity, employee_of = AUDITED[change.model]
+        for action, field, old_value, new_value in _entries(change):
+            rows.append({
+                "id": uuid.uuid4().hex,
+                "occurred_at": occurred_at,
+                "actor_id": actor_id,
+                "request_id": request_id,
+                "entity": entity,
+                "entity_id": change.row_id,
+                "employee_id": employee_of(change),
+                "action": action,
+                "field": field,
+                "old_value": old_value,
+                "new_value": new_value,
+            })
+    if not rows:
+        return
+    
+    session.execute(insert(AuditLogEntry), rows)
+    logger.debug(f"Wrote {len(rows)} audit entries")
\ No newline at end of file
@@ -0,0 +1,40 @@
+import logging
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from app.database.base import Base
+
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogEntry(Base):
+    """
+    One recorded change to an audited row.
+    
+    Updates produce one entry per changed field; creates and deletes one
+    entry holding the row as JSON. The table is append-only (enforced by
+    triggers) and, on PostgreSQL, range-partitioned by month on occurred_at,
+    so old months can be detached or moved to cheap storage as a whole.
+    """
+    
+    __tablename__ = "audit_log"
+    
+    id = Column(String(32), primary_key=True)  # uuid4 hex; the partition key must be part of the key
+    occurred_at = Column(DateTime(timezone=True), primary_key=True)  # commit time of the transaction
+    actor_id = Column(Integer, nullable=True)  # users.id, no FK so entries outlive users
+    request_id = Column(String(36), nullable=True)
+    
+    entity = Column(String(50), nullable=False)  # employee_profile, employee_document
+    entity_id = Column(Integer, nullable=False)
+    employee_id = Column(Integer, nullable=False)  # profile the change belongs to
+    action = Column(String(10), nullable=False)  # create, update, delete
+    field = Column(String(100), nullable=True)
+    old_value = Column(Text, nullable=True)  # JSON
+    new_value = Column(Text, nullable=True)  # JSON
+    
+    __table_args__ = (
+        Index("ix_audit_log_employee_occurred", "employee_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+    
+    def __repr__(self):
+        return f"<AuditLogEntry(entity={self.entity}, entity_id={self.entity_id}, action={self.action})>"
\ No newline at end of file
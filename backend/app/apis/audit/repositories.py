@@ -0,0 +1,77 @@
+import logging
+from datetime import date
+from typing import List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from .models import AuditLogEntry
+
+
+logger = logging.getLogger(__name__)
+
+
+def _month_start(day: date, months_ahead: int = 0) -> date:
+    month = day.month - 1 + months_ahead
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"audit_log_p{month:%Y%m}"
+
+
+class AuditLogRepository:
+    """Repository for the append-only audit log."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_history(
+        self,
+        employee_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        entity: Optional[str] = None
+    ) -> Tuple[List[AuditLogEntry], int]:
+        """An employee's audit entries, newest first, with the total count."""
+        logger.debug(f"Fetching audit history for employee {employee_id}")
+        
+        try:
+            query = self.db.query(AuditLogEntry).filter(AuditLogEntry.employee_id == employee_id)
+            if entity:
+                query = query.filter(AuditLogEntry.entity == entity)
+            
+            total = query.count()
+            entries = query.order_by(
+                AuditLogEntry.occurred_at.desc(),
+                AuditLogEntry.id
+            ).offset(skip).limit(limit).all()
+            return entries, total
+            
+        except Exception as e:
+            logger.error(f"Error fetching audit history for employee {employee_id}: {str(e)}")
+            raise
+    
+    def ensure_partitions(self, today: date, months_ahead: int) -> int:
+        """
+        Create monthly partitions from this month through months_ahead.
+        
+        Rows outside every monthly partition land in audit_log_default, so
+        creating partitions ahead of time keeps that one empty. Returns the
+        number created; no-op on databases without partitioning.
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return 0
+        
+        created = 0
+        for offset in range(months_ahead + 1):
+            start = _month_start(today, offset)
+            name = partition_name(start)
+            if self.db.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+                continue
+            self.db.execute(text(
+                f"CREATE TABLE {name} PARTITION OF audit_log "
+                f"FOR VALUES FROM ('{start}') TO ('{_month_start(start, 1)}')"
+            ))
+            logger.info(f"Created audit log partition {name}")
+            created += 1
+        return created
\ No newline at end of file
@@ -0,0 +1,52 @@
+import logging
+from typing import Optional
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from app.database.session import get_read_db
+from app.database.unit_of_work import UnitOfWorkRoute
+from app.apis.employees_profile.policies import Principal
+from app.apis.analytics.routers import require_admin
+from .repositories import AuditLogRepository
+from .services import AuditService
+from .schemas import AuditHistoryResponse
+
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/api/audit", tags=["Audit"], route_class=UnitOfWorkRoute)
+
+
+# ========== DEPENDENCY INJECTION ==========
+
+def get_audit_service(db: Session = Depends(get_read_db)) -> AuditService:
+    return AuditService(AuditLogRepository(db))
+
+
+# ========== ROUTES ==========
+
+@router.get("/employees/{employee_id}", response_model=AuditHistoryResponse)
+async def get_employee_history(
+    request: Request,
+    employee_id: int,
+    skip: int = 0,
+    limit: int = 50,
+    entity: Optional[str] = None,
+    principal: Principal = Depends(require_admin),
+    audit_service: AuditService = Depends(get_audit_service)
+):
+    """
+    Get who changed what on an employee's profile and documents, newest first.
+    Works for deleted and archived employees too.
+    
+    - **entity**: employee_profile or employee_document
+    """
+    logger.info(f"Get audit history endpoint called for employee: {employee_id}")
+    
+    return audit_service.get_employee_history(
+        employee_id,
+        skip=skip,
+        limit=min(limit, 200),
+        entity=entity
+    )
\ No newline at end of file
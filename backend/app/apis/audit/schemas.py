@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+
+class AuditEntryResponse(BaseModel):
+    """Schema for one audit log entry; values are JSON text."""
+    id: str
+    occurred_at: datetime
+    actor_id: Optional[int] = None
+    request_id: Optional[str] = None
+    entity: str
+    entity_id: int
+    employee_id: int
+    action: str
+    field: Optional[str] = None
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class AuditHistoryResponse(BaseModel):
+    """Schema for a page of an employee's audit history."""
+    items: List[AuditEntryResponse]
+    total: int
+    page: int
+    size: int
+    pages: int
\ No newline at end of file
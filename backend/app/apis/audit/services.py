@@ -0,0 +1,44 @@
+import logging
+from typing import Optional
+from fastapi import HTTPException, status
+
+from .repositories import AuditLogRepository
+from .schemas import AuditEntryResponse, AuditHistoryResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class AuditService:
+    """Service for reading the audit trail."""
+    
+    def __init__(self, audit_repo: AuditLogRepository):
+        self.audit_repo = audit_repo
+    
+    def get_employee_history(
+        self,
+        employee_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        entity: Optional[str] = None
+    ) -> AuditHistoryResponse:
+        """Get a page of an employee's change history, newest first."""
+        logger.info(f"Getting audit history for employee {employee_id}")
+        
+        try:
+            entries, total = self.audit_repo.get_history(employee_id, skip=skip, limit=limit, entity=entity)
+            
+            return AuditHistoryResponse(
+                items=[AuditEntryResponse.from_orm(entry) for entry in entries],
+                total=total,
+                page=skip // limit + 1 if limit > 0 else 1,
+                size=limit,
+                pages=(total + limit - 1) // limit if limit > 0 else 0
+            )
+            
+        except Exception as e:
+            logger.exception(f"Error getting audit history for employee {employee_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
\ No newline at end of file
@@ -1,5 +1,6 @@
 import logging
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.base import Base
 
@@ -17,6 +18,8 @@ class User(Base):
     name = Column(String(100), nullable=True)
     picture = Column(String(500), nullable=True)
     refresh_token = Column(String(1024), nullable=True)
+    # Access tokens issued (iat) before this instant are rejected (logout)
+    tokens_revoked_at = Column(DateTime(timezone=True), nullable=True)
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
     last_login = Column(DateTime(timezone=True), server_default=func.now())
@@ -28,4 +31,31 @@ class User(Base):
     )
     
     def __repr__(self):
-        return f"<User(id={self.id}, email={self.email})>"
\ No newline at end of file
+        return f"<User(id={self.id}, email={self.email})>"
+
+
+class RefreshSession(Base):
+    """
+    One issued refresh token. Tokens rotated from the same login share a
+    family; presenting a rotated token after the grace window revokes it.
+    """
+    
+    __tablename__ = "refresh_sessions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    family_id = Column(String(32), nullable=False, index=True)  # uuid4 hex, one per login
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)  # SHA-256 of the token
+    
+    # Set on rotation; only the successor's hash is stored, like every token
+    successor_id = Column(Integer, ForeignKey("refresh_sessions.id", ondelete="SET NULL"), nullable=True)
+    rotated_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    
+    user = relationship("User")
+    
+    def __repr__(self):
+        return f"<RefreshSession(id={self.id}, family_id={self.family_id})>"
\ No newline at end of file
@@ -1,8 +1,14 @@
+import hashlib
 import logging
+import uuid
+from datetime import datetime, timezone
 from typing import Optional
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from .models import User
+from app.database.unit_of_work import savepoint
+from .models import User, RefreshSession
 
 
 logger = logging.getLogger(__name__)
@@ -14,6 +20,15 @@ class UserRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        logger.debug(f"Fetching user by ID: {user_id}")
+        try:
+            return self.db.query(User).filter(User.id == user_id).first()
+        except Exception as e:
+            logger.error(f"Error fetching user by ID {user_id}: {str(e)}")
+            raise
+    
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         logger.debug(f"Fetching user by email: {email}")
@@ -59,15 +74,22 @@ class UserRepository:
                 picture=picture
             )
             
-            self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
+            # Savepoint: a concurrent first login may insert the same email,
+            # which must not abort the rest of the request's transaction
+            with savepoint(self.db):
+                self.db.add(user)
+                self.db.flush()
             
             logger.info(f"User created successfully: {user.email}")
             return user
             
+        except IntegrityError:
+            existing = self.get_by_email(email)
+            if existing:
+                logger.info(f"User created concurrently, using existing: {email}")
+                return existing
+            raise
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error creating user {email}: {str(e)}")
             raise
     
@@ -81,14 +103,12 @@ class UserRepository:
                     setattr(user, key, value)
                     logger.debug(f"Updated {key} for user {user.email}")
             
-            self.db.commit()
-            self.db.refresh(user)
+            self.db.flush()
             
             logger.debug(f"User updated successfully: {user.email}")
             return user
             
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error updating user {user.email}: {str(e)}")
             raise
     
@@ -99,24 +119,138 @@ class UserRepository:
         user = self.get_by_email(email)
         if user:
             user.refresh_token = refresh_token
-            self.db.commit()
-            self.db.refresh(user)
+            self.db.flush()
             logger.debug(f"Refresh token updated for user: {email}")
         else:
             logger.warning(f"User not found for refresh token update: {email}")
         
         return user
     
+    def clear_stale_refresh_tokens(self, cutoff: datetime, limit: int) -> int:
+        """Null out legacy users.refresh_token values not rotated since cutoff (long expired)."""
+        ids = [
+            row.id for row in self.db.query(User.id)
+            .filter(User.refresh_token.isnot(None), User.updated_at < cutoff)
+            .limit(limit)
+        ]
+        if not ids:
+            return 0
+        cleared = self.db.execute(
+            update(User).where(User.id.in_(ids)).values(refresh_token=None)
+        ).rowcount
+        logger.debug(f"Cleared {cleared} stale refresh tokens")
+        return cleared
+    
     def clear_refresh_token(self, email: str) -> bool:
-        """Clear user's refresh token (logout)."""
+        """Clear user's refresh token and revoke their issued access tokens (logout)."""
         logger.debug(f"Clearing refresh token for user: {email}")
         
         user = self.get_by_email(email)
         if user:
             user.refresh_token = None
-            self.db.commit()
+            user.tokens_revoked_at = datetime.now(timezone.utc)
+            self.db.flush()
             logger.debug(f"Refresh token cleared for user: {email}")
             return True
         
         logger.warning(f"User not found for token clearance: {email}")
-        return False
\ No newline at end of file
+        return False
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class _RotationLost(Exception):
+    """A concurrent refresh rotated the session first."""
+
+
+class RefreshSessionRepository:
+    """Repository for refresh token sessions and their families."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_by_token(self, token: str, for_update: bool = False) -> Optional[RefreshSession]:
+        """
+        Get the session for a refresh token.
+        
+        With for_update the row is locked (SELECT ... FOR UPDATE), so a
+        concurrent refresh of the same token waits for this transaction and
+        then reads its rotation.
+        """
+        query = self.db.query(RefreshSession).filter(RefreshSession.token_hash == hash_token(token))
+        if for_update:
+            query = query.with_for_update().populate_existing()
+        return query.first()
+    
+    def create(self, user_id: int, token: str, expires_at: datetime, family_id: Optional[str] = None) -> RefreshSession:
+        """Record an issued refresh token; a new family unless family_id is given."""
+        session = RefreshSession(
+            user_id=user_id,
+            family_id=family_id or uuid.uuid4().hex,
+            token_hash=hash_token(token),
+            expires_at=expires_at
+        )
+        self.db.add(session)
+        self.db.flush()
+        logger.debug(f"Refresh session created in family {session.family_id} for user {user_id}")
+        return session
+    
+    def rotate(self, session: RefreshSession, successor_token: str, expires_at: datetime) -> bool:
+        """
+        Replace session with a successor in the same family.
+        
+        The claim is a conditional UPDATE on an unrotated, unrevoked row, so
+        only one of several concurrent refreshes wins even without row locks
+        (SQLite). Returns False when another refresh won.
+        """
+        try:
+            with savepoint(self.db):
+                successor = self.create(session.user_id, successor_token, expires_at, family_id=session.family_id)
+                claimed = self.db.execute(
+                    update(RefreshSession)
+                    .where(
+                        RefreshSession.id == session.id,
+                        RefreshSession.rotated_at.is_(None),
+                        RefreshSession.revoked_at.is_(None)
+                    )
+                    .values(rotated_at=datetime.now(timezone.utc), successor_id=successor.id)
+                ).rowcount
+                if not claimed:
+                    raise _RotationLost()
+        except _RotationLost:
+            logger.debug(f"Refresh session {session.id} was rotated concurrently")
+            return False
+        return True
+    
+    def revoke_family(self, family_id: str) -> int:
+        """Revoke every session of a family (reuse detected or logout)."""
+        revoked = self.db.execute(
+            update(RefreshSession)
+            .where(RefreshSession.family_id == family_id, RefreshSession.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        ).rowcount
+        logger.debug(f"Revoked {revoked} refresh sessions in family {family_id}")
+        return revoked
+    
+    def purge_expired(self, user_id: Optional[int] = None, limit: int = 1000) -> int:
+        """Delete sessions whose token has expired (optionally for one user)."""
+        ids = self.db.query(RefreshSession.id).filter(
+            RefreshSession.expires_at < datetime.now(timezone.utc)
+        )
+        if user_id is not None:
+            ids = ids.filter(RefreshSession.user_id == user_id)
+        ids = [row.id for row in ids.limit(limit).all()]
+        if not ids:
+            return 0
+        
+        # Older rows may point at purged ones as their successor; detach first
+        self.db.execute(
+            update(RefreshSession).where(RefreshSession.successor_id.in_(ids)).values(successor_id=None)
+        )
+        deleted = self.db.query(RefreshSession).filter(
+            RefreshSession.id.in_(ids)
+        ).delete(synchronize_session=False)
+        logger.debug(f"Purged {deleted} expired refresh sessions")
+        return deleted
\ No newline at end of file
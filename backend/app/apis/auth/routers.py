@@ -2,9 +2,10 @@ import logging
 from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
-from app.database.session import SessionLocal  # ✅ Import SessionLocal, not get_db
-from .repositories import UserRepository
-from .services import AuthService
+from app.database.session import get_db
+from app.database.unit_of_work import UnitOfWorkRoute
+from .repositories import UserRepository, RefreshSessionRepository
+from .services import AuthService, RefreshTokenReused
 from .schemas import (
     GoogleTokenRequest,
     LoginResponse,
@@ -17,29 +18,18 @@ from .schemas import (
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/auth", tags=["Authentication"])
-
-
-# FIXED: Dependency injection
-def get_db() -> Session:
-    """FastAPI dependency for database session."""
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+router = APIRouter(prefix="/api/auth", tags=["Authentication"], route_class=UnitOfWorkRoute)
 
 
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
     return UserRepository(db)
 
 
-def get_auth_service(user_repo: UserRepository = Depends(get_user_repository)) -> AuthService:
-    return AuthService(user_repo)
+def get_auth_service(
+    db: Session = Depends(get_db),
+    user_repo: UserRepository = Depends(get_user_repository)
+) -> AuthService:
+    return AuthService(user_repo, RefreshSessionRepository(db))
 
 
 @router.post("/google-login", response_model=LoginResponse)
@@ -73,7 +63,12 @@ async def refresh_token(
     - Rotates: Refresh token (security best practice)
     """
     logger.info("Token refresh endpoint called")
-    return auth_service.refresh_access_token(request, response)
+    try:
+        return auth_service.refresh_access_token(request, response)
+    except RefreshTokenReused:
+        # The family revocation must persist although the request fails
+        request.state.uow.commit()
+        raise
 
 
 @router.post("/logout", response_model=LogoutResponse)
@@ -1,22 +1,63 @@
 import logging
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, Dict, Any
 from fastapi import HTTPException, status, Response
 
 from app.core.security import security_service
 from app.core.constants import REFRESH_TOKEN_COOKIE_NAME
 from app.core.config import settings
-from .repositories import UserRepository
+from app.core.metrics import metrics
+from .models import User, RefreshSession
+from .repositories import UserRepository, RefreshSessionRepository
 from .schemas import LoginResponse, UserResponse, TokenResponse
 
 
 logger = logging.getLogger(__name__)
 
 
+refresh_counter = metrics.counter(
+    "hrms_auth_refresh_total",
+    "Refresh outcomes (rotated, grace_reuse, reuse_detected, rejected, legacy_adopted)"
+)
+login_counter = metrics.counter("hrms_auth_logins_total", "Completed Google logins")
+
+
+class RefreshTokenReused(HTTPException):
+    """
+    A rotated refresh token was presented after the grace window. Its family
+    is revoked, and the route commits that even though the request fails.
+    """
+    
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or revoked refresh token"
+        )
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:  # SQLite returns naive UTC
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _issued_before(payload: Dict[str, Any], revoked_at: Optional[datetime]) -> bool:
+    """Whether the token was issued before the user's last revocation."""
+    if revoked_at is None:
+        return False
+    return payload.get("iat", 0) < _utc(revoked_at).timestamp()
+
+
+def _refresh_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_EXPIRE_DAYS)
+
+
 class AuthService:
     """Service for authentication business logic."""
     
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, session_repo: Optional[RefreshSessionRepository] = None):
         self.user_repo = user_repo
+        self.session_repo = session_repo  # login, refresh and logout only
     
     def google_login(self, google_token: str, response: Response) -> LoginResponse:
         """Handle Google OAuth login."""
@@ -51,8 +92,10 @@ class AuthService:
             access_token, expires_in = security_service.create_access_token(email)
             refresh_token = security_service.create_refresh_token(email)
             
-            # Update refresh token in database
-            self.user_repo.update_refresh_token(email, refresh_token)
+            # Each login starts a new refresh token family
+            self.session_repo.purge_expired(user_id=user.id)
+            self.session_repo.create(user.id, refresh_token, _refresh_expiry())
+            login_counter.inc()
             
             # Set refresh token cookie
             self._set_refresh_token_cookie(response, refresh_token)
@@ -77,7 +120,15 @@ class AuthService:
             )
     
     def refresh_access_token(self, request, response: Response) -> TokenResponse:
-        """Refresh access token using refresh token."""
+        """
+        Refresh access token using refresh token.
+        
+        The token's session row is locked, so concurrent refreshes (several
+        tabs) serialize: the first rotates it, the others find it rotated
+        within REFRESH_REUSE_GRACE_SECONDS and each get a new token in the
+        same family. A rotated token presented after the grace window is
+        treated as stolen and its whole family is revoked.
+        """
         logger.info("Processing token refresh")
         
         try:
@@ -101,10 +152,18 @@ class AuthService:
             
             email = payload.get("sub")
             
-            # Verify token against database
-            user = self.user_repo.get_by_refresh_token(refresh_token)
-            if not user or user.email != email:
+            # Verify token against its session
+            session = self.session_repo.get_by_token(refresh_token, for_update=True)
+            if session is None:
+                session = self._adopt_legacy_token(refresh_token, email)
+            if (
+                session is None
+                or session.revoked_at is not None
+                or session.user.email != email
+                or not session.user.is_active
+            ):
                 logger.warning(f"Invalid or revoked refresh token for user: {email}")
+                refresh_counter.inc(result="rejected")
                 # Clear invalid cookie
                 self._clear_refresh_token_cookie(response)
                 raise HTTPException(
@@ -112,9 +171,7 @@ class AuthService:
                     detail="Invalid or revoked refresh token"
                 )
             
-            # Refresh token rotation: create new refresh token
-            new_refresh_token = security_service.create_refresh_token(email)
-            self.user_repo.update_refresh_token(email, new_refresh_token)
+            new_refresh_token = self._rotate(session, refresh_token, email)
             
             # Set new refresh token cookie
             self._set_refresh_token_cookie(response, new_refresh_token)
@@ -137,6 +194,51 @@ class AuthService:
                 detail="Internal server error during token refresh"
             )
     
+    def _rotate(self, session: RefreshSession, refresh_token: str, email: str) -> str:
+        """
+        Return a new refresh token in the session's family.
+        
+        The first refresh rotates the session. Refreshes that find it rotated
+        within the grace window get a token of their own; the successor is
+        only stored hashed, so it cannot be handed out again.
+        """
+        if session.rotated_at is None:
+            new_refresh_token = security_service.create_refresh_token(email)
+            if self.session_repo.rotate(session, new_refresh_token, _refresh_expiry()):
+                refresh_counter.inc(result="rotated")
+                return new_refresh_token
+            # Lost the race to a concurrent refresh; read its rotation
+            session = self.session_repo.get_by_token(refresh_token, for_update=True)
+        
+        grace = timedelta(seconds=settings.REFRESH_REUSE_GRACE_SECONDS)
+        if (
+            session.revoked_at is None
+            and session.rotated_at is not None
+            and datetime.now(timezone.utc) - _utc(session.rotated_at) <= grace
+        ):
+            new_refresh_token = security_service.create_refresh_token(email)
+            self.session_repo.create(session.user_id, new_refresh_token, _refresh_expiry(), family_id=session.family_id)
+            refresh_counter.inc(result="grace_reuse")
+            logger.info(f"Concurrent refresh for {email}; issued another token in family {session.family_id}")
+            return new_refresh_token
+        
+        refresh_counter.inc(result="reuse_detected")
+        logger.warning(f"Rotated refresh token reused for {email}; revoking family {session.family_id}")
+        self.session_repo.revoke_family(session.family_id)
+        raise RefreshTokenReused()
+    
+    def _adopt_legacy_token(self, refresh_token: str, email: str) -> Optional[RefreshSession]:
+        """Move a token issued before refresh sessions (users.refresh_token) into a new family."""
+        user = self.user_repo.get_by_refresh_token(refresh_token)
+        if not user or user.email != email:
+            return None
+        
+        user.refresh_token = None
+        session = self.session_repo.create(user.id, refresh_token, _refresh_expiry())
+        refresh_counter.inc(result="legacy_adopted")
+        logger.info(f"Adopted legacy refresh token for user: {email}")
+        return session
+    
     def logout(self, request, response: Response) -> Dict[str, str]:
         """Handle user logout."""
         logger.info("Processing logout")
@@ -152,8 +254,13 @@ class AuthService:
                     email = payload.get("sub")
                     
                     # Clear refresh token from database
+                    session = self.session_repo.get_by_token(refresh_token)
+                    if session:
+                        self.session_repo.revoke_family(session.family_id)
+                    
                     if email:
                         self.user_repo.clear_refresh_token(email)
+                        security_service.revoke_tokens(email, datetime.now(timezone.utc))
                         logger.info(f"Logout successful for user: {email}")
                     else:
                         logger.warning("No email found in refresh token during logout")
@@ -178,6 +285,10 @@ class AuthService:
     
     def get_current_user(self, request) -> UserResponse:
         """Get current authenticated user from access token."""
+        return UserResponse.from_orm(self.authenticate(request))
+    
+    def authenticate(self, request) -> User:
+        """Resolve the access token to an active, non-revoked user row."""
         logger.debug("Getting current user")
         
         try:
@@ -211,8 +322,17 @@ class AuthService:
                     detail="User account is inactive"
                 )
             
+            if _issued_before(payload, user.tokens_revoked_at):
+                logger.warning(f"Revoked access token presented for user: {email}")
+                # Other workers learn of the logout here; cache the mark locally
+                security_service.revoke_tokens(email, user.tokens_revoked_at)
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid or expired token"
+                )
+            
             logger.debug(f"Current user retrieved: {email}")
-            return UserResponse.from_orm(user)
+            return user
             
         except HTTPException:
             raise
@@ -0,0 +1,60 @@
+"""
+Sparse fieldsets for employee responses.
+
+`fields=id,first_name,last_name,department,position` limits each profile
+to the named response fields. Repositories select only the matching
+columns, and the payload is serialized with a trimmed copy of the response
+model, so list views neither read nor send columns they do not show.
+"""
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+
+# Always returned, so every sparse item stays addressable
+ALWAYS_INCLUDED = ("id",)
+
+
+def parse_fields(raw: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a comma-separated `fields` value against a response model.
+    
+    Returns None (all fields) when the parameter is absent, otherwise id
+    followed by the requested names in schema order, so equal fieldsets
+    share cache keys.
+    """
+    if raw is None:
+        return None
+    
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    if not requested:
+        raise ValueError("fields must name at least one field")
+    unknown = sorted(requested - set(model.model_fields))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    
+    return ALWAYS_INCLUDED + tuple(
+        name for name in model.model_fields if name in requested and name not in ALWAYS_INCLUDED
+    )
+
+
+@lru_cache(maxsize=256)
+def sparse_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """Copy of a response model with only the given fields, built once per fieldset."""
+    return create_model(
+        f"{model.__name__}Sparse",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields}
+    )
+
+
+@lru_cache(maxsize=256)
+def with_field(model: Type[BaseModel], name: str, annotation) -> Type[BaseModel]:
+    """Subclass of a wrapper model whose field `name` holds sparse items instead."""
+    field = model.model_fields[name]
+    return create_model(
+        f"{model.__name__}Sparse",
+        __base__=model,
+        **{name: (annotation, ... if field.is_required() else field.default)}
+    )
\ No newline at end of file
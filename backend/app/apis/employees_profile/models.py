@@ -1,5 +1,5 @@
 import logging
-from sqlalchemy import Column, Integer, String, DateTime, Date, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Date, Boolean, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database.base import Base
@@ -13,11 +13,11 @@ class EmployeeProfile(Base):
     
     __tablename__ = "employee_profiles"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
     
     # Personal Information
-    employee_id = Column(String(50), unique=True, index=True, nullable=False)
+    employee_id = Column(String(50), nullable=False)
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
     date_of_birth = Column(Date, nullable=True)
@@ -35,7 +35,9 @@ class EmployeeProfile(Base):
     position = Column(String(100), nullable=True)
     employment_type = Column(String(50), nullable=True)  # Full-time, Part-time, Contract
     date_of_joining = Column(Date, nullable=True)
+    date_of_leaving = Column(Date, nullable=True)
     employee_status = Column(String(50), default="Active")  # Active, Inactive, On Leave
+    manager_id = Column(Integer, ForeignKey("employee_profiles.id", ondelete="SET NULL"), nullable=True, index=True)
     
     # Address
     address_line1 = Column(String(255), nullable=True)
@@ -60,11 +62,153 @@ class EmployeeProfile(Base):
     
     # Relationships
     user = relationship("User", backref="employee_profile", lazy="joined")
+    manager = relationship("EmployeeProfile", remote_side=[id], backref="direct_reports")
+    
+    # Partial indexes: every hot-path query filters on is_active, so departed
+    # staff never enter them and they stay small as history grows. Employee
+    # codes are unique among active staff only, as the create check assumes.
+    # manager_id keeps a full index: the self-FK's ON DELETE lookup during the
+    # archive purge has no is_active filter.
+    __table_args__ = (
+        Index(
+            "ix_employee_profiles_active_employee_id", employee_id, unique=True,
+            postgresql_where=is_active == True, sqlite_where=is_active == True
+        ),
+        Index(
+            "ix_employee_profiles_active_department", department, id,
+            postgresql_where=is_active == True, sqlite_where=is_active == True
+        ),
+        Index(
+            "ix_employee_profiles_active_status", employee_status, id,
+            postgresql_where=is_active == True, sqlite_where=is_active == True
+        ),
+    )
     
     def __repr__(self):
         return f"<EmployeeProfile(id={self.id}, employee_id={self.employee_id})>"
 
 
+class EmployeeProfileArchive(Base):
+    """
+    Soft-deleted employee profile moved out of employee_profiles after
+    ARCHIVE_RETENTION_DAYS.
+    
+    Keeps the original id. User and manager references are plain integers,
+    so archived rows outlive the users and profiles they pointed at.
+    """
+    
+    __tablename__ = "employee_profiles_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=True, index=True)
+    
+    # Personal Information
+    employee_id = Column(String(50), index=True, nullable=False)
+    first_name = Column(String(100), nullable=False)
+    last_name = Column(String(100), nullable=False)
+    date_of_birth = Column(Date, nullable=True)
+    gender = Column(String(20), nullable=True)
+    nationality = Column(String(100), nullable=True)
+    
+    # Contact Information
+    phone_number = Column(String(20), nullable=True)
+    personal_email = Column(String(255), nullable=True)
+    emergency_contact_name = Column(String(100), nullable=True)
+    emergency_contact_number = Column(String(20), nullable=True)
+    
+    # Employment Information
+    department = Column(String(100), nullable=True)
+    position = Column(String(100), nullable=True)
+    employment_type = Column(String(50), nullable=True)
+    date_of_joining = Column(Date, nullable=True)
+    date_of_leaving = Column(Date, nullable=True)
+    employee_status = Column(String(50), nullable=True)
+    manager_id = Column(Integer, nullable=True)
+    
+    # Address
+    address_line1 = Column(String(255), nullable=True)
+    address_line2 = Column(String(255), nullable=True)
+    city = Column(String(100), nullable=True)
+    state = Column(String(100), nullable=True)
+    country = Column(String(100), nullable=True)
+    postal_code = Column(String(20), nullable=True)
+    
+    # Additional Information
+    bio = Column(Text, nullable=True)
+    skills = Column(Text, nullable=True)
+    
+    # System fields
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)  # when it was soft-deleted
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    # Relationships
+    documents = relationship(
+        "EmployeeDocumentArchive",
+        backref="employee",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="EmployeeDocumentArchive.id"
+    )
+    
+    def __repr__(self):
+        return f"<EmployeeProfileArchive(id={self.id}, employee_id={self.employee_id})>"
+
+
+class EmployeeHierarchy(Base):
+    """
+    Closure table of the reporting hierarchy.
+    
+    Holds one row per (ancestor, descendant) pair, including a depth-0 row
+    for every active employee, so subtree and chain-of-command lookups are
+    single indexed queries.
+    """
+    
+    __tablename__ = "employee_hierarchy"
+    
+    ancestor_id = Column(Integer, ForeignKey("employee_profiles.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("employee_profiles.id", ondelete="CASCADE"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_employee_hierarchy_descendant_depth", "descendant_id", "depth"),
+    )
+    
+    def __repr__(self):
+        return f"<EmployeeHierarchy(ancestor={self.ancestor_id}, descendant={self.descendant_id}, depth={self.depth})>"
+
+
+class EmployeeFacetCount(Base):
+    """
+    Incrementally maintained count of active employees per facet value.
+    
+    NULL attribute values are stored as an empty string.
+    """
+    
+    __tablename__ = "employee_facet_counts"
+    
+    facet = Column(String(50), primary_key=True)  # department, employee_status, ...
+    value = Column(String(100), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<EmployeeFacetCount(facet={self.facet}, value={self.value}, count={self.count})>"
+
+
+class DepartmentAccessGrant(Base):
+    """Grants a user (e.g. an HR business partner) visibility over a department."""
+    
+    __tablename__ = "department_access_grants"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    department = Column(String(100), primary_key=True)
+    can_edit = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<DepartmentAccessGrant(user_id={self.user_id}, department={self.department})>"
+
+
 class EmployeeDocument(Base):
     """Employee documents model."""
     
@@ -78,6 +222,7 @@ class EmployeeDocument(Base):
     file_path = Column(String(500), nullable=False)
     file_size = Column(Integer, nullable=True)  # Size in bytes
     mime_type = Column(String(100), nullable=True)
+    checksum_sha256 = Column(String(64), nullable=True)
     
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -89,5 +234,91 @@ class EmployeeDocument(Base):
     # Relationships
     employee = relationship("EmployeeProfile", backref="documents")
     
+    __table_args__ = (
+        Index("ix_employee_documents_employee_id", "employee_id"),
+    )
+    
+    def __repr__(self):
+        return f"<EmployeeDocument(id={self.id}, type={self.document_type})>"
+
+
+class EmployeeDocumentArchive(Base):
+    """Document of an archived employee profile. The file stays where it was."""
+    
+    __tablename__ = "employee_documents_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    employee_id = Column(
+        Integer,
+        ForeignKey("employee_profiles_archive.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    
+    document_type = Column(String(100), nullable=False)
+    document_name = Column(String(255), nullable=False)
+    file_path = Column(String(500), nullable=False)
+    file_size = Column(Integer, nullable=True)
+    mime_type = Column(String(100), nullable=True)
+    checksum_sha256 = Column(String(64), nullable=True)
+    
+    uploaded_at = Column(DateTime(timezone=True), nullable=True)
+    uploaded_by = Column(Integer, nullable=True)
+    
+    is_verified = Column(Boolean, default=False)
+    verified_at = Column(DateTime(timezone=True), nullable=True)
+    verified_by = Column(Integer, nullable=True)
+    
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<EmployeeDocumentArchive(id={self.id}, type={self.document_type})>"
+
+
+class DocumentUploadSession(Base):
+    """Resumable upload session for a large employee document."""
+    
+    __tablename__ = "document_upload_sessions"
+    
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    employee_id = Column(Integer, ForeignKey("employee_profiles.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    document_type = Column(String(100), nullable=False)
+    document_name = Column(String(255), nullable=False)
+    file_name = Column(String(255), nullable=True)
+    mime_type = Column(String(100), nullable=True)
+    total_size = Column(BigInteger, nullable=False)
+    temp_path = Column(String(500), nullable=False)
+    
+    status = Column(String(20), default="open", nullable=False)  # open, completed
+    document_id = Column(Integer, ForeignKey("employee_documents.id", ondelete="SET NULL"), nullable=True)
+    
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    
+    # Relationships
+    chunks = relationship(
+        "DocumentUploadChunk",
+        backref="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+    
+    def __repr__(self):
+        return f"<DocumentUploadSession(id={self.id}, status={self.status})>"
+
+
+class DocumentUploadChunk(Base):
+    """Byte range received for a resumable upload session."""
+    
+    __tablename__ = "document_upload_chunks"
+    
+    id = Column(Integer, primary_key=True)
+    session_id = Column(String(32), ForeignKey("document_upload_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    byte_offset = Column(BigInteger, nullable=False)
+    size = Column(Integer, nullable=False)
+    received_at = Column(DateTime(timezone=True), server_default=func.now())
+    
     def __repr__(self):
-        return f"<EmployeeDocument(id={self.id}, type={self.document_type})>"
\ No newline at end of file
+        return f"<DocumentUploadChunk(session_id={self.session_id}, offset={self.byte_offset}, size={self.size})>"
\ No newline at end of file
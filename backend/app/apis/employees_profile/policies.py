@@ -0,0 +1,95 @@
+import logging
+from dataclasses import dataclass, field
+from typing import FrozenSet, Hashable, Optional
+
+from sqlalchemy import select, or_, true, false
+from sqlalchemy.sql.elements import ColumnElement
+
+from .models import EmployeeProfile, EmployeeHierarchy
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The caller, reduced to what visibility rules need."""
+    user_id: int
+    is_admin: bool = False
+    employee_id: Optional[int] = None  # Caller's own EmployeeProfile.id
+    read_departments: FrozenSet[str] = field(default_factory=frozenset)
+    edit_departments: FrozenSet[str] = field(default_factory=frozenset)
+
+
+class AccessPolicy:
+    """
+    Compiles a principal's visibility into SQL predicates over EmployeeProfile.
+
+    Rules (any match grants access):
+    - admins see and edit everyone
+    - everyone sees and edits their own profile
+    - managers see their whole reporting subtree (via the closure table)
+    - department grants see (and, with can_edit, edit) that department
+
+    Predicates are applied inside repository queries, so pagination, counts
+    and exports only ever touch rows the caller may see.
+    """
+
+    def __init__(self, principal: Principal):
+        self.principal = principal
+
+    @property
+    def is_unrestricted(self) -> bool:
+        return self.principal.is_admin
+
+    @property
+    def scope_key(self) -> Hashable:
+        """Identity of the read predicate: principals with equal keys see the same rows."""
+        if self.principal.is_admin:
+            return ("admin",)
+        return (self.principal.employee_id, tuple(sorted(self.principal.read_departments)))
+
+    def read_predicate(self) -> ColumnElement:
+        """Predicate selecting profiles the principal may read."""
+        if self.principal.is_admin:
+            return true()
+
+        clauses = []
+        if self.principal.employee_id is not None:
+            clauses.append(EmployeeProfile.id == self.principal.employee_id)
+            clauses.append(EmployeeProfile.id.in_(
+                select(EmployeeHierarchy.descendant_id).where(
+                    EmployeeHierarchy.ancestor_id == self.principal.employee_id
+                )
+            ))
+        if self.principal.read_departments:
+            clauses.append(EmployeeProfile.department.in_(sorted(self.principal.read_departments)))
+
+        return or_(*clauses) if clauses else false()
+
+    def write_predicate(self) -> ColumnElement:
+        """Predicate selecting profiles the principal may modify."""
+        if self.principal.is_admin:
+            return true()
+
+        clauses = []
+        if self.principal.employee_id is not None:
+            clauses.append(EmployeeProfile.id == self.principal.employee_id)
+        if self.principal.edit_departments:
+            clauses.append(EmployeeProfile.department.in_(sorted(self.principal.edit_departments)))
+
+        return or_(*clauses) if clauses else false()
+
+
+def build_principal(user, own_profile=None, grants=()) -> Principal:
+    """Build a principal from the user row, their own profile and department grants."""
+    if user.is_admin:
+        return Principal(user_id=user.id, is_admin=True)
+
+    return Principal(
+        user_id=user.id,
+        is_admin=False,
+        employee_id=own_profile.id if own_profile else None,
+        read_departments=frozenset(grant.department for grant in grants),
+        edit_departments=frozenset(grant.department for grant in grants if grant.can_edit)
+    )
\ No newline at end of file
@@ -1,28 +1,80 @@
 import logging
-from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from collections import Counter
+from datetime import date, datetime
+from typing import Optional, List, Tuple, Iterator, Dict, Sequence
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import or_, and_, select, insert, update, delete, func, literal, true, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 
-from .models import EmployeeProfile, EmployeeDocument
+from app.apis.auth.models import User
+from app.database.changes import record_change
+
+# Consumers of the collected row changes, registered wherever profiles are written
+from app.apis.audit import capture as audit_capture
+from app.apis.outbox import capture as outbox_capture
+from . import stream
+
+from .models import (
+    EmployeeProfile,
+    EmployeeProfileArchive,
+    EmployeeDocument,
+    EmployeeDocumentArchive,
+    EmployeeHierarchy,
+    EmployeeFacetCount,
+    DepartmentAccessGrant,
+    DocumentUploadSession,
+    DocumentUploadChunk
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Attributes exposed as search facets, keyed by facet name
+FACET_COLUMNS = {
+    "department": EmployeeProfile.department,
+    "employee_status": EmployeeProfile.employee_status,
+    "employment_type": EmployeeProfile.employment_type,
+    "country": EmployeeProfile.country,
+    "city": EmployeeProfile.city,
+}
+
+# Detail response fields read from the linked user account
+USER_COLUMNS = {
+    "user_email": User.email,
+    "user_name": User.name,
+    "user_picture": User.picture,
+}
+
+
+def _projection(fields: Optional[Sequence[str]], keys: Sequence[str] = ()) -> Tuple:
+    """The profile entity, or only the columns behind a sparse fieldset (plus key columns)."""
+    if fields is None:
+        return (EmployeeProfile,)
+    return tuple(
+        USER_COLUMNS[name].label(name) if name in USER_COLUMNS else getattr(EmployeeProfile, name)
+        for name in dict.fromkeys((*keys, *fields))
+    )
+
 
 class EmployeeProfileRepository:
     """Repository for EmployeeProfile database operations."""
     
     def __init__(self, db: Session):
         self.db = db
+        self.hierarchy = EmployeeHierarchyRepository(db)
+        self.facets = EmployeeFacetRepository(db)
     
-    def get_by_id(self, employee_id: int) -> Optional[EmployeeProfile]:
-        """Get employee profile by ID."""
+    def get_by_id(self, employee_id: int, scope=None) -> Optional[EmployeeProfile]:
+        """Get employee profile by ID, optionally restricted to a visibility predicate."""
         logger.debug(f"Fetching employee profile by ID: {employee_id}")
         try:
-            employee = self.db.query(EmployeeProfile).filter(
+            query = self.db.query(EmployeeProfile).filter(
                 EmployeeProfile.id == employee_id,
                 EmployeeProfile.is_active == True
-            ).first()
+            )
+            if scope is not None:
+                query = query.filter(scope)
+            employee = query.first()
             
             if employee:
                 logger.debug(f"Employee found: {employee.employee_id}")
@@ -34,14 +86,17 @@ class EmployeeProfileRepository:
             logger.error(f"Error fetching employee by ID {employee_id}: {str(e)}")
             raise
     
-    def get_by_user_id(self, user_id: int) -> Optional[EmployeeProfile]:
-        """Get employee profile by user ID."""
+    def get_by_user_id(self, user_id: int, scope=None) -> Optional[EmployeeProfile]:
+        """Get employee profile by user ID, optionally restricted to a visibility predicate."""
         logger.debug(f"Fetching employee profile by user ID: {user_id}")
         try:
-            employee = self.db.query(EmployeeProfile).filter(
+            query = self.db.query(EmployeeProfile).filter(
                 EmployeeProfile.user_id == user_id,
                 EmployeeProfile.is_active == True
-            ).first()
+            )
+            if scope is not None:
+                query = query.filter(scope)
+            employee = query.first()
             
             if employee:
                 logger.debug(f"Employee found for user {user_id}: {employee.employee_id}")
@@ -72,46 +127,117 @@ class EmployeeProfileRepository:
             logger.error(f"Error fetching employee by employee ID {employee_code}: {str(e)}")
             raise
     
+    def get_many(
+        self,
+        ids: Sequence[int] = (),
+        employee_codes: Sequence[str] = (),
+        scope=None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[EmployeeProfile]:
+        """
+        Active profiles matching any of the IDs or employee codes, in one query.
+        
+        With fields, rows of just those columns (always with id and
+        employee_id) are returned instead of profiles; user_* fields join
+        the user account.
+        """
+        logger.debug(f"Fetching {len(ids)} employees by ID and {len(employee_codes)} by employee ID")
+        keys = []
+        if ids:
+            keys.append(EmployeeProfile.id.in_(ids))
+        if employee_codes:
+            keys.append(EmployeeProfile.employee_id.in_(employee_codes))
+        if not keys:
+            return []
+        try:
+            columns = _projection(fields, keys=("id", "employee_id"))
+            query = self.db.query(*columns).select_from(EmployeeProfile).filter(
+                EmployeeProfile.is_active == True,
+                or_(*keys)
+            )
+            if fields is not None and USER_COLUMNS.keys() & set(fields):
+                query = query.outerjoin(User, User.id == EmployeeProfile.user_id)
+            if scope is not None:
+                query = query.filter(scope)
+            return query.all()
+        except Exception as e:
+            logger.error(f"Error fetching employees in batch: {str(e)}")
+            raise
+    
+    def is_visible(self, employee_id: int, scope) -> bool:
+        """Check in one indexed query whether an active profile matches a visibility predicate."""
+        return self.db.query(
+            self.db.query(EmployeeProfile).filter(
+                EmployeeProfile.id == employee_id,
+                EmployeeProfile.is_active == True,
+                scope
+            ).exists()
+        ).scalar()
+    
+    def _filtered_query(
+        self,
+        search: Optional[str] = None,
+        department: Optional[str] = None,
+        status: Optional[str] = None,
+        scope=None,
+        facets: Optional[Dict[str, str]] = None,
+        columns: Tuple = (EmployeeProfile,)
+    ):
+        """Build the active-profile query shared by list, search, facets and export."""
+        query = self.db.query(*columns).filter(
+            EmployeeProfile.is_active == True
+        )
+        
+        if scope is not None:
+            query = query.filter(scope)
+        
+        # Apply filters
+        if search:
+            search_filter = or_(
+                EmployeeProfile.first_name.ilike(f"%{search}%"),
+                EmployeeProfile.last_name.ilike(f"%{search}%"),
+                EmployeeProfile.employee_id.ilike(f"%{search}%"),
+                EmployeeProfile.personal_email.ilike(f"%{search}%")
+            )
+            query = query.filter(search_filter)
+            logger.debug(f"Applied search filter: {search}")
+        
+        if department:
+            query = query.filter(EmployeeProfile.department == department)
+            logger.debug(f"Applied department filter: {department}")
+        
+        if status:
+            query = query.filter(EmployeeProfile.employee_status == status)
+            logger.debug(f"Applied status filter: {status}")
+        
+        for facet, value in (facets or {}).items():
+            query = query.filter(FACET_COLUMNS[facet] == value)
+            logger.debug(f"Applied {facet} filter: {value}")
+        
+        return query
+    
     def get_all(
         self,
         skip: int = 0,
         limit: int = 100,
         search: Optional[str] = None,
         department: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        scope=None,
+        facets: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> Tuple[List[EmployeeProfile], int]:
-        """Get all employee profiles with pagination and filtering."""
+        """Get all employee profiles with pagination and filtering (only the given columns with fields)."""
         logger.debug(f"Fetching employees: skip={skip}, limit={limit}")
         
         try:
-            query = self.db.query(EmployeeProfile).filter(
-                EmployeeProfile.is_active == True
-            )
-            
-            # Apply filters
-            if search:
-                search_filter = or_(
-                    EmployeeProfile.first_name.ilike(f"%{search}%"),
-                    EmployeeProfile.last_name.ilike(f"%{search}%"),
-                    EmployeeProfile.employee_id.ilike(f"%{search}%"),
-                    EmployeeProfile.email.ilike(f"%{search}%")
-                )
-                query = query.filter(search_filter)
-                logger.debug(f"Applied search filter: {search}")
-            
-            if department:
-                query = query.filter(EmployeeProfile.department == department)
-                logger.debug(f"Applied department filter: {department}")
-            
-            if status:
-                query = query.filter(EmployeeProfile.employee_status == status)
-                logger.debug(f"Applied status filter: {status}")
+            query = self._filtered_query(search, department, status, scope, facets, columns=_projection(fields))
             
             # Get total count
             total = query.count()
             
             # Apply pagination
-            employees = query.offset(skip).limit(limit).all()
+            employees = query.order_by(EmployeeProfile.id).offset(skip).limit(limit).all()
             
             logger.debug(f"Found {len(employees)} employees out of {total} total")
             return employees, total
@@ -120,6 +246,51 @@ class EmployeeProfileRepository:
             logger.error(f"Error fetching employees: {str(e)}")
             raise
     
+    def get_facet_counts(
+        self,
+        search: Optional[str] = None,
+        scope=None,
+        facets: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[Tuple[Optional[str], int]]]:
+        """Count matching profiles per facet value with a single UNION ALL of GROUP BYs."""
+        logger.debug("Computing facet counts over filtered profiles")
+        
+        try:
+            selects = []
+            for facet, column in FACET_COLUMNS.items():
+                selects.append(
+                    self._filtered_query(
+                        search=search,
+                        scope=scope,
+                        facets=facets,
+                        columns=(literal(facet).label("facet"), column.label("value"), func.count().label("count"))
+                    ).group_by(column).statement
+                )
+            
+            counts = {facet: [] for facet in FACET_COLUMNS}
+            for row in self.db.execute(union_all(*selects)):
+                counts[row.facet].append((row.value, row.count))
+            return counts
+            
+        except Exception as e:
+            logger.error(f"Error computing facet counts: {str(e)}")
+            raise
+    
+    def iter_all(
+        self,
+        search: Optional[str] = None,
+        department: Optional[str] = None,
+        status: Optional[str] = None,
+        scope=None,
+        batch_size: int = 1000,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[EmployeeProfile]:
+        """Stream matching profiles (or only the given columns) in batches without loading them all."""
+        logger.debug("Streaming employees for export")
+        
+        query = self._filtered_query(search, department, status, scope, columns=_projection(fields))
+        return query.order_by(EmployeeProfile.id).yield_per(batch_size)
+    
     def create(self, employee_data: dict) -> EmployeeProfile:
         """Create a new employee profile."""
         logger.info(f"Creating new employee profile: {employee_data.get('employee_id')}")
@@ -131,11 +302,16 @@ class EmployeeProfileRepository:
                 logger.warning(f"Employee ID already exists: {employee_data.get('employee_id')}")
                 raise ValueError(f"Employee ID {employee_data.get('employee_id')} already exists")
             
+            manager_id = employee_data.get("manager_id")
+            if manager_id is not None and not self.get_by_id(manager_id):
+                raise ValueError(f"Manager {manager_id} not found")
+            
             employee = EmployeeProfile(**employee_data)
             
             self.db.add(employee)
-            self.db.commit()
-            self.db.refresh(employee)
+            self.db.flush()
+            self.hierarchy.add_node(employee.id, manager_id)
+            self.facets.apply_deltas(Counter(_facet_values(employee)))
             
             logger.info(f"Employee profile created: {employee.employee_id}")
             return employee
@@ -143,7 +319,6 @@ class EmployeeProfileRepository:
         except ValueError:
             raise
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error creating employee profile: {str(e)}")
             raise
     
@@ -157,23 +332,111 @@ class EmployeeProfileRepository:
                 logger.warning(f"Employee not found for update: {employee_id}")
                 return None
             
+            update_data = dict(update_data)
+            if "manager_id" in update_data:
+                self._set_manager(employee, update_data.pop("manager_id"))
+            
+            facets_before = _facet_values(employee)
+            
             # Update fields
             for key, value in update_data.items():
                 if hasattr(employee, key) and value is not None:
                     setattr(employee, key, value)
                     logger.debug(f"Updated {key} for employee {employee_id}")
             
-            self.db.commit()
-            self.db.refresh(employee)
+            facets_after = _facet_values(employee)
+            if facets_after != facets_before:
+                deltas = Counter(facets_after)
+                deltas.subtract(Counter(facets_before))
+                self.facets.apply_deltas(deltas)
+            
+            self.db.flush()
             
             logger.info(f"Employee profile updated: {employee.employee_id}")
             return employee
             
+        except ValueError:
+            raise
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error updating employee profile {employee_id}: {str(e)}")
             raise
     
+    def bulk_update(
+        self,
+        changes: dict,
+        ids: Sequence[int] = (),
+        search: Optional[str] = None,
+        facets: Optional[Dict[str, str]] = None,
+        scope=None,
+        max_rows: int = 1000,
+        dry_run: bool = False
+    ) -> Tuple[int, List[EmployeeProfile]]:
+        """
+        Apply one change to every active profile matching the selection.
+        
+        Only rows that differ from the new values are touched. Their current
+        values are read (and, on PostgreSQL, locked) in one query, then all of
+        them are changed with a single UPDATE ... RETURNING; audit entries,
+        facet deltas and change notifications are derived from the two
+        instead of per-row flushes. A dry run only counts the rows.
+        Returns (matched count, updated profiles).
+        """
+        logger.info(f"Bulk updating employees: fields={sorted(changes)}, ids={len(ids)}, dry_run={dry_run}")
+        
+        try:
+            columns = {key: getattr(EmployeeProfile, key) for key in changes}
+            tracked = {EmployeeProfile.department.key, *columns, *(column.key for column in FACET_COLUMNS.values())}
+            query = self._filtered_query(
+                search=search,
+                scope=scope,
+                facets=facets,
+                columns=(EmployeeProfile.id, EmployeeProfile.manager_id, *(getattr(EmployeeProfile, key) for key in sorted(tracked)))
+            ).filter(or_(*(column.is_distinct_from(changes[key]) for key, column in columns.items())))
+            if ids:
+                query = query.filter(EmployeeProfile.id.in_(ids))
+            
+            if dry_run:
+                return query.order_by(None).count(), []
+            
+            if self.db.get_bind().dialect.name == "postgresql":
+                query = query.with_for_update(of=EmployeeProfile)
+            rows = query.order_by(EmployeeProfile.id).limit(max_rows + 1).all()
+            if len(rows) > max_rows:
+                raise ValueError(f"Selection matches more than {max_rows} employees; narrow it down")
+            if not rows:
+                return 0, []
+            
+            updated = self.db.scalars(
+                update(EmployeeProfile)
+                .where(EmployeeProfile.id.in_([row.id for row in rows]))
+                .values(**changes)
+                .returning(EmployeeProfile)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).all()
+            
+            deltas = Counter()
+            for row in rows:
+                record_change(
+                    self.db, EmployeeProfile, row.id,
+                    {key: (getattr(row, key), value) for key, value in changes.items() if getattr(row, key) != value},
+                    values=row._asdict()
+                )
+                for facet, column in FACET_COLUMNS.items():
+                    before, after = getattr(row, column.key) or "", changes.get(column.key, getattr(row, column.key)) or ""
+                    if before != after:
+                        deltas[(facet, before)] -= 1
+                        deltas[(facet, after)] += 1
+            self.facets.apply_deltas(deltas)
+            
+            logger.info(f"Bulk updated {len(updated)} employee profiles")
+            return len(rows), updated
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error bulk updating employee profiles: {str(e)}")
+            raise
+    
     def delete(self, employee_id: int) -> bool:
         """Soft delete employee profile."""
         logger.info(f"Deleting employee profile: {employee_id}")
@@ -185,15 +448,413 @@ class EmployeeProfileRepository:
                 return False
             
             employee.is_active = False
-            self.db.commit()
+            if not employee.date_of_leaving:
+                employee.date_of_leaving = date.today()
+            self.hierarchy.remove_node(employee.id, employee.manager_id)
+            deltas = Counter()
+            deltas.subtract(Counter(_facet_values(employee)))
+            self.facets.apply_deltas(deltas)
+            self.db.flush()
             
             logger.info(f"Employee profile deleted: {employee.employee_id}")
             return True
             
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error deleting employee profile {employee_id}: {str(e)}")
             raise
+    
+    def _set_manager(self, employee: EmployeeProfile, manager_id: Optional[int]):
+        """Reassign an employee's manager, moving their whole subtree."""
+        if manager_id == employee.manager_id:
+            return
+        
+        if manager_id is not None:
+            if manager_id == employee.id:
+                raise ValueError("An employee cannot report to themselves")
+            if not self.get_by_id(manager_id):
+                raise ValueError(f"Manager {manager_id} not found")
+            if self.hierarchy.is_descendant(employee.id, manager_id):
+                raise ValueError("Manager cannot be one of the employee's own reports")
+        
+        self.hierarchy.move_subtree(employee.id, manager_id)
+        employee.manager_id = manager_id
+        logger.info(f"Employee {employee.id} now reports to {manager_id}")
+
+
+def _facet_values(employee: EmployeeProfile) -> List[Tuple[str, str]]:
+    """Get an employee's (facet, value) pairs, with NULL stored as an empty string."""
+    return [
+        (facet, getattr(employee, column.key) or "")
+        for facet, column in FACET_COLUMNS.items()
+    ]
+
+
+class EmployeeFacetRepository:
+    """
+    Repository for incrementally maintained facet counters.
+    
+    Write methods only stage statements on the session; the caller commits.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def apply_deltas(self, deltas: Dict[Tuple[str, str], int]):
+        """Add signed deltas to (facet, value) counters with a single upsert."""
+        rows = [
+            {"facet": facet, "value": value, "count": delta}
+            for (facet, value), delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+        
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = dialect_insert(EmployeeFacetCount)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["facet", "value"],
+                set_={"count": EmployeeFacetCount.count + stmt.excluded.count}
+            )
+            self.db.execute(stmt, rows)
+            return
+        
+        # Portable fallback: update, then insert missing counters
+        for row in rows:
+            updated = self.db.execute(
+                update(EmployeeFacetCount).where(
+                    EmployeeFacetCount.facet == row["facet"],
+                    EmployeeFacetCount.value == row["value"]
+                ).values(count=EmployeeFacetCount.count + row["count"])
+            ).rowcount
+            if not updated:
+                self.db.execute(insert(EmployeeFacetCount).values(**row))
+    
+    def get_counts(self) -> Dict[str, List[Tuple[Optional[str], int]]]:
+        """Read all non-zero counters, largest first."""
+        logger.debug("Fetching facet counters")
+        try:
+            rows = self.db.query(EmployeeFacetCount).filter(
+                EmployeeFacetCount.count > 0
+            ).order_by(EmployeeFacetCount.facet, EmployeeFacetCount.count.desc()).all()
+            
+            counts = {facet: [] for facet in FACET_COLUMNS}
+            for row in rows:
+                if row.facet in counts:
+                    counts[row.facet].append((row.value or None, row.count))
+            return counts
+            
+        except Exception as e:
+            logger.error(f"Error fetching facet counters: {str(e)}")
+            raise
+    
+    def rebuild(self) -> int:
+        """Recompute all counters from the profiles table."""
+        logger.info("Rebuilding facet counters")
+        
+        self.db.execute(delete(EmployeeFacetCount))
+        
+        for facet, column in FACET_COLUMNS.items():
+            value = func.coalesce(column, "")
+            self.db.execute(insert(EmployeeFacetCount).from_select(
+                ["facet", "value", "count"],
+                select(literal(facet), value, func.count()).where(
+                    EmployeeProfile.is_active == True
+                ).group_by(value)
+            ))
+        
+        return self.db.query(func.count()).select_from(EmployeeFacetCount).scalar()
+
+
+class EmployeeHierarchyRepository:
+    """
+    Repository for the reporting hierarchy closure table.
+    
+    Write methods only stage statements on the session; the caller commits.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def add_node(self, employee_id: int, manager_id: Optional[int] = None):
+        """Insert a new employee's self path and, if managed, the paths from every ancestor."""
+        self.db.execute(insert(EmployeeHierarchy).values(
+            ancestor_id=employee_id,
+            descendant_id=employee_id,
+            depth=0
+        ))
+        
+        if manager_id is not None:
+            ancestors = select(
+                EmployeeHierarchy.ancestor_id,
+                literal(employee_id),
+                EmployeeHierarchy.depth + 1
+            ).where(EmployeeHierarchy.descendant_id == manager_id)
+            
+            self.db.execute(insert(EmployeeHierarchy).from_select(
+                ["ancestor_id", "descendant_id", "depth"], ancestors
+            ))
+    
+    def move_subtree(self, employee_id: int, new_manager_id: Optional[int]):
+        """
+        Re-parent a subtree incrementally.
+        
+        Only paths crossing the old boundary are deleted, and only paths from
+        the new manager's ancestors into the subtree are inserted.
+        """
+        subtree = select(EmployeeHierarchy.descendant_id).where(
+            EmployeeHierarchy.ancestor_id == employee_id
+        )
+        old_ancestors = select(EmployeeHierarchy.ancestor_id).where(
+            EmployeeHierarchy.descendant_id == employee_id,
+            EmployeeHierarchy.depth > 0
+        )
+        
+        self.db.execute(
+            delete(EmployeeHierarchy).where(
+                EmployeeHierarchy.descendant_id.in_(subtree),
+                EmployeeHierarchy.ancestor_id.in_(old_ancestors)
+            ).execution_options(synchronize_session=False)
+        )
+        
+        if new_manager_id is not None:
+            upper = aliased(EmployeeHierarchy)
+            lower = aliased(EmployeeHierarchy)
+            paths = select(
+                upper.ancestor_id,
+                lower.descendant_id,
+                upper.depth + lower.depth + 1
+            ).select_from(upper).join(lower, true()).where(
+                upper.descendant_id == new_manager_id,
+                lower.ancestor_id == employee_id
+            )
+            
+            self.db.execute(insert(EmployeeHierarchy).from_select(
+                ["ancestor_id", "descendant_id", "depth"], paths
+            ))
+    
+    def remove_node(self, employee_id: int, manager_id: Optional[int]):
+        """Detach a departing employee, handing their direct reports to their manager."""
+        reports = self.db.query(EmployeeProfile.id, EmployeeProfile.department).filter(
+            EmployeeProfile.manager_id == employee_id,
+            EmployeeProfile.is_active == True
+        ).all()
+        report_ids = [row.id for row in reports]
+        
+        for report_id in report_ids:
+            self.move_subtree(report_id, manager_id)
+        
+        if report_ids:
+            self.db.query(EmployeeProfile).filter(
+                EmployeeProfile.id.in_(report_ids)
+            ).update({EmployeeProfile.manager_id: manager_id}, synchronize_session=False)
+            for row in reports:
+                record_change(
+                    self.db, EmployeeProfile, row.id,
+                    {"manager_id": (employee_id, manager_id)},
+                    values={"department": row.department}
+                )
+        
+        self.db.execute(
+            delete(EmployeeHierarchy).where(
+                or_(
+                    EmployeeHierarchy.descendant_id == employee_id,
+                    EmployeeHierarchy.ancestor_id == employee_id
+                )
+            ).execution_options(synchronize_session=False)
+        )
+    
+    def rebuild(self) -> int:
+        """Recompute the closure table from manager_id, one tree level per statement."""
+        logger.info("Rebuilding employee hierarchy closure table")
+        
+        self.db.execute(delete(EmployeeHierarchy))
+        
+        self.db.execute(insert(EmployeeHierarchy).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(EmployeeProfile.id, EmployeeProfile.id, literal(0)).where(
+                EmployeeProfile.is_active == True
+            )
+        ))
+        
+        depth = 0
+        while True:
+            # Extend every path ending at depth d by one reporting edge
+            paths = select(
+                EmployeeHierarchy.ancestor_id,
+                EmployeeProfile.id,
+                literal(depth + 1)
+            ).join(
+                EmployeeProfile,
+                EmployeeProfile.manager_id == EmployeeHierarchy.descendant_id
+            ).where(
+                EmployeeHierarchy.depth == depth,
+                EmployeeProfile.is_active == True
+            )
+            
+            inserted = self.db.execute(insert(EmployeeHierarchy).from_select(
+                ["ancestor_id", "descendant_id", "depth"], paths
+            )).rowcount
+            
+            if not inserted:
+                break
+            depth += 1
+        
+        total = self.db.query(func.count()).select_from(EmployeeHierarchy).scalar()
+        logger.info(f"Hierarchy rebuilt: {total} paths, max depth {depth}")
+        return total
+    
+    def is_descendant(self, ancestor_id: int, employee_id: int) -> bool:
+        """Check whether employee_id is inside ancestor_id's subtree (or is ancestor_id)."""
+        return self.db.query(
+            self.db.query(EmployeeHierarchy).filter(
+                EmployeeHierarchy.ancestor_id == ancestor_id,
+                EmployeeHierarchy.descendant_id == employee_id
+            ).exists()
+        ).scalar()
+    
+    def get_direct_reports(self, manager_id: int) -> List[EmployeeProfile]:
+        """Get an employee's direct reports."""
+        logger.debug(f"Fetching direct reports for: {manager_id}")
+        try:
+            return self.db.query(EmployeeProfile).filter(
+                EmployeeProfile.manager_id == manager_id,
+                EmployeeProfile.is_active == True
+            ).order_by(EmployeeProfile.last_name, EmployeeProfile.first_name).all()
+        except Exception as e:
+            logger.error(f"Error fetching direct reports for {manager_id}: {str(e)}")
+            raise
+    
+    def get_subtree(
+        self,
+        root_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        max_depth: Optional[int] = None
+    ) -> Tuple[List[EmployeeProfile], int]:
+        """Get everyone below an employee, nearest levels first."""
+        logger.debug(f"Fetching subtree for: {root_id}")
+        try:
+            query = self.db.query(EmployeeProfile).join(
+                EmployeeHierarchy,
+                EmployeeHierarchy.descendant_id == EmployeeProfile.id
+            ).filter(
+                EmployeeHierarchy.ancestor_id == root_id,
+                EmployeeHierarchy.depth > 0
+            )
+            if max_depth is not None:
+                query = query.filter(EmployeeHierarchy.depth <= max_depth)
+            
+            total = query.count()
+            employees = query.order_by(
+                EmployeeHierarchy.depth,
+                EmployeeProfile.last_name,
+                EmployeeProfile.id
+            ).offset(skip).limit(limit).all()
+            
+            return employees, total
+        except Exception as e:
+            logger.error(f"Error fetching subtree for {root_id}: {str(e)}")
+            raise
+    
+    def get_chain_of_command(self, employee_id: int) -> List[EmployeeProfile]:
+        """Get an employee's managers, from direct manager up to the root."""
+        logger.debug(f"Fetching chain of command for: {employee_id}")
+        try:
+            return self.db.query(EmployeeProfile).join(
+                EmployeeHierarchy,
+                EmployeeHierarchy.ancestor_id == EmployeeProfile.id
+            ).filter(
+                EmployeeHierarchy.descendant_id == employee_id,
+                EmployeeHierarchy.depth > 0
+            ).order_by(EmployeeHierarchy.depth).all()
+        except Exception as e:
+            logger.error(f"Error fetching chain of command for {employee_id}: {str(e)}")
+            raise
+    
+    def get_headcount(self, root_id: int) -> int:
+        """Count everyone below an employee: a primary key range scan on ancestor_id, filtering depth per row."""
+        return self.db.query(func.count()).select_from(EmployeeHierarchy).filter(
+            EmployeeHierarchy.ancestor_id == root_id,
+            EmployeeHierarchy.depth > 0
+        ).scalar()
+    
+    def get_report_headcounts(self, manager_id: int) -> List[Tuple[int, int]]:
+        """Get (direct report id, subtree size including the report) for each direct report."""
+        rows = self.db.query(
+            EmployeeHierarchy.ancestor_id,
+            func.count()
+        ).join(
+            EmployeeProfile,
+            EmployeeProfile.id == EmployeeHierarchy.ancestor_id
+        ).filter(
+            EmployeeProfile.manager_id == manager_id,
+            EmployeeProfile.is_active == True
+        ).group_by(EmployeeHierarchy.ancestor_id).all()
+        
+        return [(row[0], row[1]) for row in rows]
+
+
+class AccessGrantRepository:
+    """Repository for department access grants."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_by_user(self, user_id: int) -> List[DepartmentAccessGrant]:
+        """Get all department grants held by a user."""
+        logger.debug(f"Fetching access grants for user: {user_id}")
+        try:
+            return self.db.query(DepartmentAccessGrant).filter(
+                DepartmentAccessGrant.user_id == user_id
+            ).order_by(DepartmentAccessGrant.department).all()
+        except Exception as e:
+            logger.error(f"Error fetching access grants for user {user_id}: {str(e)}")
+            raise
+    
+    def upsert(self, user_id: int, department: str, can_edit: bool) -> DepartmentAccessGrant:
+        """Create or update a department grant."""
+        logger.info(f"Granting user {user_id} access to department {department}")
+        
+        try:
+            grant = self.db.query(DepartmentAccessGrant).filter(
+                DepartmentAccessGrant.user_id == user_id,
+                DepartmentAccessGrant.department == department
+            ).first()
+            
+            if grant:
+                grant.can_edit = can_edit
+            else:
+                grant = DepartmentAccessGrant(
+                    user_id=user_id,
+                    department=department,
+                    can_edit=can_edit
+                )
+                self.db.add(grant)
+            
+            self.db.flush()
+            return grant
+            
+        except Exception as e:
+            logger.error(f"Error granting access for user {user_id}: {str(e)}")
+            raise
+    
+    def delete(self, user_id: int, department: str) -> bool:
+        """Revoke a department grant."""
+        logger.info(f"Revoking user {user_id} access to department {department}")
+        
+        try:
+            deleted = self.db.query(DepartmentAccessGrant).filter(
+                DepartmentAccessGrant.user_id == user_id,
+                DepartmentAccessGrant.department == department
+            ).delete(synchronize_session=False)
+            self.db.flush()
+            return bool(deleted)
+            
+        except Exception as e:
+            logger.error(f"Error revoking access for user {user_id}: {str(e)}")
+            raise
 
 
 class EmployeeDocumentRepository:
@@ -202,6 +863,17 @@ class EmployeeDocumentRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    def get_by_id(self, document_id: int) -> Optional[EmployeeDocument]:
+        """Get document by ID."""
+        logger.debug(f"Fetching document by ID: {document_id}")
+        try:
+            return self.db.query(EmployeeDocument).filter(
+                EmployeeDocument.id == document_id
+            ).first()
+        except Exception as e:
+            logger.error(f"Error fetching document {document_id}: {str(e)}")
+            raise
+    
     def get_by_employee(self, employee_id: int) -> List[EmployeeDocument]:
         """Get all documents for an employee."""
         logger.debug(f"Fetching documents for employee: {employee_id}")
@@ -226,14 +898,12 @@ class EmployeeDocumentRepository:
             document = EmployeeDocument(**document_data)
             
             self.db.add(document)
-            self.db.commit()
-            self.db.refresh(document)
+            self.db.flush()
             
             logger.info(f"Document created: {document.document_name}")
             return document
             
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error creating document: {str(e)}")
             raise
     
@@ -251,12 +921,248 @@ class EmployeeDocumentRepository:
                 return False
             
             self.db.delete(document)
-            self.db.commit()
+            self.db.flush()
             
             logger.info(f"Document deleted: {document_id}")
             return True
             
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error deleting document {document_id}: {str(e)}")
+            raise
+
+
+class DocumentUploadSessionRepository:
+    """Repository for resumable document upload sessions."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_by_id(self, upload_id: str, for_update: bool = False, for_share: bool = False) -> Optional[DocumentUploadSession]:
+        """Get upload session by ID, optionally locking the row (exclusively, or shared)."""
+        logger.debug(f"Fetching upload session: {upload_id}")
+        try:
+            query = self.db.query(DocumentUploadSession).filter(
+                DocumentUploadSession.id == upload_id
+            )
+            if for_update:
+                query = query.with_for_update()
+            elif for_share:
+                query = query.with_for_update(read=True)
+            return query.first()
+        except Exception as e:
+            logger.error(f"Error fetching upload session {upload_id}: {str(e)}")
+            raise
+    
+    def create(self, session_data: dict) -> DocumentUploadSession:
+        """Create a new upload session."""
+        logger.info(f"Creating upload session for employee: {session_data.get('employee_id')}")
+        
+        try:
+            upload = DocumentUploadSession(**session_data)
+            
+            self.db.add(upload)
+            self.db.flush()
+            
+            logger.info(f"Upload session created: {upload.id}")
+            return upload
+            
+        except Exception as e:
+            logger.error(f"Error creating upload session: {str(e)}")
+            raise
+    
+    def add_chunk(self, upload_id: str, byte_offset: int, size: int) -> DocumentUploadChunk:
+        """Record a received byte range. Chunks are insert-only so parallel PUTs never contend."""
+        logger.debug(f"Recording chunk for upload {upload_id}: offset={byte_offset}, size={size}")
+        
+        try:
+            chunk = DocumentUploadChunk(
+                session_id=upload_id,
+                byte_offset=byte_offset,
+                size=size
+            )
+            
+            self.db.add(chunk)
+            self.db.flush()
+            
+            return chunk
+            
+        except Exception as e:
+            logger.error(f"Error recording chunk for upload {upload_id}: {str(e)}")
+            raise
+    
+    def get_chunk_ranges(self, upload_id: str) -> List[Tuple[int, int]]:
+        """Get received (offset, size) ranges ordered by offset."""
+        try:
+            rows = self.db.query(
+                DocumentUploadChunk.byte_offset,
+                DocumentUploadChunk.size
+            ).filter(
+                DocumentUploadChunk.session_id == upload_id
+            ).order_by(DocumentUploadChunk.byte_offset).all()
+            
+            return [(row.byte_offset, row.size) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Error fetching chunks for upload {upload_id}: {str(e)}")
+            raise
+    
+    def mark_completed(self, upload: DocumentUploadSession, document_id: int) -> DocumentUploadSession:
+        """Mark session completed and drop its chunk bookkeeping."""
+        logger.info(f"Completing upload session: {upload.id}")
+        
+        try:
+            self.db.query(DocumentUploadChunk).filter(
+                DocumentUploadChunk.session_id == upload.id
+            ).delete(synchronize_session=False)
+            
+            upload.status = "completed"
+            upload.document_id = document_id
+            self.db.flush()
+            
+            return upload
+            
+        except Exception as e:
+            logger.error(f"Error completing upload session {upload.id}: {str(e)}")
+            raise
+    
+    def delete(self, upload: DocumentUploadSession) -> bool:
+        """Delete upload session and its chunks."""
+        logger.info(f"Deleting upload session: {upload.id}")
+        
+        try:
+            self.db.delete(upload)
+            self.db.flush()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error deleting upload session {upload.id}: {str(e)}")
+            raise
+    
+    def get_expired(self, now: datetime, limit: int = 100) -> List[DocumentUploadSession]:
+        """Get abandoned sessions past their expiry."""
+        try:
+            return self.db.query(DocumentUploadSession).filter(
+                DocumentUploadSession.status == "open",
+                DocumentUploadSession.expires_at < now
+            ).order_by(DocumentUploadSession.expires_at).limit(limit).all()
+            
+        except Exception as e:
+            logger.error(f"Error fetching expired upload sessions: {str(e)}")
+            raise
+
+
+class EmployeeArchiveRepository:
+    """
+    Archive tier for departed staff.
+    
+    Soft-deleted profiles stay in employee_profiles for the retention period,
+    then move with their documents to the archive tables in batches, keeping
+    the hot table and its indexes to roughly the active headcount.
+    """
+    
+    PROFILE_COLUMNS = [c.name for c in EmployeeProfileArchive.__table__.columns if c.name != "archived_at"]
+    DOCUMENT_COLUMNS = [c.name for c in EmployeeDocumentArchive.__table__.columns if c.name != "archived_at"]
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def archive_inactive(self, cutoff: datetime, limit: int) -> int:
+        """Move up to `limit` profiles soft-deleted before cutoff, with their documents, to the archive."""
+        ids = [
+            row[0] for row in self.db.query(EmployeeProfile.id).filter(
+                EmployeeProfile.is_active == False,
+                EmployeeProfile.updated_at < cutoff
+            ).order_by(EmployeeProfile.id).limit(limit).with_for_update(skip_locked=True)
+        ]
+        if not ids:
+            return 0
+        
+        logger.info(f"Archiving {len(ids)} inactive employee profiles")
+        
+        try:
+            self.db.execute(
+                insert(EmployeeProfileArchive).from_select(
+                    self.PROFILE_COLUMNS,
+                    select(*[EmployeeProfile.__table__.c[name] for name in self.PROFILE_COLUMNS])
+                    .where(EmployeeProfile.id.in_(ids))
+                )
+            )
+            self.db.execute(
+                insert(EmployeeDocumentArchive).from_select(
+                    self.DOCUMENT_COLUMNS,
+                    select(*[EmployeeDocument.__table__.c[name] for name in self.DOCUMENT_COLUMNS])
+                    .where(EmployeeDocument.employee_id.in_(ids))
+                )
+            )
+            
+            # Departed reports of departed managers; keep updated_at so their retention clock is unchanged
+            self.db.execute(
+                update(EmployeeProfile)
+                .where(EmployeeProfile.manager_id.in_(ids))
+                .values(manager_id=None, updated_at=EmployeeProfile.updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            
+            # Explicit rather than relying on ON DELETE CASCADE, which SQLite does not enforce by default
+            upload_ids = select(DocumentUploadSession.id).where(DocumentUploadSession.employee_id.in_(ids))
+            self.db.execute(delete(DocumentUploadChunk).where(DocumentUploadChunk.session_id.in_(upload_ids)))
+            self.db.execute(delete(DocumentUploadSession).where(DocumentUploadSession.employee_id.in_(ids)))
+            self.db.execute(
+                delete(EmployeeHierarchy).where(
+                    or_(EmployeeHierarchy.ancestor_id.in_(ids), EmployeeHierarchy.descendant_id.in_(ids))
+                )
+            )
+            self.db.execute(delete(EmployeeDocument).where(EmployeeDocument.employee_id.in_(ids)))
+            self.db.execute(delete(EmployeeProfile).where(EmployeeProfile.id.in_(ids)))
+            self.db.flush()
+            
+            return len(ids)
+            
+        except Exception as e:
+            logger.error(f"Error archiving employee profiles: {str(e)}")
+            raise
+    
+    def get_by_id(self, employee_id: int) -> Optional[EmployeeProfileArchive]:
+        """Get an archived profile by its original ID."""
+        try:
+            return self.db.query(EmployeeProfileArchive).filter(
+                EmployeeProfileArchive.id == employee_id
+            ).first()
+            
+        except Exception as e:
+            logger.error(f"Error fetching archived employee {employee_id}: {str(e)}")
+            raise
+    
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        department: Optional[str] = None
+    ) -> Tuple[List[EmployeeProfileArchive], int]:
+        """Get archived profiles with pagination and filtering."""
+        logger.debug(f"Fetching archived employees: skip={skip}, limit={limit}")
+        
+        try:
+            query = self.db.query(EmployeeProfileArchive)
+            
+            if search:
+                query = query.filter(
+                    or_(
+                        EmployeeProfileArchive.first_name.ilike(f"%{search}%"),
+                        EmployeeProfileArchive.last_name.ilike(f"%{search}%"),
+                        EmployeeProfileArchive.employee_id.ilike(f"%{search}%"),
+                        EmployeeProfileArchive.personal_email.ilike(f"%{search}%")
+                    )
+                )
+            
+            if department:
+                query = query.filter(EmployeeProfileArchive.department == department)
+            
+            total = query.count()
+            employees = query.order_by(EmployeeProfileArchive.id).offset(skip).limit(limit).all()
+            return employees, total
+            
+        except Exception as e:
+            logger.error(f"Error fetching archived employees: {str(e)}")
             raise
\ No newline at end of file
@@ -1,27 +1,63 @@
 import logging
+import time
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database.session import get_db
+from app.database.session import get_db, get_read_db, recently_wrote
+from app.database.unit_of_work import UnitOfWorkRoute
 from app.apis.auth.repositories import UserRepository
 from app.apis.auth.services import AuthService
-from .repositories import EmployeeProfileRepository, EmployeeDocumentRepository
-from .services import EmployeeProfileService
+from app.apis.audit.capture import set_actor
+from app.core.config import settings
+from app.core.security import security_service
+from app.shared.single_flight import SingleFlight
+from .repositories import (
+    EmployeeProfileRepository,
+    EmployeeDocumentRepository,
+    AccessGrantRepository,
+    DocumentUploadSessionRepository,
+    EmployeeArchiveRepository
+)
+from .services import EmployeeProfileService, AccessGrantService, DocumentUploadService, EmployeeArchiveService
+from .policies import AccessPolicy, Principal, build_principal
+from .stream import broadcaster, event_stream
+from .fieldsets import parse_fields
 from .schemas import (
     EmployeeProfileCreate,
     EmployeeProfileUpdate,
     EmployeeProfileResponse,
     EmployeeProfileDetailResponse,
+    EmployeeBatchGetRequest,
+    EmployeeBatchGetResponse,
+    EmployeeBulkUpdateRequest,
+    EmployeeBulkUpdateResponse,
     EmployeeListResponse,
-    EmployeeDocumentResponse
+    EmployeeDocumentResponse,
+    ManagerAssignment,
+    HeadcountResponse,
+    AccessGrantCreate,
+    AccessGrantResponse,
+    FacetCountsResponse,
+    FacetedSearchResponse,
+    DocumentUploadSessionCreate,
+    DocumentUploadComplete,
+    DocumentUploadSessionResponse,
+    ArchivedEmployeeDetailResponse,
+    ArchivedEmployeeListResponse
 )
 
 
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/employees", tags=["Employees"])
+router = APIRouter(prefix="/api/employees", tags=["Employees"], route_class=UnitOfWorkRoute)
+
+# Identical concurrent reads in this worker share one query and one serialized body
+list_flight = SingleFlight("employees_list")
+detail_flight = SingleFlight("employees_detail")
 
 
 # ========== DEPENDENCY INJECTION ==========
@@ -46,14 +82,65 @@ def get_employee_service(
     return EmployeeProfileService(employee_repo, user_repo, doc_repo)
 
 
+def get_read_employee_service(db: Session = Depends(get_read_db)) -> EmployeeProfileService:
+    """Service on a read-only session (replica when configured) for endpoints that never write."""
+    return EmployeeProfileService(
+        EmployeeProfileRepository(db),
+        UserRepository(db),
+        EmployeeDocumentRepository(db)
+    )
+
+
+def get_upload_service(
+    db: Session = Depends(get_db),
+    employee_repo: EmployeeProfileRepository = Depends(get_employee_repository),
+    doc_repo: EmployeeDocumentRepository = Depends(get_document_repository)
+) -> DocumentUploadService:
+    return DocumentUploadService(employee_repo, doc_repo, DocumentUploadSessionRepository(db))
+
+
+def get_access_grant_service(
+    db: Session = Depends(get_db),
+    user_repo: UserRepository = Depends(get_user_repository)
+) -> AccessGrantService:
+    return AccessGrantService(AccessGrantRepository(db), user_repo)
+
+
+def get_archive_service(db: Session = Depends(get_read_db)) -> EmployeeArchiveService:
+    return EmployeeArchiveService(EmployeeArchiveRepository(db))
+
+
 # Create a proper dependency for current_user
 def get_current_user_dependency(
     request: Request,
     user_repo: UserRepository = Depends(get_user_repository)
 ):
-    """Dependency to get current user."""
+    """Dependency to get current user (the users row, so callers need not reload it)."""
     auth_service = AuthService(user_repo)
-    return auth_service.get_current_user(request)
+    user = auth_service.authenticate(request)
+    # Same session as the request's unit of work, so its changes are audited as this user's
+    set_actor(user_repo.db, user.id, getattr(request.state, "request_id", None))
+    return user
+
+
+def get_principal(
+    db: Session = Depends(get_db),
+    user = Depends(get_current_user_dependency),
+    employee_repo: EmployeeProfileRepository = Depends(get_employee_repository)
+) -> Principal:
+    """Dependency resolving the caller's identity, own profile and department grants."""
+    if user.is_admin:
+        return build_principal(user)
+    
+    return build_principal(
+        user,
+        own_profile=employee_repo.get_by_user_id(user.id),
+        grants=AccessGrantRepository(db).get_by_user(user.id)
+    )
+
+
+def get_access_policy(principal: Principal = Depends(get_principal)) -> AccessPolicy:
+    return AccessPolicy(principal)
 
 
 # ========== MIDDLEWARE ==========
@@ -61,122 +148,489 @@ def get_current_user_dependency(
 async def verify_employee_access(
     request: Request,  # MUST BE FIRST - no default value
     employee_id: int,
-    current_user = Depends(get_current_user_dependency),
-    employee_service: EmployeeProfileService = Depends(get_employee_service),
-    db: Session = Depends(get_db)
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_repo: EmployeeProfileRepository = Depends(get_employee_repository)
 ):
-    """Verify if current user has access to employee data."""
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_email(current_user.email)
+    """Verify the current user may read this employee's data (self, subtree, department or admin)."""
+    if policy.is_unrestricted:
+        return
     
-    if not user:
+    if not employee_repo.is_visible(employee_id, policy.read_predicate()):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
         )
-    
-    # Admins can access all employees
-    if user.is_admin:
+
+
+async def verify_employee_write_access(
+    request: Request,  # MUST BE FIRST - no default value
+    employee_id: int,
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_repo: EmployeeProfileRepository = Depends(get_employee_repository)
+):
+    """Verify the current user may modify this employee's data (self, editable department or admin)."""
+    if policy.is_unrestricted:
         return
     
-    # Users can only access their own profile
-    employee = employee_service.employee_repo.get_by_user_id(user.id)
-    if not employee or employee.id != employee_id:
+    if not employee_repo.is_visible(employee_id, policy.write_predicate()):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied"
         )
 
 
+async def _coalesced_json(request: Request, flight: SingleFlight, key, fn, *args, **kwargs) -> Response:
+    """
+    Run a read through the flight and return its JSON body.
+    
+    Clients inside their read-your-writes window skip coalescing, so they
+    never join a read that started before their write committed.
+    
+    Authentication and access checks are done by now, so the request's
+    primary session hands its connection back first: a herd of coalesced
+    requests waits without holding pooled connections. The read session
+    only connects in the call that actually runs.
+    """
+    def render():
+        return fn(*args, **kwargs).model_dump_json()
+    
+    uow = getattr(request.state, "uow", None)
+    if uow is not None:
+        await run_in_threadpool(uow.release)
+    
+    if recently_wrote(request):
+        body = await run_in_threadpool(render)
+    else:
+        body = await flight.do(key, render)
+    return Response(content=body, media_type="application/json")
+
+
+def _fieldset(fields: Optional[str], model):
+    """Validate a `fields` query parameter against a response model (422 on unknown names)."""
+    try:
+        return parse_fields(fields, model)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+
+
+def _sparse_json(result, fields) -> Response:
+    """Serialize a trimmed response directly; it would not validate against the full response_model."""
+    if fields is None:
+        return result
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
 # ========== ROUTES ==========
 
 @router.get("/", response_model=EmployeeListResponse)
 async def get_employees(
     request: Request,  # ✅ FIRST: No default value parameters first
-    current_user = Depends(get_current_user_dependency),  # ✅ Use correct dependency
     skip: int = 0,
     limit: int = 20,
     search: Optional[str] = None,
     department: Optional[str] = None,
     status: Optional[str] = None,
-    employee_service: EmployeeProfileService = Depends(get_employee_service),
-    user_repo: UserRepository = Depends(get_user_repository)
+    fields: Optional[str] = None,
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
 ):
     """
-    Get all employees with pagination and filtering.
+    Get all employees visible to the caller, with pagination and filtering.
+    
+    - **fields**: comma-separated profile fields to return (id is always included)
     """
     logger.info("Get employees endpoint called")
     
-    # Check if user is admin
-    user = user_repo.get_by_email(current_user.email)
+    limit = min(limit, 100)
+    fields = _fieldset(fields, EmployeeProfileResponse)
+    key = (skip, limit, search or None, department or None, status or None, fields, policy.scope_key)
+    return await _coalesced_json(
+        request,
+        list_flight,
+        key,
+        employee_service.get_employees,
+        skip=skip,
+        limit=limit,
+        search=search,
+        department=department,
+        status=status,
+        scope=policy.read_predicate(),
+        fields=fields
+    )
+
+
+@router.get("/export")
+async def export_employees(
+    request: Request,
+    search: Optional[str] = None,
+    department: Optional[str] = None,
+    status: Optional[str] = None,
+    fields: Optional[str] = None,
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Export employees visible to the caller as streamed CSV.
     
-    if not user.is_admin:
-        # Non-admin users can only see their own profile
-        employee = employee_service.employee_repo.get_by_user_id(user.id)
-        if employee:
-            items = [EmployeeProfileResponse.from_orm(employee)]
-            return EmployeeListResponse(
-                items=items,
-                total=1,
-                page=1,
-                size=1,
-                pages=1
-            )
-        return EmployeeListResponse(
-            items=[],
-            total=0,
-            page=1,
-            size=limit,
-            pages=0
+    - **fields**: comma-separated columns to export (id is always included)
+    """
+    logger.info("Export employees endpoint called")
+    
+    rows = employee_service.export_employees(
+        search=search,
+        department=department,
+        status=status,
+        scope=policy.read_predicate(),
+        fields=_fieldset(fields, EmployeeProfileResponse)
+    )
+    return StreamingResponse(
+        rows,
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="employees.csv"'}
+    )
+
+
+@router.get("/search", response_model=FacetedSearchResponse)
+async def search_employees(
+    request: Request,
+    q: Optional[str] = None,
+    department: Optional[str] = None,
+    employee_status: Optional[str] = None,
+    employment_type: Optional[str] = None,
+    country: Optional[str] = None,
+    city: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20,
+    facet_limit: int = 20,
+    fields: Optional[str] = None,
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Search employees and get facet counts in one round trip.
+    
+    - **q**: free-text search on name, employee ID and personal email
+    - Facets: department, employee_status, employment_type, country, city
+    - **fields**: comma-separated profile fields to return (id is always included)
+    """
+    logger.info("Search employees endpoint called")
+    
+    fields = _fieldset(fields, EmployeeProfileResponse)
+    
+    facets = {
+        name: value for name, value in {
+            "department": department,
+            "employee_status": employee_status,
+            "employment_type": employment_type,
+            "country": country,
+            "city": city,
+        }.items() if value is not None
+    }
+    
+    result = employee_service.search_employees(
+        skip=skip,
+        limit=min(limit, 100),
+        search=q,
+        facets=facets,
+        scope=None if policy.is_unrestricted else policy.read_predicate(),
+        facet_limit=min(facet_limit, 100),
+        fields=fields
+    )
+    return _sparse_json(result, fields)
+
+
+@router.post("/batch-get", response_model=EmployeeBatchGetResponse)
+async def batch_get_employees(
+    request: Request,
+    batch: EmployeeBatchGetRequest,
+    fields: Optional[str] = None,
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Fetch up to BATCH_GET_MAX_IDS employees in one call.
+    
+    - **ids**: profile IDs
+    - **employee_ids**: employee codes
+    - **fields** (query): comma-separated profile fields to return (id is always included)
+    
+    Each requested key gets an item with status `ok` (and the profile),
+    `not_found` or `forbidden`. A read despite the POST: it never writes.
+    """
+    logger.info("Batch get employees endpoint called")
+    fields = _fieldset(fields, EmployeeProfileDetailResponse)
+    result = employee_service.get_employees_batch(
+        batch,
+        scope=None if policy.is_unrestricted else policy.read_predicate(),
+        fields=fields
+    )
+    return _sparse_json(result, fields)
+
+
+@router.post("/bulk-update", response_model=EmployeeBulkUpdateResponse)
+async def bulk_update_employees(
+    request: Request,
+    bulk: EmployeeBulkUpdateRequest,
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_service: EmployeeProfileService = Depends(get_employee_service)
+):
+    """
+    Apply one change to many employees at once (reorgs, mass status changes).
+    
+    - **ids** and/or **filter**: the selection; both given means both must match
+    - **changes**: department, position, employee_status, date_of_leaving, city, state, country
+    - **dry_run**: only count the employees that would change
+    
+    Only employees the caller may edit are selected, and only those whose
+    values actually differ are changed. Managers are assigned one employee
+    at a time with PUT /{employee_id}/manager.
+    """
+    logger.info("Bulk update employees endpoint called")
+    return employee_service.bulk_update_employees(
+        bulk,
+        scope=None if policy.is_unrestricted else policy.write_predicate()
+    )
+
+
+@router.get("/facets", response_model=FacetCountsResponse)
+async def get_facets(
+    request: Request,
+    facet_limit: int = 20,
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Get facet counts over all employees visible to the caller (dashboard use).
+    """
+    logger.info("Get facets endpoint called")
+    return employee_service.get_facets(
+        scope=None if policy.is_unrestricted else policy.read_predicate(),
+        facet_limit=min(facet_limit, 100)
+    )
+
+
+@router.post("/facets/rebuild")
+async def rebuild_facets(
+    request: Request,
+    principal: Principal = Depends(get_principal),
+    employee_service: EmployeeProfileService = Depends(get_employee_service)
+):
+    """
+    Recompute facet counters from the profiles table (backfill/repair).
+    """
+    logger.info("Rebuild facets endpoint called")
+    
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return employee_service.rebuild_facets()
+
+
+@router.get("/access-grants/{user_id}", response_model=list[AccessGrantResponse])
+async def get_access_grants(
+    request: Request,
+    user_id: int,
+    principal: Principal = Depends(get_principal),
+    grant_service: AccessGrantService = Depends(get_access_grant_service)
+):
+    """
+    List a user's department access grants.
+    """
+    logger.info(f"Get access grants endpoint called for user: {user_id}")
+    
+    if not principal.is_admin and principal.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    return grant_service.list_grants(user_id)
+
+
+@router.post("/access-grants", response_model=AccessGrantResponse)
+async def create_access_grant(
+    request: Request,
+    grant_data: AccessGrantCreate,
+    principal: Principal = Depends(get_principal),
+    grant_service: AccessGrantService = Depends(get_access_grant_service)
+):
+    """
+    Grant a user (e.g. an HR partner) visibility over a department.
+    
+    - **can_edit**: also allow updating profiles in that department
+    """
+    logger.info("Create access grant endpoint called")
+    
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return grant_service.grant(grant_data)
+
+
+@router.delete("/access-grants/{user_id}/{department}")
+async def delete_access_grant(
+    request: Request,
+    user_id: int,
+    department: str,
+    principal: Principal = Depends(get_principal),
+    grant_service: AccessGrantService = Depends(get_access_grant_service)
+):
+    """
+    Revoke a user's visibility over a department.
+    """
+    logger.info(f"Delete access grant endpoint called for user: {user_id}")
+    
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return grant_service.revoke(user_id, department)
+
+
+@router.get("/stream")
+async def stream_changes(
+    request: Request,
+    principal: Principal = Depends(get_principal)
+):
+    """
+    Server-Sent Events: profile and document changes the caller may see.
+    
+    Events are `employee.created|updated|deleted` and
+    `document.created|updated|deleted` with the IDs involved; refetch what
+    changed through the regular endpoints. A `resync` event means some
+    notifications were missed, so refetch everything shown. The stream ends
+    when the access token expires; reconnect with a fresh one.
+    """
+    if not settings.STREAM_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Change stream is disabled"
+        )
+    
+    # Verified (and cached) once more by authenticate(); only its expiry is needed here
+    token = security_service.verify_local_token(
+        security_service.extract_token_from_header(request.headers.get("Authorization"))
+    )
+    subscriber = broadcaster.subscribe(principal)
+    if subscriber is None:
+        logger.warning(f"Change stream refused for user {principal.user_id}: {broadcaster.client_count} open")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many open change streams",
+            headers={"Retry-After": str(settings.STREAM_RETRY_MS // 1000 or 1)}
         )
     
-    # Admin users get full list
-    return employee_service.get_employees(
+    logger.info(f"Change stream opened for user {principal.user_id}")
+    return StreamingResponse(
+        event_stream(subscriber, lifetime_seconds=max(token["exp"] - time.time(), 0)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/archive", response_model=ArchivedEmployeeListResponse)
+async def get_archived_employees(
+    request: Request,
+    skip: int = 0,
+    limit: int = 20,
+    search: Optional[str] = None,
+    department: Optional[str] = None,
+    principal: Principal = Depends(get_principal),
+    archive_service: EmployeeArchiveService = Depends(get_archive_service)
+):
+    """
+    List employees archived after the retention period (admin only).
+    
+    - **search**: matches name, employee ID or personal email
+    """
+    logger.info("Get archived employees endpoint called")
+    
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return archive_service.get_archived_employees(
         skip=skip,
         limit=min(limit, 100),
         search=search,
-        department=department,
-        status=status
+        department=department
     )
 
 
+@router.get("/archive/{employee_id}", response_model=ArchivedEmployeeDetailResponse)
+async def get_archived_employee(
+    request: Request,
+    employee_id: int,
+    principal: Principal = Depends(get_principal),
+    archive_service: EmployeeArchiveService = Depends(get_archive_service)
+):
+    """
+    Get an archived employee and their documents by original ID (admin only).
+    """
+    logger.info(f"Get archived employee endpoint called for ID: {employee_id}")
+    
+    if not principal.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return archive_service.get_archived_employee(employee_id)
+
+
 @router.get("/{employee_id}", response_model=EmployeeProfileDetailResponse)
 async def get_employee(
     request: Request,  # ✅ ADD THIS
     employee_id: int,
+    fields: Optional[str] = None,
     _ = Depends(verify_employee_access),  # ✅ Now has request via verify_employee_access
-    employee_service: EmployeeProfileService = Depends(get_employee_service)
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
 ):
     """
     Get employee profile by ID.
+    
+    - **fields**: comma-separated profile fields to return (id is always included)
     """
     logger.info(f"Get employee endpoint called for ID: {employee_id}")
-    return employee_service.get_employee_by_id(employee_id)
+    fields = _fieldset(fields, EmployeeProfileDetailResponse)
+    # Access was checked above and the detail does not vary by caller, so the ID and fieldset are the key
+    return await _coalesced_json(
+        request,
+        detail_flight,
+        (employee_id, fields),
+        employee_service.get_employee_by_id,
+        employee_id,
+        fields
+    )
 
 
 @router.get("/user/{user_id}", response_model=EmployeeProfileResponse)
 async def get_employee_by_user(
     request: Request,  # ✅ ADD THIS FIRST
     user_id: int,
-    current_user = Depends(get_current_user_dependency),  # ✅ FIXED: Use correct dependency
-    employee_service: EmployeeProfileService = Depends(get_employee_service),
-    user_repo: UserRepository = Depends(get_user_repository)
+    policy: AccessPolicy = Depends(get_access_policy),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
 ):
     """
     Get employee profile by user ID.
     """
     logger.info(f"Get employee by user endpoint called for user ID: {user_id}")
     
-    # Check access
-    current_user_obj = user_repo.get_by_email(current_user.email)
-    
-    if not current_user_obj.is_admin and current_user_obj.id != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
-    
-    return employee_service.get_employee_by_user_id(user_id)
+    # Profiles outside the caller's visibility read as not found
+    return employee_service.get_employee_by_user_id(user_id, scope=policy.read_predicate())
 
 
 @router.post("/", response_model=EmployeeProfileResponse)
@@ -209,7 +663,7 @@ async def update_employee(
     request: Request,  # ✅ ADD THIS FIRST
     employee_id: int,
     update_data: EmployeeProfileUpdate,
-    _ = Depends(verify_employee_access),  # ✅ Now has request via verify_employee_access
+    _ = Depends(verify_employee_write_access),
     employee_service: EmployeeProfileService = Depends(get_employee_service)
 ):
     """
@@ -251,32 +705,23 @@ async def upload_employee_document(
     document_type: str = Form(...),
     document_name: str = Form(...),
     file: UploadFile = File(...),
-    current_user = Depends(get_current_user_dependency),  # ✅ FIXED: Use correct dependency
-    employee_service: EmployeeProfileService = Depends(get_employee_service),
-    user_repo: UserRepository = Depends(get_user_repository)
+    _ = Depends(verify_employee_write_access),
+    principal: Principal = Depends(get_principal),
+    employee_service: EmployeeProfileService = Depends(get_employee_service)
 ):
     """
     Upload document for employee.
     """
     logger.info(f"Upload document endpoint called for employee: {employee_id}")
     
-    # Check access
-    user = user_repo.get_by_email(current_user.email)
-    
-    if not user.is_admin:
-        employee = employee_service.employee_repo.get_by_user_id(user.id)
-        if not employee or employee.id != employee_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied"
-            )
-    
-    return employee_service.upload_document(
+    # Copying and hashing the file must not block the event loop
+    return await run_in_threadpool(
+        employee_service.upload_document,
         employee_id=employee_id,
         document_type=document_type,
         document_name=document_name,
         file=file,
-        uploaded_by=user.id
+        uploaded_by=principal.user_id
     )
 
 
@@ -285,7 +730,7 @@ async def get_employee_documents(
     request: Request,  # ✅ ADD THIS FIRST
     employee_id: int,
     _ = Depends(verify_employee_access),  # ✅ Now has request via verify_employee_access
-    employee_service: EmployeeProfileService = Depends(get_employee_service)
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
 ):
     """
     Get all documents for an employee.
@@ -294,6 +739,246 @@ async def get_employee_documents(
     return employee_service.get_employee_documents(employee_id)
 
 
+# ========== REPORTING HIERARCHY ==========
+
+@router.put("/{employee_id}/manager", response_model=EmployeeProfileResponse)
+async def assign_manager(
+    request: Request,
+    employee_id: int,
+    assignment: ManagerAssignment,
+    current_user = Depends(get_current_user_dependency),
+    employee_service: EmployeeProfileService = Depends(get_employee_service),
+    user_repo: UserRepository = Depends(get_user_repository)
+):
+    """
+    Assign an employee's manager; their whole subtree moves with them.
+    
+    - **manager_id**: new manager's profile ID, or null to make them a root
+    """
+    logger.info(f"Assign manager endpoint called for employee: {employee_id}")
+    
+    user = user_repo.get_by_email(current_user.email)
+    
+    if not user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return employee_service.assign_manager(employee_id, assignment)
+
+
+@router.get("/{employee_id}/reports", response_model=list[EmployeeProfileResponse])
+async def get_direct_reports(
+    request: Request,
+    employee_id: int,
+    _ = Depends(verify_employee_access),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Get an employee's direct reports.
+    """
+    logger.info(f"Get direct reports endpoint called for employee: {employee_id}")
+    return employee_service.get_direct_reports(employee_id)
+
+
+@router.get("/{employee_id}/subtree", response_model=EmployeeListResponse)
+async def get_subtree(
+    request: Request,
+    employee_id: int,
+    skip: int = 0,
+    limit: int = 20,
+    max_depth: Optional[int] = None,
+    _ = Depends(verify_employee_access),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Get everyone reporting to an employee, directly or indirectly.
+    
+    - **max_depth**: optionally limit how many levels down to go
+    """
+    logger.info(f"Get subtree endpoint called for employee: {employee_id}")
+    return employee_service.get_subtree(
+        employee_id,
+        skip=skip,
+        limit=min(limit, 100),
+        max_depth=max_depth
+    )
+
+
+@router.get("/{employee_id}/chain", response_model=list[EmployeeProfileResponse])
+async def get_chain_of_command(
+    request: Request,
+    employee_id: int,
+    _ = Depends(verify_employee_access),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Get an employee's chain of command, from direct manager to the top.
+    """
+    logger.info(f"Get chain of command endpoint called for employee: {employee_id}")
+    return employee_service.get_chain_of_command(employee_id)
+
+
+@router.get("/{employee_id}/headcount", response_model=HeadcountResponse)
+async def get_headcount(
+    request: Request,
+    employee_id: int,
+    _ = Depends(verify_employee_access),
+    employee_service: EmployeeProfileService = Depends(get_read_employee_service)
+):
+    """
+    Get headcount below an employee, in total and per direct report.
+    """
+    logger.info(f"Get headcount endpoint called for employee: {employee_id}")
+    return employee_service.get_headcount(employee_id)
+
+
+@router.post("/hierarchy/rebuild")
+async def rebuild_hierarchy(
+    request: Request,
+    current_user = Depends(get_current_user_dependency),
+    employee_service: EmployeeProfileService = Depends(get_employee_service),
+    user_repo: UserRepository = Depends(get_user_repository)
+):
+    """
+    Recompute the hierarchy closure table from manager links (backfill/repair).
+    """
+    logger.info("Rebuild hierarchy endpoint called")
+    
+    user = user_repo.get_by_email(current_user.email)
+    
+    if not user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    
+    return employee_service.rebuild_hierarchy()
+
+
+# ========== RESUMABLE UPLOADS ==========
+
+async def _read_chunk_body(request: Request) -> bytes:
+    """Read a chunk body, rejecting it as soon as it exceeds the chunk limit."""
+    limit = settings.UPLOAD_CHUNK_MAX_BYTES
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > limit:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Chunk exceeds maximum size of {limit} bytes"
+        )
+    
+    body = bytearray()
+    async for part in request.stream():
+        body.extend(part)
+        if len(body) > limit:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Chunk exceeds maximum size of {limit} bytes"
+            )
+    return bytes(body)
+
+
+@router.post(
+    "/{employee_id}/documents/uploads",
+    response_model=DocumentUploadSessionResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def create_upload_session(
+    request: Request,
+    employee_id: int,
+    session_data: DocumentUploadSessionCreate,
+    _ = Depends(verify_employee_write_access),
+    principal: Principal = Depends(get_principal),
+    upload_service: DocumentUploadService = Depends(get_upload_service)
+):
+    """
+    Start a resumable document upload.
+    
+    - Returns: upload_id and the maximum chunk size
+    - Next: PUT chunks to /uploads/{upload_id}?offset=N, then POST /complete
+    """
+    logger.info(f"Create upload session endpoint called for employee: {employee_id}")
+    return upload_service.create_session(employee_id, session_data, created_by=principal.user_id)
+
+
+@router.get("/{employee_id}/documents/uploads/{upload_id}", response_model=DocumentUploadSessionResponse)
+async def get_upload_session(
+    request: Request,
+    employee_id: int,
+    upload_id: str,
+    _ = Depends(verify_employee_write_access),
+    upload_service: DocumentUploadService = Depends(get_upload_service)
+):
+    """
+    Get upload progress, including the byte ranges still missing.
+    """
+    logger.info(f"Get upload session endpoint called: {upload_id}")
+    return upload_service.get_session(employee_id, upload_id)
+
+
+@router.put("/{employee_id}/documents/uploads/{upload_id}", response_model=DocumentUploadSessionResponse)
+async def upload_chunk(
+    request: Request,
+    employee_id: int,
+    upload_id: str,
+    offset: int,
+    _ = Depends(verify_employee_write_access),
+    upload_service: DocumentUploadService = Depends(get_upload_service)
+):
+    """
+    Upload one chunk of raw bytes at the given byte offset.
+    
+    Chunks may be sent in any order, in parallel, and re-sent after failures.
+    """
+    logger.debug(f"Upload chunk endpoint called: {upload_id} offset={offset}")
+    data = await _read_chunk_body(request)
+    # File writes stay off the event loop
+    return await run_in_threadpool(upload_service.write_chunk, employee_id, upload_id, offset, data)
+
+
+@router.post("/{employee_id}/documents/uploads/{upload_id}/complete", response_model=EmployeeDocumentResponse)
+async def complete_upload_session(
+    request: Request,
+    employee_id: int,
+    upload_id: str,
+    complete_data: DocumentUploadComplete,
+    _ = Depends(verify_employee_write_access),
+    principal: Principal = Depends(get_principal),
+    upload_service: DocumentUploadService = Depends(get_upload_service)
+):
+    """
+    Finalize an upload: verify all bytes arrived, hash and register the document.
+    
+    - **checksum_sha256**: optional client-side hash to verify against
+    """
+    logger.info(f"Complete upload endpoint called: {upload_id}")
+    # Hashing up to UPLOAD_MAX_FILE_BYTES must not block the event loop
+    return await run_in_threadpool(
+        upload_service.complete_session,
+        employee_id,
+        upload_id,
+        complete_data,
+        uploaded_by=principal.user_id
+    )
+
+
+@router.delete("/{employee_id}/documents/uploads/{upload_id}")
+async def abort_upload_session(
+    request: Request,
+    employee_id: int,
+    upload_id: str,
+    _ = Depends(verify_employee_write_access),
+    upload_service: DocumentUploadService = Depends(get_upload_service)
+):
+    """
+    Abort an upload and discard the received bytes.
+    """
+    logger.info(f"Abort upload endpoint called: {upload_id}")
+    return upload_service.abort_session(employee_id, upload_id)
+
+
 # ========== DEBUG ENDPOINT ==========
 @router.get("/test/auth")
 async def test_auth(
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import date, datetime
 
 
@@ -20,7 +20,9 @@ class EmployeeProfileBase(BaseModel):
     position: Optional[str] = Field(None, max_length=100)
     employment_type: Optional[str] = Field(None, max_length=50)
     date_of_joining: Optional[date] = None
+    date_of_leaving: Optional[date] = None
     employee_status: Optional[str] = Field("Active", max_length=50)
+    manager_id: Optional[int] = None
     address_line1: Optional[str] = Field(None, max_length=255)
     address_line2: Optional[str] = Field(None, max_length=255)
     city: Optional[str] = Field(None, max_length=100)
@@ -44,6 +46,7 @@ class EmployeeProfileUpdate(BaseModel):
     phone_number: Optional[str] = Field(None, max_length=20)
     department: Optional[str] = Field(None, max_length=100)
     position: Optional[str] = Field(None, max_length=100)
+    date_of_leaving: Optional[date] = None
     employee_status: Optional[str] = Field(None, max_length=50)
     address_line1: Optional[str] = Field(None, max_length=255)
     address_line2: Optional[str] = Field(None, max_length=255)
@@ -75,6 +78,100 @@ class EmployeeProfileDetailResponse(EmployeeProfileResponse):
     user_picture: Optional[str] = None
 
 
+class EmployeeBatchGetRequest(BaseModel):
+    """Schema for fetching many employees at once, by ID and/or employee code."""
+    ids: List[int] = []
+    employee_ids: List[str] = []
+
+
+class EmployeeBatchGetItem(BaseModel):
+    """Outcome for one requested key; profile is set only when status is "ok"."""
+    id: Optional[int] = None
+    employee_id: Optional[str] = None
+    status: str  # ok, not_found, forbidden
+    profile: Optional[EmployeeProfileDetailResponse] = None
+
+
+class EmployeeBatchGetResponse(BaseModel):
+    """Batch read results, in request order (IDs first, then employee codes)."""
+    items: List[EmployeeBatchGetItem]
+    found: int
+
+
+class EmployeeBulkChanges(BaseModel):
+    """Fields a bulk update may set; unset (None) fields are left as they are."""
+    department: Optional[str] = Field(None, max_length=100)
+    position: Optional[str] = Field(None, max_length=100)
+    date_of_leaving: Optional[date] = None
+    employee_status: Optional[str] = Field(None, max_length=50)
+    city: Optional[str] = Field(None, max_length=100)
+    state: Optional[str] = Field(None, max_length=100)
+    country: Optional[str] = Field(None, max_length=100)
+
+
+class EmployeeBulkFilter(BaseModel):
+    """Selection by the same filters as GET /api/employees/search."""
+    q: Optional[str] = None
+    department: Optional[str] = None
+    employee_status: Optional[str] = None
+    employment_type: Optional[str] = None
+    country: Optional[str] = None
+    city: Optional[str] = None
+
+
+class EmployeeBulkUpdateRequest(BaseModel):
+    """Schema for applying one change to many employees."""
+    ids: List[int] = []
+    filter: Optional[EmployeeBulkFilter] = None
+    changes: EmployeeBulkChanges
+    dry_run: bool = False
+
+
+class EmployeeBulkUpdateResponse(BaseModel):
+    """Outcome of a bulk update; on a dry run nothing is changed and ids is empty."""
+    matched: int
+    updated: int
+    dry_run: bool
+    ids: List[int] = []
+
+
+class ManagerAssignment(BaseModel):
+    """Schema for assigning (or clearing) an employee's manager."""
+    manager_id: Optional[int] = None
+
+
+class ReportHeadcount(BaseModel):
+    """Headcount of one direct report's subtree, including the report."""
+    employee_id: int
+    headcount: int
+
+
+class HeadcountResponse(BaseModel):
+    """Schema for subtree headcount."""
+    employee_id: int
+    direct_reports: int
+    total_reports: int
+    by_direct_report: List[ReportHeadcount]
+
+
+class AccessGrantCreate(BaseModel):
+    """Schema for granting a user visibility over a department."""
+    user_id: int
+    department: str = Field(..., min_length=1, max_length=100)
+    can_edit: bool = False
+
+
+class AccessGrantResponse(BaseModel):
+    """Schema for a department access grant."""
+    user_id: int
+    department: str
+    can_edit: bool
+    created_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
 class EmployeeDocumentBase(BaseModel):
     """Base schema for employee document."""
     document_type: str = Field(..., min_length=1, max_length=100)
@@ -88,6 +185,7 @@ class EmployeeDocumentResponse(EmployeeDocumentBase):
     employee_id: int
     file_size: Optional[int] = None
     mime_type: Optional[str] = None
+    checksum_sha256: Optional[str] = None
     uploaded_at: datetime
     is_verified: bool
     verified_at: Optional[datetime] = None
@@ -96,6 +194,70 @@ class EmployeeDocumentResponse(EmployeeDocumentBase):
         from_attributes = True
 
 
+class ArchivedDocumentResponse(EmployeeDocumentBase):
+    """Schema for a document of an archived employee."""
+    id: int
+    employee_id: int
+    file_size: Optional[int] = None
+    mime_type: Optional[str] = None
+    checksum_sha256: Optional[str] = None
+    uploaded_at: Optional[datetime] = None
+    is_verified: Optional[bool] = None
+    verified_at: Optional[datetime] = None
+    archived_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class ArchivedEmployeeResponse(EmployeeProfileBase):
+    """Schema for an archived employee profile."""
+    id: int
+    user_id: Optional[int] = None
+    personal_email: Optional[str] = None  # stored values are not re-validated
+    employee_status: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    archived_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class ArchivedEmployeeDetailResponse(ArchivedEmployeeResponse):
+    """Archived profile together with its documents."""
+    documents: List[ArchivedDocumentResponse] = []
+
+
+class DocumentUploadSessionCreate(BaseModel):
+    """Schema for starting a resumable document upload."""
+    document_type: str = Field(..., min_length=1, max_length=100)
+    document_name: str = Field(..., min_length=1, max_length=255)
+    file_name: Optional[str] = Field(None, max_length=255)
+    mime_type: Optional[str] = Field(None, max_length=100)
+    total_size: int = Field(..., gt=0)
+
+
+class DocumentUploadComplete(BaseModel):
+    """Schema for finalizing a resumable document upload."""
+    checksum_sha256: Optional[str] = Field(None, min_length=64, max_length=64)
+
+
+class DocumentUploadSessionResponse(BaseModel):
+    """Schema for resumable upload session state."""
+    upload_id: str
+    employee_id: int
+    document_type: str
+    document_name: str
+    total_size: int
+    received_bytes: int
+    missing_ranges: List[List[int]]
+    max_chunk_size: int
+    status: str
+    expires_at: datetime
+    document_id: Optional[int] = None
+
+
 # List responses
 class EmployeeListResponse(BaseModel):
     """Schema for paginated employee list."""
@@ -103,4 +265,29 @@ class EmployeeListResponse(BaseModel):
     total: int
     page: int
     size: int
-    pages: int
\ No newline at end of file
+    pages: int
+
+
+class ArchivedEmployeeListResponse(BaseModel):
+    """Schema for paginated archived employee list."""
+    items: List[ArchivedEmployeeResponse]
+    total: int
+    page: int
+    size: int
+    pages: int
+
+
+class FacetValue(BaseModel):
+    """Count of employees sharing one facet value."""
+    value: Optional[str] = None
+    count: int
+
+
+class FacetCountsResponse(BaseModel):
+    """Schema for facet counts keyed by facet name."""
+    facets: Dict[str, List[FacetValue]]
+
+
+class FacetedSearchResponse(EmployeeListResponse):
+    """Schema for a search page together with facet counts."""
+    facets: Dict[str, List[FacetValue]]
\ No newline at end of file
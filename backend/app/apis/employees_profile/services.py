@@ -1,23 +1,122 @@
 import logging
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Iterator
 from fastapi import HTTPException, status, UploadFile, File
+import csv
+import hashlib
+import io
 import os
-from datetime import datetime
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
 
-from .repositories import EmployeeProfileRepository, EmployeeDocumentRepository
+from .repositories import (
+    EmployeeProfileRepository,
+    EmployeeDocumentRepository,
+    AccessGrantRepository,
+    DocumentUploadSessionRepository,
+    EmployeeArchiveRepository
+)
+from .fieldsets import sparse_model, with_field
 from .schemas import (
     EmployeeProfileCreate,
     EmployeeProfileUpdate,
     EmployeeProfileResponse,
     EmployeeProfileDetailResponse,
+    EmployeeBatchGetRequest,
+    EmployeeBatchGetItem,
+    EmployeeBatchGetResponse,
+    EmployeeBulkUpdateRequest,
+    EmployeeBulkUpdateResponse,
     EmployeeListResponse,
-    EmployeeDocumentResponse
+    EmployeeDocumentResponse,
+    ManagerAssignment,
+    ReportHeadcount,
+    HeadcountResponse,
+    AccessGrantCreate,
+    AccessGrantResponse,
+    FacetValue,
+    FacetCountsResponse,
+    FacetedSearchResponse,
+    DocumentUploadSessionCreate,
+    DocumentUploadComplete,
+    DocumentUploadSessionResponse,
+    ArchivedEmployeeResponse,
+    ArchivedEmployeeDetailResponse,
+    ArchivedEmployeeListResponse
 )
 from app.apis.auth.repositories import UserRepository
+from app.core.config import settings
+from app.database.unit_of_work import on_commit, on_rollback, savepoint
 
 
 logger = logging.getLogger(__name__)
 
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _document_file_path(employee_id: int, document_type: str, filename: Optional[str]) -> str:
+    """Build a unique on-disk path for an employee document, creating its directory."""
+    upload_dir = os.path.join(settings.UPLOAD_DIR, f"employee_{employee_id}")
+    os.makedirs(upload_dir, exist_ok=True)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    file_extension = os.path.splitext(filename)[1] if filename else ""
+    filename = f"{document_type}_{timestamp}_{uuid.uuid4().hex[:8]}{file_extension}"
+    return os.path.join(upload_dir, filename)
+
+
+def _merge_ranges(ranges: List[Tuple[int, int]], total_size: int) -> Tuple[int, List[List[int]]]:
+    """Merge received (offset, size) ranges into received byte count and missing [start, end) gaps."""
+    received = 0
+    missing = []
+    cursor = 0
+    for offset, size in ranges:
+        end = offset + size
+        if end <= cursor:
+            continue
+        if offset > cursor:
+            missing.append([cursor, offset])
+            received += end - offset
+        else:
+            received += end - cursor
+        cursor = end
+    if cursor < total_size:
+        missing.append([cursor, total_size])
+    return received, missing
+
+
+def _facet_response(counts: Dict[str, List[Tuple[Optional[str], int]]], limit: int) -> Dict[str, List[FacetValue]]:
+    """Sort each facet's values by count and keep the top ones."""
+    return {
+        facet: [
+            FacetValue(value=value, count=count)
+            for value, count in sorted(values, key=lambda item: -item[1])[:limit]
+        ]
+        for facet, values in counts.items()
+    }
+
+
+def _page_models(page, fields: Optional[Tuple[str, ...]]):
+    """Item and page models for a list response, trimmed to a sparse fieldset if given."""
+    if fields is None:
+        return EmployeeProfileResponse, page
+    item = sparse_model(EmployeeProfileResponse, fields)
+    return item, with_field(page, "items", List[item])
+
+
+def _is_expired(upload) -> bool:
+    """Check session expiry, treating naive timestamps as UTC."""
+    expires_at = upload.expires_at
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at < datetime.now(timezone.utc)
+
+
+def _remove_file(path: str):
+    """Delete a file if it is still there (the orphan sweep may have got to it first)."""
+    if os.path.exists(path):
+        os.remove(path)
+
 
 class EmployeeProfileService:
     """Service for employee profile business logic."""
@@ -32,11 +131,25 @@ class EmployeeProfileService:
         self.user_repo = user_repo
         self.doc_repo = doc_repo
     
-    def get_employee_by_id(self, employee_id: int) -> EmployeeProfileDetailResponse:
-        """Get employee profile by ID."""
+    def get_employee_by_id(
+        self,
+        employee_id: int,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> EmployeeProfileDetailResponse:
+        """Get employee profile by ID, only the given fields if a sparse fieldset is passed."""
         logger.info(f"Getting employee profile by ID: {employee_id}")
         
         try:
+            if fields is not None:
+                rows = self.employee_repo.get_many(ids=[employee_id], fields=fields)
+                if not rows:
+                    logger.warning(f"Employee not found: {employee_id}")
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Employee not found"
+                    )
+                return sparse_model(EmployeeProfileDetailResponse, fields).from_orm(rows[0])
+            
             employee = self.employee_repo.get_by_id(employee_id)
             if not employee:
                 logger.warning(f"Employee not found: {employee_id}")
@@ -66,12 +179,80 @@ class EmployeeProfileService:
                 detail="Internal server error"
             )
     
-    def get_employee_by_user_id(self, user_id: int) -> EmployeeProfileResponse:
+    def get_employees_batch(
+        self,
+        batch: EmployeeBatchGetRequest,
+        scope=None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> EmployeeBatchGetResponse:
+        """
+        Fetch many employees by ID and/or employee code with one query.
+        
+        Access is part of the query, so a restricted caller cannot tell a
+        profile it may not see from a missing one: both come back as
+        "forbidden", as GET /api/employees/{id} answers 403 for both.
+        """
+        ids = list(dict.fromkeys(batch.ids))
+        codes = list(dict.fromkeys(batch.employee_ids))
+        logger.info(f"Batch get: {len(ids)} IDs, {len(codes)} employee IDs")
+        
+        try:
+            if not ids and not codes:
+                raise ValueError("Provide at least one ID or employee ID")
+            if len(ids) + len(codes) > settings.BATCH_GET_MAX_IDS:
+                raise ValueError(f"At most {settings.BATCH_GET_MAX_IDS} IDs per request")
+            
+            employees = self.employee_repo.get_many(ids=ids, employee_codes=codes, scope=scope, fields=fields)
+            by_id = {employee.id: employee for employee in employees}
+            by_code = {employee.employee_id: employee for employee in employees}
+            missing = "not_found" if scope is None else "forbidden"
+            
+            item_model, response_model = EmployeeBatchGetItem, EmployeeBatchGetResponse
+            if fields is not None:
+                profile_model = sparse_model(EmployeeProfileDetailResponse, fields)
+                item_model = with_field(EmployeeBatchGetItem, "profile", Optional[profile_model])
+                response_model = with_field(EmployeeBatchGetResponse, "items", List[item_model])
+            
+            def item(employee, **key) -> EmployeeBatchGetItem:
+                if employee is None:
+                    return item_model(status=missing, **key)
+                if fields is not None:
+                    return item_model(status="ok", profile=profile_model.from_orm(employee), **key)
+                profile = EmployeeProfileDetailResponse.from_orm(employee)
+                if employee.user:
+                    profile.user_email = employee.user.email
+                    profile.user_name = employee.user.name
+                    profile.user_picture = employee.user.picture
+                return item_model(status="ok", profile=profile, **key)
+            
+            items = [item(by_id.get(employee_id), id=employee_id) for employee_id in ids]
+            items += [item(by_code.get(code), employee_id=code) for code in codes]
+            
+            found = sum(1 for entry in items if entry.status == "ok")
+            logger.info(f"Batch get resolved {found} of {len(items)} employees")
+            return response_model(items=items, found=found)
+            
+        except ValueError as e:
+            logger.warning(f"Invalid batch get: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error in batch get: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def get_employee_by_user_id(self, user_id: int, scope=None) -> EmployeeProfileResponse:
         """Get employee profile by user ID."""
         logger.info(f"Getting employee profile by user ID: {user_id}")
         
         try:
-            employee = self.employee_repo.get_by_user_id(user_id)
+            employee = self.employee_repo.get_by_user_id(user_id, scope=scope)
             if not employee:
                 logger.warning(f"Employee not found for user: {user_id}")
                 raise HTTPException(
@@ -97,9 +278,11 @@ class EmployeeProfileService:
         limit: int = 20,
         search: Optional[str] = None,
         department: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        scope=None,
+        fields: Optional[Tuple[str, ...]] = None
     ) -> EmployeeListResponse:
-        """Get all employees with pagination and filtering."""
+        """Get all employees visible under scope, with pagination and filtering."""
         logger.info(f"Getting employees: skip={skip}, limit={limit}")
         
         try:
@@ -108,14 +291,17 @@ class EmployeeProfileService:
                 limit=limit,
                 search=search,
                 department=department,
-                status=status
+                status=status,
+                scope=scope,
+                fields=fields
             )
             
             # Calculate pagination info
             pages = (total + limit - 1) // limit if limit > 0 else 0
             
-            response = EmployeeListResponse(
-                items=[EmployeeProfileResponse.from_orm(emp) for emp in employees],
+            item, page = _page_models(EmployeeListResponse, fields)
+            response = page(
+                items=[item.from_orm(emp) for emp in employees],
                 total=total,
                 page=skip // limit + 1 if limit > 0 else 1,
                 size=limit,
@@ -132,13 +318,123 @@ class EmployeeProfileService:
                 detail="Internal server error"
             )
     
+    def search_employees(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        search: Optional[str] = None,
+        facets: Optional[Dict[str, str]] = None,
+        scope=None,
+        facet_limit: int = 20,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> FacetedSearchResponse:
+        """
+        Search employees and count facet values in one call.
+        
+        A scope of None means the caller is unrestricted; unfiltered facets are
+        then read from the maintained counters instead of scanning profiles.
+        """
+        logger.info(f"Searching employees: skip={skip}, limit={limit}, facets={facets}")
+        
+        try:
+            employees, total = self.employee_repo.get_all(
+                skip=skip,
+                limit=limit,
+                search=search,
+                scope=scope,
+                facets=facets,
+                fields=fields
+            )
+            counts = self._facet_counts(search, facets, scope)
+            
+            item, page = _page_models(FacetedSearchResponse, fields)
+            return page(
+                items=[item.from_orm(emp) for emp in employees],
+                total=total,
+                page=skip // limit + 1 if limit > 0 else 1,
+                size=limit,
+                pages=(total + limit - 1) // limit if limit > 0 else 0,
+                facets=_facet_response(counts, facet_limit)
+            )
+            
+        except Exception as e:
+            logger.exception(f"Error searching employees: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def get_facets(self, scope=None, facet_limit: int = 20) -> FacetCountsResponse:
+        """Get unfiltered facet counts for the caller's visible employees."""
+        logger.info("Getting facet counts")
+        
+        try:
+            counts = self._facet_counts(None, None, scope)
+            return FacetCountsResponse(facets=_facet_response(counts, facet_limit))
+            
+        except Exception as e:
+            logger.exception(f"Error getting facet counts: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def rebuild_facets(self) -> Dict[str, Any]:
+        """Recompute facet counters from the profiles table."""
+        logger.info("Rebuilding facet counters")
+        
+        try:
+            counters = self.employee_repo.facets.rebuild()
+            return {"message": "Facet counters rebuilt", "counters": counters}
+            
+        except Exception as e:
+            logger.exception(f"Error rebuilding facet counters: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def _facet_counts(self, search: Optional[str], facets: Optional[Dict[str, str]], scope):
+        """Use the counters when nothing narrows the result set, otherwise GROUP BY."""
+        if scope is None and not search and not facets:
+            return self.employee_repo.facets.get_counts()
+        return self.employee_repo.get_facet_counts(search=search, scope=scope, facets=facets)
+    
+    def export_employees(
+        self,
+        search: Optional[str] = None,
+        department: Optional[str] = None,
+        status: Optional[str] = None,
+        scope=None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Iterator[str]:
+        """Stream visible employees as CSV (only the given columns with fields), one batch of rows at a time."""
+        logger.info("Exporting employees")
+        
+        columns = list(fields or EmployeeProfileResponse.model_fields)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        writer.writerow(columns)
+        yield buffer.getvalue()
+        
+        rows = 0
+        for employee in self.employee_repo.iter_all(search, department, status, scope, fields=fields):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow([getattr(employee, column) for column in columns])
+            yield buffer.getvalue()
+            rows += 1
+        
+        logger.info(f"Exported {rows} employees")
+    
     def create_employee(self, employee_data: EmployeeProfileCreate) -> EmployeeProfileResponse:
         """Create new employee profile."""
         logger.info(f"Creating new employee: {employee_data.employee_id}")
         
         try:
             # Check if user exists
-            user = self.user_repo.get_by_email(employee_data.user_id)
+            user = self.user_repo.get_by_id(employee_data.user_id)
             if not user:
                 logger.warning(f"User not found for employee creation: {employee_data.user_id}")
                 raise HTTPException(
@@ -211,6 +507,12 @@ class EmployeeProfileService:
             logger.info(f"Employee profile updated: {employee.employee_id}")
             return EmployeeProfileResponse.from_orm(employee)
             
+        except ValueError as e:
+            logger.warning(f"Validation error updating employee: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
         except HTTPException:
             raise
         except Exception as e:
@@ -220,6 +522,56 @@ class EmployeeProfileService:
                 detail="Internal server error"
             )
     
+    def bulk_update_employees(self, bulk: EmployeeBulkUpdateRequest, scope=None) -> EmployeeBulkUpdateResponse:
+        """Apply one change to a set of employees (by IDs and/or filter) in one statement."""
+        changes = {k: v for k, v in bulk.changes.dict().items() if v is not None}
+        logger.info(f"Bulk update: fields={sorted(changes)}, ids={len(bulk.ids)}, dry_run={bulk.dry_run}")
+        
+        try:
+            if not changes:
+                raise ValueError("No update data provided")
+            if not bulk.ids and bulk.filter is None:
+                raise ValueError("Select employees with ids and/or a filter")
+            if len(bulk.ids) > settings.BULK_UPDATE_MAX_ROWS:
+                raise ValueError(f"At most {settings.BULK_UPDATE_MAX_ROWS} IDs per request")
+            
+            selection = bulk.filter.dict() if bulk.filter else {}
+            search = selection.pop("q", None)
+            facets = {name: value for name, value in selection.items() if value is not None}
+            
+            matched, updated = self.employee_repo.bulk_update(
+                changes,
+                ids=list(dict.fromkeys(bulk.ids)),
+                search=search,
+                facets=facets,
+                scope=scope,
+                max_rows=settings.BULK_UPDATE_MAX_ROWS,
+                dry_run=bulk.dry_run
+            )
+            
+            logger.info(f"Bulk update matched {matched}, updated {len(updated)}")
+            return EmployeeBulkUpdateResponse(
+                matched=matched,
+                updated=len(updated),
+                dry_run=bulk.dry_run,
+                ids=sorted(employee.id for employee in updated)
+            )
+            
+        except ValueError as e:
+            logger.warning(f"Validation error in bulk update: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error in bulk update: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
     def delete_employee(self, employee_id: int) -> Dict[str, str]:
         """Delete employee profile (soft delete)."""
         logger.info(f"Deleting employee: {employee_id}")
@@ -245,6 +597,119 @@ class EmployeeProfileService:
                 detail="Internal server error"
             )
     
+    def assign_manager(self, employee_id: int, assignment: ManagerAssignment) -> EmployeeProfileResponse:
+        """Assign or clear an employee's manager, moving their subtree with them."""
+        logger.info(f"Assigning manager {assignment.manager_id} to employee: {employee_id}")
+        
+        try:
+            employee = self.employee_repo.update(employee_id, {"manager_id": assignment.manager_id})
+            if not employee:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Employee not found"
+                )
+            return EmployeeProfileResponse.from_orm(employee)
+            
+        except ValueError as e:
+            logger.warning(f"Invalid manager assignment for {employee_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error assigning manager for {employee_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def get_direct_reports(self, employee_id: int) -> List[EmployeeProfileResponse]:
+        """Get an employee's direct reports."""
+        logger.info(f"Getting direct reports for employee: {employee_id}")
+        
+        self._require_employee(employee_id)
+        reports = self.employee_repo.hierarchy.get_direct_reports(employee_id)
+        return [EmployeeProfileResponse.from_orm(emp) for emp in reports]
+    
+    def get_subtree(
+        self,
+        employee_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        max_depth: Optional[int] = None
+    ) -> EmployeeListResponse:
+        """Get everyone reporting (directly or indirectly) to an employee."""
+        logger.info(f"Getting subtree for employee: {employee_id}")
+        
+        self._require_employee(employee_id)
+        employees, total = self.employee_repo.hierarchy.get_subtree(
+            employee_id,
+            skip=skip,
+            limit=limit,
+            max_depth=max_depth
+        )
+        
+        return EmployeeListResponse(
+            items=[EmployeeProfileResponse.from_orm(emp) for emp in employees],
+            total=total,
+            page=skip // limit + 1 if limit > 0 else 1,
+            size=limit,
+            pages=(total + limit - 1) // limit if limit > 0 else 0
+        )
+    
+    def get_chain_of_command(self, employee_id: int) -> List[EmployeeProfileResponse]:
+        """Get an employee's managers from nearest to the top."""
+        logger.info(f"Getting chain of command for employee: {employee_id}")
+        
+        self._require_employee(employee_id)
+        managers = self.employee_repo.hierarchy.get_chain_of_command(employee_id)
+        return [EmployeeProfileResponse.from_orm(emp) for emp in managers]
+    
+    def get_headcount(self, employee_id: int) -> HeadcountResponse:
+        """Get subtree headcount, in total and per direct report."""
+        logger.info(f"Getting headcount for employee: {employee_id}")
+        
+        self._require_employee(employee_id)
+        by_report = self.employee_repo.hierarchy.get_report_headcounts(employee_id)
+        
+        return HeadcountResponse(
+            employee_id=employee_id,
+            direct_reports=len(by_report),
+            total_reports=self.employee_repo.hierarchy.get_headcount(employee_id),
+            by_direct_report=[
+                ReportHeadcount(employee_id=report_id, headcount=count)
+                for report_id, count in by_report
+            ]
+        )
+    
+    def rebuild_hierarchy(self) -> Dict[str, Any]:
+        """Recompute the hierarchy closure table from manager links."""
+        logger.info("Rebuilding hierarchy")
+        
+        try:
+            paths = self.employee_repo.hierarchy.rebuild()
+            return {"message": "Hierarchy rebuilt", "paths": paths}
+            
+        except Exception as e:
+            logger.exception(f"Error rebuilding hierarchy: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def _require_employee(self, employee_id: int):
+        """Raise 404 unless the employee exists and is active."""
+        employee = self.employee_repo.get_by_id(employee_id)
+        if not employee:
+            logger.warning(f"Employee not found: {employee_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Employee not found"
+            )
+        return employee
+    
     def upload_document(
         self,
         employee_id: int,
@@ -266,23 +731,19 @@ class EmployeeProfileService:
                     detail="Employee not found"
                 )
             
-            # Create upload directory if not exists
-            upload_dir = f"uploads/employee_{employee_id}"
-            os.makedirs(upload_dir, exist_ok=True)
+            file_path = _document_file_path(employee_id, document_type, file.filename)
             
-            # Generate unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_extension = os.path.splitext(file.filename)[1] if file.filename else ""
-            filename = f"{document_type}_{timestamp}{file_extension}"
-            file_path = os.path.join(upload_dir, filename)
-            
-            # Save file
+            # Stream file to disk in blocks, hashing as we go
+            digest = hashlib.sha256()
+            file_size = 0
             with open(file_path, "wb") as buffer:
-                content = file.file.read()
-                buffer.write(content)
-            
-            # Get file size
-            file_size = len(content)
+                while True:
+                    block = file.file.read(_HASH_BLOCK_SIZE)
+                    if not block:
+                        break
+                    digest.update(block)
+                    buffer.write(block)
+                    file_size += len(block)
             
             # Create document record
             document_data = {
@@ -292,6 +753,7 @@ class EmployeeProfileService:
                 "file_path": file_path,
                 "file_size": file_size,
                 "mime_type": file.content_type,
+                "checksum_sha256": digest.hexdigest(),
                 "uploaded_by": uploaded_by
             }
             
@@ -335,4 +797,405 @@ class EmployeeProfileService:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Internal server error"
-            )
\ No newline at end of file
+            )
+
+
+class AccessGrantService:
+    """Service for managing department access grants."""
+    
+    def __init__(self, grant_repo: AccessGrantRepository, user_repo: UserRepository):
+        self.grant_repo = grant_repo
+        self.user_repo = user_repo
+    
+    def list_grants(self, user_id: int) -> List[AccessGrantResponse]:
+        """List a user's department grants."""
+        return [AccessGrantResponse.from_orm(grant) for grant in self.grant_repo.get_by_user(user_id)]
+    
+    def grant(self, grant_data: AccessGrantCreate) -> AccessGrantResponse:
+        """Grant a user visibility over a department."""
+        logger.info(f"Granting department access: {grant_data.user_id} -> {grant_data.department}")
+        
+        if not self.user_repo.get_by_id(grant_data.user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        
+        grant = self.grant_repo.upsert(grant_data.user_id, grant_data.department, grant_data.can_edit)
+        return AccessGrantResponse.from_orm(grant)
+    
+    def revoke(self, user_id: int, department: str) -> Dict[str, str]:
+        """Revoke a user's visibility over a department."""
+        logger.info(f"Revoking department access: {user_id} -> {department}")
+        
+        if not self.grant_repo.delete(user_id, department):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Access grant not found"
+            )
+        return {"message": "Access grant revoked"}
+
+
+class EmployeeArchiveService:
+    """Read access to archived (long-departed) employee profiles."""
+    
+    def __init__(self, archive_repo: EmployeeArchiveRepository):
+        self.archive_repo = archive_repo
+    
+    def get_archived_employees(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        search: Optional[str] = None,
+        department: Optional[str] = None
+    ) -> ArchivedEmployeeListResponse:
+        """List archived employees with pagination and filtering."""
+        logger.info(f"Getting archived employees: skip={skip}, limit={limit}")
+        
+        try:
+            employees, total = self.archive_repo.get_all(
+                skip=skip,
+                limit=limit,
+                search=search,
+                department=department
+            )
+            
+            return ArchivedEmployeeListResponse(
+                items=[ArchivedEmployeeResponse.from_orm(emp) for emp in employees],
+                total=total,
+                page=skip // limit + 1 if limit > 0 else 1,
+                size=limit,
+                pages=(total + limit - 1) // limit if limit > 0 else 0
+            )
+            
+        except Exception as e:
+            logger.exception(f"Error getting archived employees: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def get_archived_employee(self, employee_id: int) -> ArchivedEmployeeDetailResponse:
+        """Get an archived profile and its documents by original ID."""
+        logger.info(f"Getting archived employee: {employee_id}")
+        
+        try:
+            employee = self.archive_repo.get_by_id(employee_id)
+            if not employee:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Archived employee not found"
+                )
+            return ArchivedEmployeeDetailResponse.from_orm(employee)
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error getting archived employee {employee_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+
+
+class DocumentUploadService:
+    """Service for resumable, chunked employee document uploads."""
+    
+    # Abandoned sessions are swept opportunistically, at most this often per worker
+    GC_INTERVAL_SECONDS = 300
+    _last_gc = 0.0
+    
+    def __init__(
+        self,
+        employee_repo: EmployeeProfileRepository,
+        doc_repo: EmployeeDocumentRepository,
+        upload_repo: DocumentUploadSessionRepository
+    ):
+        self.employee_repo = employee_repo
+        self.doc_repo = doc_repo
+        self.upload_repo = upload_repo
+    
+    def create_session(
+        self,
+        employee_id: int,
+        session_data: DocumentUploadSessionCreate,
+        created_by: int
+    ) -> DocumentUploadSessionResponse:
+        """Start a resumable upload by preallocating a sparse temp file."""
+        logger.info(f"Creating upload session for employee: {employee_id}")
+        
+        try:
+            employee = self.employee_repo.get_by_id(employee_id)
+            if not employee:
+                logger.warning(f"Employee not found for upload session: {employee_id}")
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Employee not found"
+                )
+            
+            if session_data.total_size > settings.UPLOAD_MAX_FILE_BYTES:
+                logger.warning(f"Upload too large: {session_data.total_size} bytes")
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File exceeds maximum size of {settings.UPLOAD_MAX_FILE_BYTES} bytes"
+                )
+            
+            self._maybe_purge_expired()
+            
+            upload_id = uuid.uuid4().hex
+            incoming_dir = os.path.join(settings.UPLOAD_DIR, ".incoming")
+            os.makedirs(incoming_dir, exist_ok=True)
+            temp_path = os.path.join(incoming_dir, f"{upload_id}.part")
+            
+            # Preallocate so chunks can be written at any offset, in any order
+            with open(temp_path, "wb") as buffer:
+                buffer.truncate(session_data.total_size)
+            
+            upload = self.upload_repo.create({
+                "id": upload_id,
+                "employee_id": employee_id,
+                "document_type": session_data.document_type,
+                "document_name": session_data.document_name,
+                "file_name": session_data.file_name,
+                "mime_type": session_data.mime_type,
+                "total_size": session_data.total_size,
+                "temp_path": temp_path,
+                "created_by": created_by,
+                "expires_at": datetime.now(timezone.utc) + timedelta(
+                    hours=settings.UPLOAD_SESSION_TTL_HOURS
+                )
+            })
+            
+            logger.info(f"Upload session created: {upload.id}")
+            return self._to_response(upload, [])
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error creating upload session: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def get_session(self, employee_id: int, upload_id: str) -> DocumentUploadSessionResponse:
+        """Get upload progress so a client can resume from the missing ranges."""
+        logger.debug(f"Getting upload session: {upload_id}")
+        
+        upload = self._get_session(employee_id, upload_id)
+        ranges = self.upload_repo.get_chunk_ranges(upload.id) if upload.status == "open" else []
+        return self._to_response(upload, ranges)
+    
+    def write_chunk(
+        self,
+        employee_id: int,
+        upload_id: str,
+        offset: int,
+        data: bytes
+    ) -> DocumentUploadSessionResponse:
+        """Write one chunk at its byte offset. Chunks may arrive in any order or in parallel."""
+        logger.debug(f"Writing chunk for upload {upload_id}: offset={offset}, size={len(data)}")
+        
+        try:
+            # A shared row lock: chunks still write in parallel, but never while
+            # complete_session (FOR UPDATE) moves the file or an abort deletes the row
+            upload = self._get_open_session(employee_id, upload_id, for_share=True)
+            
+            if not data:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Empty chunk"
+                )
+            
+            if offset < 0 or offset + len(data) > upload.total_size:
+                logger.warning(f"Chunk out of range for upload {upload_id}: offset={offset}")
+                raise HTTPException(
+                    status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    detail=f"Chunk must lie within 0-{upload.total_size} bytes"
+                )
+            
+            # pwrite to disjoint regions is safe across concurrent requests
+            fd = os.open(upload.temp_path, os.O_WRONLY)
+            try:
+                view = memoryview(data)
+                position = offset
+                while view:
+                    written = os.pwrite(fd, view, position)
+                    view = view[written:]
+                    position += written
+            finally:
+                os.close(fd)
+            
+            self.upload_repo.add_chunk(upload.id, offset, len(data))
+            
+            return self._to_response(upload, self.upload_repo.get_chunk_ranges(upload.id))
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error writing chunk for upload {upload_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def complete_session(
+        self,
+        employee_id: int,
+        upload_id: str,
+        complete_data: DocumentUploadComplete,
+        uploaded_by: int
+    ) -> EmployeeDocumentResponse:
+        """Assemble, hash and register the uploaded document."""
+        logger.info(f"Completing upload session: {upload_id}")
+        
+        try:
+            upload = self._get_session(employee_id, upload_id, for_update=True)
+            
+            # Repeated finalize calls return the already registered document
+            if upload.status == "completed" and upload.document_id:
+                document = self.doc_repo.get_by_id(upload.document_id)
+                if document:
+                    return EmployeeDocumentResponse.from_orm(document)
+            
+            if upload.status != "open" or _is_expired(upload):
+                raise HTTPException(
+                    status_code=status.HTTP_410_GONE,
+                    detail="Upload session is no longer open"
+                )
+            
+            received, missing = _merge_ranges(
+                self.upload_repo.get_chunk_ranges(upload.id),
+                upload.total_size
+            )
+            if missing:
+                logger.warning(f"Upload {upload_id} incomplete: {received}/{upload.total_size} bytes")
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Upload incomplete, missing ranges: {missing[:10]}"
+                )
+            
+            digest = hashlib.sha256()
+            with open(upload.temp_path, "rb") as buffer:
+                for block in iter(lambda: buffer.read(_HASH_BLOCK_SIZE), b""):
+                    digest.update(block)
+            checksum = digest.hexdigest()
+            
+            if complete_data.checksum_sha256 and complete_data.checksum_sha256.lower() != checksum:
+                logger.warning(f"Checksum mismatch for upload {upload_id}")
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Checksum mismatch"
+                )
+            
+            # Register the document first: a failed insert leaves the temp file in place
+            file_path = _document_file_path(employee_id, upload.document_type, upload.file_name)
+            document = self.doc_repo.create({
+                "employee_id": employee_id,
+                "document_type": upload.document_type,
+                "document_name": upload.document_name,
+                "file_path": file_path,
+                "file_size": upload.total_size,
+                "mime_type": upload.mime_type,
+                "checksum_sha256": checksum,
+                "uploaded_by": uploaded_by
+            })
+            self.upload_repo.mark_completed(upload, document.id)
+            
+            # If the request's commit fails, move the file back so the session can be completed again
+            os.replace(upload.temp_path, file_path)
+            temp_path = upload.temp_path
+            on_rollback(self.upload_repo.db, lambda: os.replace(file_path, temp_path))
+            
+            logger.info(f"Upload {upload_id} registered as document {document.id}")
+            return EmployeeDocumentResponse.from_orm(document)
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception(f"Error completing upload {upload_id}: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def abort_session(self, employee_id: int, upload_id: str) -> Dict[str, str]:
+        """Abort an upload and discard its temp file."""
+        logger.info(f"Aborting upload session: {upload_id}")
+        
+        upload = self._get_session(employee_id, upload_id)
+        self._discard(upload)
+        return {"message": "Upload session aborted"}
+    
+    def purge_expired_sessions(self, limit: int = 100) -> int:
+        """Garbage-collect abandoned upload sessions and their temp files."""
+        expired = self.upload_repo.get_expired(datetime.now(timezone.utc), limit=limit)
+        for upload in expired:
+            self._discard(upload)
+        
+        if expired:
+            logger.info(f"Purged {len(expired)} expired upload sessions")
+        return len(expired)
+    
+    def _maybe_purge_expired(self):
+        """Run the expired-session sweep if this worker has not done so recently."""
+        now = time.monotonic()
+        if now - DocumentUploadService._last_gc < self.GC_INTERVAL_SECONDS:
+            return
+        DocumentUploadService._last_gc = now
+        
+        try:
+            # Savepoint: a failed sweep must not abort the request's own transaction
+            with savepoint(self.upload_repo.db):
+                self.purge_expired_sessions()
+        except Exception as e:
+            logger.error(f"Error purging expired upload sessions: {str(e)}")
+    
+    def _discard(self, upload):
+        """Remove an upload session's row, and its temp file once that commits."""
+        if upload.status == "open":
+            temp_path = upload.temp_path
+            on_commit(self.upload_repo.db, lambda: _remove_file(temp_path))
+        self.upload_repo.delete(upload)
+    
+    def _get_session(self, employee_id: int, upload_id: str, for_update: bool = False, for_share: bool = False):
+        """Get an upload session belonging to the employee or raise 404."""
+        upload = self.upload_repo.get_by_id(upload_id, for_update=for_update, for_share=for_share)
+        if not upload or upload.employee_id != employee_id:
+            logger.warning(f"Upload session not found: {upload_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Upload session not found"
+            )
+        return upload
+    
+    def _get_open_session(self, employee_id: int, upload_id: str, for_share: bool = False):
+        """Get an upload session that still accepts chunks or raise 410."""
+        upload = self._get_session(employee_id, upload_id, for_share=for_share)
+        if upload.status != "open" or _is_expired(upload):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Upload session is no longer open"
+            )
+        return upload
+    
+    def _to_response(self, upload, ranges: List[Tuple[int, int]]) -> DocumentUploadSessionResponse:
+        """Build session state response from received chunk ranges."""
+        if upload.status == "completed":
+            received, missing = upload.total_size, []
+        else:
+            received, missing = _merge_ranges(ranges, upload.total_size)
+        
+        return DocumentUploadSessionResponse(
+            upload_id=upload.id,
+            employee_id=upload.employee_id,
+            document_type=upload.document_type,
+            document_name=upload.document_name,
+            total_size=upload.total_size,
+            received_bytes=received,
+            missing_ranges=missing,
+            max_chunk_size=settings.UPLOAD_CHUNK_MAX_BYTES,
+            status=upload.status,
+            expires_at=upload.expires_at,
+            document_id=upload.document_id
+        )
\ No newline at end of file
@@ -0,0 +1,383 @@
+"""
+Live change notifications behind GET /api/employees/stream (Server-Sent Events).
+
+Writers: at commit, the profile and document changes collected by
+app.database.changes are resolved to who may see them (the profile's
+departments and its managers' chain of command, one query each).
+On PostgreSQL the notifications are sent with pg_notify in the same
+transaction, so they are delivered only if it commits, to every worker.
+
+Readers: each worker holds one LISTEN connection, outside the request pool,
+and fans notifications out to its open streams through an in-process
+broadcaster. Every stream has a bounded queue; a client that falls behind
+is told to resync instead of buffering without limit. On other databases,
+or while the worker's LISTEN connection is down, commits made by this
+worker are handed to the broadcaster directly.
+
+Notifications are hints ("employee 42 changed"), not data: clients refetch
+what they show, through the regular, access-checked endpoints.
+"""
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, create_engine, event, select, text, Text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.database.changes import RowChange, by_row, on_commit_changes
+from app.database.connection import engine
+from .models import EmployeeProfile, EmployeeDocument, EmployeeHierarchy
+from .policies import Principal
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "hrms_employee_changes"
+
+_READY_KEY = "stream_ready"
+
+clients_gauge = metrics.gauge("hrms_stream_clients", "Open change streams in this worker")
+notifications_counter = metrics.counter("hrms_stream_notifications_total", "Change notifications received by this worker")
+resyncs_counter = metrics.counter("hrms_stream_resyncs_total", "Streams told to resync, by reason")
+listener_gauge = metrics.gauge("hrms_stream_listener_connected", "1 while this worker's LISTEN connection is up")
+
+
+# ========== CAPTURE (writers) ==========
+
+_KINDS = {EmployeeProfile: "employee", EmployeeDocument: "document"}
+_VERBS = {"create": "created", "update": "updated", "delete": "deleted"}
+
+
+def _notification(change: RowChange) -> dict:
+    """A notification for one row's change, before its viewers are resolved."""
+    kind = _KINDS[change.model]
+    verb = "deleted" if change.deactivated else _VERBS[change.action]
+    if kind == "employee":
+        # Old and new department and manager, so viewers losing sight of the row hear about it too
+        departments = {change.values.get("department"), change.changed.get("department", (None,))[0]}
+        managers = {change.values.get("manager_id"), change.changed.get("manager_id", (None,))[0]}
+        employee_id, document_id = change.row_id, None
+    else:
+        departments, managers = set(), set()
+        employee_id, document_id = change.values.get("employee_id"), change.row_id
+    return {
+        "type": f"{kind}.{verb}",
+        "employee_id": employee_id,
+        "document_id": document_id,
+        "departments": {department for department in departments if department},
+        "managers": {manager for manager in managers if manager},
+    }
+
+
+def _resolve_viewers(session: Session, notifications: List[dict]):
+    """Fill in departments and the full management chain each change is visible to."""
+    documents = [notification for notification in notifications if notification["type"].startswith("document.")]
+    if documents:
+        owners = {
+            row.id: row for row in session.execute(
+                select(EmployeeProfile.id, EmployeeProfile.department, EmployeeProfile.manager_id)
+                .where(EmployeeProfile.id.in_({notification["employee_id"] for notification in documents}))
+            )
+        }
+        for notification in documents:
+            owner = owners.get(notification["employee_id"])
+            if owner is not None:
+                if owner.department:
+                    notification["departments"].add(owner.department)
+                if owner.manager_id:
+                    notification["managers"].add(owner.manager_id)
+    
+    heads = set().union(*(notification["managers"] for notification in notifications))
+    if not heads:
+        return
+    chains: Dict[int, Set[int]] = {}
+    for row in session.execute(
+        select(EmployeeHierarchy.descendant_id, EmployeeHierarchy.ancestor_id)
+        .where(EmployeeHierarchy.descendant_id.in_(heads))
+    ):
+        chains.setdefault(row.descendant_id, set()).add(row.ancestor_id)
+    for notification in notifications:
+        notification["managers"] = notification["managers"].union(
+            *(chains.get(head, ()) for head in notification["managers"])
+        )
+
+
+@on_commit_changes(EmployeeProfile, EmployeeDocument)
+def _prepare_notifications(session: Session, changes: List[RowChange]):
+    if not settings.STREAM_ENABLED:
+        return
+    
+    notifications = [_notification(change) for change in by_row(changes)]
+    _resolve_viewers(session, notifications)
+    payloads = [
+        {**notification, "departments": sorted(notification["departments"]), "managers": sorted(notification["managers"])}
+        for notification in notifications
+    ]
+    
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(:payloads) AS payload").bindparams(
+                bindparam("payloads", type_=ARRAY(Text))
+            ),
+            {"channel": CHANNEL, "payloads": [json.dumps(payload) for payload in payloads]}
+        )
+    session.info[_READY_KEY] = payloads
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_over(session):
+    payloads = session.info.pop(_READY_KEY, None)
+    if payloads and not listener.connected:
+        # No LISTEN connection in this worker: its own commits are all it can show
+        broadcaster.publish_threadsafe(payloads)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_ready(session):
+    session.info.pop(_READY_KEY, None)
+
+
+# ========== FAN-OUT (readers) ==========
+
+def is_visible(principal: Principal, payload: dict) -> bool:
+    """Same rules as AccessPolicy.read_predicate, evaluated against a notification."""
+    if principal.is_admin:
+        return True
+    if principal.employee_id is not None and (
+        payload["employee_id"] == principal.employee_id or principal.employee_id in payload["managers"]
+    ):
+        return True
+    return not principal.read_departments.isdisjoint(payload["departments"])
+
+
+class Subscriber:
+    """One open stream: its caller and a bounded queue of pending notifications."""
+    
+    def __init__(self, principal: Principal, queue_size: int):
+        self.principal = principal
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.needs_resync = False
+    
+    def offer(self, payload: dict) -> bool:
+        """Queue a notification; False (and flagged for resync) when the client has fallen behind."""
+        if self.needs_resync:
+            return False
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            self.needs_resync = True
+            return False
+
+
+class Broadcaster:
+    """Fans notifications out to this worker's open streams."""
+    
+    def __init__(self, max_clients: int, queue_size: int):
+        self.max_clients = max_clients
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscriber] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def client_count(self) -> int:
+        return len(self._subscribers)
+    
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+    
+    def subscribe(self, principal: Principal) -> Optional[Subscriber]:
+        """A new subscriber, or None when the worker already serves max_clients streams."""
+        if len(self._subscribers) >= self.max_clients:
+            return None
+        subscriber = Subscriber(principal, self.queue_size)
+        self._subscribers.add(subscriber)
+        clients_gauge.set(len(self._subscribers))
+        return subscriber
+    
+    def unsubscribe(self, subscriber: Subscriber):
+        self._subscribers.discard(subscriber)
+        clients_gauge.set(len(self._subscribers))
+    
+    def publish(self, payloads: List[dict]):
+        """Deliver notifications to every subscriber allowed to see them (event loop thread only)."""
+        notifications_counter.inc(len(payloads))
+        for subscriber in list(self._subscribers):
+            for payload in payloads:
+                if is_visible(subscriber.principal, payload) and not subscriber.offer(payload):
+                    resyncs_counter.inc(reason="overflow")
+                    break
+    
+    def publish_threadsafe(self, payloads: List[dict]):
+        if self._loop is None or self._loop.is_closed():
+            return  # no streams outside the app's event loop (scripts, migrations)
+        self._loop.call_soon_threadsafe(self.publish, payloads)
+    
+    def resync_all(self, reason: str):
+        """Ask every client to refetch, after notifications may have been missed."""
+        for subscriber in self._subscribers:
+            subscriber.needs_resync = True
+        if self._subscribers:
+            resyncs_counter.inc(len(self._subscribers), reason=reason)
+
+
+class ChangeListener:
+    """The worker's LISTEN connection, feeding the broadcaster (PostgreSQL only)."""
+    
+    def __init__(self, broadcaster: Broadcaster, retry_seconds: float = 5.0):
+        self.broadcaster = broadcaster
+        self.retry_seconds = retry_seconds
+        self._engine = None
+        self._raw = None
+        self._stop = asyncio.Event()
+        self._lost = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def connected(self) -> bool:
+        return self._raw is not None
+    
+    def start(self):
+        self.broadcaster.bind(asyncio.get_running_loop())
+        if engine.dialect.name != "postgresql":
+            logger.info("Change stream using the in-process broadcaster (no LISTEN/NOTIFY on this database)")
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        self._stop.set()
+        self._lost.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        first = True
+        while not self._stop.is_set():
+            try:
+                connection = await run_in_threadpool(self._connect)
+            except Exception as e:
+                logger.warning(f"Change stream LISTEN connection failed: {str(e)}")
+                connection = None
+    
+            if connection is not None:
+                if not first:
+                    # Commits while disconnected were not heard; clients refetch
+                    self.broadcaster.resync_all("reconnect")
+                first = False
+                self._lost.clear()
+                loop.add_reader(connection.fileno(), self._drain, connection)
+                listener_gauge.set(1)
+                logger.info(f"Change stream listening on {CHANNEL}")
+                try:
+                    await self._lost.wait()
+                finally:
+                    loop.remove_reader(connection.fileno())
+                    listener_gauge.set(0)
+                    self._close()
+    
+            if not self._stop.is_set():
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.retry_seconds)
+                except asyncio.TimeoutError:
+                    pass
+    
+    def _connect(self):
+        if self._engine is None:
+            # One connection per worker, outside the request pool's budget
+            self._engine = create_engine(engine.url, poolclass=NullPool)
+        raw = self._engine.raw_connection()
+        connection = raw.driver_connection
+        if not hasattr(connection, "notifies"):
+            raw.close()
+            raise RuntimeError(f"driver {type(connection).__module__} does not expose notifications")
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        self._raw = raw
+        return connection
+    
+    def _drain(self, connection):
+        try:
+            connection.poll()
+        except Exception as e:
+            logger.warning(f"Change stream LISTEN connection lost: {str(e)}")
+            self._lost.set()
+            return
+    
+        payloads = []
+        while connection.notifies:
+            notification = connection.notifies.pop(0)
+            try:
+                payloads.append(json.loads(notification.payload))
+            except ValueError:
+                logger.warning(f"Ignoring malformed change notification: {notification.payload[:200]}")
+        if payloads:
+            self.broadcaster.publish(payloads)
+    
+    def _close(self):
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+
+broadcaster = Broadcaster(settings.STREAM_MAX_CLIENTS, settings.STREAM_CLIENT_QUEUE_SIZE)
+listener = ChangeListener(broadcaster)
+
+
+# ========== SSE ==========
+
+def _sse(event_name: str, data: dict) -> str:
+    return f"event: {event_name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def event_stream(subscriber: Subscriber, lifetime_seconds: float) -> AsyncIterator[str]:
+    """
+    SSE frames for one subscriber, for at most `lifetime_seconds`.
+    
+    Heartbeat comments keep proxies from closing an idle stream and surface
+    disconnected clients. The caller ends it at token expiry, so the client
+    reconnects with a fresh token (and re-evaluated access).
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + lifetime_seconds
+    try:
+        yield f"retry: {settings.STREAM_RETRY_MS}\n\n"
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+    
+            if subscriber.needs_resync:
+                while not subscriber.queue.empty():
+                    subscriber.queue.get_nowait()
+                subscriber.needs_resync = False
+                yield _sse("resync", {})
+                continue
+    
+            try:
+                payload = await asyncio.wait_for(
+                    subscriber.queue.get(),
+                    timeout=min(settings.STREAM_HEARTBEAT_SECONDS, remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+    
+            data = {"employee_id": payload["employee_id"]}
+            if payload.get("document_id") is not None:
+                data["document_id"] = payload["document_id"]
+            yield _sse(payload["type"], data)
+    finally:
+        broadcaster.unsubscribe(subscriber)
\ No newline at end of file
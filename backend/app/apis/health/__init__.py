@@ -0,0 +1,3 @@
+"""
+Health and readiness API module.
+"""
\ No newline at end of file
@@ -0,0 +1,60 @@
+import logging
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import PlainTextResponse
+
+from .services import HealthService, SERVICE_NAME, SERVICE_VERSION
+from .schemas import LivenessResponse, ReadinessResponse
+from app.core.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/api/health", tags=["Health"])
+
+
+# ========== DEPENDENCY INJECTION ==========
+
+def get_health_service() -> HealthService:
+    return HealthService()
+
+
+# ========== ROUTES ==========
+
+@router.get("", response_model=LivenessResponse)
+@router.get("/live", response_model=LivenessResponse)
+async def liveness():
+    """
+    Liveness: the process is up. No dependency checks, so a database outage
+    doesn't get healthy workers restarted.
+    """
+    logger.debug("Liveness endpoint accessed")
+    return {
+        "status": "healthy",
+        "service": SERVICE_NAME,
+        "version": SERVICE_VERSION
+    }
+
+
+@router.get("/ready", response_model=ReadinessResponse)
+async def readiness(
+    response: Response,
+    health_service: HealthService = Depends(get_health_service)
+):
+    """
+    Readiness: database reachable within a timeout, pool not saturated and
+    upload directory writable. Returns 503 when the worker should not get traffic.
+    """
+    result = await health_service.check_readiness()
+    if result.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """
+    This worker's metrics in the Prometheus text format. Each gunicorn worker
+    keeps its own registry, so scrape every worker or aggregate per instance.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
\ No newline at end of file
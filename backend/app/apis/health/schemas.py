@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import Dict, Any, Optional
+
+
+class CheckResult(BaseModel):
+    """Outcome of one readiness check."""
+    ok: bool
+    latency_ms: Optional[float] = None
+    detail: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+
+class LivenessResponse(BaseModel):
+    """Process is up and serving the event loop."""
+    status: str
+    service: str
+    version: str
+
+
+class ReadinessResponse(BaseModel):
+    """Whether this worker should receive traffic, with per-dependency results."""
+    status: str  # ready, not_ready
+    checks: Dict[str, CheckResult]
\ No newline at end of file
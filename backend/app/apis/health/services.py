@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import Dict
+
+from fastapi.concurrency import run_in_threadpool
+
+from .schemas import CheckResult, ReadinessResponse
+from app.core.config import settings
+from app.database.connection import engine, replica_engine, test_connection, pool_status
+
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "hrms-backend"
+SERVICE_VERSION = "1.0.0"
+
+
+class HealthService:
+    """Dependency checks behind the readiness probe."""
+    
+    async def check_readiness(self) -> ReadinessResponse:
+        """Run all checks; ready only if every check passes."""
+        checks: Dict[str, CheckResult] = {}
+        
+        checks["pool"] = self._check_pool()
+        if checks["pool"].ok:
+            checks["database"] = await self._check_database()
+        else:
+            # A saturated pool would make the ping wait for pool_timeout
+            checks["database"] = CheckResult(ok=False, detail="Skipped: connection pool saturated")
+        if replica_engine is not engine:
+            checks["replica"] = await self._check_database(replica_engine)
+        checks["uploads"] = await run_in_threadpool(self._check_upload_dir)
+        
+        ready = all(check.ok for check in checks.values())
+        if not ready:
+            failed = [name for name, check in checks.items() if not check.ok]
+            logger.warning(f"Readiness check failed: {', '.join(failed)}")
+        
+        return ReadinessResponse(status="ready" if ready else "not_ready", checks=checks)
+    
+    def _check_pool(self) -> CheckResult:
+        status = pool_status()
+        ok = status["saturation"] < settings.HEALTH_MAX_POOL_SATURATION
+        return CheckResult(
+            ok=ok,
+            detail=None if ok else "Connection pool saturated",
+            data=status
+        )
+    
+    async def _check_database(self, bind=None) -> CheckResult:
+        timeout = settings.HEALTH_DB_TIMEOUT_SECONDS
+        started = time.perf_counter()
+        try:
+            ok = await asyncio.wait_for(run_in_threadpool(test_connection, timeout, bind), timeout=timeout)
+            detail = None if ok else "Database ping failed"
+        except asyncio.TimeoutError:
+            ok, detail = False, f"Database ping timed out after {timeout}s"
+        
+        return CheckResult(
+            ok=ok,
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
+            detail=detail
+        )
+    
+    def _check_upload_dir(self) -> CheckResult:
+        try:
+            os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=settings.UPLOAD_DIR, prefix=".ready_"):
+                pass
+            return CheckResult(ok=True)
+        except OSError as e:
+            return CheckResult(ok=False, detail=f"Upload directory not writable: {e.strerror}")
\ No newline at end of file
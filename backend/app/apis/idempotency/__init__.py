@@ -0,0 +1,3 @@
+"""
+Idempotency-Key support for create and upload endpoints.
+"""
\ No newline at end of file
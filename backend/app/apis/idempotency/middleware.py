@@ -0,0 +1,277 @@
+"""
+Idempotency-Key handling for create and upload endpoints.
+
+A POST carrying an `Idempotency-Key` header first claims the key (scoped to
+the caller) in its own short transaction, so every worker sees it. The
+request then runs as usual; on success its response is stored through a
+unit-of-work commit hook, in the same transaction as the request's own
+changes, so a stored response always means the work committed. Failed
+requests (4xx/5xx) release the key and may be retried.
+
+A repeated key replays the stored response without running the endpoint
+again (`Idempotent-Replayed: true`). A duplicate arriving while the first
+request is still running waits for it, up to IDEMPOTENCY_WAIT_SECONDS, then
+gets 409. The fingerprint covers the method, the path (trailing slash
+ignored, so a redirected `/api/employees` matches) and, for JSON bodies,
+the body: reusing a key for a different endpoint or payload gets 422. Keys
+expire after IDEMPOTENCY_TTL_HOURS and are purged by a maintenance job.
+"""
+import asyncio
+import hashlib
+import logging
+import re
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.security import security_service
+from app.database.session import SessionLocal
+from app.database.unit_of_work import COMMIT_HOOKS_KEY
+from app.shared.exceptions import error_response
+from .repositories import IdempotencyRepository
+
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# POST endpoints whose retries must not repeat work
+IDEMPOTENT_PATHS = (
+    re.compile(r"^/api/employees/?$"),
+    re.compile(r"^/api/employees/bulk-update$"),
+    re.compile(r"^/api/employees/\d+/documents$"),
+    re.compile(r"^/api/employees/\d+/documents/uploads$"),
+    re.compile(r"^/api/employees/\d+/documents/uploads/[^/]+/complete$"),
+)
+
+_COMPLETED_KEY = "idempotency_completed"
+
+requests_counter = metrics.counter("hrms_idempotency_requests_total", "Requests with an Idempotency-Key by outcome")
+
+
+def is_idempotent_path(method: str, path: str) -> bool:
+    return method == "POST" and any(pattern.match(path) for pattern in IDEMPOTENT_PATHS)
+
+
+def _caller(scope: Scope) -> Optional[str]:
+    """Token subject of the request, or None when unauthenticated (the endpoint answers 401)."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            try:
+                token = security_service.extract_token_from_header(value.decode("latin-1"))
+                return security_service.verify_local_token(token).get("sub")
+            except Exception:
+                return None
+    return None
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+class _Refused(Exception):
+    def __init__(self, status_code: int, message: str, retry_after: Optional[int] = None):
+        self.status_code = status_code
+        self.message = message
+        self.retry_after = retry_after
+
+
+class IdempotencyMiddleware:
+    """
+    ASGI middleware applying Idempotency-Key semantics to IDEMPOTENT_PATHS.
+    
+    Plain ASGI, like admission control. Only JSON bodies (create, bulk
+    update) are read here, to be hashed and handed on unchanged; uploads are
+    not, so a replay answers before a retried upload is written anywhere.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Keys this worker is executing; local duplicates wake as soon as they finish
+        self._running: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not is_idempotent_path(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+    
+        key = next((value.decode("latin-1") for name, value in scope["headers"] if name == IDEMPOTENCY_HEADER), None)
+        caller = _caller(scope) if key else None
+        if not key or caller is None:
+            await self.app(scope, receive, send)
+            return
+    
+        try:
+            if len(key) > MAX_KEY_LENGTH:
+                raise _Refused(400, f"Idempotency-Key must be at most {MAX_KEY_LENGTH} characters")
+            key_hash = _sha256(f"{caller}\n{key}")
+            receive, body_digest = await self._read_json_body(scope, receive)
+            path = scope["path"].rstrip("/") or "/"
+            replay = await self._acquire(key_hash, _sha256(f"{scope['method']} {path}\n{body_digest or ''}"))
+        except _Refused as refusal:
+            requests_counter.inc(outcome=f"refused_{refusal.status_code}")
+            await self._refuse(scope, refusal)(scope, receive, send)
+            return
+    
+        if replay is not None:
+            requests_counter.inc(outcome="replayed")
+            logger.info(f"Replaying stored response for idempotency key {key_hash[:12]} on {scope['path']}")
+            await replay(scope, receive, send)
+            return
+    
+        requests_counter.inc(outcome="executed")
+        await self._execute(key_hash, scope, receive, send)
+    
+    async def _acquire(self, key_hash: str, fingerprint: str) -> Optional[Response]:
+        """Claim the key (None) or return the stored response to replay, waiting out a running duplicate."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.IDEMPOTENCY_WAIT_SECONDS
+        delay = 0.05
+    
+        while True:
+            claimed, stored = await run_in_threadpool(self._claim, key_hash, fingerprint)
+            if claimed:
+                self._running[key_hash] = (loop, asyncio.Event())
+                return None
+            if stored is not None:
+                if stored[0] != fingerprint:
+                    raise _Refused(422, "Idempotency-Key was already used for a different request")
+                if stored[1] is not None:
+                    status_code, content_type, body = stored[1]
+                    return Response(
+                        content=zlib.decompress(body),
+                        status_code=status_code,
+                        media_type=content_type,
+                        headers={REPLAYED_HEADER: "true"}
+                    )
+    
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise _Refused(409, "A request with this Idempotency-Key is still in progress", retry_after=1)
+            running = self._running.get(key_hash)
+            try:
+                if running is not None and running[0] is loop:
+                    await asyncio.wait_for(running[1].wait(), timeout=min(delay, remaining))
+                else:
+                    await asyncio.sleep(min(delay, remaining))
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, 0.5)
+    
+    @staticmethod
+    async def _read_json_body(scope: Scope, receive: Receive) -> Tuple[Receive, Optional[str]]:
+        """
+        Digest of a JSON body of at most IDEMPOTENCY_MAX_BODY_BYTES, and a
+        receive that hands the endpoint what was read. Other bodies give None.
+        """
+        content_type = next((value for name, value in scope["headers"] if name == b"content-type"), b"")
+        if not content_type.lower().startswith(b"application/json"):
+            return receive, None
+        
+        messages = []
+        size = 0
+        more_body = True
+        while more_body and size <= settings.IDEMPOTENCY_MAX_BODY_BYTES:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            size += len(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        
+        digest = None
+        if not more_body and size <= settings.IDEMPOTENCY_MAX_BODY_BYTES:
+            digest = hashlib.sha256(b"".join(message.get("body", b"") for message in messages)).hexdigest()
+        
+        async def replay_receive() -> Message:
+            if messages:
+                return messages.pop(0)
+            return await receive()
+        
+        return replay_receive, digest
+    
+    def _claim(self, key_hash: str, fingerprint: str) -> Tuple[bool, Optional[Tuple[str, Optional[tuple]]]]:
+        now = datetime.now(timezone.utc)
+        with SessionLocal() as db:
+            repo = IdempotencyRepository(db)
+            claimed = repo.claim(
+                key_hash,
+                fingerprint,
+                now,
+                lock_seconds=settings.IDEMPOTENCY_LOCK_SECONDS,
+                ttl=timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS)
+            )
+            db.commit()
+            if claimed:
+                return True, None
+            record = repo.get(key_hash)
+            if record is None:
+                return False, None  # released meanwhile; the next attempt claims it
+            response = (record.status_code, record.content_type, record.body) if record.completed_at else None
+            return False, (record.fingerprint, response)
+    
+    async def _execute(self, key_hash: str, scope: Scope, receive: Receive, send: Send):
+        state = scope.setdefault("state", {})
+        state.setdefault(COMMIT_HOOKS_KEY, []).append(
+            lambda session, response: self._store(key_hash, state, session, response)
+        )
+        status_code = 500
+    
+        async def send_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+    
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            if status_code >= 400 or not state.get(_COMPLETED_KEY):
+                try:
+                    await run_in_threadpool(self._release, key_hash)
+                except Exception as e:
+                    logger.warning(f"Could not release idempotency key {key_hash[:12]}: {str(e)}")
+            running = self._running.pop(key_hash, None)
+            if running is not None:
+                running[1].set()
+    
+    @staticmethod
+    def _store(key_hash: str, state: dict, session, response: Response):
+        """Commit hook: save the response with the request's own transaction."""
+        body = getattr(response, "body", None)
+        if body is None or len(body) > settings.IDEMPOTENCY_MAX_BODY_BYTES:
+            logger.warning(f"Response for idempotency key {key_hash[:12]} not stored (streamed or too large)")
+            return
+        IdempotencyRepository(session).complete(
+            key_hash,
+            response.status_code,
+            response.headers.get("content-type"),
+            zlib.compress(body),
+            datetime.now(timezone.utc)
+        )
+        state[_COMPLETED_KEY] = True
+    
+    @staticmethod
+    def _release(key_hash: str):
+        with SessionLocal() as db:
+            if IdempotencyRepository(db).release(key_hash):
+                logger.debug(f"Released idempotency key {key_hash[:12]}")
+            db.commit()
+    
+    @staticmethod
+    def _refuse(scope: Scope, refusal: _Refused) -> JSONResponse:
+        return error_response(
+            refusal.status_code,
+            refusal.message,
+            scope["path"],
+            scope["method"],
+            headers={"Retry-After": str(refusal.retry_after)} if refusal.retry_after else None
+        )
\ No newline at end of file
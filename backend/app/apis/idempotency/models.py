@@ -0,0 +1,28 @@
+import logging
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary, Index
+from app.database.base import Base
+
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKey(Base):
+    """A client's Idempotency-Key and, once its request succeeded, the response to replay."""
+    
+    __tablename__ = "idempotency_keys"
+    
+    key_hash = Column(String(64), primary_key=True)  # sha256 of caller and key; raw keys are not kept
+    fingerprint = Column(String(64), nullable=False)  # sha256 of method and path
+    status_code = Column(Integer, nullable=True)  # NULL while the first request is in progress
+    content_type = Column(String(100), nullable=True)
+    body = Column(LargeBinary, nullable=True)  # zlib-compressed response body
+    locked_until = Column(DateTime(timezone=True), nullable=False)  # in-progress claim lease
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+    
+    def __repr__(self):
+        return f"<IdempotencyKey(key_hash={self.key_hash[:12]}, status_code={self.status_code})>"
\ No newline at end of file
@@ -0,0 +1,97 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .models import IdempotencyKey
+
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyRepository:
+    """Repository for idempotency keys."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get(self, key_hash: str) -> Optional[IdempotencyKey]:
+        return self.db.get(IdempotencyKey, key_hash, populate_existing=True)
+    
+    def claim(self, key_hash: str, fingerprint: str, now: datetime, lock_seconds: float, ttl: timedelta) -> bool:
+        """
+        Take a key for a new request; False when another request holds or completed it.
+        
+        Expired keys and in-progress claims whose lease ran out (their
+        worker died) are taken over.
+        """
+        values = {
+            "key_hash": key_hash,
+            "fingerprint": fingerprint,
+            "locked_until": now + timedelta(seconds=lock_seconds),
+            "expires_at": now + ttl,
+        }
+        
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            inserted = self.db.execute(
+                dialect_insert(IdempotencyKey).values(**values).on_conflict_do_nothing(index_elements=["key_hash"])
+            ).rowcount
+        else:
+            try:
+                with self.db.begin_nested():
+                    self.db.add(IdempotencyKey(**values))
+                inserted = 1
+            except IntegrityError:
+                inserted = 0
+        if inserted:
+            return True
+        
+        taken = self.db.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.key_hash == key_hash,
+                or_(
+                    IdempotencyKey.expires_at <= now,
+                    and_(IdempotencyKey.completed_at.is_(None), IdempotencyKey.locked_until <= now)
+                )
+            )
+            .values(status_code=None, content_type=None, body=None, completed_at=None, **values)
+        ).rowcount
+        if taken:
+            logger.info(f"Took over idempotency key {key_hash[:12]}")
+        return bool(taken)
+    
+    def complete(self, key_hash: str, status_code: int, content_type: Optional[str], body: bytes, now: datetime):
+        """Store the response to replay; commits with the request's own changes."""
+        self.db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key_hash == key_hash)
+            .values(status_code=status_code, content_type=content_type, body=body, completed_at=now)
+        )
+    
+    def release(self, key_hash: str) -> bool:
+        """Drop an in-progress claim so the request can be retried."""
+        return bool(self.db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.key_hash == key_hash,
+                IdempotencyKey.completed_at.is_(None)
+            )
+        ).rowcount)
+    
+    def purge_expired(self, now: datetime, limit: int = 1000) -> int:
+        """Delete keys past their TTL."""
+        key_hashes = self.db.execute(
+            select(IdempotencyKey.key_hash).where(IdempotencyKey.expires_at <= now).limit(limit)
+        ).scalars().all()
+        if not key_hashes:
+            return 0
+        deleted = self.db.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.key_hash.in_(key_hashes))
+        ).rowcount
+        logger.debug(f"Purged {deleted} expired idempotency keys")
+        return deleted
\ No newline at end of file
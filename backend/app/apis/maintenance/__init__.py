@@ -0,0 +1,3 @@
+"""
+Scheduled maintenance API module.
+"""
\ No newline at end of file
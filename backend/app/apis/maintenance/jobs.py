@@ -0,0 +1,248 @@
+"""
+Maintenance jobs.
+
+Each job works in batches of at most MAINTENANCE_BATCH_SIZE rows or files.
+Every batch commits in its own transaction, and the runner pauses
+MAINTENANCE_BATCH_PAUSE_MS between batches, so a large backlog is worked
+off over several runs without long locks or I/O spikes. A job returns the
+number of items it cleaned up.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobContext:
+    """Batching, pacing and cancellation for one job run."""
+    
+    def __init__(self, batch_size: int, max_batches: int, pause_seconds: float, stop: threading.Event):
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.pause_seconds = pause_seconds
+        self.stop = stop
+    
+    def batches(self) -> Iterator[int]:
+        """Batch numbers to run; pauses between batches and ends early on shutdown."""
+        for number in range(self.max_batches):
+            if self.stop.is_set():
+                return
+            if number:
+                time.sleep(self.pause_seconds)
+            yield number
+    
+    @contextmanager
+    def transaction(self) -> Iterator[Session]:
+        """A session committed when the batch succeeds and rolled back when it fails."""
+        db = SessionLocal()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+@dataclass(frozen=True)
+class Job:
+    name: str
+    interval_seconds: int
+    run: Callable[[JobContext], int]
+    description: str = ""
+
+
+def purge_refresh_sessions(ctx: JobContext) -> int:
+    """Delete refresh sessions whose token has expired."""
+    from app.apis.auth.repositories import RefreshSessionRepository
+    
+    total = 0
+    for _ in ctx.batches():
+        with ctx.transaction() as db:
+            purged = RefreshSessionRepository(db).purge_expired(limit=ctx.batch_size)
+        total += purged
+        if purged < ctx.batch_size:
+            break
+    return total
+
+
+def clear_legacy_refresh_tokens(ctx: JobContext) -> int:
+    """Null out users.refresh_token values that have certainly expired."""
+    from app.apis.auth.repositories import UserRepository
+    
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.REFRESH_EXPIRE_DAYS)
+    total = 0
+    for _ in ctx.batches():
+        with ctx.transaction() as db:
+            cleared = UserRepository(db).clear_stale_refresh_tokens(cutoff, limit=ctx.batch_size)
+        total += cleared
+        if cleared < ctx.batch_size:
+            break
+    return total
+
+
+def purge_upload_sessions(ctx: JobContext) -> int:
+    """Remove abandoned upload sessions and their temp files."""
+    from app.apis.employees_profile.repositories import (
+        EmployeeProfileRepository,
+        EmployeeDocumentRepository,
+        DocumentUploadSessionRepository
+    )
+    from app.apis.employees_profile.services import DocumentUploadService
+    
+    total = 0
+    for _ in ctx.batches():
+        with ctx.transaction() as db:
+            purged = DocumentUploadService(
+                EmployeeProfileRepository(db),
+                EmployeeDocumentRepository(db),
+                DocumentUploadSessionRepository(db)
+            ).purge_expired_sessions(limit=ctx.batch_size)
+        total += purged
+        if purged < ctx.batch_size:
+            break
+    return total
+
+
+def archive_inactive_employees(ctx: JobContext) -> int:
+    """Move profiles soft-deleted more than ARCHIVE_RETENTION_DAYS ago to the archive tables."""
+    from app.apis.employees_profile.repositories import EmployeeArchiveRepository
+    
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.ARCHIVE_RETENTION_DAYS)
+    total = 0
+    for _ in ctx.batches():
+        with ctx.transaction() as db:
+            archived = EmployeeArchiveRepository(db).archive_inactive(cutoff, limit=ctx.batch_size)
+        total += archived
+        if archived < ctx.batch_size:
+            break
+    return total
+
+
+def create_audit_partitions(ctx: JobContext) -> int:
+    """Create audit_log partitions for the coming AUDIT_PARTITIONS_AHEAD months."""
+    from app.apis.audit.repositories import AuditLogRepository
+    
+    with ctx.transaction() as db:
+        return AuditLogRepository(db).ensure_partitions(date.today(), settings.AUDIT_PARTITIONS_AHEAD)
+
+
+def purge_outbox(ctx: JobContext) -> int:
+    """Delete published events past OUTBOX_RETENTION_DAYS that every active webhook has received."""
+    from app.apis.outbox.repositories import OutboxRepository, WebhookSubscriptionRepository
+    
+    before = datetime.now(timezone.utc) - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+    total = 0
+    for _ in ctx.batches():
+        with ctx.transaction() as db:
+            outbox = OutboxRepository(db)
+            owed_from = WebhookSubscriptionRepository(db).min_active_cursor()
+            max_position = outbox.last_position() if owed_from is None else owed_from
+            purged = outbox.purge_published(before, max_position, limit=ctx.batch_size)
+        total += purged
+        if purged < ctx.batch_size:
+            break
+    return total
+
+
+def purge_idempotency_keys(ctx: JobContext) -> int:
+    """Delete idempotency keys past IDEMPOTENCY_TTL_HOURS."""
+    from app.apis.idempotency.repositories import IdempotencyRepository
+    
+    total = 0
+    for _ in ctx.batches():
+        with ctx.transaction() as db:
+            purged = IdempotencyRepository(db).purge_expired(datetime.now(timezone.utc), limit=ctx.batch_size)
+        total += purged
+        if purged < ctx.batch_size:
+            break
+    return total
+
+
+def _upload_files(min_age_seconds: float) -> Iterator[str]:
+    """Files under UPLOAD_DIR last modified more than min_age_seconds ago."""
+    cutoff = time.time() - min_age_seconds
+    for root, _, files in os.walk(settings.UPLOAD_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    yield path
+            except FileNotFoundError:
+                continue
+
+
+def remove_orphan_files(ctx: JobContext) -> int:
+    """
+    Delete upload files no document or upload session refers to.
+    
+    Covers documents deleted without their file and temp files of sessions
+    removed by hand. Recent files are skipped so an upload that has written
+    its file but not yet committed its row is never touched.
+    """
+    from .repositories import UploadReferenceRepository
+    
+    files = _upload_files(settings.MAINTENANCE_ORPHAN_MIN_AGE_HOURS * 3600)
+    removed = 0
+    for _ in ctx.batches():
+        batch: List[str] = [path for _, path in zip(range(ctx.batch_size), files)]
+        if not batch:
+            break
+        
+        with ctx.transaction() as db:
+            referenced = UploadReferenceRepository(db).referenced_paths(batch)
+        for path in batch:
+            if path in referenced:
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+                logger.info(f"Removed orphan upload file: {path}")
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+def purge_job_history(ctx: JobContext) -> int:
+    """Delete job history older than MAINTENANCE_HISTORY_DAYS."""
+    from .repositories import JobRunRepository
+    
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.MAINTENANCE_HISTORY_DAYS)
+    total = 0
+    for _ in ctx.batches():
+        with ctx.transaction() as db:
+            purged = JobRunRepository(db).purge_before(cutoff, limit=ctx.batch_size)
+        total += purged
+        if purged < ctx.batch_size:
+            break
+    return total
+
+
+HOUR = 3600
+
+JOBS: Dict[str, Job] = {
+    job.name: job for job in (
+        Job("refresh_sessions", HOUR, purge_refresh_sessions, "Expired refresh sessions"),
+        Job("legacy_refresh_tokens", 24 * HOUR, clear_legacy_refresh_tokens, "Expired users.refresh_token values"),
+        Job("upload_sessions", HOUR // 4, purge_upload_sessions, "Abandoned upload sessions and temp files"),
+        Job("archive_employees", 24 * HOUR, archive_inactive_employees, "Profiles past the archive retention period"),
+        Job("audit_partitions", 24 * HOUR, create_audit_partitions, "Upcoming monthly audit log partitions"),
+        Job("outbox", 24 * HOUR, purge_outbox, "Delivered outbox events past retention"),
+        Job("idempotency_keys", HOUR, purge_idempotency_keys, "Expired idempotency keys"),
+        Job("orphan_files", 6 * HOUR, remove_orphan_files, "Upload files without a document or session"),
+        Job("job_history", 24 * HOUR, purge_job_history, "Old maintenance job runs"),
+    )
+}
\ No newline at end of file
@@ -0,0 +1,29 @@
+import logging
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+logger = logging.getLogger(__name__)
+
+
+class MaintenanceJobRun(Base):
+    """One run of a scheduled maintenance job."""
+    
+    __tablename__ = "maintenance_job_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False, default="running")  # running, succeeded, failed
+    items = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    worker = Column(String(255), nullable=True)  # host:pid that ran it
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        Index("ix_maintenance_job_runs_job_started", "job_name", "started_at"),
+    )
+    
+    def __repr__(self):
+        return f"<MaintenanceJobRun(id={self.id}, job_name={self.job_name}, status={self.status})>"
\ No newline at end of file
@@ -0,0 +1,98 @@
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.apis.employees_profile.models import EmployeeDocument, EmployeeDocumentArchive, DocumentUploadSession
+from .models import MaintenanceJobRun
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunRepository:
+    """Repository for maintenance job history."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def start(self, job_name: str, worker: str) -> MaintenanceJobRun:
+        """Record a run as started."""
+        run = MaintenanceJobRun(job_name=job_name, status="running", items=0, worker=worker)
+        self.db.add(run)
+        self.db.flush()
+        return run
+    
+    def finish(self, run: MaintenanceJobRun, status: str, items: int, error: Optional[str] = None) -> MaintenanceJobRun:
+        """Record a run's outcome."""
+        run.status = status
+        run.items = items
+        run.error = error
+        run.finished_at = func.now()
+        self.db.flush()
+        return run
+    
+    def last_started(self) -> Dict[str, datetime]:
+        """Most recent start time per job."""
+        try:
+            rows = self.db.execute(
+                select(MaintenanceJobRun.job_name, func.max(MaintenanceJobRun.started_at))
+                .group_by(MaintenanceJobRun.job_name)
+            ).all()
+            return {name: started_at for name, started_at in rows}
+            
+        except Exception as e:
+            logger.error(f"Error fetching last job runs: {str(e)}")
+            raise
+    
+    def get_runs(self, job_name: Optional[str] = None, limit: int = 50) -> List[MaintenanceJobRun]:
+        """Latest runs, newest first."""
+        try:
+            query = self.db.query(MaintenanceJobRun)
+            if job_name:
+                query = query.filter(MaintenanceJobRun.job_name == job_name)
+            return query.order_by(MaintenanceJobRun.started_at.desc(), MaintenanceJobRun.id.desc()).limit(limit).all()
+            
+        except Exception as e:
+            logger.error(f"Error fetching job runs: {str(e)}")
+            raise
+    
+    def purge_before(self, cutoff: datetime, limit: int) -> int:
+        """Delete up to `limit` runs started before cutoff."""
+        ids = [
+            row.id for row in self.db.query(MaintenanceJobRun.id)
+            .filter(MaintenanceJobRun.started_at < cutoff)
+            .limit(limit)
+        ]
+        if not ids:
+            return 0
+        deleted = self.db.query(MaintenanceJobRun).filter(
+            MaintenanceJobRun.id.in_(ids)
+        ).delete(synchronize_session=False)
+        self.db.flush()
+        return deleted
+
+
+class UploadReferenceRepository:
+    """Which files under the upload directory the database still points at."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def referenced_paths(self, paths: Iterable[str]) -> Set[str]:
+        """Subset of paths that are a (possibly archived) document's file or an upload session's temp file."""
+        paths = list(paths)
+        if not paths:
+            return set()
+        
+        documents = self.db.execute(
+            select(EmployeeDocument.file_path).where(EmployeeDocument.file_path.in_(paths))
+        ).scalars()
+        archived = self.db.execute(
+            select(EmployeeDocumentArchive.file_path).where(EmployeeDocumentArchive.file_path.in_(paths))
+        ).scalars()
+        uploads = self.db.execute(
+            select(DocumentUploadSession.temp_path).where(DocumentUploadSession.temp_path.in_(paths))
+        ).scalars()
+        return set(documents) | set(archived) | set(uploads)
\ No newline at end of file
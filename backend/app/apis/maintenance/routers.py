@@ -0,0 +1,75 @@
+import logging
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.database.session import get_read_db
+from app.database.unit_of_work import UnitOfWorkRoute
+from app.apis.employees_profile.policies import Principal
+from app.apis.analytics.routers import require_admin
+from .repositories import JobRunRepository
+from .services import MaintenanceService
+from .schemas import JobListResponse, JobRunResponse
+
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/api/maintenance", tags=["Maintenance"], route_class=UnitOfWorkRoute)
+
+
+# ========== DEPENDENCY INJECTION ==========
+
+def get_maintenance_service(db: Session = Depends(get_read_db)) -> MaintenanceService:
+    return MaintenanceService(JobRunRepository(db))
+
+
+# ========== ROUTES ==========
+
+@router.get("/jobs", response_model=JobListResponse)
+async def list_jobs(
+    request: Request,
+    principal: Principal = Depends(require_admin),
+    maintenance_service: MaintenanceService = Depends(get_maintenance_service)
+):
+    """
+    List scheduled maintenance jobs with their latest run, and whether this
+    worker is the scheduler leader.
+    """
+    logger.info("List maintenance jobs endpoint called")
+    
+    return maintenance_service.list_jobs()
+
+
+@router.get("/runs", response_model=List[JobRunResponse])
+async def list_runs(
+    request: Request,
+    job: Optional[str] = None,
+    limit: int = 50,
+    principal: Principal = Depends(require_admin),
+    maintenance_service: MaintenanceService = Depends(get_maintenance_service)
+):
+    """
+    List recent maintenance job runs, newest first.
+    """
+    logger.info("List maintenance runs endpoint called")
+    
+    return maintenance_service.list_runs(job_name=job, limit=min(limit, 200))
+
+
+@router.post("/jobs/{job_name}/run", response_model=JobRunResponse)
+async def run_job_now(
+    request: Request,
+    job_name: str,
+    principal: Principal = Depends(require_admin),
+    maintenance_service: MaintenanceService = Depends(get_maintenance_service)
+):
+    """
+    Run a maintenance job now on this worker. Jobs are batched and idempotent,
+    so overlapping with a scheduled run is harmless.
+    """
+    logger.info(f"Run maintenance job endpoint called: {job_name}")
+    
+    # Batched DB and file work; keep it off the event loop
+    return await run_in_threadpool(maintenance_service.run_now, job_name)
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+In-process maintenance scheduler with leader election.
+
+Every worker runs a scheduler loop, but only the leader runs jobs. The
+leader is whichever process holds a session-level PostgreSQL advisory lock,
+taken on a dedicated connection outside the request pool. If that
+connection drops, the lock is released and another worker takes over on its
+next tick. Due-ness comes from the job history table, so a new leader
+continues the schedule where the old one stopped.
+
+On other databases (SQLite in development) every process considers itself
+leader; run a single worker there.
+"""
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.database.connection import engine
+from app.database.session import SessionLocal
+from .jobs import JOBS, Job, JobContext
+from .models import MaintenanceJobRun
+from .repositories import JobRunRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary application-wide key, distinct from MIGRATION_LOCK_KEY
+LEADER_LOCK_KEY = 724_201_042
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+leader_gauge = metrics.gauge("hrms_scheduler_leader", "1 while this worker holds the scheduler lock")
+runs_counter = metrics.counter("hrms_maintenance_runs_total", "Maintenance job runs by outcome")
+items_counter = metrics.counter("hrms_maintenance_items_total", "Rows and files cleaned up by maintenance jobs")
+duration_histogram = metrics.histogram(
+    "hrms_maintenance_run_seconds",
+    "Maintenance job run duration",
+    buckets=(0.1, 0.5, 1, 5, 15, 60, 300, 900)
+)
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:  # SQLite returns naive UTC
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class LeaderLock:
+    """pg_try_advisory_lock held for as long as its dedicated connection lives."""
+    
+    def __init__(self, key: int = LEADER_LOCK_KEY, name: str = "scheduler"):
+        self.key = key
+        self.name = name
+        self._engine = None
+        self._connection = None
+    
+    @property
+    def is_held(self) -> bool:
+        return self._connection is not None or engine.dialect.name != "postgresql"
+    
+    def acquire_or_keep(self) -> bool:
+        """Keep the lock if its connection is healthy, otherwise try to take it."""
+        if engine.dialect.name != "postgresql":
+            return True
+        
+        if self._connection is not None:
+            try:
+                self._connection.execute(text("SELECT 1"))
+                return True
+            except Exception as e:
+                logger.warning(f"{self.name.capitalize()} lock connection lost: {str(e)}")
+                self._close()
+        
+        if self._engine is None:
+            # One connection per process, outside the request pool's budget
+            self._engine = create_engine(engine.url, poolclass=NullPool)
+        connection = self._engine.connect()
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}
+            ).scalar()
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+        
+        if not acquired:
+            connection.close()
+            return False
+        self._connection = connection
+        logger.info(f"{self.name.capitalize()} leadership acquired by {WORKER_ID}")
+        return True
+    
+    def release(self):
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+            self._connection.commit()
+        except Exception as e:
+            logger.warning(f"Error releasing {self.name} lock: {str(e)}")
+        self._close()
+        logger.info(f"{self.name.capitalize()} leadership released by {WORKER_ID}")
+    
+    def _close(self):
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+
+def run_job(job: Job, stop: Optional[threading.Event] = None) -> MaintenanceJobRun:
+    """Run one job now and record it in the job history."""
+    with SessionLocal() as db:
+        run = JobRunRepository(db).start(job.name, WORKER_ID)
+        db.commit()
+        run_id = run.id
+    
+    context = JobContext(
+        batch_size=settings.MAINTENANCE_BATCH_SIZE,
+        max_batches=settings.MAINTENANCE_MAX_BATCHES,
+        pause_seconds=settings.MAINTENANCE_BATCH_PAUSE_MS / 1000,
+        stop=stop or threading.Event()
+    )
+    started = time.monotonic()
+    items, status, error = 0, "succeeded", None
+    try:
+        items = job.run(context)
+        logger.info(f"Maintenance job {job.name} cleaned up {items} items")
+    except Exception as e:
+        status, error = "failed", "".join(traceback.format_exception_only(type(e), e)).strip()
+        logger.exception(f"Maintenance job {job.name} failed: {str(e)}")
+    
+    elapsed = time.monotonic() - started
+    runs_counter.inc(job=job.name, status=status)
+    items_counter.inc(items, job=job.name)
+    duration_histogram.observe(elapsed, job=job.name)
+    
+    with SessionLocal() as db:
+        repo = JobRunRepository(db)
+        run = db.get(MaintenanceJobRun, run_id)
+        repo.finish(run, status, items, error)
+        db.commit()
+        db.refresh(run)
+        return run
+
+
+class MaintenanceScheduler:
+    """Ticks every MAINTENANCE_TICK_SECONDS; the leader runs the jobs that are due."""
+    
+    def __init__(self, jobs: Dict[str, Job] = JOBS, tick_seconds: Optional[float] = None):
+        self.jobs = jobs
+        self.tick_seconds = tick_seconds or settings.MAINTENANCE_TICK_SECONDS
+        self.lock = LeaderLock()
+        self._stop = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        self._stop.clear()
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Maintenance scheduler started ({len(self.jobs)} jobs)")
+    
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            # A running batch finishes first; jobs check the stop flag between batches
+            await self._task
+            self._task = None
+        await run_in_threadpool(self.lock.release)
+        leader_gauge.set(0)
+    
+    async def _loop(self):
+        while not self._stop.is_set():
+            try:
+                is_leader = await run_in_threadpool(self.lock.acquire_or_keep)
+                leader_gauge.set(1 if is_leader else 0)
+                if is_leader:
+                    await run_in_threadpool(self.run_due_jobs)
+            except Exception as e:
+                logger.exception(f"Maintenance scheduler tick failed: {str(e)}")
+            
+            deadline = time.monotonic() + self.tick_seconds
+            while not self._stop.is_set() and time.monotonic() < deadline:
+                await asyncio.sleep(min(1.0, self.tick_seconds))
+    
+    def run_due_jobs(self):
+        with SessionLocal() as db:
+            last_started = JobRunRepository(db).last_started()
+        
+        now = datetime.now(timezone.utc)
+        for job in self.jobs.values():
+            if self._stop.is_set():
+                return
+            started = _utc(last_started.get(job.name))
+            if started is None or (now - started).total_seconds() >= job.interval_seconds:
+                run_job(job, self._stop)
+
+
+scheduler = MaintenanceScheduler()
\ No newline at end of file
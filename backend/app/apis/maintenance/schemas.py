@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+
+class JobRunResponse(BaseModel):
+    """Schema for one maintenance job run."""
+    id: int
+    job_name: str
+    status: str
+    items: int
+    error: Optional[str] = None
+    worker: Optional[str] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class JobResponse(BaseModel):
+    """Schema for a scheduled job and its latest run."""
+    name: str
+    description: str
+    interval_seconds: int
+    last_run: Optional[JobRunResponse] = None
+
+
+class JobListResponse(BaseModel):
+    """Schema for the job list and this worker's scheduler state."""
+    leader: bool
+    jobs: List[JobResponse]
\ No newline at end of file
@@ -0,0 +1,67 @@
+import logging
+from typing import List, Optional
+from fastapi import HTTPException, status
+
+from .jobs import JOBS
+from .repositories import JobRunRepository
+from .scheduler import run_job, scheduler
+from .schemas import JobListResponse, JobResponse, JobRunResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class MaintenanceService:
+    """Service exposing scheduled maintenance jobs and their history."""
+    
+    def __init__(self, run_repo: JobRunRepository):
+        self.run_repo = run_repo
+    
+    def list_jobs(self) -> JobListResponse:
+        """List jobs with their latest run."""
+        logger.info("Listing maintenance jobs")
+        
+        try:
+            jobs = []
+            for job in JOBS.values():
+                latest = self.run_repo.get_runs(job_name=job.name, limit=1)
+                jobs.append(JobResponse(
+                    name=job.name,
+                    description=job.description,
+                    interval_seconds=job.interval_seconds,
+                    last_run=JobRunResponse.from_orm(latest[0]) if latest else None
+                ))
+            return JobListResponse(leader=scheduler.lock.is_held, jobs=jobs)
+            
+        except Exception as e:
+            logger.exception(f"Error listing maintenance jobs: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def list_runs(self, job_name: Optional[str] = None, limit: int = 50) -> List[JobRunResponse]:
+        """List recent runs, newest first."""
+        logger.info(f"Listing maintenance job runs: job={job_name}")
+        
+        try:
+            return [JobRunResponse.from_orm(run) for run in self.run_repo.get_runs(job_name, limit)]
+            
+        except Exception as e:
+            logger.exception(f"Error listing maintenance job runs: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def run_now(self, job_name: str) -> JobRunResponse:
+        """Run a job immediately on this worker, whether or not it is the leader."""
+        job = JOBS.get(job_name)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        
+        logger.info(f"Running maintenance job on demand: {job_name}")
+        return JobRunResponse.from_orm(run_job(job))
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Outbox and change-event delivery API module.
+"""
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Outbox events from the session's collected profile changes.
+
+At commit, every created, changed and deleted (or deactivated) profile
+collected by app.database.changes becomes one employee.* event carrying the
+profile as the API returns it, written with a single multi-row INSERT in
+the same transaction. The event is published only if its change commits.
+"""
+import logging
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.apis.employees_profile.models import EmployeeProfile
+from app.apis.employees_profile.schemas import EmployeeProfileResponse
+from app.database.changes import RowChange, by_row, on_commit_changes
+from .repositories import OutboxRepository
+
+
+logger = logging.getLogger(__name__)
+
+_EVENT_TYPES = {"create": "employee.created", "update": "employee.updated", "delete": "employee.deleted"}
+
+
+@on_commit_changes(EmployeeProfile)
+def _write_events(session: Session, changes: List[RowChange]):
+    changes = by_row(changes)
+    # Current state in one query, including rows changed by bulk statements behind the session
+    profiles = {
+        profile.id: profile for profile in session.scalars(
+            select(EmployeeProfile)
+            .where(EmployeeProfile.id.in_([change.row_id for change in changes]))
+            .execution_options(populate_existing=True)
+        ).unique()
+    }
+    
+    events = []
+    for change in changes:
+        profile = profiles.get(change.row_id, change.target)
+        if profile is None:
+            continue
+        event_type = "employee.deleted" if change.deactivated else _EVENT_TYPES[change.action]
+        events.append((event_type, change.row_id, EmployeeProfileResponse.from_orm(profile).model_dump(mode="json")))
+    
+    OutboxRepository(session).add_many(events)
+    logger.debug(f"Queued {len(events)} outbox events")
\ No newline at end of file
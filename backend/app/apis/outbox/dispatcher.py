@@ -0,0 +1,192 @@
+"""
+Outbox dispatcher.
+
+Runs in every worker; like the maintenance scheduler, only the holder of a
+PostgreSQL advisory lock (its own key) does the work. Each tick it
+
+1. publishes committed events: gives them the next positions in one
+   serial sequence, which is what feed and webhook cursors count in;
+2. POSTs each due webhook subscription the next batch of events after its
+   cursor, signed with the subscription's secret, concurrently across
+   subscriptions.
+
+A subscription's cursor moves only after a 2xx response, so delivery is at
+least once: receivers deduplicate on the event id. Failures back off
+exponentially (with jitter) per subscription, and the other subscriptions
+keep flowing.
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.database.session import SessionLocal
+from app.apis.maintenance.scheduler import LeaderLock
+from .repositories import OutboxRepository, WebhookSubscriptionRepository, event_envelope
+
+
+logger = logging.getLogger(__name__)
+
+# Distinct from the scheduler's key, so dispatch and maintenance may lead on different workers
+DISPATCHER_LOCK_KEY = 724_201_045
+
+SIGNATURE_HEADER = "X-HRMS-Signature"
+
+leader_gauge = metrics.gauge("hrms_outbox_dispatcher_leader", "1 while this worker holds the dispatcher lock")
+published_counter = metrics.counter("hrms_outbox_published_total", "Outbox events published")
+deliveries_counter = metrics.counter("hrms_outbox_deliveries_total", "Webhook delivery attempts by outcome")
+
+
+def sign(secret: str, body: bytes) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Delay before the next try after `attempts` consecutive failures."""
+    delay = min(
+        settings.OUTBOX_BACKOFF_MAX_SECONDS,
+        settings.OUTBOX_BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+@dataclass
+class _Batch:
+    subscription_id: int
+    url: str
+    secret: str
+    attempts: int
+    last_position: int
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class OutboxDispatcher:
+    """Publishes outbox events and delivers them to webhook subscribers."""
+    
+    def __init__(self, poll_seconds: Optional[float] = None, batch_size: Optional[int] = None):
+        self.poll_seconds = poll_seconds or settings.OUTBOX_POLL_SECONDS
+        self.batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        self.lock = LeaderLock(DISPATCHER_LOCK_KEY, name="dispatcher")
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def start(self):
+        self._stop.clear()
+        self._task = asyncio.create_task(self._loop())
+        logger.info("Outbox dispatcher started")
+    
+    async def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await run_in_threadpool(self.lock.release)
+        leader_gauge.set(0)
+    
+    async def _loop(self):
+        while not self._stop.is_set():
+            busy = False
+            try:
+                is_leader = await run_in_threadpool(self.lock.acquire_or_keep)
+                leader_gauge.set(1 if is_leader else 0)
+                if is_leader:
+                    busy = await self.dispatch_once()
+            except Exception as e:
+                logger.exception(f"Outbox dispatch failed: {str(e)}")
+            
+            if not busy:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+    
+    async def dispatch_once(self) -> bool:
+        """Publish and deliver one round; True when a full batch suggests more is waiting."""
+        published = await run_in_threadpool(self.publish)
+        batches = await run_in_threadpool(self._load_batches)
+        if batches:
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=settings.OUTBOX_WEBHOOK_TIMEOUT_SECONDS)
+            results = await asyncio.gather(*(self._deliver(batch) for batch in batches))
+            await run_in_threadpool(self._save_results, results)
+        return published >= self.batch_size or any(
+            len(batch.events) >= self.batch_size for batch in batches
+        )
+    
+    def publish(self) -> int:
+        with SessionLocal() as db:
+            published = OutboxRepository(db).publish_pending(datetime.now(timezone.utc), self.batch_size)
+            db.commit()
+        if published:
+            published_counter.inc(published)
+            logger.debug(f"Published {published} outbox events")
+        return published
+    
+    def _load_batches(self) -> List[_Batch]:
+        now = datetime.now(timezone.utc)
+        batches = []
+        with SessionLocal() as db:
+            outbox = OutboxRepository(db)
+            for subscription in WebhookSubscriptionRepository(db).get_due(now):
+                events = outbox.get_after(subscription.cursor, self.batch_size)
+                if not events:
+                    continue
+                batches.append(_Batch(
+                    subscription_id=subscription.id,
+                    url=subscription.url,
+                    secret=subscription.secret,
+                    attempts=subscription.attempts,
+                    last_position=events[-1].position,
+                    # Filtered-out events still advance the cursor
+                    events=[event_envelope(event) for event in events if subscription.accepts(event.event_type)]
+                ))
+        return batches
+    
+    async def _deliver(self, batch: _Batch) -> Tuple[_Batch, Optional[str]]:
+        if not batch.events:
+            return batch, None
+        
+        body = json.dumps({"events": batch.events}).encode()
+        try:
+            response = await self._client.post(
+                batch.url,
+                content=body,
+                headers={"Content-Type": "application/json", SIGNATURE_HEADER: sign(batch.secret, body)}
+            )
+            error = None if response.is_success else f"HTTP {response.status_code}"
+        except httpx.HTTPError as e:
+            error = f"{type(e).__name__}: {str(e)}"
+        
+        deliveries_counter.inc(result="ok" if error is None else "failed")
+        if error is not None:
+            logger.warning(f"Webhook delivery to subscription {batch.subscription_id} failed: {error}")
+        return batch, error
+    
+    def _save_results(self, results: List[Tuple[_Batch, Optional[str]]]):
+        now = datetime.now(timezone.utc)
+        with SessionLocal() as db:
+            repo = WebhookSubscriptionRepository(db)
+            for batch, error in results:
+                if error is None:
+                    repo.record_success(batch.subscription_id, batch.last_position, now, delivered=bool(batch.events))
+                else:
+                    retry_at = now + timedelta(seconds=backoff_seconds(batch.attempts + 1))
+                    repo.record_failure(batch.subscription_id, error, retry_at)
+            db.commit()
+
+
+dispatcher = OutboxDispatcher()
\ No newline at end of file
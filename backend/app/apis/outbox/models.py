@@ -0,0 +1,66 @@
+import logging
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Index
+from sqlalchemy.sql import func
+from app.database.base import Base
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxEvent(Base):
+    """
+    Change event written in the same transaction as the change.
+    
+    position is assigned by the dispatcher once the event is committed, in
+    a single serial sequence, so feed and webhook cursors never skip an event
+    whose transaction committed after a later one.
+    """
+    
+    __tablename__ = "outbox_events"
+    
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String(50), nullable=False)  # employee.created, employee.updated, employee.deleted
+    employee_id = Column(Integer, nullable=False)
+    payload = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    position = Column(Integer, nullable=True, unique=True)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        # Only the not yet published tail, which the dispatcher polls every second
+        Index(
+            "ix_outbox_events_unpublished", "id",
+            postgresql_where=position.is_(None), sqlite_where=position.is_(None)
+        ),
+    )
+    
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, type={self.event_type}, position={self.position})>"
+
+
+class WebhookSubscription(Base):
+    """A downstream system receiving change events by HTTP POST."""
+    
+    __tablename__ = "webhook_subscriptions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    url = Column(String(500), nullable=False)
+    secret = Column(String(64), nullable=False)  # HMAC-SHA256 key for X-HRMS-Signature
+    event_types = Column(String(255), nullable=True)  # comma-separated; NULL = all
+    is_active = Column(Boolean, default=True, nullable=False)
+    
+    cursor = Column(Integer, nullable=False, default=0)  # last delivered position
+    attempts = Column(Integer, nullable=False, default=0)  # consecutive failures
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    last_delivered_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def accepts(self, event_type: str) -> bool:
+        if not self.event_types:
+            return True
+        return event_type in {value.strip() for value in self.event_types.split(",")}
+    
+    def __repr__(self):
+        return f"<WebhookSubscription(id={self.id}, name={self.name}, cursor={self.cursor})>"
\ No newline at end of file
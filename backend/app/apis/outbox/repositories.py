@@ -0,0 +1,176 @@
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import func, insert, select, update, delete
+from sqlalchemy.orm import Session
+
+from .models import OutboxEvent, WebhookSubscription
+
+
+logger = logging.getLogger(__name__)
+
+
+def event_envelope(event: OutboxEvent) -> Dict[str, Any]:
+    """The JSON shape delivered to subscribers and served by the feed."""
+    return {
+        "id": event.id,
+        "position": event.position,
+        "type": event.event_type,
+        "employee_id": event.employee_id,
+        "occurred_at": event.created_at.isoformat() if event.created_at else None,
+        "data": json.loads(event.payload),
+    }
+
+
+class OutboxRepository:
+    """Repository for outbox events."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def add(self, event_type: str, employee_id: int, payload: Dict[str, Any]) -> OutboxEvent:
+        """Queue an event; it commits or rolls back with the caller's transaction."""
+        event = OutboxEvent(
+            event_type=event_type,
+            employee_id=employee_id,
+            payload=json.dumps(payload, default=str)
+        )
+        self.db.add(event)
+        return event
+    
+    def add_many(self, events: List[Tuple[str, int, Dict[str, Any]]]) -> int:
+        """Queue one event per (event_type, employee_id, payload) with a single multi-row INSERT."""
+        if not events:
+            return 0
+        self.db.execute(insert(OutboxEvent), [
+            {
+                "event_type": event_type,
+                "employee_id": employee_id,
+                "payload": json.dumps(payload, default=str)
+            }
+            for event_type, employee_id, payload in events
+        ])
+        return len(events)
+    
+    def publish_pending(self, now: datetime, limit: int) -> int:
+        """Give committed, unpublished events the next positions, in id order."""
+        ids = self.db.execute(
+            select(OutboxEvent.id)
+            .where(OutboxEvent.position.is_(None))
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+        ).scalars().all()
+        if not ids:
+            return 0
+        
+        last = self.db.execute(select(func.max(OutboxEvent.position))).scalar() or 0
+        self.db.execute(
+            update(OutboxEvent),
+            [
+                {"id": event_id, "position": last + offset, "published_at": now}
+                for offset, event_id in enumerate(ids, start=1)
+            ]
+        )
+        self.db.flush()
+        return len(ids)
+    
+    def get_after(self, position: int, limit: int) -> List[OutboxEvent]:
+        """Published events after a cursor, in position order."""
+        try:
+            return self.db.query(OutboxEvent).filter(
+                OutboxEvent.position > position
+            ).order_by(OutboxEvent.position).limit(limit).all()
+            
+        except Exception as e:
+            logger.error(f"Error fetching outbox events after {position}: {str(e)}")
+            raise
+    
+    def last_position(self) -> int:
+        return self.db.execute(select(func.max(OutboxEvent.position))).scalar() or 0
+    
+    def purge_published(self, before: datetime, max_position: int, limit: int) -> int:
+        """Delete up to `limit` events published before a time and at or below a position."""
+        ids = self.db.execute(
+            select(OutboxEvent.id).where(
+                OutboxEvent.published_at < before,
+                OutboxEvent.position <= max_position
+            ).limit(limit)
+        ).scalars().all()
+        if not ids:
+            return 0
+        deleted = self.db.execute(
+            delete(OutboxEvent).where(OutboxEvent.id.in_(ids))
+        ).rowcount
+        self.db.flush()
+        return deleted
+
+
+class WebhookSubscriptionRepository:
+    """Repository for webhook subscriptions."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_all(self) -> List[WebhookSubscription]:
+        return self.db.query(WebhookSubscription).order_by(WebhookSubscription.id).all()
+    
+    def get_by_id(self, subscription_id: int) -> Optional[WebhookSubscription]:
+        return self.db.query(WebhookSubscription).filter(
+            WebhookSubscription.id == subscription_id
+        ).first()
+    
+    def create(self, subscription_data: dict) -> WebhookSubscription:
+        """Create a subscription."""
+        logger.info(f"Creating webhook subscription: {subscription_data.get('name')}")
+        
+        try:
+            subscription = WebhookSubscription(**subscription_data)
+            self.db.add(subscription)
+            self.db.flush()
+            return subscription
+            
+        except Exception as e:
+            logger.error(f"Error creating webhook subscription: {str(e)}")
+            raise
+    
+    def delete(self, subscription_id: int) -> bool:
+        deleted = self.db.query(WebhookSubscription).filter(
+            WebhookSubscription.id == subscription_id
+        ).delete(synchronize_session=False)
+        self.db.flush()
+        return bool(deleted)
+    
+    def get_due(self, now: datetime) -> List[WebhookSubscription]:
+        """Active subscriptions not waiting out a backoff."""
+        return self.db.query(WebhookSubscription).filter(
+            WebhookSubscription.is_active == True,
+            (WebhookSubscription.next_attempt_at.is_(None)) | (WebhookSubscription.next_attempt_at <= now)
+        ).order_by(WebhookSubscription.id).all()
+    
+    def min_active_cursor(self) -> Optional[int]:
+        """Lowest cursor among active subscriptions: events above it are still owed to someone."""
+        return self.db.execute(
+            select(func.min(WebhookSubscription.cursor)).where(WebhookSubscription.is_active == True)
+        ).scalar()
+    
+    def record_success(self, subscription_id: int, cursor: int, now: datetime, delivered: bool):
+        values = {"cursor": cursor, "attempts": 0, "next_attempt_at": None, "last_error": None}
+        if delivered:
+            values["last_delivered_at"] = now
+        self.db.execute(
+            update(WebhookSubscription)
+            .where(WebhookSubscription.id == subscription_id)
+            .values(**values)
+        )
+    
+    def record_failure(self, subscription_id: int, error: str, next_attempt_at: datetime):
+        self.db.execute(
+            update(WebhookSubscription)
+            .where(WebhookSubscription.id == subscription_id)
+            .values(
+                attempts=WebhookSubscription.attempts + 1,
+                next_attempt_at=next_attempt_at,
+                last_error=error[:1000]
+            )
+        )
\ No newline at end of file
@@ -0,0 +1,104 @@
+import logging
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+
+from app.database.session import get_db, get_read_db
+from app.database.unit_of_work import UnitOfWorkRoute
+from app.apis.employees_profile.policies import Principal
+from app.apis.analytics.routers import require_admin
+from .repositories import OutboxRepository, WebhookSubscriptionRepository
+from .services import OutboxService
+from .schemas import (
+    WebhookSubscriptionCreate,
+    WebhookSubscriptionResponse,
+    WebhookSubscriptionCreatedResponse
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter(prefix="/api/events", tags=["Events"], route_class=UnitOfWorkRoute)
+
+
+# ========== DEPENDENCY INJECTION ==========
+
+def get_outbox_service(db: Session = Depends(get_db)) -> OutboxService:
+    return OutboxService(OutboxRepository(db), WebhookSubscriptionRepository(db))
+
+
+def get_read_outbox_service(db: Session = Depends(get_read_db)) -> OutboxService:
+    return OutboxService(OutboxRepository(db), WebhookSubscriptionRepository(db))
+
+
+# ========== ROUTES ==========
+
+@router.get("/feed")
+async def get_feed(
+    request: Request,
+    after: int = 0,
+    limit: int = 500,
+    principal: Principal = Depends(require_admin),
+    outbox_service: OutboxService = Depends(get_read_outbox_service)
+):
+    """
+    Employee change events after a cursor, one JSON object per line.
+    
+    Pass the X-Next-Cursor response header as `after` on the next call; an
+    empty body means the consumer is caught up. Events are kept for
+    OUTBOX_RETENTION_DAYS after publication.
+    """
+    logger.info(f"Event feed endpoint called: after={after}")
+    
+    body, next_cursor = outbox_service.get_feed(after=max(after, 0), limit=min(max(limit, 1), 1000))
+    return Response(
+        content=body,
+        media_type="application/x-ndjson",
+        headers={"X-Next-Cursor": str(next_cursor)}
+    )
+
+
+@router.get("/subscriptions", response_model=list[WebhookSubscriptionResponse])
+async def list_subscriptions(
+    request: Request,
+    principal: Principal = Depends(require_admin),
+    outbox_service: OutboxService = Depends(get_read_outbox_service)
+):
+    """
+    List webhook subscriptions with their cursor and delivery state.
+    """
+    logger.info("List webhook subscriptions endpoint called")
+    return outbox_service.list_subscriptions()
+
+
+@router.post("/subscriptions", response_model=WebhookSubscriptionCreatedResponse, status_code=status.HTTP_201_CREATED)
+async def create_subscription(
+    request: Request,
+    subscription_data: WebhookSubscriptionCreate,
+    principal: Principal = Depends(require_admin),
+    outbox_service: OutboxService = Depends(get_outbox_service)
+):
+    """
+    Subscribe a URL to employee change events.
+    
+    Batches are POSTed as {"events": [...]} with an X-HRMS-Signature header
+    (sha256=HMAC of the body with the returned secret). Delivery is at
+    least once, so deduplicate on the event id.
+    """
+    logger.info("Create webhook subscription endpoint called")
+    return outbox_service.create_subscription(subscription_data)
+
+
+@router.delete("/subscriptions/{subscription_id}")
+async def delete_subscription(
+    request: Request,
+    subscription_id: int,
+    principal: Principal = Depends(require_admin),
+    outbox_service: OutboxService = Depends(get_outbox_service)
+):
+    """
+    Delete a webhook subscription.
+    """
+    logger.info(f"Delete webhook subscription endpoint called: {subscription_id}")
+    return outbox_service.delete_subscription(subscription_id)
\ No newline at end of file
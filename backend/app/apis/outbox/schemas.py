@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class WebhookSubscriptionCreate(BaseModel):
+    """Schema for subscribing a downstream system to change events."""
+    name: str = Field(..., min_length=1, max_length=100)
+    url: str = Field(..., min_length=1, max_length=500, pattern=r"^https?://")
+    event_types: Optional[str] = Field(None, max_length=255)  # comma-separated; omit for all
+    from_start: bool = False  # replay retained events instead of starting at the next one
+
+
+class WebhookSubscriptionResponse(BaseModel):
+    """Schema for a webhook subscription and its delivery state."""
+    id: int
+    name: str
+    url: str
+    event_types: Optional[str] = None
+    is_active: bool
+    cursor: int
+    attempts: int
+    next_attempt_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    last_delivered_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class WebhookSubscriptionCreatedResponse(WebhookSubscriptionResponse):
+    """Creation response; the only time the signing secret is returned."""
+    secret: str
\ No newline at end of file
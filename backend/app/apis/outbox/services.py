@@ -0,0 +1,68 @@
+import json
+import logging
+import secrets
+from typing import Dict, List, Tuple
+from fastapi import HTTPException, status
+
+from .repositories import OutboxRepository, WebhookSubscriptionRepository, event_envelope
+from .schemas import (
+    WebhookSubscriptionCreate,
+    WebhookSubscriptionResponse,
+    WebhookSubscriptionCreatedResponse
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxService:
+    """Service for the change-event feed and webhook subscriptions."""
+    
+    def __init__(self, outbox_repo: OutboxRepository, subscription_repo: WebhookSubscriptionRepository):
+        self.outbox_repo = outbox_repo
+        self.subscription_repo = subscription_repo
+    
+    def get_feed(self, after: int = 0, limit: int = 500) -> Tuple[str, int]:
+        """NDJSON page of published events after a cursor, and the cursor to pass next."""
+        logger.info(f"Reading event feed after {after}")
+        
+        try:
+            events = self.outbox_repo.get_after(after, limit)
+            body = "".join(json.dumps(event_envelope(event)) + "\n" for event in events)
+            return body, events[-1].position if events else after
+            
+        except Exception as e:
+            logger.exception(f"Error reading event feed: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def list_subscriptions(self) -> List[WebhookSubscriptionResponse]:
+        return [WebhookSubscriptionResponse.from_orm(sub) for sub in self.subscription_repo.get_all()]
+    
+    def create_subscription(self, subscription_data: WebhookSubscriptionCreate) -> WebhookSubscriptionCreatedResponse:
+        """Subscribe a URL; it receives events published from now on unless from_start is set."""
+        logger.info(f"Creating webhook subscription: {subscription_data.name}")
+        
+        try:
+            data = subscription_data.dict(exclude={"from_start"})
+            data["secret"] = secrets.token_hex(32)
+            data["cursor"] = 0 if subscription_data.from_start else self.outbox_repo.last_position()
+            subscription = self.subscription_repo.create(data)
+            return WebhookSubscriptionCreatedResponse.from_orm(subscription)
+            
+        except Exception as e:
+            logger.exception(f"Error creating webhook subscription: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal server error"
+            )
+    
+    def delete_subscription(self, subscription_id: int) -> Dict[str, str]:
+        if not self.subscription_repo.delete(subscription_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Subscription not found"
+            )
+        return {"message": "Subscription deleted"}
\ No newline at end of file
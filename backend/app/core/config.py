@@ -16,6 +16,48 @@ class Settings(BaseSettings):
         "postgresql+psycopg2://postgres:postgres@db:5432/appdb"
     )
     
+    # Optional read replica; list/search/get/export endpoints read from it
+    DATABASE_REPLICA_URL: str = os.getenv("DATABASE_REPLICA_URL", "")
+    # After a client writes, its reads go to the primary for this long (replica lag)
+    READ_YOUR_WRITES_SECONDS: int = int(os.getenv("READ_YOUR_WRITES_SECONDS", 5))
+    
+    # Connection budget for this instance, shared by all worker processes.
+    # Keep (instances x DB_MAX_CONNECTIONS) under PostgreSQL max_connections.
+    DB_MAX_CONNECTIONS: int = int(os.getenv("DB_MAX_CONNECTIONS", 40))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 0))  # 0 = derive from the budget
+    # Kept well under gunicorn's timeout; admission control sheds load before the pool runs dry
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 5))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    
+    DB_POOL_WARMUP: bool = os.getenv("DB_POOL_WARMUP", "True").lower() == "true"
+    
+    # --- Admission control (per worker) ---
+    ADMISSION_ENABLED: bool = os.getenv("ADMISSION_ENABLED", "True").lower() == "true"
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", 0))  # 0 = derive from the pool
+    ADMISSION_RESERVED_SLOTS: int = int(os.getenv("ADMISSION_RESERVED_SLOTS", 1))  # for refresh and readiness
+    ADMISSION_BULK_SHARE: float = float(os.getenv("ADMISSION_BULK_SHARE", 0.5))
+    ADMISSION_QUEUE_TARGET_MS: int = int(os.getenv("ADMISSION_QUEUE_TARGET_MS", 500))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", 100))
+    
+    # --- Rate limiting (requests per minute; 0 disables a bucket) ---
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "True").lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")  # memory | redis
+    RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_MAX_KEYS: int = int(os.getenv("RATE_LIMIT_MAX_KEYS", 100_000))  # memory backend, per worker
+    RATE_LIMIT_LOGIN_PER_IP: int = int(os.getenv("RATE_LIMIT_LOGIN_PER_IP", 20))
+    RATE_LIMIT_REFRESH_PER_IP: int = int(os.getenv("RATE_LIMIT_REFRESH_PER_IP", 60))
+    RATE_LIMIT_REFRESH_PER_USER: int = int(os.getenv("RATE_LIMIT_REFRESH_PER_USER", 10))
+    RATE_LIMIT_API_PER_IP: int = int(os.getenv("RATE_LIMIT_API_PER_IP", 1200))
+    RATE_LIMIT_API_PER_USER: int = int(os.getenv("RATE_LIMIT_API_PER_USER", 600))
+    
+    # --- Health checks ---
+    HEALTH_DB_TIMEOUT_SECONDS: float = float(os.getenv("HEALTH_DB_TIMEOUT_SECONDS", 2.0))
+    HEALTH_MAX_POOL_SATURATION: float = float(os.getenv("HEALTH_MAX_POOL_SATURATION", 1.0))
+    
+    # --- Server ---
+    # Worker processes per instance; docker/gunicorn_conf.py exports it before loading the app
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", 1))
+    
     # --- Authentication ---
     GOOGLE_CLIENT_ID: str = os.getenv(
         "GOOGLE_CLIENT_ID",
@@ -25,6 +67,10 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_EXPIRE_MINUTES", 15))
     REFRESH_EXPIRE_DAYS: int = int(os.getenv("REFRESH_EXPIRE_DAYS", 15))
+    # Concurrent refreshes (several tabs) within this window get a token in the same family
+    REFRESH_REUSE_GRACE_SECONDS: int = int(os.getenv("REFRESH_REUSE_GRACE_SECONDS", 30))
+    # Verified access tokens cached per worker (0 disables the cache)
+    JWT_CACHE_SIZE: int = int(os.getenv("JWT_CACHE_SIZE", 10_000))
     
     # --- Application ---
     FRONTEND_ORIGIN: str = os.getenv("FRONTEND_ORIGIN", "http://localhost:3000")
@@ -33,7 +79,68 @@ class Settings(BaseSettings):
     # --- Security ---
     SECURE_COOKIES: bool = os.getenv("SECURE_COOKIES", "False").lower() == "true"
     SAME_SITE_COOKIE: str = os.getenv("SAME_SITE_COOKIE", "lax")
-    
+
+    # --- Batch reads ---
+    BATCH_GET_MAX_IDS: int = int(os.getenv("BATCH_GET_MAX_IDS", 100))  # keys per POST /api/employees/batch-get
+
+    # --- Bulk updates ---
+    # Rows one POST /api/employees/bulk-update may change (all in one transaction)
+    BULK_UPDATE_MAX_ROWS: int = int(os.getenv("BULK_UPDATE_MAX_ROWS", 5000))
+
+    # --- Idempotency keys (POST create and upload endpoints) ---
+    IDEMPOTENCY_TTL_HOURS: int = int(os.getenv("IDEMPOTENCY_TTL_HOURS", 24))
+    # A duplicate waits this long for the first request before getting 409
+    IDEMPOTENCY_WAIT_SECONDS: float = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", 30.0))
+    # An in-progress claim older than this is taken over (its worker died)
+    IDEMPOTENCY_LOCK_SECONDS: int = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", 300))
+    IDEMPOTENCY_MAX_BODY_BYTES: int = int(os.getenv("IDEMPOTENCY_MAX_BODY_BYTES", 64 * 1024))
+
+    # --- Uploads ---
+    UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "uploads")
+    UPLOAD_MAX_FILE_BYTES: int = int(os.getenv("UPLOAD_MAX_FILE_BYTES", 200 * 1024 * 1024))
+    UPLOAD_CHUNK_MAX_BYTES: int = int(os.getenv("UPLOAD_CHUNK_MAX_BYTES", 8 * 1024 * 1024))
+    UPLOAD_SESSION_TTL_HOURS: int = int(os.getenv("UPLOAD_SESSION_TTL_HOURS", 24))
+
+    # --- Archive ---
+    # Soft-deleted profiles move to the archive tables this long after deletion
+    ARCHIVE_RETENTION_DAYS: int = int(os.getenv("ARCHIVE_RETENTION_DAYS", 365))
+
+    # --- Audit ---
+    # Monthly audit_log partitions created ahead of time (PostgreSQL)
+    AUDIT_PARTITIONS_AHEAD: int = int(os.getenv("AUDIT_PARTITIONS_AHEAD", 2))
+
+    # --- Outbox (change events for downstream systems) ---
+    # The dispatcher's single leader needs PostgreSQL advisory locks: on other
+    # databases every worker would lead, so startup refuses WEB_CONCURRENCY > 1
+    OUTBOX_ENABLED: bool = os.getenv("OUTBOX_ENABLED", "True").lower() == "true"
+    OUTBOX_POLL_SECONDS: float = float(os.getenv("OUTBOX_POLL_SECONDS", 1.0))
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+    OUTBOX_WEBHOOK_TIMEOUT_SECONDS: float = float(os.getenv("OUTBOX_WEBHOOK_TIMEOUT_SECONDS", 5.0))
+    OUTBOX_BACKOFF_BASE_SECONDS: float = float(os.getenv("OUTBOX_BACKOFF_BASE_SECONDS", 5.0))
+    OUTBOX_BACKOFF_MAX_SECONDS: float = float(os.getenv("OUTBOX_BACKOFF_MAX_SECONDS", 900.0))
+    # Published events kept for the feed; never purged while an active webhook still owes them
+    OUTBOX_RETENTION_DAYS: int = int(os.getenv("OUTBOX_RETENTION_DAYS", 7))
+
+    # --- Live change stream (GET /api/employees/stream) ---
+    STREAM_ENABLED: bool = os.getenv("STREAM_ENABLED", "True").lower() == "true"
+    STREAM_MAX_CLIENTS: int = int(os.getenv("STREAM_MAX_CLIENTS", 5000))  # per worker
+    STREAM_CLIENT_QUEUE_SIZE: int = int(os.getenv("STREAM_CLIENT_QUEUE_SIZE", 100))  # a fuller client is told to resync
+    STREAM_HEARTBEAT_SECONDS: float = float(os.getenv("STREAM_HEARTBEAT_SECONDS", 15.0))
+    STREAM_RETRY_MS: int = int(os.getenv("STREAM_RETRY_MS", 3000))  # client reconnect delay
+
+    # --- Analytics ---
+    ANALYTICS_HISTORY_MONTHS: int = int(os.getenv("ANALYTICS_HISTORY_MONTHS", 36))
+    ANALYTICS_SNAPSHOTS_KEEP: int = int(os.getenv("ANALYTICS_SNAPSHOTS_KEEP", 30))
+
+    # --- Maintenance jobs (one leader runs them, see app/apis/maintenance/scheduler.py) ---
+    MAINTENANCE_ENABLED: bool = os.getenv("MAINTENANCE_ENABLED", "True").lower() == "true"
+    MAINTENANCE_TICK_SECONDS: int = int(os.getenv("MAINTENANCE_TICK_SECONDS", 60))
+    MAINTENANCE_BATCH_SIZE: int = int(os.getenv("MAINTENANCE_BATCH_SIZE", 500))
+    MAINTENANCE_MAX_BATCHES: int = int(os.getenv("MAINTENANCE_MAX_BATCHES", 20))  # per run; the rest waits for the next one
+    MAINTENANCE_BATCH_PAUSE_MS: int = int(os.getenv("MAINTENANCE_BATCH_PAUSE_MS", 200))
+    MAINTENANCE_ORPHAN_MIN_AGE_HOURS: int = int(os.getenv("MAINTENANCE_ORPHAN_MIN_AGE_HOURS", 24))
+    MAINTENANCE_HISTORY_DAYS: int = int(os.getenv("MAINTENANCE_HISTORY_DAYS", 30))
+
     # --- Logging ---
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = os.getenv(
@@ -49,9 +156,7 @@ class Settings(BaseSettings):
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    settings = Settings()
-    logger.info(f"Loaded settings: DEBUG={settings.DEBUG}, LOG_LEVEL={settings.LOG_LEVEL}")
-    return settings
+    return Settings()
 
 
 settings = get_settings()
\ No newline at end of file
@@ -3,7 +3,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from .logging import setup_logging
-from app.database.connection import engine
+from .config import settings
+from app.database.connection import engine, replica_engine, warm_pool
+from app.database.migrations import check_schema_version
+from app.apis.maintenance.scheduler import scheduler
+from app.apis.outbox.dispatcher import dispatcher
+from app.apis.employees_profile.stream import listener as stream_listener
 
 
 logger = logging.getLogger(__name__)
@@ -20,22 +25,60 @@ async def lifespan(app: FastAPI):
     # Setup logging
     setup_logging()
     logger.info("Logging configured")
+    logger.info(f"Loaded settings: DEBUG={settings.DEBUG}, LOG_LEVEL={settings.LOG_LEVEL}")
     
-    # Create database tables
+    # Verify schema version (migrations run once per deploy, see app/database/migrations.py)
     try:
-        from app.database.base import Base
-        # Simple synchronous create_all
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created/verified")
+        check_schema_version()
     except Exception as e:
-        logger.error(f"Error creating database tables: {str(e)}")
+        logger.error(f"Database schema check failed: {str(e)}")
         raise
     
+    # Open pooled connections before serving, so readiness flips only once
+    # they exist and the first requests after a deploy don't pay for connecting
+    if settings.DB_POOL_WARMUP:
+        try:
+            warm_pool()
+            if replica_engine is not engine:
+                warm_pool(replica_engine)
+        except Exception as e:
+            logger.error(f"Database pool warm-up failed: {str(e)}")
+            raise
+    
+    # Without PostgreSQL advisory locks every worker would lead and deliver each event once per worker
+    if settings.OUTBOX_ENABLED and engine.dialect.name != "postgresql" and settings.WEB_CONCURRENCY > 1:
+        logger.error(f"Outbox dispatcher needs PostgreSQL to run with WEB_CONCURRENCY={settings.WEB_CONCURRENCY}")
+        raise RuntimeError(
+            f"OUTBOX_ENABLED with WEB_CONCURRENCY={settings.WEB_CONCURRENCY} requires PostgreSQL; "
+            "run a single worker or set OUTBOX_ENABLED=False"
+        )
+    
+    # Every worker runs the loop; only the advisory lock holder runs jobs
+    if settings.MAINTENANCE_ENABLED:
+        scheduler.start()
+    if settings.OUTBOX_ENABLED:
+        dispatcher.start()
+    # One LISTEN connection per worker feeds all of its open change streams
+    if settings.STREAM_ENABLED:
+        stream_listener.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down HRMS FastAPI application...")
     
+    if settings.MAINTENANCE_ENABLED:
+        await scheduler.stop()
+        logger.info("Maintenance scheduler stopped")
+    if settings.OUTBOX_ENABLED:
+        await dispatcher.stop()
+        logger.info("Outbox dispatcher stopped")
+    if settings.STREAM_ENABLED:
+        await stream_listener.stop()
+        logger.info("Change stream listener stopped")
+    
     # Cleanup
     engine.dispose()
+    if replica_engine is not engine:
+        replica_engine.dispose()
     logger.info("Database engine disposed")
@@ -1,10 +1,12 @@
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Tuple
 
 from jose import jwt, JWTError
-from google.oauth2 import id_token
-from google.auth.transport import requests as grequests
 from fastapi import HTTPException, status
 
 from .config import settings
@@ -12,6 +14,92 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Google auth (and requests under it) is only needed at login, so it is
+# imported on first use rather than during every worker's boot.
+_google_request = None
+
+
+def _google_transport():
+    """Lazily import Google auth; reuse one HTTP transport (and its connection pool)."""
+    global _google_request
+    from google.oauth2 import id_token
+    
+    if _google_request is None:
+        from google.auth.transport import requests as grequests
+        _google_request = grequests.Request()
+    return id_token, _google_request
+
+
+class TokenCache:
+    """
+    Bounded LRU of verified access-token payloads, keyed by the token's SHA-256.
+    
+    An entry lives until the token's ``exp``, so a hit skips signature and
+    claim checks but never extends a token's life. revoke_subject() drops a
+    subject's entries and rejects its tokens issued (``iat``) before the
+    revocation, in this worker; other workers rely on the users row check in
+    AuthService.
+    """
+    
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._revoked_before: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+    
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            payload = self._entries.get(digest)
+            if payload is None or payload["exp"] <= time.time():
+                if payload is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return payload
+    
+    def put(self, digest: str, payload: Dict[str, Any]):
+        if self.max_size <= 0 or not isinstance(payload.get("exp"), (int, float)):
+            return
+        with self._lock:
+            self._entries[digest] = payload
+            self._entries.move_to_end(digest)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        revoked_before = self._revoked_before.get(payload.get("sub"))
+        return revoked_before is not None and payload.get("iat", 0) < revoked_before
+    
+    def revoke_subject(self, subject: str, revoked_at: Optional[float] = None):
+        revoked_at = revoked_at or time.time()
+        with self._lock:
+            self._revoked_before[subject] = revoked_at
+            for digest in [d for d, payload in self._entries.items() if payload.get("sub") == subject]:
+                del self._entries[digest]
+            # Marks only matter while tokens issued before them can still be valid
+            horizon = time.time() - settings.ACCESS_EXPIRE_MINUTES * 60
+            for stale in [sub for sub, at in self._revoked_before.items() if at < horizon]:
+                del self._revoked_before[stale]
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._revoked_before.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = TokenCache(settings.JWT_CACHE_SIZE)
+
 
 class SecurityService:
     """Handles all security-related operations including JWT and OAuth."""
@@ -22,9 +110,10 @@ class SecurityService:
         logger.debug(f"Verifying Google token: {token[:20]}...")
         
         try:
+            id_token, google_request = _google_transport()
             idinfo = id_token.verify_oauth2_token(
                 token,
-                grequests.Request(),
+                google_request,
                 settings.GOOGLE_CLIENT_ID
             )
             
@@ -56,6 +145,7 @@ class SecurityService:
             payload = {
                 "sub": subject,
                 "exp": expire,
+                "iat": time.time(),  # fractional, so revocation is exact to the instant
                 "type": "access"
             }
             
@@ -89,6 +179,7 @@ class SecurityService:
             payload = {
                 "sub": subject,
                 "exp": expire,
+                "iat": time.time(),
                 "type": "refresh"
             }
             
@@ -110,18 +201,38 @@ class SecurityService:
     
     @staticmethod
     def verify_local_token(token: str) -> Dict[str, Any]:
-        """Verify locally issued JWT token."""
-        logger.debug(f"Verifying local token: {token[:20]}...")
+        """
+        Verify locally issued JWT token.
+        
+        Verified access tokens are cached until they expire, so repeat
+        requests with the same token skip HMAC verification and claim parsing.
+        """
+        digest = token_cache.digest(token)
+        payload = token_cache.get(digest)
+        if payload is None:
+            logger.debug(f"Verifying local token: {token[:20]}...")
         
         try:
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            logger.debug(f"Token verified for subject: {payload.get('sub')}")
-            return payload
+            if payload is None:
+                payload = jwt.decode(
+                    token,
+                    settings.JWT_SECRET,
+                    algorithms=[settings.JWT_ALGORITHM]
+                )
+                logger.debug(f"Token verified for subject: {payload.get('sub')}")
+                if payload.get("type") == "access":
+                    token_cache.put(digest, payload)
             
+            if token_cache.is_revoked(payload):
+                logger.warning(f"Revoked token presented for subject: {payload.get('sub')}")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid or expired token"
+                )
+            return dict(payload)
+            
+        except HTTPException:
+            raise
         except JWTError as e:
             logger.warning(f"JWT verification failed: {str(e)}")
             raise HTTPException(
@@ -135,6 +246,11 @@ class SecurityService:
                 detail="Error verifying token"
             )
     
+    @staticmethod
+    def revoke_tokens(subject: str, revoked_at: datetime):
+        """Reject the subject's tokens issued before revoked_at (this worker's cache)."""
+        token_cache.revoke_subject(subject, revoked_at.timestamp())
+    
     @staticmethod
     def extract_token_from_header(auth_header: Optional[str]) -> str:
         """Extract Bearer token from Authorization header."""
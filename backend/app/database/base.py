@@ -12,5 +12,10 @@ def init_models():
     """Initialize all database models."""
     from app.apis.auth import models as auth_models
     from app.apis.employees_profile import models as employee_models
+    from app.apis.analytics import models as analytics_models
+    from app.apis.maintenance import models as maintenance_models
+    from app.apis.audit import models as audit_models
+    from app.apis.outbox import models as outbox_models
+    from app.apis.idempotency import models as idempotency_models
     
     logger.info("Database models initialized")
\ No newline at end of file
@@ -0,0 +1,191 @@
+"""
+Row change collection from the SQLAlchemy session.
+
+One before_flush listener records every created, modified and deleted row
+of a tracked model, tagged with the transaction it happened in, and
+buffers the changes in session.info. Bulk statements (query.update,
+insert/delete) bypass the flush; code that changes tracked rows that way
+calls `record_change()`. Changes made inside a savepoint that is rolled
+back are dropped with it.
+
+Consumers (the audit trail, outbox events, the live change stream) register
+with `on_commit_changes()`. When the outermost transaction commits, pending
+work is flushed and each consumer gets the changes to its models once,
+still inside the transaction, so whatever it writes commits or rolls back
+with the changes themselves.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, SessionTransaction
+
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "row_changes"
+
+# (models, consumer) in registration order
+_consumers: List[Tuple[Tuple[type, ...], Callable[[Session, List["RowChange"]], None]]] = []
+
+
+@dataclass
+class RowChange:
+    """One created, updated or deleted row."""
+    transaction: SessionTransaction
+    model: type
+    action: str  # create, update, delete
+    row_id: Optional[int] = None
+    values: Dict[str, Any] = field(default_factory=dict)  # column values when captured (before a delete)
+    changed: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)  # update: field -> (old, new)
+    target: Any = None  # new rows get their ID at flush, so it is read at commit
+    
+    @property
+    def deactivated(self) -> bool:
+        """Soft delete: is_active went from true to false."""
+        return self.changed.get("is_active") == (True, False)
+
+
+def on_commit_changes(*models: type):
+    """Register a consumer(session, changes) for changes to the given models."""
+    def register(consumer):
+        _consumers.append((models, consumer))
+        return consumer
+    return register
+
+
+def record_change(
+    session: Session,
+    model: type,
+    row_id: int,
+    changed: Dict[str, Tuple[Any, Any]],
+    values: Optional[Dict[str, Any]] = None
+):
+    """Buffer an update made with a bulk statement; values are the row's other current columns."""
+    session.info.setdefault(_PENDING_KEY, []).append(RowChange(
+        transaction=_current_transaction(session),
+        model=model,
+        action="update",
+        row_id=row_id,
+        values={**(values or {}), **{key: new for key, (_, new) in changed.items()}},
+        changed=dict(changed)
+    ))
+
+
+# When one row changes several ways in a transaction, the strongest change wins
+_PRECEDENCE = {"delete": 2, "create": 1, "update": 0}
+
+
+def by_row(changes: List[RowChange]) -> List[RowChange]:
+    """One change per row, in first-seen order: the strongest action, with its field changes merged."""
+    merged: Dict[tuple, RowChange] = {}
+    for change in changes:
+        key = (change.model, change.row_id)
+        current = merged.get(key)
+        if current is None:
+            merged[key] = RowChange(
+                change.transaction, change.model, change.action, change.row_id,
+                dict(change.values), dict(change.changed), change.target
+            )
+            continue
+        if _PRECEDENCE[change.action] > _PRECEDENCE[current.action]:
+            current.action = change.action
+        for name, (old, new) in change.changed.items():
+            current.changed[name] = (current.changed[name][0] if name in current.changed else old, new)
+        current.values.update(change.values)
+        current.target = current.target or change.target
+    return list(merged.values())
+
+
+def _tracked() -> Tuple[type, ...]:
+    return tuple({model for models, _ in _consumers for model in models})
+
+
+def _values(obj) -> Dict[str, Any]:
+    # Loaded values only: reading an expired column here would cost a SELECT per row
+    state = inspect(obj)
+    return {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict}
+
+
+def _current_transaction(session: Session) -> SessionTransaction:
+    return session.get_nested_transaction() or session.get_transaction()
+
+
+def _within(transaction: Optional[SessionTransaction], ancestor: SessionTransaction) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Session, "before_flush")
+def _capture_changes(session, flush_context, instances):
+    tracked = _tracked()
+    if not tracked:
+        return
+    
+    changes = []
+    transaction = _current_transaction(session)
+    
+    for obj in session.new:
+        if isinstance(obj, tracked):
+            changes.append(RowChange(transaction, type(obj), "create", values=_values(obj), target=obj))
+    
+    for obj in session.dirty:
+        if not isinstance(obj, tracked) or not session.is_modified(obj, include_collections=False):
+            continue
+        state = inspect(obj)
+        changed = {}
+        for attr in state.mapper.column_attrs:
+            history = state.attrs[attr.key].history
+            if not history.has_changes():
+                continue
+            old = history.deleted[0] if history.deleted else None
+            new = history.added[0] if history.added else None
+            if old != new:
+                changed[attr.key] = (old, new)
+        if changed:
+            changes.append(RowChange(
+                transaction, type(obj), "update", obj.id, _values(obj), changed, target=obj
+            ))
+    
+    for obj in session.deleted:
+        if isinstance(obj, tracked):
+            changes.append(RowChange(transaction, type(obj), "delete", obj.id, _values(obj), target=obj))
+    
+    if changes:
+        session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+
+@event.listens_for(Session, "before_commit")
+def _dispatch(session):
+    if session.in_nested_transaction():
+        return  # a SAVEPOINT being released; its changes go out with the real COMMIT
+    if not session.info.get(_PENDING_KEY) and not (session.new or session.dirty or session.deleted):
+        return
+    
+    # Pending changes are flushed after this hook; flush now so they are collected
+    session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    
+    for change in pending:
+        if change.target is not None:
+            change.row_id = change.target.id
+    for models, consumer in _consumers:
+        selected = [change for change in pending if issubclass(change.model, models)]
+        if selected:
+            consumer(session, selected)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_rolled_back(session, previous_transaction):
+    pending = session.info.get(_PENDING_KEY)
+    if pending:
+        session.info[_PENDING_KEY] = [
+            change for change in pending
+            if not _within(change.transaction, previous_transaction)
+        ]
\ No newline at end of file
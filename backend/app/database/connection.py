@@ -1,7 +1,6 @@
 import logging
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.pool import QueuePool
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 
 from app.core.config import settings
 
@@ -9,20 +8,45 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
-# Create synchronous engine for SQLAlchemy 1.4/2.0
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
-    future=True
+def worker_pool_size() -> int:
+    """Connections each worker process may hold: its share of the instance budget."""
+    if settings.DB_POOL_SIZE > 0:
+        return settings.DB_POOL_SIZE
+    return max(1, settings.DB_MAX_CONNECTIONS // max(1, settings.WEB_CONCURRENCY))
+
+
+def _create_pooled_engine(url: str):
+    # No overflow: the pool size is the hard per-worker cap, so the instance
+    # never exceeds DB_MAX_CONNECTIONS and connections are not churned under bursts.
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=worker_pool_size(),
+        max_overflow=0,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=settings.DEBUG,
+        future=True
+    )
+
+
+# Create synchronous engine for SQLAlchemy 1.4/2.0 (primary: all writes)
+engine = _create_pooled_engine(settings.DATABASE_URL)
+
+# Read replica engine; the primary itself when no replica is configured.
+# The replica has its own server, so it gets its own connection budget.
+replica_engine = (
+    _create_pooled_engine(settings.DATABASE_REPLICA_URL)
+    if settings.DATABASE_REPLICA_URL else engine
 )
 
 # For async support (if needed)
 async_engine = None
 if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    # Imported only when configured; sqlalchemy.ext.asyncio is costly to load
+    from sqlalchemy.ext.asyncio import create_async_engine
+    
     async_engine = create_async_engine(
         settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql+asyncpg"),
         echo=settings.DEBUG,
@@ -30,13 +54,46 @@ if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
     )
 
 
-def test_connection():
-    """Test database connection."""
+def test_connection(timeout_seconds: float = 0, bind=None) -> bool:
+    """Test database connection, optionally bounding the query with a server-side timeout."""
     try:
-        with engine.connect() as conn:
-            conn.execute("SELECT 1")
-        logger.info("Database connection test successful")
+        with (bind or engine).connect() as conn:
+            if timeout_seconds and conn.dialect.name == "postgresql":
+                conn.execute(text(f"SET LOCAL statement_timeout = {int(timeout_seconds * 1000)}"))
+            conn.execute(text("SELECT 1"))
+        logger.debug("Database connection test successful")
         return True
     except Exception as e:
         logger.error(f"Database connection failed: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+
+def warm_pool(bind=None) -> int:
+    """Open the pool's connections up front so the first requests don't pay for connecting."""
+    bind = bind or engine
+    size = bind.pool.size()
+    connections = []
+    try:
+        for _ in range(size):
+            connection = bind.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+    logger.info(f"Database pool warmed with {len(connections)} connections ({bind.url.render_as_string(hide_password=True)})")
+    return len(connections)
+
+
+def pool_status(bind=None) -> dict:
+    """Current pool usage; saturation is the share of the maximum connections checked out."""
+    pool = (bind or engine).pool
+    capacity = pool.size() + max(0, getattr(pool, "_max_overflow", 0))
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": max(0, pool.overflow()),
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0
+    }
\ No newline at end of file
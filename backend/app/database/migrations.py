@@ -0,0 +1,114 @@
+"""
+Schema migrations.
+
+`python -m app.database.migrations` upgrades the database to head. It is run
+once per deploy from docker/start.sh, before any app worker starts, and holds
+a PostgreSQL advisory lock so replicas booting together migrate one at a time
+(the rest wait, then find nothing to do).
+
+Workers never touch DDL; at startup they only compare the stored revision with
+the code's head revision (`check_schema_version`).
+"""
+import logging
+import os
+
+from sqlalchemy import inspect, text
+
+from app.database.connection import engine
+
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "alembic.ini")
+
+# Arbitrary application-wide key for pg_advisory_lock
+MIGRATION_LOCK_KEY = 724_201_031
+
+# Revision matching the schema the app used to create with create_all
+BASELINE_REVISION = "0001"
+
+
+def _alembic_config():
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "alembic"))
+    return config
+
+
+def get_current_revisions(connection) -> set:
+    """Revision(s) stamped in the database; empty if it was never migrated."""
+    from alembic.runtime.migration import MigrationContext
+
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def run_migrations() -> None:
+    """Upgrade to head under an advisory lock."""
+    from alembic import command
+
+    config = _alembic_config()
+    
+    with engine.connect() as connection:
+        locked = connection.dialect.name == "postgresql"
+        if locked:
+            logger.info("Waiting for migration lock")
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            connection.commit()
+        
+        try:
+            config.attributes["connection"] = connection
+            
+            if not get_current_revisions(connection) and inspect(connection).has_table("users"):
+                # Created by the old create_all startup path: adopt it at the baseline
+                logger.info(f"Unversioned existing schema found, stamping {BASELINE_REVISION}")
+                command.stamp(config, BASELINE_REVISION)
+                connection.commit()
+            
+            command.upgrade(config, "head")
+            connection.commit()
+            logger.info(f"Database at revision {', '.join(sorted(get_current_revisions(connection)))}")
+        finally:
+            if locked:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                connection.commit()
+
+
+def check_schema_version() -> None:
+    """
+    Cheap startup check: one SELECT on alembic_version.
+    
+    Raises if the database is unmigrated or behind this code. A database
+    ahead of the code (newer release already migrated during a rolling
+    deploy) only logs a warning, since migrations are kept backward compatible.
+    """
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(_alembic_config())
+    heads = set(script.get_heads())
+    
+    with engine.connect() as connection:
+        current = get_current_revisions(connection)
+    
+    if current == heads:
+        logger.info(f"Database schema at revision {', '.join(sorted(current))}")
+        return
+    
+    if not current:
+        raise RuntimeError("Database is not migrated; run `python -m app.database.migrations`")
+    
+    known = {revision.revision for revision in script.walk_revisions()}
+    if current <= known:
+        raise RuntimeError(
+            f"Database schema at {', '.join(sorted(current))} but code expects "
+            f"{', '.join(sorted(heads))}; run `python -m app.database.migrations`"
+        )
+    
+    logger.warning(f"Database schema {', '.join(sorted(current))} is newer than this code")
+
+
+if __name__ == "__main__":
+    from app.core.logging import setup_logging
+
+    setup_logging()
+    run_migrations()
\ No newline at end of file
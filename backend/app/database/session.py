@@ -1,11 +1,15 @@
 import logging
+import time
 from contextlib import contextmanager
 from typing import Generator
 
+from fastapi import Request
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.database.connection import engine
+from app.database.connection import engine, replica_engine
+from app.database.unit_of_work import UnitOfWork
 
 
 logger = logging.getLogger(__name__)
@@ -19,30 +23,107 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only sessions; bound per request to the replica or, right after the
+# client's own write, the primary
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=replica_engine,
+    expire_on_commit=False,
+)
+
+# Cookie holding the epoch second until which this client reads from the primary
+READ_YOUR_WRITES_COOKIE = "hrms_rw_until"
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     Dependency to get database session.
-    Handles session lifecycle and errors.
+    
+    The session is the request's unit of work: repositories only flush, and
+    UnitOfWorkRoute commits once before the response is sent. The commit
+    after the yield only covers routes that do not use UnitOfWorkRoute, and
+    is skipped once the unit of work is settled or answered with an error.
     """
     db = SessionLocal()
+    uow = UnitOfWork(db)
+    request.state.uow = uow
     try:
         logger.debug("Database session started")
         yield db
-        db.commit()
-        logger.debug("Database session committed")
+        if not uow.completed:
+            if uow.status_code is not None and uow.status_code >= 400:
+                uow.rollback()
+            else:
+                uow.commit()
     except SQLAlchemyError as e:
-        db.rollback()
+        uow.rollback()
         logger.error(f"Database error, rolling back: {str(e)}")
         raise
     except Exception as e:
-        db.rollback()
+        uow.rollback()
         logger.error(f"Unexpected error, rolling back: {str(e)}")
         raise
     finally:
         db.close()
-        logger.debug("Database session closed")
+        logger.debug(f"Database session closed ({uow.commit_count} commits)")
+
+
+def recently_wrote(request: Request) -> bool:
+    """Whether the client wrote within the read-your-writes window."""
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+_READ_ONLY_CONNECTION_KEY = "read_only_connection"
+
+
+def _set_read_only(connection, enabled: bool = True):
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        if enabled:
+            # Transaction-scoped; ends with the rollback in get_read_db
+            connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+    elif dialect == "sqlite":
+        # Connection-scoped, so it must be switched off before the connection returns to the pool
+        connection.exec_driver_sql(f"PRAGMA query_only = {'ON' if enabled else 'OFF'}")
+
+
+@event.listens_for(ReadSessionLocal, "after_begin")
+def _begin_read_only(session, transaction, connection):
+    # Applied when the session first takes a connection, so requests that end up
+    # not querying (e.g. coalesced onto another request's read) never check one out
+    _set_read_only(connection)
+    session.info[_READ_ONLY_CONNECTION_KEY] = connection
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Dependency for read-only endpoints.
+    
+    Uses the replica unless the client wrote within READ_YOUR_WRITES_SECONDS,
+    runs in a READ ONLY transaction and never commits. No connection is taken
+    from the pool until the first query.
+    """
+    use_primary = replica_engine is engine or recently_wrote(request)
+    db = ReadSessionLocal(bind=engine if use_primary else replica_engine)
+    try:
+        logger.debug(f"Read-only session started on {'primary' if use_primary else 'replica'}")
+        yield db
+    except SQLAlchemyError as e:
+        logger.error(f"Database error in read-only session: {str(e)}")
+        raise
+    finally:
+        try:
+            connection = db.info.pop(_READ_ONLY_CONNECTION_KEY, None)
+            if connection is not None and not connection.closed:
+                _set_read_only(connection, enabled=False)
+            db.rollback()
+        finally:
+            db.close()
+            logger.debug("Read-only session closed")
 
 
 def get_db_session() -> Session:
@@ -0,0 +1,170 @@
+"""
+Unit of work: one transaction, and at most one commit, per request.
+
+Repositories only add and flush. `get_db` attaches a UnitOfWork to the
+request, and `UnitOfWorkRoute` commits it once the endpoint has produced its
+response, before the response is sent, so clients never see a success for
+a write that did not commit. Requests that wrote nothing end with a rollback
+instead of a commit. Nested operations that may fail without failing the
+request run inside `savepoint()`. Side effects outside the database (files
+moved into place) register an undo with `on_rollback()`, which runs if the
+transaction ends without committing; irreversible ones (files deleted) are
+deferred with `on_commit()` until the transaction has committed.
+"""
+import logging
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+logger = logging.getLogger(__name__)
+
+_WRITES_KEY = "uow_writes"
+_COMMITS_KEY = "uow_commits"
+_ROLLBACK_CALLBACKS_KEY = "uow_on_rollback"
+_COMMIT_CALLBACKS_KEY = "uow_on_commit"
+
+# Request-state key of callables run as (session, response) before a successful commit
+COMMIT_HOOKS_KEY = "commit_hooks"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_writes(session, flush_context):
+    session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state):
+    # Core-style insert/update/delete run through session.execute() skip the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _count_commit(session):
+    if session.in_nested_transaction():
+        return  # a released SAVEPOINT, not a COMMIT
+    session.info[_COMMITS_KEY] = session.info.get(_COMMITS_KEY, 0) + 1
+    session.info.pop(_ROLLBACK_CALLBACKS_KEY, None)
+    for _, callback in session.info.pop(_COMMIT_CALLBACKS_KEY, []):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Commit callback failed: {str(e)}")
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_commit_callbacks(session, previous_transaction):
+    # Work deferred inside a rolled-back savepoint was rolled back with it
+    callbacks = session.info.get(_COMMIT_CALLBACKS_KEY)
+    if not callbacks:
+        return
+    kept = []
+    for transaction, callback in callbacks:
+        current = transaction
+        while current is not None and current is not previous_transaction:
+            current = current.parent
+        if current is None:
+            kept.append((transaction, callback))
+    session.info[_COMMIT_CALLBACKS_KEY] = kept
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _run_rollback_callbacks(session, transaction):
+    # Still registered when the outermost transaction ends means it did not commit
+    if transaction.parent is not None:
+        return
+    session.info.pop(_COMMIT_CALLBACKS_KEY, None)
+    for callback in reversed(session.info.pop(_ROLLBACK_CALLBACKS_KEY, [])):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Rollback callback failed: {str(e)}")
+
+
+def on_rollback(session: Session, callback: Callable[[], None]):
+    """Undo a side effect outside the database if the session's transaction does not commit."""
+    session.info.setdefault(_ROLLBACK_CALLBACKS_KEY, []).append(callback)
+
+
+def on_commit(session: Session, callback: Callable[[], None]):
+    """Run a side effect outside the database once the session's transaction has committed."""
+    transaction = session.get_nested_transaction() or session.get_transaction()
+    session.info.setdefault(_COMMIT_CALLBACKS_KEY, []).append((transaction, callback))
+
+
+@contextmanager
+def savepoint(db: Session) -> Iterator[Session]:
+    """Run a nested operation in a SAVEPOINT; on error only its own work is rolled back."""
+    with db.begin_nested():
+        yield db
+
+
+class UnitOfWork:
+    """The request's transaction."""
+    
+    def __init__(self, session: Session):
+        self.session = session
+        self.completed = False
+        self.status_code: Optional[int] = None  # response status, once UnitOfWorkRoute has seen it
+    
+    @property
+    def has_writes(self) -> bool:
+        return bool(self.session.info.get(_WRITES_KEY)) or bool(self.session.new or self.session.dirty or self.session.deleted)
+    
+    @property
+    def commit_count(self) -> int:
+        return self.session.info.get(_COMMITS_KEY, 0)
+    
+    def savepoint(self):
+        return savepoint(self.session)
+    
+    def release(self):
+        """End a transaction that wrote nothing, returning its connection to the pool; the session stays usable."""
+        if not self.has_writes and self.session.in_transaction():
+            self.session.rollback()
+    
+    def commit(self):
+        """Commit if anything was written, otherwise just end the read transaction."""
+        if self.completed:
+            return
+        self.completed = True
+        
+        if self.has_writes:
+            self.session.commit()
+            logger.debug("Unit of work committed")
+        else:
+            self.session.rollback()
+        self.session.info.pop(_WRITES_KEY, None)
+    
+    def rollback(self):
+        self.completed = True
+        self.session.rollback()
+        self.session.info.pop(_WRITES_KEY, None)
+
+
+class UnitOfWorkRoute(APIRoute):
+    """Route class that commits the request's unit of work before the response is sent."""
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def unit_of_work_handler(request: Request) -> Response:
+            response = await handler(request)
+            uow = getattr(request.state, "uow", None)
+            if uow is not None:
+                uow.status_code = response.status_code
+                if response.status_code < 400:
+                    for hook in getattr(request.state, COMMIT_HOOKS_KEY, ()):
+                        hook(uow.session, response)
+                    uow.commit()
+                else:
+                    # An error response returned rather than raised: its writes must not commit
+                    uow.rollback()
+            return response
+        
+        return unit_of_work_handler
\ No newline at end of file
@@ -8,6 +8,11 @@ from app.shared.middleware import setup_middleware
 from app.shared.exceptions import setup_exception_handlers
 from app.apis.auth.routers import router as auth_router
 from app.apis.employees_profile.routers import router as employees_router
+from app.apis.analytics.routers import router as analytics_router
+from app.apis.maintenance.routers import router as maintenance_router
+from app.apis.audit.routers import router as audit_router
+from app.apis.outbox.routers import router as outbox_router
+from app.apis.health.routers import router as health_router
 
 
 # Initialize logger
@@ -24,24 +29,30 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Setup CORS
+# Setup middleware
+setup_middleware(app)
+
+# Setup CORS (added last so it wraps everything, including 503s from admission control)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[settings.FRONTEND_ORIGIN],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
-# Setup middleware
-setup_middleware(app)
-
 # Setup exception handlers
 setup_exception_handlers(app)
 
 # Include routers
 app.include_router(auth_router)
 app.include_router(employees_router)
+app.include_router(analytics_router)
+app.include_router(maintenance_router)
+app.include_router(audit_router)
+app.include_router(outbox_router)
+app.include_router(health_router)
 
 
 @app.get("/")
@@ -56,17 +67,6 @@ async def root():
     }
 
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint for monitoring."""
-    logger.debug("Health check endpoint accessed")
-    return {
-        "status": "healthy",
-        "service": "hrms-backend",
-        "version": "1.0.0"
-    }
-
-
 if __name__ == "__main__":
     import uvicorn
     
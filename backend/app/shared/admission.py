@@ -0,0 +1,257 @@
+"""
+Admission control for database-bound requests.
+
+Each worker admits at most as many requests as its connection pool can
+serve; the rest wait in short per-class queues. Requests whose expected
+queueing delay exceeds ADMISSION_QUEUE_TARGET_MS are rejected immediately
+with 503 and Retry-After instead of blocking on the pool's checkout timeout,
+so latency of admitted requests stays flat under overload.
+
+Route classes, in priority order:
+- critical: token refresh and readiness; may use the reserved slots
+- default: everything else under /api
+- bulk: list, search, export and rebuild endpoints; capped to a share of the slots
+
+Liveness, metrics, long-lived streams and non-API paths bypass admission
+entirely.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.database.connection import engine, replica_engine, worker_pool_size
+from app.shared.exceptions import error_response
+
+
+logger = logging.getLogger(__name__)
+
+CRITICAL = "critical"
+DEFAULT = "default"
+BULK = "bulk"
+
+PRIORITY = (CRITICAL, DEFAULT, BULK)
+
+CRITICAL_PATHS = {"/api/auth/refresh", "/api/health/ready"}
+EXEMPT_PATHS = {"/api/health", "/api/health/live", "/api/health/metrics"}
+# Held open for minutes without using the database after connecting
+STREAM_PATHS = {"/api/employees/stream"}
+BULK_GET_PATHS = {
+    "/api/employees", "/api/employees/", "/api/employees/export", "/api/employees/search",
+    "/api/employees/archive", "/api/events/feed"
+}
+BULK_POST_PATHS = {
+    "/api/employees/facets/rebuild", "/api/employees/hierarchy/rebuild", "/api/analytics/snapshots",
+    "/api/employees/bulk-update"
+}
+
+# Weight of the latest request in the moving average of service time
+SERVICE_TIME_ALPHA = 0.2
+
+in_flight_gauge = metrics.gauge("hrms_admission_in_flight", "Requests holding an admission slot")
+queued_gauge = metrics.gauge("hrms_admission_queued", "Requests waiting for an admission slot")
+admitted_counter = metrics.counter("hrms_admission_admitted_total", "Requests admitted")
+rejected_counter = metrics.counter("hrms_admission_rejected_total", "Requests shed with 503")
+queue_wait_histogram = metrics.histogram("hrms_admission_queue_wait_seconds", "Time spent queued before admission")
+service_time_histogram = metrics.histogram("hrms_admission_service_seconds", "Time admitted requests held their slot")
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """Route class for a request, or None when it does not need admission."""
+    if method == "OPTIONS" or not path.startswith("/api") or path in EXEMPT_PATHS or path in STREAM_PATHS:
+        return None
+    if path in CRITICAL_PATHS:
+        return CRITICAL
+    if method == "GET" and (path in BULK_GET_PATHS or path.endswith("/subtree")):
+        return BULK
+    if method == "POST" and path in BULK_POST_PATHS:
+        return BULK
+    return DEFAULT
+
+
+def default_capacity() -> int:
+    """
+    Concurrent requests one worker can serve from its pool.
+    
+    Without a replica a read request holds two primary connections (the
+    caller's session and the read-only session), so it counts double.
+    """
+    connections_per_request = 2 if replica_engine is engine else 1
+    return max(1, worker_pool_size() // connections_per_request)
+
+
+class Rejected(Exception):
+    """Raised by AdmissionController.acquire when a request is shed."""
+    
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Per-worker slot accounting with priority queues. Event-loop only, not thread-safe."""
+    
+    def __init__(
+        self,
+        capacity: int,
+        reserved: int = 1,
+        bulk_share: float = 0.5,
+        queue_target: float = 0.5,
+        max_queue: int = 100
+    ):
+        self.capacity = max(1, capacity)
+        reserved = min(max(0, reserved), self.capacity - 1)
+        shared = self.capacity - reserved
+        self.limits = {
+            CRITICAL: self.capacity,
+            DEFAULT: shared,
+            BULK: max(1, int(shared * bulk_share)),
+        }
+        self.queue_target = queue_target
+        self.max_queue = max_queue
+        self.in_flight: Dict[str, int] = {name: 0 for name in PRIORITY}
+        self.waiters: Dict[str, Deque[asyncio.Future]] = {name: deque() for name in PRIORITY}
+        self.service_time = 0.0  # moving average, seconds
+    
+    @property
+    def total_in_flight(self) -> int:
+        return sum(self.in_flight.values())
+    
+    def _can_admit(self, route_class: str) -> bool:
+        # Only critical requests may use the reserved slots
+        ceiling = self.capacity if route_class == CRITICAL else self.limits[DEFAULT]
+        return self.total_in_flight < ceiling and self.in_flight[route_class] < self.limits[route_class]
+    
+    def _take(self, route_class: str):
+        self.in_flight[route_class] += 1
+        in_flight_gauge.inc(**{"class": route_class})
+        admitted_counter.inc(**{"class": route_class})
+    
+    def estimated_wait(self, route_class: str) -> float:
+        """Expected seconds until a newly queued request of this class is admitted."""
+        ahead = sum(len(self.waiters[name]) for name in PRIORITY[:PRIORITY.index(route_class) + 1])
+        return (ahead + 1) * self.service_time / self.limits[route_class]
+    
+    async def acquire(self, route_class: str) -> float:
+        """Wait for a slot; returns seconds spent queued or raises Rejected."""
+        if self._can_admit(route_class) and not self._has_priority_waiters(route_class):
+            self._take(route_class)
+            return 0.0
+        
+        estimate = self.estimated_wait(route_class)
+        if len(self.waiters[route_class]) >= self.max_queue:
+            raise Rejected("queue_full", estimate)
+        if estimate > self.queue_target:
+            raise Rejected("latency", estimate)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters[route_class].append(waiter)
+        queued_gauge.inc(**{"class": route_class})
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_target)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as the timer fired; keep the slot
+                return time.monotonic() - started
+            waiter.cancel()
+            raise Rejected("timeout", self.estimated_wait(route_class))
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release(route_class, 0.0)
+            waiter.cancel()
+            raise
+        finally:
+            if waiter in self.waiters[route_class]:
+                self.waiters[route_class].remove(waiter)
+            queued_gauge.dec(**{"class": route_class})
+        return time.monotonic() - started
+    
+    def _has_priority_waiters(self, route_class: str) -> bool:
+        """Whether requests of this or a higher-priority class are already queued (no barging)."""
+        return any(self.waiters[name] for name in PRIORITY[:PRIORITY.index(route_class) + 1])
+    
+    def release(self, route_class: str, service_time: float):
+        self.in_flight[route_class] -= 1
+        in_flight_gauge.dec(**{"class": route_class})
+        if service_time:
+            self.service_time += SERVICE_TIME_ALPHA * (service_time - self.service_time)
+        self._dispatch()
+    
+    def _dispatch(self):
+        """Hand freed slots to queued requests, highest priority first."""
+        for route_class in PRIORITY:
+            queue = self.waiters[route_class]
+            while queue and self._can_admit(route_class):
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                self._take(route_class)
+                waiter.set_result(None)
+
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware applying AdmissionController to every API request.
+    
+    Written as plain ASGI rather than BaseHTTPMiddleware so the slot is held
+    until the response body has been sent, which matters for streamed exports.
+    """
+    
+    def __init__(self, app: ASGIApp, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or AdmissionController(
+            capacity=settings.ADMISSION_MAX_IN_FLIGHT or default_capacity(),
+            reserved=settings.ADMISSION_RESERVED_SLOTS,
+            bulk_share=settings.ADMISSION_BULK_SHARE,
+            queue_target=settings.ADMISSION_QUEUE_TARGET_MS / 1000,
+            max_queue=settings.ADMISSION_MAX_QUEUE
+        )
+        logger.info(
+            f"Admission control: {self.controller.capacity} slots per worker, "
+            f"limits {self.controller.limits}"
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        route_class = classify(scope.get("method", ""), scope["path"]) if scope["type"] == "http" else None
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+        
+        try:
+            waited = await self.controller.acquire(route_class)
+        except Rejected as rejection:
+            rejected_counter.inc(**{"class": route_class, "reason": rejection.reason})
+            logger.debug(
+                f"Shedding {scope['method']} {scope['path']} ({route_class}): {rejection.reason}, "
+                f"{self.controller.total_in_flight} in flight"
+            )
+            await self._reject(scope, rejection)(scope, receive, send)
+            return
+        
+        queue_wait_histogram.observe(waited, **{"class": route_class})
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            elapsed = time.monotonic() - started
+            service_time_histogram.observe(elapsed, **{"class": route_class})
+            self.controller.release(route_class, elapsed)
+    
+    @staticmethod
+    def _reject(scope: Scope, rejection: Rejected) -> JSONResponse:
+        return error_response(
+            503,
+            "Server is busy, please retry shortly",
+            scope["path"],
+            scope["method"],
+            headers={"Retry-After": str(max(1, math.ceil(rejection.retry_after)))}
+        )
\ No newline at end of file
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
@@ -24,75 +24,84 @@ class CustomHTTPException(StarletteHTTPException):
         self.metadata = metadata or {}
 
 
+def error_response(
+    status_code: int,
+    message: Any,
+    path: str,
+    method: str,
+    headers: Optional[Dict[str, str]] = None,
+    **extra: Any
+) -> JSONResponse:
+    """The JSON error body every handler and middleware answers with."""
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "error": True,
+            "message": message,
+            "path": path,
+            "method": method,
+            "status_code": status_code,
+            **extra
+        },
+        headers=headers
+    )
+
+
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions."""
-    error_detail = {
-        "error": True,
-        "message": exc.detail,
-        "path": request.url.path,
-        "method": request.method,
-        "status_code": exc.status_code
-    }
+    extra = {}
     
     # Add additional details for custom exceptions
     if isinstance(exc, CustomHTTPException):
         if exc.error_code:
-            error_detail["error_code"] = exc.error_code
+            extra["error_code"] = exc.error_code
         if exc.metadata:
-            error_detail["metadata"] = exc.metadata
+            extra["metadata"] = exc.metadata
     
     logger.warning(
         f"HTTP Exception: {exc.status_code} {exc.detail} "
         f"| Path: {request.url.path} | Method: {request.method}"
     )
     
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_detail
+    return error_response(
+        exc.status_code,
+        exc.detail,
+        request.url.path,
+        request.method,
+        headers=getattr(exc, "headers", None),  # e.g. Retry-After on a 503
+        **extra
     )
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation exceptions."""
-    error_detail = {
-        "error": True,
-        "message": "Validation error",
-        "path": request.url.path,
-        "method": request.method,
-        "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
-        "details": exc.errors()
-    }
-    
     logger.warning(
         f"Validation Error: {exc.errors()} "
         f"| Path: {request.url.path} | Method: {request.method}"
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_detail
+    return error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "Validation error",
+        request.url.path,
+        request.method,
+        details=exc.errors()
     )
 
 
 async def generic_exception_handler(request: Request, exc: Exception):
     """Handle generic exceptions."""
-    error_detail = {
-        "error": True,
-        "message": "Internal server error",
-        "path": request.url.path,
-        "method": request.method,
-        "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR
-    }
-    
     logger.error(
         f"Unhandled Exception: {str(exc)} "
         f"| Path: {request.url.path} | Method: {request.method}",
         exc_info=True
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_detail
+    return error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "Internal server error",
+        request.url.path,
+        request.method
     )
 
 
@@ -5,6 +5,13 @@ from fastapi import FastAPI, Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
+from app.core.config import settings
+from app.database.connection import engine, replica_engine
+from app.database.session import READ_YOUR_WRITES_COOKIE
+from app.shared.admission import AdmissionControlMiddleware
+from app.apis.idempotency.middleware import IdempotencyMiddleware
+from app.shared.rate_limit import RateLimitMiddleware
+
 
 logger = logging.getLogger(__name__)
 
@@ -69,8 +76,50 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Pins a client's reads to the primary for a short window after it writes.
+    
+    Successful non-GET requests set a cookie with the window's end; the
+    read-only session dependency routes to the primary while it is valid,
+    so clients see their own changes despite replica lag.
+    """
+    
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+    # POST only to carry a body; they never write
+    READ_ONLY_PATHS = {"/api/employees/batch-get"}
+    
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        
+        writes = request.method not in self.SAFE_METHODS and request.url.path not in self.READ_ONLY_PATHS
+        if writes and response.status_code < 400:
+            window = settings.READ_YOUR_WRITES_SECONDS
+            response.set_cookie(
+                key=READ_YOUR_WRITES_COOKIE,
+                value=f"{time.time() + window:.3f}",
+                max_age=window,
+                httponly=True,
+                samesite=settings.SAME_SITE_COOKIE,
+                secure=settings.SECURE_COOKIES,
+                path="/api"
+            )
+        
+        return response
+
+
 def setup_middleware(app: FastAPI):
     """Setup all middleware for the application."""
+    # Added first so it runs innermost: shed requests are still logged
+    if settings.ADMISSION_ENABLED:
+        app.add_middleware(AdmissionControlMiddleware)
+    # Outside admission control, so duplicates waiting on a running request hold no slot
+    app.add_middleware(IdempotencyMiddleware)
+    # Outside admission control, so rate-limited requests never take a slot
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(RateLimitMiddleware)
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(SecurityHeadersMiddleware)
+    if replica_engine is not engine:
+        app.add_middleware(ReadYourWritesMiddleware)
     logger.info("Middleware setup complete")
\ No newline at end of file
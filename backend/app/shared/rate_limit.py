@@ -0,0 +1,254 @@
+"""
+Token-bucket rate limiting in front of the API.
+
+Each route policy has an optional per-IP and per-user bucket. The per-IP
+bucket is checked first and costs no JWT verification or DB work. The user
+is the ``sub`` of the bearer token or refresh cookie, and only a token whose
+signature verifies is charged to a per-user bucket. Access tokens are
+verified through the shared TokenCache, so this is usually a cache hit.
+A forged or expired token counts against its IP only, so nobody can spend
+another user's budget.
+
+Buckets live in a bounded per-worker LRU by default. With
+RATE_LIMIT_BACKEND=redis they live in any Redis-compatible server (Redis,
+Valkey, a local redis-server), so limits hold across workers and instances.
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.constants import REFRESH_TOKEN_COOKIE_NAME
+from app.core.metrics import metrics
+from app.core.security import security_service
+from app.shared.exceptions import error_response
+
+
+logger = logging.getLogger(__name__)
+
+rejected_counter = metrics.counter("hrms_rate_limit_rejected_total", "Requests rejected with 429")
+backend_errors_counter = metrics.counter(
+    "hrms_rate_limit_backend_errors_total",
+    "Shared bucket store failures (requests are allowed through)"
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A bucket holding up to ``burst`` tokens, refilled at ``rate`` tokens per second."""
+    rate: float
+    burst: int
+    
+    @classmethod
+    def per_minute(cls, count: int) -> Optional["RateLimit"]:
+        return cls(rate=count / 60, burst=count) if count > 0 else None
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    name: str
+    per_ip: Optional[RateLimit] = None
+    per_user: Optional[RateLimit] = None
+
+
+def build_policies() -> Dict[Tuple[str, str], RoutePolicy]:
+    """Route-specific policies keyed by (method, path)."""
+    return {
+        ("POST", "/api/auth/google-login"): RoutePolicy(
+            "login",
+            per_ip=RateLimit.per_minute(settings.RATE_LIMIT_LOGIN_PER_IP)
+        ),
+        ("POST", "/api/auth/refresh"): RoutePolicy(
+            "refresh",
+            per_ip=RateLimit.per_minute(settings.RATE_LIMIT_REFRESH_PER_IP),
+            per_user=RateLimit.per_minute(settings.RATE_LIMIT_REFRESH_PER_USER)
+        ),
+    }
+
+
+def default_policy() -> RoutePolicy:
+    return RoutePolicy(
+        "api",
+        per_ip=RateLimit.per_minute(settings.RATE_LIMIT_API_PER_IP),
+        per_user=RateLimit.per_minute(settings.RATE_LIMIT_API_PER_USER)
+    )
+
+
+EXEMPT_PREFIXES = ("/api/health",)
+
+
+class MemoryBucketStore:
+    """
+    Per-worker buckets in an LRU of at most ``max_keys`` entries.
+    
+    Lookups, updates and evictions are O(1). An evicted key comes back with
+    a full bucket, which errs on the side of allowing.
+    """
+    
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+    
+    async def take(self, key: str, limit: RateLimit, now: float) -> Tuple[bool, float]:
+        """Spend one token; returns (allowed, seconds until a token is available)."""
+        tokens, updated = self._buckets.pop(key, (limit.burst, now))
+        tokens = min(limit.burst, tokens + (now - updated) * limit.rate)
+        
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed, 0.0 if allowed else (1 - tokens) / limit.rate
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# Same algorithm as MemoryBucketStore, atomic on the server. Keys expire once
+# their bucket would be full again, so idle clients cost no memory.
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return {allowed, tostring(retry)}
+"""
+
+
+class RedisBucketStore:
+    """
+    Buckets shared by every worker, kept in a Redis-compatible server.
+    
+    Store failures allow the request (and are counted): the limiter must
+    not turn a cache outage into an auth outage.
+    """
+    
+    def __init__(self, url: str, prefix: str = "hrms:rl:"):
+        # Optional dependency, only needed with RATE_LIMIT_BACKEND=redis
+        import redis.asyncio as redis
+        
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url, socket_timeout=0.1, socket_connect_timeout=0.1)
+        self._script = self._client.register_script(TOKEN_BUCKET_LUA)
+    
+    async def take(self, key: str, limit: RateLimit, now: float) -> Tuple[bool, float]:
+        try:
+            allowed, retry = await self._script(
+                keys=[self.prefix + key],
+                args=[limit.rate, limit.burst, now]
+            )
+        except Exception as e:
+            backend_errors_counter.inc()
+            logger.warning(f"Rate limit store unavailable, allowing request: {str(e)}")
+            return True, 0.0
+        return bool(int(allowed)), float(retry)
+
+
+def create_bucket_store():
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisBucketStore(settings.RATE_LIMIT_REDIS_URL)
+    return MemoryBucketStore(settings.RATE_LIMIT_MAX_KEYS)
+
+
+def token_subject(token: Optional[str]) -> Optional[str]:
+    """``sub`` of a token whose signature verifies, else None (only the per-IP bucket applies)."""
+    if not token or token.count(".") != 2:
+        return None
+    try:
+        subject = security_service.verify_local_token(token).get("sub")
+    except HTTPException:
+        return None
+    return subject if isinstance(subject, str) else None
+
+
+def _request_token(scope: Scope) -> Optional[str]:
+    """Bearer token, or the refresh cookie when there is none."""
+    cookie_header = None
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                return credentials.strip()
+        elif name == b"cookie":
+            cookie_header = value.decode("latin-1")
+    
+    if cookie_header:
+        prefix = f"{REFRESH_TOKEN_COOKIE_NAME}="
+        for part in cookie_header.split(";"):
+            part = part.strip()
+            if part.startswith(prefix):
+                return part[len(prefix):].strip('"')
+    return None
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying route policies before routing, auth or DB work."""
+    
+    def __init__(self, app: ASGIApp, store=None):
+        self.app = app
+        self.store = store or create_bucket_store()
+        self.policies = build_policies()
+        self.default = default_policy()
+        logger.info(f"Rate limiting with {type(self.store).__name__}")
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or not scope["path"].startswith("/api"):
+            await self.app(scope, receive, send)
+            return
+        if scope["path"].startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        
+        policy = self.policies.get((scope["method"], scope["path"]), self.default)
+        now = time.time()
+        
+        if policy.per_ip:
+            client_ip = scope["client"][0] if scope.get("client") else "unknown"
+            allowed, retry_after = await self.store.take(f"{policy.name}:ip:{client_ip}", policy.per_ip, now)
+            if not allowed:
+                await self._reject(scope, policy, "ip", retry_after)(scope, receive, send)
+                return
+        
+        if policy.per_user:
+            subject = token_subject(_request_token(scope))
+            if subject:
+                allowed, retry_after = await self.store.take(f"{policy.name}:user:{subject}", policy.per_user, now)
+                if not allowed:
+                    await self._reject(scope, policy, "user", retry_after)(scope, receive, send)
+                    return
+        
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    def _reject(scope: Scope, policy: RoutePolicy, key_type: str, retry_after: float) -> JSONResponse:
+        rejected_counter.inc(policy=policy.name, key=key_type)
+        logger.debug(f"Rate limited {scope['method']} {scope['path']} by {key_type} ({policy.name})")
+        return error_response(
+            429,
+            "Too many requests",
+            scope["path"],
+            scope["method"],
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
\ No newline at end of file
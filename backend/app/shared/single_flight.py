@@ -0,0 +1,63 @@
+"""
+Request coalescing for identical concurrent reads.
+
+A SingleFlight group runs at most one call per key at a time in this worker.
+Requests that arrive while a call is in flight await its result instead of
+issuing their own queries. Keys must include everything the result depends
+on: normalized parameters plus the caller's visibility scope.
+"""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Hashable
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+calls_counter = metrics.counter(
+    "hrms_single_flight_calls_total",
+    "Coalescable reads by outcome (leader ran the call, coalesced shared it)"
+)
+
+
+class SingleFlight:
+    """Per-worker registry of in-flight calls for one endpoint."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) in the threadpool, or join the identical call in flight.
+        
+        The call runs with the leader's arguments (including its session), so
+        the leader waits for it to finish even if its own request is cancelled;
+        the session must not be closed under the running call.
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            calls_counter.inc(group=self.name, result="coalesced")
+            logger.debug(f"Coalesced {self.name} read: {key}")
+            return await asyncio.shield(call)
+        
+        calls_counter.inc(group=self.name, result="leader")
+        call = asyncio.ensure_future(run_in_threadpool(fn, *args, **kwargs))
+        self._calls[key] = call
+        call.add_done_callback(lambda _: self._forget(key, call))
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            await asyncio.wait([call])
+            raise
+    
+    def _forget(self, key: Hashable, call: asyncio.Future):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+    
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import gc
 import multiprocessing
 import os
 
@@ -6,12 +7,27 @@ bind = "0.0.0.0:8000"
 backlog = 2048
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
+# UvicornWorkers are async: one event loop per core keeps every core busy.
+# The old cpu_count()*2+1 sizing is for blocking sync workers.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
 worker_class = "uvicorn.workers.UvicornWorker"
 worker_connections = 1000
 timeout = 30
+graceful_timeout = 30
 keepalive = 2
 
+# Each worker sizes its DB pool as DB_MAX_CONNECTIONS // WEB_CONCURRENCY
+# (app/database/connection.py); export the count before the app is loaded.
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# Import the app once in the master and fork workers from it, so code and
+# read-only data are shared copy-on-write instead of loaded per worker.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Recycle workers periodically (jittered so they don't restart together)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 5000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 500))
+
 # Logging
 accesslog = "-"
 errorlog = "-"
@@ -39,6 +55,12 @@ tmp_upload_dir = None
 
 # Server hooks
 def post_fork(server, worker):
+    # Never share pooled connections across processes: drop any the master
+    # opened (without closing them under the master) and start a fresh pool.
+    from app.database.connection import engine, replica_engine
+    engine.dispose(close=False)
+    if replica_engine is not engine:
+        replica_engine.dispose(close=False)
     server.log.info("Worker spawned (pid: %s)", worker.pid)
 
 def pre_fork(server, worker):
@@ -48,6 +70,10 @@ def pre_exec(server):
     server.log.info("Forked child, re-executing.")
 
 def when_ready(server):
+    # Move everything the preloaded app allocated into the permanent GC
+    # generation, so collections in workers don't touch (and copy) those pages.
+    gc.collect()
+    gc.freeze()
     server.log.info("Server is ready. Spawning workers")
 
 def worker_int(worker):
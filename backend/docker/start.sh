@@ -14,9 +14,10 @@ if [ -n "$DATABASE_URL" ]; then
     echo "Database is up - continuing"
 fi
 
-# Run migrations (if using Alembic)
-# echo "Running database migrations..."
-# alembic upgrade head
+# Run migrations once, before any worker starts. Concurrent replicas
+# serialize on an advisory lock; workers only verify the schema version.
+echo "Running database migrations..."
+python -m app.database.migrations
 
 # Start the application
 if [ "$ENVIRONMENT" = "production" ]; then
@@ -0,0 +1,127 @@
+"""
+Benchmark the production server configuration on the local box.
+
+Boots gunicorn with docker/gunicorn_conf.py, measures worker memory (PSS,
+which splits shared copy-on-write pages between the processes sharing them)
+and drives an endpoint with concurrent keep-alive requests.
+
+    python scripts/bench_server.py --workers 4 --preload true
+    python scripts/bench_server.py --workers 4 --preload false
+
+Run from the backend directory with DATABASE_URL pointing at a migrated
+database. Compare runs on the same box only; numbers are not portable.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pss_kb(pid: int) -> int:
+    """Proportional set size of a process, from /proc (Linux only)."""
+    with open(f"/proc/{pid}/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
+
+
+def child_pids(pid: int) -> list:
+    with open(f"/proc/{pid}/task/{pid}/children") as children:
+        return [int(child) for child in children.read().split()]
+
+
+async def drive(url: str, requests: int, concurrency: int) -> list:
+    """Issue `requests` GETs over `concurrency` keep-alive connections; return latencies."""
+    latencies = []
+    remaining = iter(range(requests))
+    
+    async def client_loop(client):
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+    
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--preload", choices=["true", "false"], default="true")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default="/api/health")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    
+    env = dict(os.environ, WEB_CONCURRENCY=str(args.workers), GUNICORN_PRELOAD=args.preload)
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn",
+            "-c", "docker/gunicorn_conf.py",
+            "--bind", f"127.0.0.1:{args.port}",
+            "--access-logfile", "/dev/null",
+            "app.main:app"
+        ],
+        env=env,
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{args.port}{args.path}"
+    
+    try:
+        while True:
+            try:
+                httpx.get(url, timeout=1).raise_for_status()
+                if len(child_pids(server.pid)) >= args.workers:
+                    break
+            except (httpx.HTTPError, FileNotFoundError):
+                pass
+            if time.perf_counter() - started > 60:
+                raise SystemExit("server did not become ready within 60s")
+            time.sleep(0.1)
+        boot_seconds = time.perf_counter() - started
+        
+        asyncio.run(drive(url, min(500, args.requests), args.concurrency))  # warm up
+        began = time.perf_counter()
+        latencies = sorted(asyncio.run(drive(url, args.requests, args.concurrency)))
+        elapsed = time.perf_counter() - began
+        
+        workers = child_pids(server.pid)
+        worker_pss = [pss_kb(pid) for pid in workers]
+        master_pss = pss_kb(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+    
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    sys.path.insert(0, BACKEND_DIR)
+    from app.database.connection import worker_pool_size
+    
+    print(f"workers={args.workers} preload={args.preload} boot={boot_seconds:.2f}s")
+    print(f"db pool: {worker_pool_size()} per worker, {worker_pool_size() * args.workers} max for this instance")
+    print(f"memory: master {master_pss / 1024:.1f} MiB, workers "
+          f"{statistics.mean(worker_pss) / 1024:.1f} MiB avg, total {(master_pss + sum(worker_pss)) / 1024:.1f} MiB (PSS)")
+    print(f"throughput: {args.requests / elapsed:.0f} req/s, "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms "
+          f"({args.requests} requests, concurrency {args.concurrency})")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
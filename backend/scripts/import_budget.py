@@ -0,0 +1,106 @@
+"""
+Startup import budget.
+
+Imports the app in a fresh interpreter with `python -X importtime`, reports
+the most expensive modules and exits non-zero if the total import time is over
+budget or a module that must stay lazy was imported at boot.
+
+    python scripts/import_budget.py
+    python scripts/import_budget.py --budget-ms 900 --top 30
+
+Run from the backend directory. Timings are noisy; the median of --runs
+fresh imports is used.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TARGET = "app.main"
+DEFAULT_BUDGET_MS = 1000
+
+# Heavy, rarely used modules that must only be imported on first use
+DEFERRED_MODULES = (
+    "google.oauth2",          # Google login only (app/core/security.py)
+    "google.auth.transport",
+    "numpy",                  # analytics batch job only
+    "sqlalchemy.ext.asyncio", # only with a postgresql+asyncpg URL
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def profile_imports(target: str) -> List[Tuple[str, int, int]]:
+    """Import `target` in a fresh interpreter; return (module, self_us, cumulative_us) rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"importing {target} failed")
+    
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default=DEFAULT_TARGET)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    
+    profiles = [profile_imports(args.target) for _ in range(args.runs)]
+    totals = [next(cumulative for module, _, cumulative in rows if module == args.target) for rows in profiles]
+    median_total = statistics.median(totals)
+    rows = profiles[totals.index(median_total)] if median_total in totals else profiles[0]
+    
+    cumulative: Dict[str, int] = {module: cumulative for module, _, cumulative in rows}
+    
+    print(f"{args.target}: {median_total / 1000:.0f} ms (budget {args.budget_ms:.0f} ms, "
+          f"median of {args.runs}: {', '.join(f'{total / 1000:.0f}' for total in totals)})")
+    
+    print(f"\nTop {args.top} modules by self time:")
+    for module, self_us, cumulative_us in sorted(rows, key=lambda row: row[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {module}")
+    
+    print("\nApplication modules by cumulative time:")
+    for module, _, cumulative_us in sorted(
+        (row for row in rows if row[0].startswith("app.")),
+        key=lambda row: row[2],
+        reverse=True
+    )[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+    
+    failures = []
+    if median_total / 1000 > args.budget_ms:
+        failures.append(f"import time {median_total / 1000:.0f} ms exceeds budget of {args.budget_ms:.0f} ms")
+    for deferred in DEFERRED_MODULES:
+        loaded = [module for module in cumulative if module == deferred or module.startswith(deferred + ".")]
+        if loaded:
+            cost = max(cumulative[module] for module in loaded)
+            failures.append(f"{deferred} is imported at startup ({cost / 1000:.0f} ms); import it on first use")
+    
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
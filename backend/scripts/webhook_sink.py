@@ -0,0 +1,76 @@
+"""
+Local stand-in for a webhook subscriber.
+
+Prints every event it receives, one JSON object per line, and checks the
+X-HRMS-Signature header when given the subscription's secret. Use it to try
+the outbox end to end without a real downstream system:
+
+    python scripts/webhook_sink.py --port 8085 --secret <secret>
+
+then subscribe http://localhost:8085/ with POST /api/events/subscriptions.
+--fail-every N answers every Nth delivery with a 503 to exercise retries.
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(secret: str, fail_every: int):
+    deliveries = {"count": 0}
+    seen = set()
+    
+    class SinkHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            deliveries["count"] += 1
+            
+            if secret:
+                expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+                if not hmac.compare_digest(expected, self.headers.get("X-HRMS-Signature", "")):
+                    print("rejected: bad signature", file=sys.stderr)
+                    self.send_response(401)
+                    self.end_headers()
+                    return
+            
+            if fail_every and deliveries["count"] % fail_every == 0:
+                print(f"delivery {deliveries['count']}: simulated failure", file=sys.stderr)
+                self.send_response(503)
+                self.end_headers()
+                return
+            
+            for event in json.loads(body)["events"]:
+                # Delivery is at least once; a real consumer deduplicates the same way
+                duplicate = event["id"] in seen
+                seen.add(event["id"])
+                print(json.dumps(event) + ("  # duplicate" if duplicate else ""), flush=True)
+            
+            self.send_response(204)
+            self.end_headers()
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return SinkHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--secret", default="", help="subscription secret; omit to skip signature checks")
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args()
+    
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.secret, args.fail_every))
+    print(f"Webhook sink listening on http://{args.host}:{args.port}/", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Test fixtures: the app against a throwaway SQLite database migrated to head.
+
+Settings are read at import time, so the environment is set up before the
+app is imported. Background tasks only start in the lifespan, which the
+TestClient is never entered for, so no commits happen behind a test's back.
+"""
+import os
+import tempfile
+
+_TMP_DIR = tempfile.mkdtemp(prefix="hrms-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP_DIR, 'test.db')}"
+os.environ["UPLOAD_DIR"] = os.path.join(_TMP_DIR, "uploads")
+os.environ["RATE_LIMIT_ENABLED"] = "False"
+os.environ["DEBUG"] = "False"
+os.environ["LOG_LEVEL"] = "WARNING"
+os.chdir(_TMP_DIR)  # app.log is written to the working directory
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.apis.auth.models import User
+from app.apis.employees_profile.models import EmployeeProfile
+from app.apis.employees_profile.repositories import EmployeeFacetRepository, EmployeeHierarchyRepository
+from app.core.security import security_service
+from app.database.migrations import run_migrations
+from app.database.session import SessionLocal
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    run_migrations()
+    db = SessionLocal()
+    admin = User(email="admin@example.com", name="Admin", is_admin=True)
+    user = User(email="user@example.com", name="User")
+    db.add_all([admin, user])
+    db.flush()
+    db.add_all([
+        EmployeeProfile(user_id=admin.id, employee_id="E1", first_name="Ada", last_name="Admin", department="Eng"),
+        EmployeeProfile(user_id=user.id, employee_id="E2", first_name="Uma", last_name="User", department="Ops"),
+    ])
+    db.flush()
+    EmployeeHierarchyRepository(db).rebuild()
+    EmployeeFacetRepository(db).rebuild()
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def admin_headers():
+    token, _ = security_service.create_access_token("admin@example.com")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def commits():
+    """List that records one entry per COMMIT issued by any session (released savepoints excluded)."""
+    recorded = []
+    
+    def count(session):
+        if not session.in_nested_transaction():
+            recorded.append(session)
+    
+    event.listen(Session, "after_commit", count)
+    yield recorded
+    event.remove(Session, "after_commit", count)
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""Audit entries captured from the session at commit (see app/apis/audit/capture.py)."""
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.apis.audit.capture import set_actor
+from app.apis.audit.models import AuditLogEntry
+from app.apis.auth.models import User
+from app.apis.employees_profile.models import EmployeeDocument, EmployeeProfile
+from app.database.session import SessionLocal
+
+
+@pytest.fixture
+def db():
+    """A session whose changes are attributed to a fresh request ID."""
+    session = SessionLocal()
+    set_actor(session, 42, uuid.uuid4().hex)
+    yield session
+    session.close()
+
+
+def _entries(db):
+    _, request_id = db.info["audit_actor"]
+    check = SessionLocal()
+    entries = check.query(AuditLogEntry).filter(AuditLogEntry.request_id == request_id).all()
+    check.close()
+    return sorted(
+        [(entry.entity, entry.action, entry.field, entry.old_value, entry.new_value) for entry in entries],
+        key=lambda entry: (entry[0], entry[1], entry[2] or "")
+    )
+
+
+def _new_profile(db, code: str) -> EmployeeProfile:
+    user = User(email=f"{code.lower()}@example.com", name=code)
+    db.add(user)
+    db.flush()
+    profile = EmployeeProfile(user_id=user.id, employee_id=code, first_name="Audit", last_name="Me", department="Ops")
+    db.add(profile)
+    return profile
+
+
+def test_create_records_the_row_without_ignored_fields(db):
+    profile = _new_profile(db, "AU1")
+    db.commit()
+    
+    [(entity, action, field, old_value, new_value)] = _entries(db)
+    assert (entity, action, field, old_value) == ("employee_profile", "create", None, None)
+    snapshot = json.loads(new_value)
+    assert snapshot["employee_id"] == "AU1" and snapshot["department"] == "Ops"
+    assert "created_at" not in snapshot and "updated_at" not in snapshot
+    
+    check = SessionLocal()
+    entry = check.query(AuditLogEntry).filter(AuditLogEntry.request_id == db.info["audit_actor"][1]).one()
+    assert (entry.actor_id, entry.entity_id, entry.employee_id) == (42, profile.id, profile.id)
+    check.close()
+
+
+def test_update_records_one_entry_per_changed_field(db):
+    profile = _new_profile(db, "AU2")
+    db.commit()
+    set_actor(db, 42, uuid.uuid4().hex)
+    
+    profile.position = "Lead"
+    profile.department = "Eng"
+    profile.last_name = "Me"  # unchanged
+    profile.updated_at = datetime.now(timezone.utc)  # ignored
+    db.commit()
+    
+    assert _entries(db) == [
+        ("employee_profile", "update", "department", '"Ops"', '"Eng"'),
+        ("employee_profile", "update", "position", None, '"Lead"'),
+    ]
+
+
+def test_delete_records_the_row_as_it_was(db):
+    profile = _new_profile(db, "AU3")
+    db.flush()
+    document = EmployeeDocument(employee_id=profile.id, document_type="ID", document_name="passport", file_path="x")
+    db.add(document)
+    db.commit()
+    set_actor(db, 42, uuid.uuid4().hex)
+    
+    db.delete(document)
+    db.commit()
+    
+    [(entity, action, field, old_value, new_value)] = _entries(db)
+    assert (entity, action, field, new_value) == ("employee_document", "delete", None, None)
+    assert json.loads(old_value)["document_name"] == "passport"
+
+
+def test_rolled_back_savepoint_drops_its_entries(db):
+    profile = _new_profile(db, "AU4")
+    db.commit()
+    set_actor(db, 42, uuid.uuid4().hex)
+    
+    savepoint = db.begin_nested()
+    profile.position = "Discarded"
+    db.flush()
+    savepoint.rollback()
+    with db.begin_nested():
+        profile.phone_number = "555-0199"
+    db.commit()
+    
+    assert _entries(db) == [("employee_profile", "update", "phone_number", None, '"555-0199"')]
+
+
+def test_rolled_back_transaction_writes_nothing(db):
+    _new_profile(db, "AU5")
+    db.flush()
+    db.rollback()
+    db.commit()
+    
+    assert _entries(db) == []
\ No newline at end of file
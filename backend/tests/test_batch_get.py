@@ -0,0 +1,76 @@
+"""POST /api/employees/batch-get: one item per distinct key, in request order."""
+from app.apis.employees_profile.models import EmployeeProfile
+from app.core.config import settings
+from app.core.security import security_service
+from app.database.session import SessionLocal
+
+
+def _user_headers() -> dict:
+    token, _ = security_service.create_access_token("user@example.com")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _ids() -> dict:
+    db = SessionLocal()
+    ids = dict(db.query(EmployeeProfile.employee_id, EmployeeProfile.id).filter(
+        EmployeeProfile.employee_id.in_(["E1", "E2"])
+    ).all())
+    db.close()
+    return ids
+
+
+def _batch(client, headers, **body):
+    response = client.post("/api/employees/batch-get", json=body, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_duplicate_keys_are_answered_once(client, admin_headers):
+    ids = _ids()
+    
+    result = _batch(client, admin_headers, ids=[ids["E2"], ids["E1"], ids["E2"]], employee_ids=["E1", "E1"])
+    
+    assert [(item["id"], item["employee_id"], item["status"]) for item in result["items"]] == [
+        (ids["E2"], None, "ok"), (ids["E1"], None, "ok"), (None, "E1", "ok")
+    ]
+    assert result["found"] == 3
+    assert result["items"][0]["profile"]["employee_id"] == "E2"
+
+
+def test_unknown_keys_are_not_found_for_admins(client, admin_headers):
+    ids = _ids()
+    
+    result = _batch(client, admin_headers, ids=[999_999, ids["E1"]], employee_ids=["NOPE"])
+    
+    assert [item["status"] for item in result["items"]] == ["not_found", "ok", "not_found"]
+    assert result["items"][0]["profile"] is None
+    assert result["found"] == 1
+
+
+def test_restricted_caller_cannot_tell_invisible_from_unknown(client):
+    ids = _ids()
+    
+    result = _batch(client, _user_headers(), ids=[ids["E1"], 999_999, ids["E2"]], employee_ids=["E1", "NOPE"])
+    
+    assert [item["status"] for item in result["items"]] == ["forbidden", "forbidden", "ok", "forbidden", "forbidden"]
+    assert result["found"] == 1
+
+
+def test_fields_trim_the_profiles(client, admin_headers):
+    result = _batch(client, admin_headers, employee_ids=["E1"])
+    assert "department" in result["items"][0]["profile"]
+    
+    response = client.post("/api/employees/batch-get?fields=first_name", json={"employee_ids": ["E1"]}, headers=admin_headers)
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["items"][0]["profile"] == {"id": _ids()["E1"], "first_name": "Ada"}
+
+
+def test_empty_and_oversized_batches_are_rejected(client, admin_headers, monkeypatch):
+    assert client.post("/api/employees/batch-get", json={}, headers=admin_headers).status_code == 400
+    
+    monkeypatch.setattr(settings, "BATCH_GET_MAX_IDS", 2)
+    response = client.post("/api/employees/batch-get", json={"ids": [1, 2, 3]}, headers=admin_headers)
+    assert response.status_code == 400
+    # Duplicates do not count against the limit
+    assert client.post("/api/employees/batch-get", json={"ids": [1, 1, 1]}, headers=admin_headers).status_code == 200
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""POST /api/employees/bulk-update (see EmployeeProfileRepository.bulk_update)."""
+from app.apis.audit.models import AuditLogEntry
+from app.apis.auth.models import User
+from app.apis.employees_profile.models import EmployeeFacetCount, EmployeeProfile
+from app.core.security import security_service
+from app.database.session import SessionLocal
+
+
+def _new_user(email: str) -> int:
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def _create(client, headers, code: str, **fields) -> int:
+    response = client.post("/api/employees/", json={
+        "user_id": _new_user(f"{code.lower()}@example.com"),
+        "employee_id": code,
+        "first_name": code,
+        "last_name": "Bulk",
+        **fields
+    }, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def _profiles(*ids):
+    db = SessionLocal()
+    profiles = {profile.id: profile for profile in db.query(EmployeeProfile).filter(EmployeeProfile.id.in_(ids))}
+    db.close()
+    return profiles
+
+
+def _status_counters():
+    db = SessionLocal()
+    counters = {
+        row.value: row.count
+        for row in db.query(EmployeeFacetCount).filter(EmployeeFacetCount.facet == "employee_status")
+    }
+    db.close()
+    return counters
+
+
+def test_only_editable_employees_are_updated(client, admin_headers):
+    editable = [_create(client, admin_headers, code, department="BulkA") for code in ("BA1", "BA2")]
+    other = _create(client, admin_headers, "BB1", department="BulkB")
+    editor = _new_user("bulk-editor@example.com")
+    response = client.post(
+        "/api/employees/access-grants",
+        json={"user_id": editor, "department": "BulkA", "can_edit": True},
+        headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    token, _ = security_service.create_access_token("bulk-editor@example.com")
+    
+    response = client.post(
+        "/api/employees/bulk-update",
+        json={"ids": editable + [other], "changes": {"position": "Lead"}},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["matched"] == 2
+    assert response.json()["ids"] == sorted(editable)
+    profiles = _profiles(*editable, other)
+    assert [profiles[id].position for id in editable] == ["Lead", "Lead"]
+    assert profiles[other].position is None
+
+
+def test_unknown_and_unchanged_ids_are_skipped(client, admin_headers):
+    employee_id = _create(client, admin_headers, "BU1")
+    body = {"ids": [employee_id, 999999], "changes": {"position": "Analyst"}}
+    
+    first = client.post("/api/employees/bulk-update", json=body, headers=admin_headers)
+    again = client.post("/api/employees/bulk-update", json=body, headers=admin_headers)
+    
+    assert first.status_code == 200, first.text
+    assert first.json() == {"matched": 1, "updated": 1, "dry_run": False, "ids": [employee_id]}
+    assert again.json() == {"matched": 0, "updated": 0, "dry_run": False, "ids": []}
+
+
+def test_status_change_moves_facet_counters(client, admin_headers):
+    ids = [_create(client, admin_headers, code, employee_status="Active") for code in ("BS1", "BS2")]
+    before = _status_counters()
+    
+    response = client.post(
+        "/api/employees/bulk-update",
+        json={"ids": ids, "changes": {"employee_status": "On Leave"}},
+        headers=admin_headers
+    )
+    
+    assert response.status_code == 200, response.text
+    after = _status_counters()
+    assert after["Active"] == before["Active"] - 2
+    assert after["On Leave"] == before.get("On Leave", 0) + 2
+
+
+def test_one_audit_entry_per_changed_field(client, admin_headers):
+    moved = _create(client, admin_headers, "BC1", city="Oslo")
+    stayed = _create(client, admin_headers, "BC2", city="Bergen")
+    
+    response = client.post(
+        "/api/employees/bulk-update",
+        json={"ids": [moved, stayed], "changes": {"position": "Lead", "city": "Bergen"}},
+        headers=admin_headers
+    )
+    
+    assert response.status_code == 200, response.text
+    db = SessionLocal()
+    entries = db.query(AuditLogEntry).filter(
+        AuditLogEntry.entity_id.in_([moved, stayed]),
+        AuditLogEntry.action == "update"
+    ).all()
+    db.close()
+    assert sorted((entry.entity_id, entry.field) for entry in entries) == sorted([
+        (moved, "position"), (moved, "city"), (stayed, "position")
+    ])
+    city = next(entry for entry in entries if entry.field == "city")
+    assert (city.old_value, city.new_value) == ('"Oslo"', '"Bergen"')
\ No newline at end of file
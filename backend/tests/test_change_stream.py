@@ -0,0 +1,170 @@
+"""Live change stream: publish on commit, bounded queues and the SSE endpoint (see stream.py)."""
+import asyncio
+
+import pytest
+
+from app.apis.employees_profile.models import EmployeeProfile
+from app.apis.employees_profile.policies import Principal
+from app.apis.employees_profile.stream import Broadcaster, Subscriber, broadcaster, event_stream
+from app.core.config import settings
+from app.core.security import security_service
+from app.database.session import SessionLocal
+
+
+@pytest.fixture
+def loop():
+    """The in-process broadcaster bound to a loop the test drives (the lifespan normally does this)."""
+    loop = asyncio.new_event_loop()
+    broadcaster.bind(loop)
+    yield loop
+    broadcaster.bind(None)
+    loop.close()
+
+
+def _deliver(loop):
+    # Run the publish callbacks handed over by committing threads
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+def _drain(subscriber: Subscriber):
+    payloads = []
+    while not subscriber.queue.empty():
+        payloads.append(subscriber.queue.get_nowait())
+    return payloads
+
+
+def _profile_id(code: str) -> int:
+    db = SessionLocal()
+    profile_id = db.query(EmployeeProfile.id).filter(EmployeeProfile.employee_id == code).scalar()
+    db.close()
+    return profile_id
+
+
+def test_commit_is_published_to_viewers_only(client, admin_headers, loop):
+    ops = broadcaster.subscribe(Principal(user_id=901, read_departments=frozenset({"Ops"})))
+    eng = broadcaster.subscribe(Principal(user_id=902, read_departments=frozenset({"Eng"})))
+    try:
+        employee_id = _profile_id("E2")
+        response = client.put(f"/api/employees/{employee_id}", json={"phone_number": "555-0101"}, headers=admin_headers)
+        assert response.status_code == 200, response.text
+        _deliver(loop)
+        
+        assert [(payload["type"], payload["employee_id"]) for payload in _drain(ops)] == [("employee.updated", employee_id)]
+        assert _drain(eng) == []
+    finally:
+        broadcaster.unsubscribe(ops)
+        broadcaster.unsubscribe(eng)
+
+
+def test_savepoint_changes_are_published_with_the_outer_commit_only(loop):
+    subscriber = broadcaster.subscribe(Principal(user_id=903, is_admin=True))
+    employee_id = _profile_id("E2")
+    db = SessionLocal()
+    try:
+        profile = db.get(EmployeeProfile, employee_id)
+        savepoint = db.begin_nested()
+        profile.position = "Discarded"
+        db.flush()
+        savepoint.rollback()
+        with db.begin_nested():
+            profile.phone_number = "555-0102"
+        _deliver(loop)
+        assert _drain(subscriber) == []  # a released savepoint is not a commit
+        
+        db.commit()
+        _deliver(loop)
+        
+        assert [payload["type"] for payload in _drain(subscriber)] == ["employee.updated"]
+    finally:
+        db.close()
+        broadcaster.unsubscribe(subscriber)
+
+
+def test_rolled_back_transaction_is_not_published(loop):
+    subscriber = broadcaster.subscribe(Principal(user_id=904, is_admin=True))
+    db = SessionLocal()
+    try:
+        db.get(EmployeeProfile, _profile_id("E2")).position = "Never"
+        db.flush()
+        db.rollback()
+        _deliver(loop)
+        
+        assert _drain(subscriber) == []
+    finally:
+        db.close()
+        broadcaster.unsubscribe(subscriber)
+
+
+def test_full_queue_flags_resync_and_drops_the_rest():
+    local = Broadcaster(max_clients=10, queue_size=2)
+    behind = local.subscribe(Principal(user_id=905, is_admin=True))
+    other = local.subscribe(Principal(user_id=906, read_departments=frozenset({"Eng"})))
+    payloads = [
+        {"type": "employee.updated", "employee_id": i, "document_id": None, "departments": ["Ops"], "managers": []}
+        for i in range(1, 5)
+    ]
+    
+    local.publish(payloads)
+    
+    assert behind.needs_resync
+    assert behind.queue.qsize() == 2
+    assert not behind.offer(payloads[0])  # nothing more is queued until the client resyncs
+    assert not other.needs_resync and other.queue.empty()
+
+
+def test_broadcaster_refuses_clients_over_the_limit():
+    local = Broadcaster(max_clients=1, queue_size=2)
+    first = local.subscribe(Principal(user_id=907))
+    
+    assert local.subscribe(Principal(user_id=908)) is None
+    local.unsubscribe(first)
+    assert local.subscribe(Principal(user_id=908)) is not None
+
+
+def test_event_stream_sends_resync_then_new_events(monkeypatch):
+    monkeypatch.setattr(settings, "STREAM_HEARTBEAT_SECONDS", 0.05)
+    subscriber = Subscriber(Principal(user_id=909, is_admin=True), queue_size=1)
+    subscriber.offer({"type": "employee.updated", "employee_id": 1})
+    subscriber.offer({"type": "employee.updated", "employee_id": 2})  # overflows
+    
+    async def collect():
+        frames = []
+        async for frame in event_stream(subscriber, lifetime_seconds=0.3):
+            frames.append(frame)
+            if frame.startswith("event: resync"):
+                subscriber.offer({"type": "document.created", "employee_id": 3, "document_id": 7})
+        return frames
+    
+    frames = asyncio.run(collect())
+    
+    assert frames[0] == f"retry: {settings.STREAM_RETRY_MS}\n\n"
+    assert frames[1] == "event: resync\ndata: {}\n\n"  # the stale, queued notification was dropped
+    assert frames[2] == 'event: document.created\ndata: {"employee_id": 3, "document_id": 7}\n\n'
+    assert set(frames[3:]) == {": ping\n\n"}
+
+
+def test_sse_endpoint_streams_until_the_token_expires(client, monkeypatch):
+    monkeypatch.setattr(settings, "ACCESS_EXPIRE_MINUTES", 1 / 60)
+    monkeypatch.setattr(settings, "STREAM_HEARTBEAT_SECONDS", 0.2)
+    token, _ = security_service.create_access_token("user@example.com")
+    
+    response = client.get("/api/employees/stream", headers={"Authorization": f"Bearer {token}"})
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text.startswith(f"retry: {settings.STREAM_RETRY_MS}\n\n")
+    assert broadcaster.client_count == 0
+
+
+def test_sse_endpoint_requires_a_token(client):
+    assert client.get("/api/employees/stream").status_code == 401
+
+
+def test_sse_endpoint_refuses_over_the_client_limit(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(broadcaster, "max_clients", 0)
+    
+    response = client.get("/api/employees/stream", headers=admin_headers)
+    
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == str(settings.STREAM_RETRY_MS // 1000 or 1)
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""Resumable document uploads (see DocumentUploadService)."""
+import hashlib
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.apis.employees_profile.models import DocumentUploadSession
+from app.apis.employees_profile.repositories import (
+    DocumentUploadSessionRepository,
+    EmployeeDocumentRepository,
+    EmployeeProfileRepository
+)
+from app.apis.employees_profile.schemas import DocumentUploadComplete, DocumentUploadSessionCreate
+from app.apis.employees_profile.services import DocumentUploadService
+from app.database.session import SessionLocal
+
+
+def test_chunked_upload_round_trip(client, admin_headers):
+    payload = b"0123456789" * 10
+    response = client.post(
+        "/api/employees/1/documents/uploads",
+        json={"document_type": "ID", "document_name": "Passport", "total_size": len(payload)},
+        headers=admin_headers
+    )
+    assert response.status_code == 201, response.text
+    upload_id = response.json()["upload_id"]
+    
+    for offset in (50, 0):
+        response = client.put(
+            f"/api/employees/1/documents/uploads/{upload_id}?offset={offset}",
+            content=payload[offset:offset + 50],
+            headers=admin_headers
+        )
+        assert response.status_code == 200, response.text
+    
+    response = client.post(
+        f"/api/employees/1/documents/uploads/{upload_id}/complete",
+        json={"checksum_sha256": hashlib.sha256(payload).hexdigest()},
+        headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    with open(response.json()["file_path"], "rb") as stored:
+        assert stored.read() == payload
+
+
+def test_failed_commit_moves_completed_file_back():
+    db = SessionLocal()
+    service = DocumentUploadService(
+        EmployeeProfileRepository(db),
+        EmployeeDocumentRepository(db),
+        DocumentUploadSessionRepository(db)
+    )
+    try:
+        upload = service.create_session(
+            1,
+            DocumentUploadSessionCreate(document_type="ID", document_name="Visa", total_size=5),
+            created_by=1
+        )
+        service.write_chunk(1, upload.upload_id, 0, b"hello")
+        db.commit()
+        
+        document = service.complete_session(1, upload.upload_id, DocumentUploadComplete(), uploaded_by=1)
+        assert os.path.exists(document.file_path)
+        db.rollback()  # the request's commit failed
+        
+        assert not os.path.exists(document.file_path)
+        retried = service.complete_session(1, upload.upload_id, DocumentUploadComplete(), uploaded_by=1)
+        db.commit()
+        with open(retried.file_path, "rb") as stored:
+            assert stored.read() == b"hello"
+    finally:
+        db.close()
+
+
+def _service(db) -> DocumentUploadService:
+    return DocumentUploadService(
+        EmployeeProfileRepository(db),
+        EmployeeDocumentRepository(db),
+        DocumentUploadSessionRepository(db)
+    )
+
+
+def _expired_upload(db, service) -> DocumentUploadSession:
+    created = service.create_session(
+        1,
+        DocumentUploadSessionCreate(document_type="ID", document_name="Stale", total_size=5),
+        created_by=1
+    )
+    upload = db.get(DocumentUploadSession, created.upload_id)
+    upload.expires_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    db.commit()
+    return upload
+
+
+def test_chunk_after_completion_is_rejected():
+    db = SessionLocal()
+    service = _service(db)
+    try:
+        upload = service.create_session(
+            1,
+            DocumentUploadSessionCreate(document_type="ID", document_name="Late", total_size=5),
+            created_by=1
+        )
+        service.write_chunk(1, upload.upload_id, 0, b"hello")
+        service.complete_session(1, upload.upload_id, DocumentUploadComplete(), uploaded_by=1)
+        db.commit()
+        
+        with pytest.raises(HTTPException) as rejected:
+            service.write_chunk(1, upload.upload_id, 0, b"HELLO")
+        assert rejected.value.status_code == 410
+    finally:
+        db.close()
+
+
+def test_purged_temp_file_is_removed_only_after_commit():
+    db = SessionLocal()
+    service = _service(db)
+    try:
+        upload = _expired_upload(db, service)
+        temp_path = upload.temp_path
+        
+        assert service.purge_expired_sessions() >= 1
+        assert os.path.exists(temp_path)
+        
+        db.commit()
+        assert not os.path.exists(temp_path)
+    finally:
+        db.close()
+
+
+def test_purge_in_a_rolled_back_savepoint_keeps_the_temp_file():
+    db = SessionLocal()
+    service = _service(db)
+    try:
+        upload = _expired_upload(db, service)
+        upload_id, temp_path = upload.id, upload.temp_path
+        
+        savepoint = db.begin_nested()
+        service.purge_expired_sessions()
+        savepoint.rollback()
+        db.commit()
+        
+        assert os.path.exists(temp_path)
+        assert db.get(DocumentUploadSession, upload_id) is not None
+        
+        service.purge_expired_sessions()  # leave nothing expired behind for other tests
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_aborted_upload_keeps_its_file_if_the_commit_fails():
+    db = SessionLocal()
+    service = _service(db)
+    try:
+        upload = service.create_session(
+            1,
+            DocumentUploadSessionCreate(document_type="ID", document_name="Abort", total_size=5),
+            created_by=1
+        )
+        db.commit()
+        temp_path = db.get(DocumentUploadSession, upload.upload_id).temp_path
+        
+        service.abort_session(1, upload.upload_id)
+        db.rollback()
+        assert os.path.exists(temp_path)
+        
+        service.abort_session(1, upload.upload_id)
+        db.commit()
+        assert not os.path.exists(temp_path)
+    finally:
+        db.close()
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""Who may see and change what on employee profiles (see AccessPolicy)."""
+import csv
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.apis.auth.models import User
+from app.core.security import security_service
+from app.database.session import SessionLocal
+
+# Caller -> employee codes they may see, in the org built by the fixture below
+VISIBLE = {
+    "admin@example.com": {"AX-BOSS", "AX-M", "AX-R", "AX-S", "AX-SR", "AX-L"},
+    "ax-boss@example.com": {"AX-BOSS", "AX-M", "AX-R", "AX-S", "AX-SR"},
+    "ax-m@example.com": {"AX-M", "AX-R"},
+    "ax-l@example.com": {"AX-L"},
+    "ax-grant@example.com": {"AX-SR", "AX-L"},
+}
+
+
+def _headers(email: str) -> dict:
+    token, _ = security_service.create_access_token(email)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _new_user(email: str) -> int:
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+@pytest.fixture(scope="module")
+def org():
+    """
+    AX-BOSS (AccessEng)
+    ├── AX-M (AccessEng) ── AX-R (AccessEng)
+    └── AX-S (AccessEng) ── AX-SR (AccessOps)
+    AX-L (AccessOps), with no manager or reports
+    
+    ax-grant@example.com has no profile, only a read grant on AccessOps.
+    """
+    client = TestClient(app)
+    headers = _headers("admin@example.com")
+    ids = {}
+    for code, department, manager in [
+        ("AX-BOSS", "AccessEng", None),
+        ("AX-M", "AccessEng", "AX-BOSS"),
+        ("AX-R", "AccessEng", "AX-M"),
+        ("AX-S", "AccessEng", "AX-BOSS"),
+        ("AX-SR", "AccessOps", "AX-S"),
+        ("AX-L", "AccessOps", None),
+    ]:
+        response = client.post("/api/employees/", json={
+            "user_id": _new_user(f"{code.lower()}@example.com"),
+            "employee_id": code,
+            "first_name": code,
+            "last_name": "Access",
+            "department": department,
+            "manager_id": ids.get(manager)
+        }, headers=headers)
+        assert response.status_code == 200, response.text
+        ids[code] = response.json()["id"]
+    
+    response = client.post(
+        "/api/employees/access-grants",
+        json={"user_id": _new_user("ax-grant@example.com"), "department": "AccessOps"},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return ids
+
+
+@pytest.mark.parametrize("caller", VISIBLE)
+def test_list_shows_only_visible_employees(client, org, caller):
+    response = client.get("/api/employees/?search=AX-&limit=100", headers=_headers(caller))
+    
+    assert response.status_code == 200, response.text
+    assert {item["employee_id"] for item in response.json()["items"]} == VISIBLE[caller]
+    assert response.json()["total"] == len(VISIBLE[caller])
+
+
+@pytest.mark.parametrize("caller", VISIBLE)
+def test_search_shows_only_visible_employees(client, org, caller):
+    response = client.get("/api/employees/search?q=AX-&limit=100", headers=_headers(caller))
+    
+    assert response.status_code == 200, response.text
+    assert {item["employee_id"] for item in response.json()["items"]} == VISIBLE[caller]
+    counts = {facet["value"]: facet["count"] for facet in response.json()["facets"]["department"]}
+    assert sum(counts.values()) == len(VISIBLE[caller])
+
+
+@pytest.mark.parametrize("caller", VISIBLE)
+def test_export_contains_only_visible_employees(client, org, caller):
+    response = client.get("/api/employees/export?search=AX-", headers=_headers(caller))
+    
+    assert response.status_code == 200, response.text
+    assert {row["employee_id"] for row in csv.DictReader(io.StringIO(response.text))} == VISIBLE[caller]
+
+
+@pytest.mark.parametrize("caller", VISIBLE)
+def test_get_is_forbidden_outside_visibility(client, org, caller):
+    headers = _headers(caller)
+    
+    statuses = {code: client.get(f"/api/employees/{id}", headers=headers).status_code for code, id in org.items()}
+    
+    assert statuses == {code: 200 if code in VISIBLE[caller] else 403 for code in org}
+
+
+@pytest.mark.parametrize("caller", VISIBLE)
+def test_batch_get_marks_invisible_employees_forbidden(client, org, caller):
+    response = client.post("/api/employees/batch-get", json={"ids": list(org.values())}, headers=_headers(caller))
+    
+    assert response.status_code == 200, response.text
+    by_code = {code: item["status"] for code, item in zip(org, response.json()["items"])}
+    assert by_code == {code: "ok" if code in VISIBLE[caller] else "forbidden" for code in org}
+
+
+def test_read_grant_does_not_allow_edits(client, org):
+    response = client.put(
+        f"/api/employees/{org['AX-L']}", json={"position": "Lead"}, headers=_headers("ax-grant@example.com")
+    )
+    
+    assert response.status_code == 403
+
+
+def test_self_update_cannot_change_manager(client, admin_headers):
+    token, _ = security_service.create_access_token("user@example.com")
+    user_headers = {"Authorization": f"Bearer {token}"}
+    
+    response = client.put("/api/employees/2", json={"position": "Staff", "manager_id": 1}, headers=user_headers)
+    
+    assert response.status_code == 200, response.text
+    assert response.json()["position"] == "Staff"
+    assert response.json()["manager_id"] is None
+    assert client.get("/api/employees/1/reports", headers=admin_headers).json() == []
\ No newline at end of file
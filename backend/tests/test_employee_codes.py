@@ -0,0 +1,36 @@
+"""Employee codes are unique among active staff (ix_employee_profiles_active_employee_id)."""
+from app.apis.auth.models import User
+from app.database.session import SessionLocal
+
+
+def _create(client, headers, email: str, code: str):
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return client.post(
+        "/api/employees/",
+        json={"user_id": user_id, "employee_id": code, "first_name": "New", "last_name": "Hire"},
+        headers=headers
+    )
+
+
+def test_departed_employee_code_can_be_reissued(client, admin_headers):
+    first = _create(client, admin_headers, "leaver@example.com", "R1")
+    assert first.status_code == 200, first.text
+    assert client.delete(f"/api/employees/{first.json()['id']}", headers=admin_headers).status_code == 200
+    
+    second = _create(client, admin_headers, "joiner@example.com", "R1")
+    
+    assert second.status_code == 200, second.text
+    assert second.json()["id"] != first.json()["id"]
+
+
+def test_active_employee_code_stays_unique(client, admin_headers):
+    assert _create(client, admin_headers, "holder@example.com", "R2").status_code == 200
+    
+    response = _create(client, admin_headers, "clash@example.com", "R2")
+    
+    assert response.status_code == 400, response.text
\ No newline at end of file
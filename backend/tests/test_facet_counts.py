@@ -0,0 +1,89 @@
+"""Facet counters kept by apply_deltas must match a rebuild from the profiles table."""
+from collections import Counter
+
+from app.apis.auth.models import User
+from app.apis.employees_profile.models import EmployeeFacetCount
+from app.apis.employees_profile.repositories import EmployeeFacetRepository
+from app.database.session import SessionLocal
+
+
+def _new_user(email: str) -> int:
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def _counters(rebuild: bool = False) -> Counter:
+    """Current counters, or (rolled back) what a rebuild would produce."""
+    db = SessionLocal()
+    if rebuild:
+        EmployeeFacetRepository(db).rebuild()
+    counts = Counter({(row.facet, row.value): row.count for row in db.query(EmployeeFacetCount).all()})
+    db.rollback()
+    db.close()
+    return counts
+
+
+def _change(before: Counter, after: Counter) -> dict:
+    keys = set(before) | set(after)
+    return {key: after[key] - before[key] for key in keys if after[key] != before[key]}
+
+
+class _Tracker:
+    """Compares how the maintained counters moved with how a rebuild moved."""
+    
+    def __init__(self):
+        self.kept, self.rebuilt = _counters(), _counters(rebuild=True)
+    
+    def check(self) -> dict:
+        kept, rebuilt = _counters(), _counters(rebuild=True)
+        moved = _change(self.kept, kept)
+        assert moved == _change(self.rebuilt, rebuilt)
+        self.kept, self.rebuilt = kept, rebuilt
+        return moved
+
+
+def test_create_update_delete_keep_counters_consistent(client, admin_headers):
+    tracker = _Tracker()
+    
+    response = client.post("/api/employees/", json={
+        "user_id": _new_user("facets@example.com"),
+        "employee_id": "FC1",
+        "first_name": "Facet",
+        "last_name": "Count",
+        "department": "FacetDept",
+        "city": "Lyon"
+    }, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    employee_id = response.json()["id"]
+    assert tracker.check()[("department", "FacetDept")] == 1
+    
+    response = client.put(
+        f"/api/employees/{employee_id}", json={"department": "OtherDept", "city": None}, headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    moved = tracker.check()
+    assert (moved[("department", "FacetDept")], moved[("department", "OtherDept")]) == (-1, 1)
+    
+    response = client.put(f"/api/employees/{employee_id}", json={"position": "Lead"}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert tracker.check() == {}
+    
+    response = client.post(
+        "/api/employees/bulk-update",
+        json={"ids": [employee_id], "changes": {"employee_status": "On Leave"}},
+        headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+    assert tracker.check()[("employee_status", "On Leave")] == 1
+    
+    response = client.delete(f"/api/employees/{employee_id}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    moved = tracker.check()
+    assert moved[("department", "OtherDept")] == -1
+    
+    assert client.get("/api/employees/facets", headers=admin_headers).status_code == 200
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Sparse fieldsets: `fields` validation and trimmed responses (see fieldsets.py)."""
+import pytest
+
+from app.apis.employees_profile.fieldsets import parse_fields
+from app.apis.employees_profile.schemas import EmployeeProfileDetailResponse, EmployeeProfileResponse
+
+
+def test_parse_fields_puts_id_first_in_schema_order():
+    assert parse_fields(None, EmployeeProfileResponse) is None
+    assert parse_fields(" last_name,first_name ,id,,", EmployeeProfileResponse) == ("id", "first_name", "last_name")
+
+
+@pytest.mark.parametrize("raw", ["salary", "first_name,salary", ",", "user_email"])
+def test_parse_fields_rejects_unknown_or_empty(raw):
+    with pytest.raises(ValueError):
+        parse_fields(raw, EmployeeProfileResponse)
+
+
+def test_detail_fields_include_the_user_account():
+    assert parse_fields("user_email", EmployeeProfileDetailResponse) == ("id", "user_email")
+
+
+@pytest.mark.parametrize("method, path, body", [
+    ("GET", "/api/employees/", None),
+    ("GET", "/api/employees/search", None),
+    ("GET", "/api/employees/export", None),
+    ("GET", "/api/employees/{id}", None),
+    ("POST", "/api/employees/batch-get", {"employee_ids": ["E1"]}),
+])
+def test_unknown_fields_get_422(client, admin_headers, method, path, body):
+    employee_id = client.get("/api/employees/?fields=employee_id", headers=admin_headers).json()["items"][0]["id"]
+    
+    response = client.request(
+        method, path.format(id=employee_id) + "?fields=first_name,salary", json=body, headers=admin_headers
+    )
+    
+    assert response.status_code == 422
+    assert "salary" in response.json()["message"]
+
+
+def test_list_returns_only_the_requested_fields(client, admin_headers):
+    response = client.get("/api/employees/?fields=department,first_name", headers=admin_headers)
+    
+    assert response.status_code == 200, response.text
+    assert {tuple(employee) for employee in response.json()["items"]} == {("id", "first_name", "department")}
\ No newline at end of file
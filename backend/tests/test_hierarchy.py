@@ -0,0 +1,117 @@
+"""Closure table upkeep for manager changes and departures (see EmployeeHierarchyRepository)."""
+from app.apis.auth.models import User
+from app.apis.employees_profile.models import EmployeeHierarchy, EmployeeProfile
+from app.apis.employees_profile.repositories import EmployeeHierarchyRepository
+from app.database.session import SessionLocal
+
+
+def _new_user(email: str) -> int:
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def _build(client, headers, prefix: str) -> dict:
+    """
+    A (prefix-A)
+    ├── B ── C ── D
+    └── E
+    """
+    ids = {}
+    for name, manager in [("A", None), ("B", "A"), ("C", "B"), ("D", "C"), ("E", "A")]:
+        code = f"{prefix}-{name}"
+        response = client.post("/api/employees/", json={
+            "user_id": _new_user(f"{code.lower()}@example.com"),
+            "employee_id": code,
+            "first_name": name,
+            "last_name": prefix,
+            "manager_id": ids.get(manager)
+        }, headers=headers)
+        assert response.status_code == 200, response.text
+        ids[name] = response.json()["id"]
+    return ids
+
+
+def _closure(ids: dict) -> set:
+    """Closure rows among the tree's employees, as (ancestor, descendant, depth) names."""
+    names = {employee_id: name for name, employee_id in ids.items()}
+    db = SessionLocal()
+    rows = db.query(EmployeeHierarchy).filter(
+        EmployeeHierarchy.ancestor_id.in_(names) | EmployeeHierarchy.descendant_id.in_(names)
+    ).all()
+    db.close()
+    return {(names.get(row.ancestor_id), names.get(row.descendant_id), row.depth) for row in rows}
+
+
+def _expected(ids: dict) -> set:
+    """The closure implied by manager_id, walked in Python."""
+    names = {employee_id: name for name, employee_id in ids.items()}
+    db = SessionLocal()
+    managers = dict(db.query(EmployeeProfile.id, EmployeeProfile.manager_id).filter(
+        EmployeeProfile.id.in_(names),
+        EmployeeProfile.is_active == True
+    ).all())
+    db.close()
+    expected = set()
+    for employee_id in managers:
+        ancestor, depth = employee_id, 0
+        while ancestor is not None:
+            expected.add((names[ancestor], names[employee_id], depth))
+            ancestor, depth = managers.get(ancestor), depth + 1
+    return expected
+
+
+def test_move_subtree_rewires_only_the_crossing_paths(client, admin_headers):
+    ids = _build(client, admin_headers, "HM")
+    assert _closure(ids) == _expected(ids)
+    
+    response = client.put(f"/api/employees/{ids['C']}/manager", json={"manager_id": ids["E"]}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    
+    closure = _closure(ids)
+    assert closure == _expected(ids)
+    assert {("E", "C", 1), ("E", "D", 2), ("A", "D", 3)} <= closure
+    assert not any(ancestor == "B" and descendant in {"C", "D"} for ancestor, descendant, _ in closure)
+
+
+def test_move_to_top_level_keeps_the_subtree(client, admin_headers):
+    ids = _build(client, admin_headers, "HT")
+    
+    response = client.put(f"/api/employees/{ids['B']}/manager", json={"manager_id": None}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    
+    closure = _closure(ids)
+    assert closure == _expected(ids)
+    assert {("B", "C", 1), ("B", "D", 2)} <= closure
+    assert not any(ancestor == "A" and descendant in {"B", "C", "D"} for ancestor, descendant, _ in closure)
+
+
+def test_move_under_own_report_is_rejected_unchanged(client, admin_headers):
+    ids = _build(client, admin_headers, "HC")
+    before = _closure(ids)
+    
+    response = client.put(f"/api/employees/{ids['B']}/manager", json={"manager_id": ids["D"]}, headers=admin_headers)
+    
+    assert response.status_code == 400
+    assert _closure(ids) == before
+
+
+def test_remove_node_hands_reports_to_the_manager(client, admin_headers):
+    ids = _build(client, admin_headers, "HR")
+    
+    response = client.delete(f"/api/employees/{ids['B']}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    
+    closure = _closure(ids)
+    assert closure == _expected(ids)
+    assert {("A", "C", 1), ("A", "D", 2), ("C", "D", 1)} <= closure
+    assert not any("B" in (ancestor, descendant) for ancestor, descendant, _ in closure)
+    
+    db = SessionLocal()
+    assert db.get(EmployeeProfile, ids["C"]).manager_id == ids["A"]
+    assert EmployeeHierarchyRepository(db).get_headcount(ids["A"]) == 3
+    db.close()
\ No newline at end of file
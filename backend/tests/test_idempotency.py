@@ -0,0 +1,38 @@
+"""Idempotency-Key replay and fingerprinting (see app/apis/idempotency/middleware.py)."""
+from app.apis.auth.models import User
+from app.database.session import SessionLocal
+
+
+def _new_user(email: str) -> int:
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def test_retry_of_redirected_create_is_replayed(client, admin_headers):
+    body = {"user_id": _new_user("idem1@example.com"), "employee_id": "I1", "first_name": "Ida", "last_name": "Em"}
+    headers = {**admin_headers, "Idempotency-Key": "create-i1"}
+    
+    first = client.post("/api/employees", json=body, headers=headers)
+    retry = client.post("/api/employees", json=body, headers=headers)
+    
+    assert first.status_code == 200, first.text
+    assert retry.status_code == 200, retry.text
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+
+
+def test_same_key_with_different_body_is_rejected(client, admin_headers):
+    body = {"user_id": _new_user("idem2@example.com"), "employee_id": "I2", "first_name": "Ida", "last_name": "Em"}
+    headers = {**admin_headers, "Idempotency-Key": "create-i2"}
+    
+    first = client.post("/api/employees/", json=body, headers=headers)
+    reused = client.post("/api/employees/", json={**body, "first_name": "Other"}, headers=headers)
+    
+    assert first.status_code == 200, first.text
+    assert reused.status_code == 422
+    assert "Idempotent-Replayed" not in reused.headers
\ No newline at end of file
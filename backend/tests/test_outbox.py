@@ -0,0 +1,165 @@
+"""Outbox publishing and webhook delivery (see app/apis/outbox/dispatcher.py)."""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.apis.outbox import dispatcher as dispatcher_module
+from app.apis.outbox.dispatcher import OutboxDispatcher, backoff_seconds
+from app.apis.outbox.models import OutboxEvent, WebhookSubscription
+from app.apis.outbox.repositories import OutboxRepository, WebhookSubscriptionRepository
+from app.core.config import settings
+from app.core.events import lifespan
+from app.database.session import SessionLocal
+from app.main import app
+
+
+def _publish_all() -> int:
+    """Publish whatever earlier tests left pending; returns the last position."""
+    db = SessionLocal()
+    outbox = OutboxRepository(db)
+    while outbox.publish_pending(datetime.now(timezone.utc), 1000):
+        pass
+    db.commit()
+    last = outbox.last_position()
+    db.close()
+    return last
+
+
+def _add_events(*event_types: str):
+    db = SessionLocal()
+    OutboxRepository(db).add_many([(event_type, 1, {"id": 1}) for event_type in event_types])
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def subscription():
+    """An active webhook subscription starting at the current end of the feed, removed afterwards."""
+    cursor = _publish_all()
+    db = SessionLocal()
+    created = WebhookSubscriptionRepository(db).create({
+        "name": "test", "url": "http://sink.test/hook", "secret": "s3cret",
+        "event_types": "employee.deleted", "cursor": cursor
+    })
+    db.commit()
+    subscription_id = created.id
+    db.close()
+    yield subscription_id
+    db = SessionLocal()
+    WebhookSubscriptionRepository(db).delete(subscription_id)
+    db.commit()
+    db.close()
+
+
+def _subscription(subscription_id: int) -> WebhookSubscription:
+    db = SessionLocal()
+    subscription = WebhookSubscriptionRepository(db).get_by_id(subscription_id)
+    db.close()
+    return subscription
+
+
+def _dispatch(status_code: int = 200):
+    """One dispatcher round against a fake webhook receiver; returns the posted bodies."""
+    posted = []
+    
+    def receive(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content))
+        return httpx.Response(status_code)
+    
+    async def run():
+        dispatcher = OutboxDispatcher(batch_size=50)
+        dispatcher._client = httpx.AsyncClient(transport=httpx.MockTransport(receive))
+        try:
+            await dispatcher.dispatch_once()
+        finally:
+            await dispatcher._client.aclose()
+    
+    asyncio.run(run())
+    return posted
+
+
+def test_publish_assigns_consecutive_positions_in_id_order():
+    last = _publish_all()
+    _add_events("employee.created", "employee.updated", "employee.deleted")
+    db = SessionLocal()
+    outbox = OutboxRepository(db)
+    
+    assert outbox.publish_pending(datetime.now(timezone.utc), 2) == 2
+    assert outbox.publish_pending(datetime.now(timezone.utc), 2) == 1
+    db.commit()
+    
+    events = db.query(OutboxEvent).filter(OutboxEvent.position > last).order_by(OutboxEvent.id).all()
+    assert [(event.event_type, event.position) for event in events] == [
+        ("employee.created", last + 1), ("employee.updated", last + 2), ("employee.deleted", last + 3)
+    ]
+    assert all(event.published_at is not None for event in events)
+    db.close()
+
+
+def test_cursor_moves_past_filtered_events_without_a_delivery(subscription):
+    _add_events("employee.created", "employee.updated")
+    
+    assert _dispatch() == []
+    
+    state = _subscription(subscription)
+    assert state.cursor == _publish_all()
+    assert state.last_delivered_at is None
+    
+    _add_events("employee.updated", "employee.deleted")
+    posted = _dispatch()
+    
+    assert [[event["type"] for event in body["events"]] for body in posted] == [["employee.deleted"]]
+    state = _subscription(subscription)
+    assert state.cursor == posted[0]["events"][0]["position"]
+    assert state.last_delivered_at is not None
+
+
+def test_failed_delivery_backs_off_and_keeps_the_cursor(subscription, monkeypatch):
+    monkeypatch.setattr(dispatcher_module.random, "uniform", lambda low, high: high)
+    cursor = _subscription(subscription).cursor
+    _add_events("employee.deleted")
+    
+    before = datetime.now(timezone.utc)
+    assert len(_dispatch(status_code=500)) == 1
+    
+    state = _subscription(subscription)
+    assert (state.cursor, state.attempts, state.last_error) == (cursor, 1, "HTTP 500")
+    retry_at = state.next_attempt_at.replace(tzinfo=timezone.utc)
+    assert retry_at >= before + timedelta(seconds=settings.OUTBOX_BACKOFF_BASE_SECONDS)
+    assert _dispatch() == []  # not due yet
+    
+    db = SessionLocal()
+    db.query(WebhookSubscription).filter(WebhookSubscription.id == subscription).update(
+        {WebhookSubscription.next_attempt_at: before}
+    )
+    db.commit()
+    db.close()
+    assert len(_dispatch()) == 1
+    
+    state = _subscription(subscription)
+    assert (state.attempts, state.next_attempt_at, state.last_error) == (0, None, None)
+    assert state.cursor > cursor
+
+
+def test_backoff_doubles_up_to_the_maximum(monkeypatch):
+    monkeypatch.setattr(dispatcher_module.random, "uniform", lambda low, high: high)
+    monkeypatch.setattr(settings, "OUTBOX_BACKOFF_BASE_SECONDS", 5.0)
+    monkeypatch.setattr(settings, "OUTBOX_BACKOFF_MAX_SECONDS", 30.0)
+    
+    assert [backoff_seconds(attempts) for attempts in range(1, 6)] == [5.0, 10.0, 20.0, 30.0, 30.0]
+
+
+def test_startup_refuses_several_workers_without_postgresql(monkeypatch):
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "OUTBOX_ENABLED", True)
+    monkeypatch.setattr(settings, "DB_POOL_WARMUP", False)
+    
+    async def start():
+        async with lifespan(app):
+            pass
+    
+    with pytest.raises(RuntimeError, match="WEB_CONCURRENCY=2"):
+        asyncio.run(start())
\ No newline at end of file
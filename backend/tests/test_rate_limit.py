@@ -0,0 +1,102 @@
+"""Token-bucket rate limiting (see app/shared/rate_limit.py)."""
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+from jose import jwt
+from starlette.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.security import security_service
+from app.shared.rate_limit import MemoryBucketStore, RateLimit, RateLimitMiddleware, RoutePolicy
+
+
+def _take(store, key, limit, now):
+    return asyncio.run(store.take(key, limit, now))
+
+
+def test_burst_then_reject_with_retry_after():
+    store = MemoryBucketStore()
+    limit = RateLimit(rate=0.5, burst=2)
+    
+    assert _take(store, "k", limit, 100.0) == (True, 0.0)
+    assert _take(store, "k", limit, 100.0) == (True, 0.0)
+    
+    assert _take(store, "k", limit, 100.0) == (False, 2.0)
+
+
+def test_bucket_refills_at_rate_up_to_burst():
+    store = MemoryBucketStore()
+    limit = RateLimit(rate=0.5, burst=2)
+    for _ in range(2):
+        _take(store, "k", limit, 100.0)
+    
+    assert _take(store, "k", limit, 101.0) == (False, 1.0)  # half a token so far
+    assert _take(store, "k", limit, 103.0) == (True, 0.0)
+    
+    # A long idle period refills to burst, not beyond
+    assert [_take(store, "k", limit, 1000.0)[0] for _ in range(3)] == [True, True, False]
+
+
+def test_keys_are_independent_and_bounded():
+    store = MemoryBucketStore(max_keys=2)
+    limit = RateLimit(rate=1, burst=1)
+    
+    assert _take(store, "a", limit, 100.0)[0]
+    assert _take(store, "b", limit, 100.0)[0]
+    assert _take(store, "c", limit, 100.0)[0]
+    
+    assert len(store) == 2
+    assert _take(store, "a", limit, 100.0)[0]  # evicted, so it came back full
+
+
+async def _ok(scope, receive, send):
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+def _limited_client(per_ip: RateLimit, per_user: RateLimit) -> TestClient:
+    middleware = RateLimitMiddleware(_ok, store=MemoryBucketStore())
+    middleware.policies = {}
+    middleware.default = RoutePolicy("api", per_ip=per_ip, per_user=per_user)
+    return TestClient(middleware)
+
+
+def _bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_rejection_carries_retry_after():
+    client = _limited_client(per_ip=RateLimit.per_minute(1), per_user=None)
+    assert client.get("/api/employees").status_code == 200
+    
+    response = client.get("/api/employees")
+    
+    assert response.status_code == 429
+    assert 59 <= int(response.headers["Retry-After"]) <= 60
+    assert response.json()["status_code"] == 429
+
+
+def test_per_user_bucket_follows_the_verified_subject():
+    client = _limited_client(per_ip=RateLimit.per_minute(100), per_user=RateLimit.per_minute(2))
+    first, _ = security_service.create_access_token("limited@example.com")
+    second, _ = security_service.create_access_token("limited@example.com")
+    
+    statuses = [client.get("/api/employees", headers=_bearer(token)).status_code for token in (first, second, first)]
+    
+    assert statuses == [200, 200, 429]
+    other, _ = security_service.create_access_token("unlimited@example.com")
+    assert client.get("/api/employees", headers=_bearer(other)).status_code == 200
+
+
+def test_forged_token_is_charged_to_its_ip_only():
+    client = _limited_client(per_ip=RateLimit.per_minute(100), per_user=RateLimit.per_minute(2))
+    forged = jwt.encode(
+        {"sub": "victim@example.com", "exp": time.time() + 60, "type": "access"},
+        "not-" + settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM
+    )
+    
+    assert all(client.get("/api/employees", headers=_bearer(forged)).status_code == 200 for _ in range(5))
+    
+    genuine, _ = security_service.create_access_token("victim@example.com")
+    assert [client.get("/api/employees", headers=_bearer(genuine)).status_code for _ in range(3)] == [200, 200, 429]
\ No newline at end of file
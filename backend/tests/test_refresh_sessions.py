@@ -0,0 +1,127 @@
+"""Refresh token rotation, grace reuse and reuse detection (see AuthService._rotate)."""
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.apis.auth.models import RefreshSession, User
+from app.apis.auth.repositories import RefreshSessionRepository, UserRepository, hash_token
+from app.apis.auth.services import AuthService, _refresh_expiry
+from app.core.constants import REFRESH_TOKEN_COOKIE_NAME
+from app.core.security import security_service
+from app.database.session import SessionLocal
+
+
+def _login(email: str) -> str:
+    """A user with a fresh refresh session, as google_login leaves them."""
+    db = SessionLocal()
+    user = UserRepository(db).get_by_email(email) or UserRepository(db).create_user(email, email.split("@")[0])
+    token = security_service.create_refresh_token(email)
+    RefreshSessionRepository(db).create(user.id, token, _refresh_expiry())
+    db.commit()
+    db.close()
+    return token
+
+
+def _refresh(token: str):
+    client = TestClient(app)
+    client.cookies.set(REFRESH_TOKEN_COOKIE_NAME, token)
+    return client.post("/api/auth/refresh")
+
+
+def _session(token: str) -> RefreshSession:
+    db = SessionLocal()
+    session = db.query(RefreshSession).filter(RefreshSession.token_hash == hash_token(token)).one()
+    db.close()
+    return session
+
+
+def test_refresh_rotates_within_the_family():
+    token = _login("rotate@example.com")
+    
+    response = _refresh(token)
+    
+    assert response.status_code == 200, response.text
+    successor = response.cookies[REFRESH_TOKEN_COOKIE_NAME]
+    old, new = _session(token), _session(successor)
+    assert old.rotated_at is not None and old.successor_id == new.id
+    assert new.family_id == old.family_id and new.rotated_at is None
+
+
+def test_reuse_within_grace_window_gets_a_new_token_in_the_family():
+    token = _login("grace@example.com")
+    successor = _refresh(token).cookies[REFRESH_TOKEN_COOKIE_NAME]
+    
+    response = _refresh(token)
+    
+    assert response.status_code == 200, response.text
+    reissued = response.cookies[REFRESH_TOKEN_COOKIE_NAME]
+    assert reissued != successor
+    assert _session(reissued).family_id == _session(token).family_id
+    assert _refresh(successor).status_code == 200
+    assert _refresh(reissued).status_code == 200
+
+
+def test_reuse_after_grace_window_revokes_the_family():
+    token = _login("stolen@example.com")
+    successor = _refresh(token).cookies[REFRESH_TOKEN_COOKIE_NAME]
+    db = SessionLocal()
+    db.query(RefreshSession).filter(RefreshSession.token_hash == hash_token(token)).update(
+        {RefreshSession.rotated_at: datetime.now(timezone.utc) - timedelta(minutes=5)}
+    )
+    db.commit()
+    db.close()
+    
+    response = _refresh(token)
+    
+    assert response.status_code == 401
+    family_id = _session(token).family_id
+    db = SessionLocal()
+    family = db.query(RefreshSession).filter(RefreshSession.family_id == family_id).all()
+    db.close()
+    assert len(family) == 2 and all(session.revoked_at is not None for session in family)
+    assert _refresh(successor).status_code == 401
+
+
+def test_losing_a_concurrent_rotation_takes_the_grace_path(monkeypatch):
+    token = _login("race@example.com")
+    db = SessionLocal()
+    stale = RefreshSessionRepository(db).get_by_token(token)
+    assert stale.rotated_at is None
+    # Another worker rotates the session after this one read it
+    assert _refresh(token).status_code == 200
+    outcomes = []
+    rotate = RefreshSessionRepository.rotate
+    monkeypatch.setattr(
+        RefreshSessionRepository, "rotate",
+        lambda self, *args: outcomes.append(rotate(self, *args)) or outcomes[-1]
+    )
+    service = AuthService(UserRepository(db), RefreshSessionRepository(db))
+    
+    try:
+        issued = service._rotate(stale, token, "race@example.com")
+        db.commit()
+    finally:
+        db.close()
+    
+    assert outcomes == [False]
+    session = _session(issued)
+    assert session.family_id == _session(token).family_id
+    assert session.rotated_at is None and session.revoked_at is None
+
+
+def test_legacy_refresh_token_is_moved_into_a_family():
+    token = security_service.create_refresh_token("legacy@example.com")
+    db = SessionLocal()
+    db.add(User(email="legacy@example.com", name="Legacy", refresh_token=token))
+    db.commit()
+    db.close()
+    
+    response = _refresh(token)
+    
+    assert response.status_code == 200, response.text
+    adopted, successor = _session(token), _session(response.cookies[REFRESH_TOKEN_COOKIE_NAME])
+    assert adopted.rotated_at is not None and successor.family_id == adopted.family_id
+    db = SessionLocal()
+    assert UserRepository(db).get_by_email("legacy@example.com").refresh_token is None
+    db.close()
\ No newline at end of file
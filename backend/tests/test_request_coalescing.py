@@ -0,0 +1,41 @@
+"""Coalesced reads share one query and hold no pooled connections while they wait."""
+import asyncio
+import threading
+
+import httpx
+
+from app.main import app
+from app.apis.employees_profile.services import EmployeeProfileService
+from app.database.connection import engine
+
+
+def test_coalesced_requests_wait_without_connections(admin_headers, monkeypatch):
+    release = threading.Event()
+    calls = []
+    get_employees = EmployeeProfileService.get_employees
+    
+    def slow_get_employees(self, *args, **kwargs):
+        calls.append(1)
+        release.wait(5)
+        return get_employees(self, *args, **kwargs)
+    
+    monkeypatch.setattr(EmployeeProfileService, "get_employees", slow_get_employees)
+    
+    async def run():
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            requests = [
+                asyncio.create_task(client.get("/api/employees/?limit=7", headers=admin_headers))
+                for _ in range(5)
+            ]
+            while not calls:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.3)  # let the other requests join the flight
+            checked_out = engine.pool.checkedout()
+            release.set()
+            return checked_out, await asyncio.gather(*requests)
+    
+    checked_out, responses = asyncio.run(run())
+    
+    assert [response.status_code for response in responses] == [200] * 5
+    assert len(calls) == 1
+    assert checked_out <= 1  # only the leader's read session
\ No newline at end of file
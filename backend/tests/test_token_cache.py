@@ -0,0 +1,98 @@
+"""Verified access-token cache and revocation (see TokenCache and AuthService.authenticate)."""
+import time
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.apis.auth.models import User
+from app.apis.auth.repositories import RefreshSessionRepository
+from app.apis.auth.services import _refresh_expiry
+from app.core.constants import REFRESH_TOKEN_COOKIE_NAME
+from app.core.security import TokenCache, security_service, token_cache
+from app.database.session import SessionLocal
+
+
+def _user(email: str) -> int:
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def _me(client, token: str):
+    return client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_cached_token_is_rejected_after_logout(client):
+    user_id = _user("logout@example.com")
+    access_token, _ = security_service.create_access_token("logout@example.com")
+    refresh_token = security_service.create_refresh_token("logout@example.com")
+    db = SessionLocal()
+    RefreshSessionRepository(db).create(user_id, refresh_token, _refresh_expiry())
+    db.commit()
+    db.close()
+    assert _me(client, access_token).status_code == 200
+    assert token_cache.get(TokenCache.digest(access_token)) is not None
+    
+    logout = TestClient(app)
+    logout.cookies.set(REFRESH_TOKEN_COOKIE_NAME, refresh_token)
+    assert logout.post("/api/auth/logout").status_code == 200
+    
+    assert _me(client, access_token).status_code == 401
+    # A token issued after the logout, even within the same second, still works
+    new_token, _ = security_service.create_access_token("logout@example.com")
+    assert _me(client, new_token).status_code == 200
+
+
+def test_cached_token_is_rejected_after_logout_on_another_worker(client):
+    _user("elsewhere@example.com")
+    access_token, _ = security_service.create_access_token("elsewhere@example.com")
+    assert _me(client, access_token).status_code == 200
+    
+    # Another worker's logout only reaches this one through the users row
+    db = SessionLocal()
+    db.query(User).filter(User.email == "elsewhere@example.com").update(
+        {User.tokens_revoked_at: datetime.now(timezone.utc)}
+    )
+    db.commit()
+    db.close()
+    
+    assert _me(client, access_token).status_code == 401
+    assert token_cache.get(TokenCache.digest(access_token)) is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TokenCache(max_size=2)
+    payload = {"sub": "lru@example.com", "exp": time.time() + 60}
+    cache.put("a", payload)
+    cache.put("b", payload)
+    assert cache.get("a") == payload
+    
+    cache.put("c", payload)
+    
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == payload and cache.get("c") == payload
+
+
+def test_cache_drops_expired_entries():
+    cache = TokenCache(max_size=2)
+    cache.put("a", {"sub": "old@example.com", "exp": time.time() - 1})
+    
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_revoke_subject_uses_the_fractional_issue_time():
+    cache = TokenCache(max_size=10)
+    revoked_at = time.time()
+    
+    cache.revoke_subject("frac@example.com", revoked_at)
+    
+    assert cache.is_revoked({"sub": "frac@example.com", "iat": revoked_at - 0.001})
+    assert not cache.is_revoked({"sub": "frac@example.com", "iat": revoked_at + 0.001})
+    assert not cache.is_revoked({"sub": "other@example.com", "iat": revoked_at - 0.001})
\ No newline at end of file
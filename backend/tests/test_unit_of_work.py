@@ -0,0 +1,189 @@
+"""One commit per write request, none per read (see app/database/unit_of_work.py)."""
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.apis.auth.models import User
+from app.apis.auth.repositories import RefreshSessionRepository, UserRepository
+from app.apis.auth.services import _refresh_expiry
+from app.core.constants import REFRESH_TOKEN_COOKIE_NAME
+from app.core.security import security_service
+from app.database.session import SessionLocal, get_db
+from app.database.unit_of_work import UnitOfWork, UnitOfWorkRoute
+
+
+def _new_user(email: str) -> int:
+    db = SessionLocal()
+    user = User(email=email, name=email.split("@")[0])
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def _create_employee(client, headers, code: str) -> int:
+    user_id = _new_user(f"{code.lower()}@example.com")
+    response = client.post(
+        "/api/employees/",
+        json={"user_id": user_id, "employee_id": code, "first_name": "New", "last_name": "Hire"},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def test_create_commits_once(client, admin_headers, commits):
+    user_id = _new_user("create@example.com")
+    commits.clear()
+    
+    response = client.post(
+        "/api/employees/",
+        json={"user_id": user_id, "employee_id": "C1", "first_name": "New", "last_name": "Hire"},
+        headers=admin_headers
+    )
+    
+    assert response.status_code == 200, response.text
+    assert len(commits) == 1
+
+
+def test_update_commits_once(client, admin_headers, commits):
+    employee_id = _create_employee(client, admin_headers, "U1")
+    commits.clear()
+    
+    response = client.put(f"/api/employees/{employee_id}", json={"position": "Lead"}, headers=admin_headers)
+    
+    assert response.status_code == 200, response.text
+    assert len(commits) == 1
+
+
+def test_delete_commits_once(client, admin_headers, commits):
+    employee_id = _create_employee(client, admin_headers, "D1")
+    commits.clear()
+    
+    response = client.delete(f"/api/employees/{employee_id}", headers=admin_headers)
+    
+    assert response.status_code == 200, response.text
+    assert len(commits) == 1
+
+
+def test_refresh_commits_once(client, commits):
+    db = SessionLocal()
+    user = UserRepository(db).get_by_email("user@example.com")
+    refresh_token = security_service.create_refresh_token(user.email)
+    RefreshSessionRepository(db).create(user.id, refresh_token, _refresh_expiry())
+    db.commit()
+    db.close()
+    commits.clear()
+    
+    client.cookies.set(REFRESH_TOKEN_COOKIE_NAME, refresh_token)
+    response = client.post("/api/auth/refresh")
+    
+    # Rotation runs in a savepoint; releasing it is not a commit
+    assert response.status_code == 200, response.text
+    assert len(commits) == 1
+
+
+@pytest.mark.parametrize("path", [
+    "/api/employees/",
+    "/api/employees/1",
+    "/api/employees/search?q=Ada",
+    "/api/auth/me",
+])
+def test_reads_do_not_commit(client, admin_headers, commits, path):
+    response = client.get(path, headers=admin_headers)
+    
+    assert response.status_code == 200, response.text
+    assert commits == []
+
+
+def test_failed_write_does_not_commit(client, admin_headers, commits):
+    response = client.put("/api/employees/999999", json={"position": "Lead"}, headers=admin_headers)
+    
+    assert response.status_code == 404
+    assert commits == []
+
+
+def test_savepoint_rollback_keeps_outer_work(commits):
+    db = SessionLocal()
+    uow = UnitOfWork(db)
+    try:
+        db.add(User(email="outer@example.com", name="Outer"))
+        db.flush()
+        
+        with uow.savepoint():
+            db.add(User(email="nested@example.com", name="Nested"))
+        
+        with pytest.raises(IntegrityError):
+            with uow.savepoint():
+                db.add(User(email="outer@example.com", name="Duplicate"))
+                db.flush()
+        
+        uow.commit()
+    finally:
+        db.close()
+    
+    assert len(commits) == 1
+    assert uow.commit_count == 1
+    db = SessionLocal()
+    try:
+        assert [user.name for user in db.query(User).filter(User.email == "outer@example.com")] == ["Outer"]
+        assert db.query(User).filter(User.email == "nested@example.com").count() == 1
+    finally:
+        db.close()
+
+
+def _app_writing_user(route_class=None) -> TestClient:
+    """A one-route app that adds a user, then answers with the status in the query."""
+    router = APIRouter(route_class=route_class) if route_class else APIRouter()
+    
+    @router.post("/write")
+    def write(email: str, status_code: int, db: Session = Depends(get_db)):
+        db.add(User(email=email, name="Written"))
+        db.flush()
+        return JSONResponse({"ok": status_code < 400}, status_code=status_code)
+    
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def _user_exists(email: str) -> bool:
+    db = SessionLocal()
+    try:
+        return db.query(User).filter(User.email == email).count() == 1
+    finally:
+        db.close()
+
+
+def test_returned_error_response_does_not_commit(commits):
+    client = _app_writing_user(UnitOfWorkRoute)
+    
+    response = client.post("/write", params={"email": "returned-409@example.com", "status_code": 409})
+    
+    assert response.status_code == 409
+    assert commits == []
+    assert not _user_exists("returned-409@example.com")
+
+
+def test_success_commits_once_with_the_teardown(commits):
+    client = _app_writing_user(UnitOfWorkRoute)
+    
+    response = client.post("/write", params={"email": "returned-201@example.com", "status_code": 201})
+    
+    assert response.status_code == 201
+    assert len(commits) == 1
+    assert _user_exists("returned-201@example.com")
+
+
+def test_plain_route_still_commits_in_the_teardown(commits):
+    client = _app_writing_user()
+    
+    response = client.post("/write", params={"email": "plain@example.com", "status_code": 200})
+    
+    assert response.status_code == 200
+    assert len(commits) == 1
+    assert _user_exists("plain@example.com")
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""compute_workforce_series on a small dataset with known monthly figures."""
+from datetime import date, datetime
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.apis.analytics.computations import WorkforceColumns, compute_workforce_series
+
+
+AS_OF = date(2024, 3, 15)
+
+# (department, joined, left, birth, is_active, updated_at)
+ROWS = [
+    ("Eng", date(2020, 5, 1), None, date(1990, 1, 1), True, None),
+    ("Eng", date(2024, 2, 10), None, date(2000, 6, 1), True, None),  # joins in February
+    ("Eng", date(2019, 1, 1), date(2024, 1, 20), date(1970, 1, 1), False, None),  # leaves in January
+    ("Ops", date(2023, 12, 1), None, None, False, datetime(2024, 3, 5)),  # deactivated in March, no leaving date
+    (None, None, None, None, True, None),  # nothing known
+    ("Ops", date(2024, 4, 1), None, date(1980, 1, 1), True, None),  # starts after the window
+]
+
+
+@pytest.fixture(scope="module")
+def series():
+    rows = compute_workforce_series(WorkforceColumns.from_rows(ROWS), AS_OF, history_months=3)
+    values = {(metric, department, bucket): value for metric, department, bucket, value in rows}
+    assert len(values) == len(rows)
+    return values
+
+
+def _months(series, metric: str, department: str):
+    return [series[(metric, department, month)] for month in ("2024-01", "2024-02", "2024-03")]
+
+
+def test_headcount_per_month(series):
+    assert _months(series, "headcount", "Eng") == [1, 2, 2]
+    assert _months(series, "headcount", "Ops") == [1, 1, 0]
+    assert _months(series, "headcount", "(unassigned)") == [1, 1, 1]
+    assert _months(series, "headcount", "") == [3, 4, 3]
+
+
+def test_joiners_and_leavers_per_month(series):
+    assert _months(series, "joiners", "Eng") == [0, 1, 0]
+    assert _months(series, "joiners", "Ops") == [0, 0, 0]
+    assert _months(series, "leavers", "Eng") == [1, 0, 0]
+    assert _months(series, "leavers", "Ops") == [0, 0, 1]
+    assert _months(series, "leavers", "") == [1, 0, 1]
+
+
+def test_tenure_and_age_bands_count_current_employees(series):
+    assert {bucket: series[("tenure", "Eng", bucket)] for bucket in ("<1y", "2-5y", "5-10y")} == {
+        "<1y": 1, "2-5y": 1, "5-10y": 0
+    }
+    assert {bucket: series[("age", "Eng", bucket)] for bucket in ("<25", "25-34", "55+")} == {
+        "<25": 1, "25-34": 1, "55+": 0
+    }
+    assert series[("tenure", "(unassigned)", "unknown")] == 1
+    assert series[("age", "(unassigned)", "unknown")] == 1
+    assert sum(series[("tenure", "Ops", bucket)] for bucket in ("<1y", "1-2y", "2-5y", "5-10y", "10y+", "unknown")) == 0
+
+
+def test_no_profiles_gives_zero_totals():
+    rows = compute_workforce_series(WorkforceColumns.from_rows([]), AS_OF, history_months=2)
+    
+    assert [row for row in rows if row[0] == "headcount"] == [
+        ("headcount", "", "2024-02", 0), ("headcount", "", "2024-03", 0)
+    ]
\ No newline at end of file